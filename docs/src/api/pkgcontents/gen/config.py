@@ -55,6 +55,7 @@ _CONFIG_ = {
 			vice.cumulative_return_fraction,
 			vice.main_sequence_mass_fraction,
 			vice.single_stellar_population,
+			vice.single_stellar_population_many,
 			vice.mlr,
 			vice.yields,
 			vice.elements,
@@ -111,6 +112,11 @@ _CONFIG_ = {
 		"header": 		"vice.single_stellar_population",
 		"subs": 		[]
 	},
+	vice.single_stellar_population_many: {
+		"filename": 	"vice.single_stellar_population_many.rst",
+		"header": 		"vice.single_stellar_population_many",
+		"subs": 		[]
+	},
 	vice.dataframe: {
 		"filename":		"vice.core.dataframe.base.rst",
 		"header": 		"vice.dataframe",
@@ -950,6 +956,7 @@ _CONFIG_ = {
 		"header": 		"vice.singlezone",
 		"subs": 		[
 			vice.singlezone.run,
+			vice.singlezone.run_many,
 			vice.singlezone.from_output,
 			vice.singlezone.name,
 			vice.singlezone.func,
@@ -985,6 +992,11 @@ _CONFIG_ = {
 		"header": 		"vice.singlezone.run",
 		"subs": 		[]
 	},
+	vice.singlezone.run_many: {
+		"filename": 	"vice.singlezone.run_many.rst",
+		"header": 		"vice.singlezone.run_many",
+		"subs": 		[]
+	},
 	vice.singlezone.from_output: {
 		"filename": 	"vice.singlezone.from_output.rst",
 		"header": 		"vice.singlezone.from_output",
@@ -1149,6 +1161,7 @@ _CONFIG_ = {
 		"header": 		"vice.multizone",
 		"subs": 		[
 			vice.multizone.run,
+			vice.multizone.estimate_resources,
 			vice.multizone.from_output,
 			vice.multizone.name,
 			vice.multizone.zones,
@@ -1164,6 +1177,11 @@ _CONFIG_ = {
 		"header": 		"vice.multizone.run",
 		"subs": 		[]
 	},
+	vice.multizone.estimate_resources: {
+		"filename": 	"vice.multizone.estimate_resources.rst",
+		"header": 		"vice.multizone.estimate_resources",
+		"subs": 		[]
+	},
 	vice.multizone.from_output: {
 		"filename": 	"vice.multizone.from_output.rst",
 		"header": 		"vice.multizone.from_output",
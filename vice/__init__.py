@@ -42,10 +42,14 @@ output : ``object``
 	Read and store output from ``singlezone`` simulations.
 multioutput : ``object``
 	Read and store output from ``multizone`` simulations.
+load_many : <function>
+	Read in the output from many simulations across a pool of threads.
 migration : <module>
 	Utilities for mixing prescriptions in multizone simulations.
 single_stellar_population : <function>
 	Simulate enrichment from a single conatal star cluster
+single_stellar_population_many : <function>
+	Simulate enrichment from many star clusters of different metallicities
 cumulative_return_fraction : <function>
 	Calculate the cumulative return fraction of a star cluster of known age
 main_sequence_mass_fraction : <function>
@@ -72,6 +76,8 @@ stars : <function>
 	Read in stellar population abundances from a multizone simulation output.
 toolkit : <module>
 	Generally useful utilities.
+benchmarks : <module>
+	Performance benchmarks of VICE's most expensive calculations.
 _dev : <module>
 	Developer's tools.
 
@@ -129,6 +135,7 @@ exit the VICE source tree and relaunch your python interpreter from there. \
 			"_globals",
 			"_dev",
 			"toolkit",
+			"benchmarks",
 			"ScienceWarning",
 			"VisibleRuntimeWarning",
 			"VisibleDeprecationWarning"
@@ -157,6 +164,7 @@ exit the VICE source tree and relaunch your python interpreter from there. \
 			from . import elements
 			from . import yields
 			from . import toolkit
+			from . import benchmarks
 			from .tests import test
 			from . import _dev
 			__all__.extend(core.__all__)
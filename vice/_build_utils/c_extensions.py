@@ -15,6 +15,9 @@ _CFILES_ = {
 		"./vice/src/objects/callback_1arg.c",
 		"./vice/src/objects/callback_2arg.c",
 		"./vice/src/io/progressbar.c",
+		"./vice/src/imf.c",
+		"./vice/src/ssp/remnants.c",
+		"./vice/src/callback.c",
 		"./vice/src/utils.c"
 	],
 	"vice.core._mlr": [
@@ -255,6 +258,7 @@ _CFILES_ = {
 	],
 	"vice.core.ssp._imf": [
 		"./vice/src/imf.c",
+		"./vice/src/ssp/remnants.c",
 		"./vice/src/callback.c",
 		"./vice/src/utils.c"
 	],
@@ -465,6 +469,7 @@ _CFILES_ = {
 	"vice.src.tests._imf": [
 		"./vice/src/tests/imf.c",
 		"./vice/src/imf.c",
+		"./vice/src/ssp/remnants.c",
 		"./vice/src/callback.c",
 		"./vice/src/utils.c",
 		"./vice/src/objects/imf.c",
@@ -477,6 +482,7 @@ _CFILES_ = {
 	],
 	"vice.src.tests._utils": [
 		"./vice/src/tests/utils.c",
+		"./vice/src/toolkit/interp_scheme_2d.c",
 		"./vice/src/utils.c"
 	],
 	"vice.toolkit.hydrodisk._hydrodiskstars": [
@@ -0,0 +1,41 @@
+r"""
+VICE Benchmarks : Performance tracking across versions of VICE.
+
+.. versionadded:: 1.4.0
+
+Times a fixed set of scenarios covering VICE's most expensive calculations
+and records their peak memory usage and throughput in machine-readable form,
+such that performance regressions can be identified by comparing the results
+from two versions or commits. Run them from the command line via
+``python -m vice.benchmarks`` (see ``python -m vice.benchmarks --help``).
+
+Contents
+--------
+benchmark : ``type``
+	A scenario whose performance is tracked.
+scenarios : ``function``
+	Get the built-in benchmark scenarios.
+run : ``function``
+	Run one or more scenarios, each in a separate process.
+compare : ``function``
+	Compare the results of two runs of the benchmarks.
+"""
+
+from __future__ import absolute_import
+try:
+	__VICE_SETUP__
+except NameError:
+	__VICE_SETUP__ = False
+
+if not __VICE_SETUP__:
+
+	__all__ = ["benchmark", "scenarios", "run", "compare", "test"]
+	from ..testing import moduletest
+	from .benchmark import benchmark
+	from .scenarios import scenarios
+	from .runner import run, compare
+	from .tests import test
+
+else:
+	pass
+
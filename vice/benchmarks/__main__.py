@@ -0,0 +1,13 @@
+try:
+	__VICE_SETUP__
+except NameError:
+	__VICE_SETUP__ = False
+
+
+if not __VICE_SETUP__:
+	from vice.benchmarks.runner import main
+	main()
+else:
+	raise RuntimeError("""VICE's benchmarks cannot be ran during a source \
+installation. Please wait until that process has finished.""")
+
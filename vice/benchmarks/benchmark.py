@@ -0,0 +1,202 @@
+r"""
+This file implements the benchmark object, which times a single scenario and
+records its peak memory usage and throughput.
+"""
+
+from __future__ import absolute_import
+import numbers
+import resource
+import time
+import sys
+
+
+class benchmark(object):
+
+	r"""
+	A scenario whose performance is tracked across versions of VICE.
+
+	**Signature**: vice.benchmarks.benchmark(name, function, params = {},
+	setup = None, unit = None, requires = None)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	name : ``str``
+		The name of the scenario (e.g. "multizone"). Scenarios with the same
+		name are distinguished by their parameters.
+	function : <function>
+		Runs the scenario once, accepting no arguments. It may return
+		``None``, the amount of work done in units of ``unit`` (e.g. the
+		number of zone-steps in a simulation), or a ``dict`` with the keys
+		"work" and "time", the latter replacing the measured wall-clock time
+		when only part of the call is of interest (e.g. the setup of a
+		simulation).
+	params : ``dict`` [default : {}]
+		The parameters of this scenario.
+	setup : <function> [default : None]
+		Prepares the scenario before it is timed (e.g. by running the
+		simulation whose output is loaded by ``function``), accepting no
+		arguments.
+	unit : ``str`` [default : None]
+		The unit of work returned by ``function``, reported as the unit of
+		throughput per second.
+	requires : <function> [default : None]
+		Determines whether or not the scenario can be ran, accepting no
+		arguments and returning ``None`` if so, and a ``str`` describing the
+		reason it cannot be otherwise.
+
+	Attributes
+	----------
+	name : ``str``
+		The name of the scenario, including its parameters (e.g.
+		"multizone[n_zones=100,n_stars=8]").
+	params : ``dict``
+		The parameters of this scenario.
+	unit : ``str`` or ``None``
+		The unit of work done by this scenario.
+
+	Functions
+	---------
+	measure : ``function``
+		Time this scenario in the current process.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> def example():
+		vice.singlezone(name = "example").run([0.01 * i for i in range(1001)],
+			overwrite = True)
+		return 1000
+	>>> b = vice.benchmarks.benchmark("singlezone", example,
+		params = {"dt": 0.01}, unit = "zone-steps")
+	>>> b.name
+	'singlezone[dt=0.01]'
+	>>> b.measure()
+	{'name': 'singlezone[dt=0.01]', 'params': {'dt': 0.01}, 'time': 0.1937,
+	'peak_rss': 97.8, 'throughput': 5162.6, 'unit': 'zone-steps/s'}
+	"""
+
+	def __init__(self, name, function, params = {}, setup = None,
+		unit = None, requires = None):
+		if params:
+			self._name = "%s[%s]" % (name, ",".join(["%s=%s" % (key,
+				params[key]) for key in params.keys()]))
+		else:
+			self._name = name
+		self._function = function
+		self._params = dict(params)
+		self._setup = setup
+		self._unit = unit
+		self._requires = requires
+
+	def __repr__(self):
+		return "vice.benchmarks.benchmark{%s}" % (self._name)
+
+	@property
+	def name(self):
+		r"""
+		Type : ``str``
+
+		The name of the scenario, including its parameters.
+		"""
+		return self._name
+
+	@property
+	def params(self):
+		r"""
+		Type : ``dict``
+
+		The parameters of this scenario.
+		"""
+		return self._params
+
+	@property
+	def unit(self):
+		r"""
+		Type : ``str`` or ``None``
+
+		The unit of work done by this scenario.
+		"""
+		return self._unit
+
+	def measure(self, repeat = 1):
+		r"""
+		Time this scenario in the current process.
+
+		**Signature**: x.measure(repeat = 1)
+
+		Parameters
+		----------
+		x : ``benchmark``
+			An instance of this class.
+		repeat : ``int`` [default : 1]
+			The number of times to run the scenario. The fastest of them is
+			reported.
+
+		Returns
+		-------
+		result : ``dict``
+			The name and parameters of the scenario, along with the following:
+
+				- time: The wall-clock time in seconds.
+				- peak_rss: The peak resident set size of the process in MB.
+				- throughput: The work done per second, if applicable.
+				- unit: The unit of throughput, if applicable.
+
+			If the scenario cannot be ran, these are replaced by the key
+			"skipped", storing the reason. If it raises an exception, they are
+			replaced by the key "error", storing the error message.
+
+		.. note:: The peak resident set size is that of the entire process
+			over its lifetime. ``vice.benchmarks.run`` runs each scenario in a
+			separate process for this reason.
+		"""
+		result = {"name": self._name, "params": self._params}
+		reason = self._requires() if self._requires is not None else None
+		if reason is not None:
+			result["skipped"] = reason
+			return result
+		else: pass
+		try:
+			if self._setup is not None: self._setup()
+			best = None
+			for i in range(repeat):
+				start = time.perf_counter()
+				work = self._function()
+				elapsed = time.perf_counter() - start
+				if isinstance(work, dict):
+					elapsed = work["time"]
+					work = work["work"]
+				else: pass
+				if best is None or elapsed < best: best = elapsed
+		except Exception as exc:
+			result["error"] = "%s: %s" % (type(exc).__name__, str(exc))
+			return result
+		result["time"] = best
+		result["peak_rss"] = peak_rss()
+		if isinstance(work, numbers.Number) and self._unit is not None:
+			result["throughput"] = work / best
+			result["unit"] = "%s/s" % (self._unit)
+		else:
+			result["throughput"] = None
+			result["unit"] = None
+		return result
+
+
+def peak_rss():
+	r"""
+	Determine the peak resident set size of the current process.
+
+	Returns
+	-------
+	rss : ``float``
+		The peak resident set size in MB.
+	"""
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if sys.platform == "darwin":
+		# reported in bytes on Mac OS, and in kilobytes on Linux
+		return rss / 1024**2
+	else:
+		return rss / 1024
+
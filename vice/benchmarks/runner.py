@@ -0,0 +1,286 @@
+r"""
+This file implements running VICE's benchmarks, each in a separate process,
+and comparing the results of two runs. ``python -m vice.benchmarks`` calls
+the main function defined here.
+"""
+
+from __future__ import absolute_import
+from ..version import version
+from .scenarios import scenarios
+import subprocess
+import tempfile
+import platform
+import argparse
+import json
+import time
+import sys
+import os
+
+
+def run(select = None, repeat = 1, verbose = False):
+	r"""
+	Run VICE's benchmarks.
+
+	**Signature**: vice.benchmarks.run(select = None, repeat = 1,
+	verbose = False)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	select : ``list`` [elements of type ``str``] [default : None]
+		Run only the scenarios whose names contain at least one of these
+		strings. ``None`` to run all of them.
+	repeat : ``int`` [default : 1]
+		The number of times to run each scenario. The fastest of them is
+		reported.
+	verbose : ``bool`` [default : False]
+		Whether or not to print the result of each scenario to the standard
+		error stream as it finishes.
+
+	Returns
+	-------
+	results : ``dict``
+		The results of each scenario under the key "results", in the format
+		returned by ``vice.benchmarks.benchmark.measure``, along with the
+		version of VICE, the git commit (if VICE is ran from its source tree),
+		the version of python, the platform, and the date under the keys
+		"version", "commit", "python", "platform", and "date". Scenarios
+		whose process fails (e.g. by running out of memory) report the
+		reason under the key "error".
+
+	Notes
+	-----
+	Each scenario runs in a separate python process in a temporary
+	directory, such that the peak memory usage reported for each is its own
+	and that no output is left behind. See ``vice.benchmarks.scenarios`` for
+	a description of each scenario.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> results = vice.benchmarks.run(select = ["singlezone["])
+	>>> [(i["name"], i["throughput"]) for i in results["results"]]
+	[('singlezone[dt=0.01]', 5162.6), ('singlezone[dt=0.001]', 2893.0)]
+	"""
+	results = {
+		"version": str(version),
+		"commit": commit(),
+		"python": platform.python_version(),
+		"platform": "%s-%s" % (sys.platform, platform.machine()),
+		"date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+		"results": []
+	}
+	for case in selected(select):
+		results["results"].append(run_isolated(case.name, repeat))
+		if verbose: sys.stderr.write("%s\n" % (summary(
+			results["results"][-1])))
+	return results
+
+
+def compare(baseline, results):
+	r"""
+	Compare the results of two runs of VICE's benchmarks.
+
+	**Signature**: vice.benchmarks.compare(baseline, results)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	baseline : ``dict`` or ``str``
+		The results of the earlier run, as returned by
+		``vice.benchmarks.run``, or the name of a file they were saved to.
+	results : ``dict`` or ``str``
+		The results of the later run, in the same format.
+
+	Returns
+	-------
+	ratios : ``dict``
+		The ratio of the later to the earlier time and peak memory usage of
+		each scenario ran successfully in both, under the keys "time" and
+		"peak_rss". Ratios above 1 indicate a regression.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> vice.benchmarks.compare("v1.3.json", "v1.4.json")
+	{'singlezone[dt=0.01]': {'time': 0.62, 'peak_rss': 1.01}, ...}
+	"""
+	baseline = load(baseline)
+	results = load(results)
+	earlier = dict([(i["name"], i) for i in baseline["results"] if "time" in
+		i.keys()])
+	ratios = {}
+	for i in results["results"]:
+		if "time" in i.keys() and i["name"] in earlier.keys():
+			ratios[i["name"]] = {
+				"time": i["time"] / earlier[i["name"]]["time"],
+				"peak_rss": i["peak_rss"] / earlier[i["name"]]["peak_rss"]
+			}
+		else: pass
+	return ratios
+
+
+def main():
+	r"""
+	Run VICE's benchmarks from the command line.
+	"""
+	parser = argparse.ArgumentParser(
+		prog = "python -m vice.benchmarks",
+		description = """\
+Run VICE's performance benchmarks, each in a separate process, and write the \
+time, peak memory usage, and throughput of each scenario as JSON.""")
+
+	parser.add_argument("-k", "--select",
+		help = """\
+Run only the scenarios whose names contain this string. Can be given more \
+than once.""",
+		action = "append")
+
+	parser.add_argument("-l", "--list",
+		help = "List the names of the scenarios and exit.",
+		action = "store_true")
+
+	parser.add_argument("-r", "--repeat",
+		help = """\
+The number of times to run each scenario, reporting the fastest. \
+(Default: 1)""",
+		type = int,
+		default = 1)
+
+	parser.add_argument("-o", "--outfile",
+		help = """\
+The file to write the results to. If not specified, they are written to \
+the standard output.""")
+
+	parser.add_argument("-c", "--compare",
+		help = """\
+A file holding the results of an earlier run. The ratio of the time and peak \
+memory usage of each scenario to that in the earlier run are printed to the \
+standard error stream.""")
+
+	# runs a single scenario in the current process; used internally
+	parser.add_argument("--case", help = argparse.SUPPRESS)
+
+	args = parser.parse_args()
+	if args.list:
+		for case in selected(args.select): print(case.name)
+	elif args.case is not None:
+		case = [i for i in scenarios() if i.name == args.case]
+		if len(case) != 1: parser.error("Unrecognized case: %s" % (args.case))
+		print(json.dumps(case[0].measure(repeat = args.repeat)))
+	else:
+		results = run(select = args.select, repeat = args.repeat,
+			verbose = True)
+		if args.outfile is not None:
+			with open(args.outfile, 'w') as out:
+				json.dump(results, out, indent = 4)
+				out.write("\n")
+		else:
+			print(json.dumps(results, indent = 4))
+		if args.compare is not None:
+			ratios = compare(args.compare, results)
+			sys.stderr.write("\nRatio to %s:\n" % (args.compare))
+			for name in ratios.keys():
+				sys.stderr.write("%-45s time: %6.3f  peak_rss: %6.3f\n" % (
+					name, ratios[name]["time"], ratios[name]["peak_rss"]))
+		else: pass
+
+
+def selected(select):
+	r"""
+	Get the scenarios whose names contain at least one of the strings in
+	``select``, or all of them if ``select`` is ``None``.
+	"""
+	return [i for i in scenarios() if select is None or any([j in i.name
+		for j in select])]
+
+
+def run_isolated(name, repeat):
+	r"""
+	Run a single scenario in a separate python process in a temporary
+	directory.
+
+	Parameters
+	----------
+	name : ``str``
+		The name of the scenario.
+	repeat : ``int``
+		The number of times to run it.
+
+	Returns
+	-------
+	result : ``dict``
+		The result of the scenario (see vice.benchmarks.benchmark.measure).
+	"""
+	# the child process must find this copy of VICE from any directory
+	env = dict(os.environ)
+	path = os.path.dirname(os.path.dirname(os.path.dirname(
+		os.path.abspath(__file__))))
+	if "PYTHONPATH" in env.keys():
+		env["PYTHONPATH"] = os.pathsep.join([path, env["PYTHONPATH"]])
+	else:
+		env["PYTHONPATH"] = path
+	with tempfile.TemporaryDirectory() as cwd:
+		proc = subprocess.run([sys.executable, "-W", "ignore", "-m",
+			"vice.benchmarks", "--case", name, "--repeat", str(repeat)],
+			cwd = cwd, env = env, stdout = subprocess.PIPE,
+			stderr = subprocess.PIPE, universal_newlines = True)
+	lines = proc.stdout.strip().split("\n")
+	if proc.returncode == 0 and lines[-1].startswith("{"):
+		return json.loads(lines[-1])
+	else:
+		stderr = proc.stderr.strip().split("\n")
+		return {
+			"name": name,
+			"error": "Exited with status %d: %s" % (proc.returncode,
+				stderr[-1] if stderr[-1] else "no error message")
+		}
+
+
+def summary(result):
+	r"""
+	A one-line, human-readable summary of the result of a scenario.
+	"""
+	if "time" in result.keys():
+		line = "%-45s %10.4f s  %8.1f MB" % (result["name"], result["time"],
+			result["peak_rss"])
+		if result["throughput"] is not None:
+			line += "  %.4g %s" % (result["throughput"], result["unit"])
+		else: pass
+		return line
+	elif "skipped" in result.keys():
+		return "%-45s skipped: %s" % (result["name"], result["skipped"])
+	else:
+		return "%-45s failed: %s" % (result["name"], result["error"])
+
+
+def commit():
+	r"""
+	The git commit of the source tree VICE is imported from, if applicable.
+	``None`` otherwise.
+	"""
+	try:
+		proc = subprocess.run(["git", "rev-parse", "HEAD"],
+			cwd = os.path.dirname(os.path.abspath(__file__)),
+			stdout = subprocess.PIPE, stderr = subprocess.DEVNULL,
+			universal_newlines = True)
+	except OSError:
+		return None
+	if proc.returncode == 0:
+		return proc.stdout.strip()
+	else:
+		return None
+
+
+def load(results):
+	r"""
+	Load the results of a run of the benchmarks if given as a filename.
+	"""
+	if isinstance(results, str):
+		with open(results, 'r') as f:
+			return json.load(f)
+	else:
+		return results
+
@@ -0,0 +1,258 @@
+r"""
+This file implements VICE's built-in benchmark scenarios, covering the
+calculations which dominate the computational cost of typical use cases.
+"""
+
+from __future__ import absolute_import
+from ..core.singlezone import singlezone
+from ..core.multizone import multizone
+from ..core.outputs import output
+from ..core.outputs import multioutput
+from ..milkyway import milkyway
+from ..toolkit.hydrodisk.data import _h277_exists
+from ..yields import agb
+from ..yields import ccsne
+from ..yields import sneia
+from ..core import _pyutils
+from .benchmark import benchmark
+import warnings
+import time
+import os
+
+
+"""
+The parameters of each scenario. Singlezone models are evolved for 10 Gyr.
+Multizone models are evolved for only 2 Gyr in 50 Myr timesteps, as the
+memory required for the gas migration matrix and star particles grows with
+the number of timesteps; the 1000-zone models require several hundred MB
+nonetheless (see vice.multizone.estimate_resources).
+"""
+_SINGLEZONE_DT_ = [0.01, 0.001]
+_SINGLEZONE_END_TIME_ = 10
+_MULTIZONE_N_ZONES_ = [10, 100, 1000]
+_MULTIZONE_N_STARS_ = [1, 8]
+_MULTIZONE_DT_ = 0.05
+_MULTIZONE_END_TIME_ = 2
+_MILKYWAY_ZONE_WIDTH_ = 0.5
+_MILKYWAY_DT_ = 0.05
+_MILKYWAY_END_TIME_ = 13.2
+_YIELD_STUDIES_ = ["LC18", "S16/W18", "WW95"]
+_YIELD_ELEMENTS_ = ["c", "n", "o", "mg", "si", "fe", "sr", "ba"]
+
+
+def scenarios():
+	r"""
+	Get VICE's built-in benchmark scenarios.
+
+	**Signature**: vice.benchmarks.scenarios()
+
+	.. versionadded:: 1.4.0
+
+	Returns
+	-------
+	scenarios : ``list``
+		The ``benchmark`` objects describing each scenario, in the order in
+		which they are ran. These are:
+
+			- singlezone[dt=0.01], singlezone[dt=0.001]: The default
+			  singlezone model evolved for 10 Gyr with each timestep size.
+			- singlezone_functional[dt=0.01]: The same model with yields from
+			  all three channels and the star formation efficiency timescale
+			  given as functions, such that the C library calls back into
+			  Python at every timestep.
+			- multizone[n_zones=N,n_stars=M]: A multizone model with N zones
+			  linked by gas migration, forming M star particles per zone per
+			  timestep, evolved for 2 Gyr in timesteps of 50 Myr, for
+			  N = 10, 100, and 1000 and M = 1 and 8.
+			- milkyway_setup[zone_width=0.5]: The setup of the ``milkyway``
+			  model over 13.2 Gyr, from constructing it (which reads the star
+			  particle data from the h277 simulation) to computing the zone
+			  history of every star particle, without evolving it. Requires
+			  the h277 data, which can be downloaded via
+			  ``vice.toolkit.hydrodisk.data.download``.
+			- output[kind=singlezone], output[kind=multizone]: Reading the
+			  output of a singlezone model and of a 10-zone multizone model
+			  with 8 star particles per zone per timestep.
+			- yield_integration[study=S]: IMF-integrated core collapse
+			  supernova yields of 8 elements from each study S.
+
+		The throughput of simulations is reported in zone-steps per second
+		(i.e. the number of zones times the number of timesteps per second),
+		and that of yield integration in integrations per second.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> [i.name for i in vice.benchmarks.scenarios()][:3]
+	['singlezone[dt=0.01]', 'singlezone[dt=0.001]',
+	'singlezone_functional[dt=0.01]']
+	"""
+	scenarios = [singlezone_scenario(dt) for dt in _SINGLEZONE_DT_]
+	scenarios.append(singlezone_functional_scenario(_SINGLEZONE_DT_[0]))
+	for n_zones in _MULTIZONE_N_ZONES_:
+		for n_stars in _MULTIZONE_N_STARS_:
+			scenarios.append(multizone_scenario(n_zones, n_stars))
+	scenarios.append(milkyway_setup_scenario(_MILKYWAY_ZONE_WIDTH_))
+	scenarios.append(singlezone_output_scenario())
+	scenarios.append(multizone_output_scenario())
+	for study in _YIELD_STUDIES_:
+		scenarios.append(yield_integration_scenario(study))
+	return scenarios
+
+
+def output_times(end, dt):
+	r"""
+	The output times of a benchmark simulation: every timestep from 0 to
+	``end`` (inclusive).
+	"""
+	n = int(round(end / dt))
+	return [i * dt for i in range(n + 1)]
+
+
+def singlezone_scenario(dt):
+	r"""
+	The default singlezone model evolved for 10 Gyr with a given timestep
+	size.
+	"""
+	def function():
+		times = output_times(_SINGLEZONE_END_TIME_, dt)
+		singlezone(name = "benchmark", dt = dt).run(times, overwrite = True)
+		return len(times) - 1
+	return benchmark("singlezone", function, params = {"dt": dt},
+		unit = "zone-steps")
+
+
+def singlezone_functional_scenario(dt):
+	r"""
+	The default singlezone model evolved for 10 Gyr with functional yields
+	from all three enrichment channels and a functional star formation
+	efficiency timescale.
+	"""
+	def function():
+		times = output_times(_SINGLEZONE_END_TIME_, dt)
+		settings = [ccsne.settings['o'], sneia.settings['fe'],
+			agb.settings['sr']]
+		try:
+			ccsne.settings['o'] = lambda z: 0.015 * (1 + z / 0.014)
+			sneia.settings['fe'] = lambda z: 0.0012 * (1 + z / 0.014)
+			agb.settings['sr'] = lambda m, z: 1.e-7 * m * (z / 0.014)
+			sz = singlezone(name = "benchmark", dt = dt,
+				tau_star = lambda t, mgas: 2 * (mgas / 6.e9)**-0.5)
+			with warnings.catch_warnings():
+				# about the integration time of functional yields
+				warnings.simplefilter("ignore")
+				sz.run(times, overwrite = True)
+		finally:
+			ccsne.settings['o'] = settings[0]
+			sneia.settings['fe'] = settings[1]
+			agb.settings['sr'] = settings[2]
+		return len(times) - 1
+	return benchmark("singlezone_functional", function, params = {"dt": dt},
+		unit = "zone-steps")
+
+
+def multizone_scenario(n_zones, n_stars):
+	r"""
+	A multizone model with a given number of zones, each exchanging gas with
+	its neighbors, and a given number of star particles per zone per
+	timestep.
+	"""
+	def function():
+		times = output_times(_MULTIZONE_END_TIME_, _MULTIZONE_DT_)
+		mz = multizone(name = "benchmark", n_zones = n_zones,
+			n_stars = n_stars)
+		for i in range(n_zones):
+			mz.zones[i].dt = _MULTIZONE_DT_
+			if i: mz.migration.gas[i][i - 1] = 0.005
+			if i < n_zones - 1: mz.migration.gas[i][i + 1] = 0.005
+		mz.run(times, overwrite = True)
+		return n_zones * (len(times) - 1)
+	return benchmark("multizone", function, params = {"n_zones": n_zones,
+		"n_stars": n_stars}, unit = "zone-steps")
+
+
+def milkyway_setup_scenario(zone_width):
+	r"""
+	The setup of the milkyway model, from its construction through the
+	computation of the zone history of each star particle. The setup phases
+	of vice.multizone.run are called directly, such that the model is never
+	evolved.
+	"""
+	def requires():
+		if _h277_exists():
+			return None
+		else:
+			return """Requires the h277 star particle data. Download it via \
+vice.toolkit.hydrodisk.data.download()."""
+
+	def function():
+		times = output_times(_MILKYWAY_END_TIME_, _MILKYWAY_DT_)
+		start = time.perf_counter()
+		mw = milkyway(name = "benchmark", zone_width = zone_width)
+		construction = time.perf_counter() - start
+		for i in range(mw.n_zones): mw.zones[i].dt = _MILKYWAY_DT_
+		mz = mw._multizone__c_version
+		timings = {}
+		mz.align_name_attributes()
+		try:
+			# the same steps as vice.multizone.run up to the evolution
+			with _pyutils.phase_timer(timings, "prep"): mz.prep(times)
+			mz.outfile_check(True)
+			os.mkdir("benchmark.vice")
+			for i in range(mw.n_zones): os.mkdir("%s.vice" % (
+				mw.zones[i].name))
+			mz.setup_migration(timings = timings)
+		finally:
+			mz.dealign_name_attributes()
+		setup = sum([timings[i]["wall"] for i in ["prep",
+			"setup_gas_migration", "setup_tracers"]])
+		return {"work": None, "time": construction + setup}
+	return benchmark("milkyway_setup", function,
+		params = {"zone_width": zone_width}, requires = requires)
+
+
+def singlezone_output_scenario():
+	r"""
+	Reading the output of the default singlezone model evolved for 10 Gyr.
+	"""
+	def setup():
+		singlezone(name = "benchmark_output").run(
+			output_times(_SINGLEZONE_END_TIME_, _SINGLEZONE_DT_[0]),
+			overwrite = True)
+
+	def function():
+		output("benchmark_output")
+
+	return benchmark("output", function, params = {"kind": "singlezone"},
+		setup = setup)
+
+
+def multizone_output_scenario():
+	r"""
+	Reading the output of a 10-zone multizone model with 8 star particles per
+	zone per timestep, including the star particle data.
+	"""
+	def setup():
+		mz = multizone(name = "benchmark_multioutput", n_zones = 10,
+			n_stars = 8)
+		mz.run(output_times(_MULTIZONE_END_TIME_, 0.01), overwrite = True)
+
+	def function():
+		multioutput("benchmark_multioutput")
+
+	return benchmark("output", function, params = {"kind": "multizone"},
+		setup = setup)
+
+
+def yield_integration_scenario(study):
+	r"""
+	IMF-integrated core collapse supernova yields of several elements from a
+	given study.
+	"""
+	def function():
+		for element in _YIELD_ELEMENTS_:
+			ccsne.fractional(element, study = study)
+		return len(_YIELD_ELEMENTS_)
+	return benchmark("yield_integration", function,
+		params = {"study": study}, unit = "integrations")
+
@@ -0,0 +1,31 @@
+
+from __future__ import absolute_import
+try:
+	__VICE_SETUP__
+except NameError:
+	__VICE_SETUP__ = False
+
+if not __VICE_SETUP__:
+
+	__all__ = ["test"]
+	from ...testing import moduletest
+	from .benchmark import test_measure
+	from .benchmark import test_scenarios
+	from .benchmark import test_compare
+
+	@moduletest
+	def test():
+		r"""
+		vice.benchmarks module test
+		"""
+		return ["vice.benchmarks",
+			[
+				test_measure(),
+				test_scenarios(),
+				test_compare()
+			]
+		]
+
+else:
+	pass
+
@@ -0,0 +1,93 @@
+
+from __future__ import absolute_import
+__all__ = ["test_measure", "test_scenarios", "test_compare"]
+from ..benchmark import benchmark
+from ..scenarios import scenarios
+from ..runner import compare
+from ...testing import unittest
+
+
+@unittest
+def test_measure():
+	r"""
+	vice.benchmarks.benchmark.measure unittest
+	"""
+	def test():
+		r"""
+		Measuring a scenario must report its time, peak memory usage, and
+		throughput, or the reason it was skipped or failed.
+		"""
+		def fails():
+			raise ValueError("example")
+		def works():
+			sum(range(10000))
+			return 200
+		try:
+			result = benchmark("example", works, params = {"n": 200},
+				unit = "examples").measure(repeat = 2)
+			status = result["name"] == "example[n=200]"
+			status &= result["time"] > 0
+			status &= result["peak_rss"] > 0
+			status &= result["unit"] == "examples/s"
+			status &= abs(result["throughput"] * result["time"] - 200) < 1.e-6
+			result = benchmark("example", fails).measure()
+			status &= result["error"] == "ValueError: example"
+			result = benchmark("example", fails,
+				requires = lambda: "example").measure()
+			status &= result["skipped"] == "example"
+			result = benchmark("example", lambda: {"work": 2, "time": 0.5},
+				unit = "examples").measure()
+			status &= result["time"] == 0.5 and result["throughput"] == 4
+		except:
+			return False
+		return status
+	return ["vice.benchmarks.benchmark.measure", test]
+
+
+@unittest
+def test_scenarios():
+	r"""
+	vice.benchmarks.scenarios unittest
+	"""
+	def test():
+		r"""
+		Each scenario must have a unique name.
+		"""
+		try:
+			names = [i.name for i in scenarios()]
+			status = len(names) == len(set(names))
+			status &= "multizone[n_zones=1000,n_stars=8]" in names
+		except:
+			return False
+		return status
+	return ["vice.benchmarks.scenarios", test]
+
+
+@unittest
+def test_compare():
+	r"""
+	vice.benchmarks.compare unittest
+	"""
+	def test():
+		r"""
+		Only scenarios ran successfully in both runs are compared.
+		"""
+		baseline = {"results": [
+			{"name": "a", "time": 2., "peak_rss": 100.},
+			{"name": "b", "error": "example"},
+			{"name": "c", "time": 1., "peak_rss": 100.}
+		]}
+		results = {"results": [
+			{"name": "a", "time": 1., "peak_rss": 150.},
+			{"name": "b", "time": 1., "peak_rss": 100.},
+			{"name": "c", "skipped": "example"}
+		]}
+		try:
+			ratios = compare(baseline, results)
+			status = list(ratios.keys()) == ["a"]
+			status &= ratios["a"] == {"time": 0.5, "peak_rss": 1.5}
+		except:
+			return False
+		return status
+	return ["vice.benchmarks.compare", test]
+
@@ -2,8 +2,14 @@
 
 from __future__ import absolute_import
 from .objects._imf cimport IMF_
+from .objects._imf cimport IMF_N_MASSES
+from .objects._imf cimport imf_tabulation_mass
+from .objects._imf cimport imf_integrate_table
 from .objects._callback_1arg cimport CALLBACK_1ARG
 from .objects._callback_2arg cimport CALLBACK_2ARG
+from .objects._interp_scheme_2d cimport INTERP_SCHEME_2D
+from .objects._element cimport ELEMENT
+from .objects._timings cimport TIMINGS
 
 cdef extern from "../src/io/progressbar.h":
 	ctypedef struct PROGRESSBAR:
@@ -47,10 +53,15 @@ cdef void callback_1arg_setup(CALLBACK_1ARG *cb1, value) except *
 cdef void callback_2arg_setup(CALLBACK_2ARG *cb2, value) except *
 cdef double callback_1arg(double x, void *f)
 cdef double callback_2arg(double x, double y, void *f)
+cdef void callback_timing_register(value, label) except *
+cdef void callback_timing_collect(timings, values) except *
 cdef void setup_imf(IMF_ *imf, IMF) except *
+cdef void tabulate_imf(IMF_ *imf, IMF) except *
+cdef void setup_agb_grid(ELEMENT *e, element, study) except *
 cdef void set_string(char *dest, pystr) except *
 cdef int *ordinals(pystr) except *
 cdef double *copy_pylist(pylist) except *
 cdef double **copy_2Dpylist(pylist) except *
+cdef void add_c_timings(timings, TIMINGS *c_timings) except *
 cdef double *map_pyfunc_over_array(pyfunc, pyarray) except *
 
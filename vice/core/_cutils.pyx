@@ -16,7 +16,9 @@ from . import _pyutils
 from ..yields import agb
 from ..yields import ccsne
 from ..yields import sneia
+import threading
 import warnings
+import weakref
 import numbers
 import math as m
 import sys
@@ -29,6 +31,7 @@ else:
 
 from libc.stdlib cimport malloc, free
 from libc.string cimport strlen
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
 from . cimport _cutils
 
 
@@ -463,6 +466,17 @@ cdef double callback_1arg(double x, void *f):
 
 	.. seealso:: vice/core/callback.py
 	"""
+	cdef double start
+	cdef double result
+	if _CALLBACK_TIMINGS_:
+		record = _CALLBACK_TIMINGS_.get(id(<object> f))
+		if record is not None:
+			start = wall_seconds()
+			result = <double> (<object> f)(x)
+			callback_timer_stop(record, start, 1)
+			return result
+		else: pass
+	else: pass
 	# pythonic callback objects handle errors
 	return <double> (<object> f)(x)
 
@@ -495,10 +509,106 @@ cdef double callback_2arg(double x, double y, void *f):
 
 	.. seealso:: vice/core/callback.py
 	"""
+	cdef double start
+	cdef double result
+	if _CALLBACK_TIMINGS_:
+		record = _CALLBACK_TIMINGS_.get(id(<object> f))
+		if record is not None:
+			start = wall_seconds()
+			result = <double> (<object> f)(x, y)
+			callback_timer_stop(record, start, 1)
+			return result
+		else: pass
+	else: pass
 	# pythonic callback objects handle errors
 	return <double> (<object> f)(x, y)
 
 
+"""
+The functions which the C library calls back into Python that are being timed,
+keyed by the id of their callback objects. Each record is a list of the form
+[label, calls, wall]. Callback objects which are not registered here,
+including all of them when no simulation is being profiled, are called without
+timing them.
+"""
+_CALLBACK_TIMINGS_ = {}
+
+
+cdef void callback_timing_register(value, label) except *:
+	r"""
+	Start timing the calls to a function which the C library calls back into
+	Python.
+
+	Parameters
+	----------
+	value : <function> or real number
+		The function, already wrapped by one of the callback objects in
+		vice/core/callback.py. Real numbers are ignored, as the C library
+		does not call back into Python for them.
+	label : str
+		The name of the attribute which the function describes (e.g.
+		"ccsne yield of fe"), under which it is reported in the timings of
+		the simulation.
+
+	.. seealso:: vice/core/_pyutils.phase_timer
+	"""
+	if callable(value):
+		_CALLBACK_TIMINGS_[id(value)] = [label, 0, 0.]
+	else: pass
+
+
+cdef void callback_timing_collect(timings, values) except *:
+	r"""
+	Stop timing the calls to functions which the C library calls back into
+	Python, adding their number of calls and wall-clock time to the
+	"callbacks" entry of a simulation's timings.
+
+	Parameters
+	----------
+	timings : dict
+		The timings of the simulation (see vice.core._pyutils.phase_timer).
+	values : list
+		The functions passed to callback_timing_register. Those which were
+		never registered or never called are left out.
+
+	Notes
+	-----
+	Unlike the phases of the simulation, the CPU time is not recorded for
+	each function, as reading the CPU clock of the calling thread takes
+	several times longer than reading the wall clock and would slow down
+	simulations which call these functions many times.
+	"""
+	for value in values:
+		record = _CALLBACK_TIMINGS_.pop(id(value), None)
+		if record is not None and record[1]:
+			callbacks = timings.setdefault("callbacks", {})
+			if record[0] not in callbacks.keys():
+				callbacks[record[0]] = {"wall": 0., "calls": 0}
+			else: pass
+			callbacks[record[0]]["wall"] += record[2]
+			callbacks[record[0]]["calls"] += record[1]
+		else: pass
+
+
+cdef double wall_seconds():
+	r"""
+	Read the monotonic wall clock in seconds.
+	"""
+	cdef timespec ts
+	clock_gettime(CLOCK_MONOTONIC, &ts)
+	return ts.tv_sec + 1.e-9 * ts.tv_nsec
+
+
+cdef void callback_timer_stop(record, double start,
+	unsigned long calls) except *:
+	r"""
+	Add the time elapsed since ``start`` (see wall_seconds) and the number of
+	calls to a function in that time to its record in _CALLBACK_TIMINGS_.
+	"""
+	record[1] += calls
+	record[2] += wall_seconds() - start
+
+
 cdef void setup_imf(IMF_ *imf, IMF) except *:
 	r"""
 	Setup an IMF_ object.
@@ -531,11 +641,149 @@ cdef void setup_imf(IMF_ *imf, IMF) except *:
 	elif callable(IMF):
 		callback_1arg_setup(imf[0].custom_imf, IMF)
 		set_string(imf[0].spec, "custom")
+		tabulate_imf(imf, IMF)
 	else:
 		raise TypeError("""IMF must be either a string denoting a built-in \
 IMF or a callable function. Got: %s""" % (type(IMF)))
 
 
+# Tabulated IMFs which are known not to change from one call to the next,
+# keyed weakly by the function itself and then by the mass range. Simulations
+# running in parallel (see vice.singlezone.run_many) share them under the
+# lock.
+_IMF_TABLES_ = weakref.WeakKeyDictionary()
+_IMF_TABLES_MAXSIZE_ = 16
+_IMF_TABLES_LOCK_ = threading.Lock()
+
+
+cdef void tabulate_imf(IMF_ *imf, IMF) except *:
+	r"""
+	Sample a custom IMF at the stellar masses on which the C routines
+	integrate it, storing the result in the mass_distribution attribute and
+	its cumulative integrals in the mass_cumulative and returned_cumulative
+	attributes.
+
+	.. note:: This function assumes that the mass limits of star formation
+		have already been assigned.
+
+	Parameters
+	----------
+	imf : IMF_ *
+		A pointer to the IMF_ object
+	IMF : <function>
+		The user's custom IMF, possibly wrapped by one of the callback
+		objects in vice/core/callback.py.
+
+	Raises
+	------
+	* Exceptions raised by the IMF itself
+
+	Notes
+	-----
+	Only the IMFs built into VICE (vice.imf.kroupa and vice.imf.salpeter)
+	and ``vice.toolkit.interpolation.interp_scheme_1d`` objects, whose output
+	cannot change from one call to the next, have their tables cached. These
+	are held through weak references, so that a table is discarded along
+	with the object it was computed from. Any other function is tabulated
+	anew each time, as its output may depend on variables that change between
+	simulations.
+	"""
+	cdef unsigned long i
+	cdef double start = wall_seconds()
+	record = _CALLBACK_TIMINGS_.get(id(IMF))
+	function = getattr(IMF, "function", IMF)
+	key = (imf[0].m_lower, imf[0].m_upper)
+	if cacheable_imf(function):
+		with _IMF_TABLES_LOCK_:
+			tables = _IMF_TABLES_.setdefault(function, {})
+			table = tables.get(key)
+	else:
+		tables = None
+		table = None
+	if table is None:
+		table = [IMF(imf_tabulation_mass(imf[0], i)) for i in range(
+			IMF_N_MASSES)]
+		if record is not None:
+			callback_timer_stop(record, start, IMF_N_MASSES)
+		else: pass
+		if tables is not None:
+			with _IMF_TABLES_LOCK_:
+				if len(tables) >= _IMF_TABLES_MAXSIZE_:
+					tables.pop(next(iter(tables)), None)
+				else: pass
+				tables[key] = table
+		else: pass
+	else: pass
+	if imf[0].mass_distribution is not NULL: free(imf[0].mass_distribution)
+	imf[0].mass_distribution = copy_pylist(table)
+	imf_integrate_table(imf)
+
+
+def cacheable_imf(function):
+	r"""
+	Determine whether or not a tabulated IMF can be reused.
+
+	Parameters
+	----------
+	function : <function>
+		The user's custom IMF, unwrapped from any callback object.
+
+	Returns
+	-------
+	cacheable : bool
+		True if the function is one of the IMFs built into VICE or a
+		``vice.toolkit.interpolation.interp_scheme_1d`` object, False
+		otherwise.
+	"""
+	# imported here to avoid circular imports when VICE is first loaded
+	from .ssp._imf import kroupa, salpeter
+	from ..toolkit.interpolation.interp_scheme_1d import interp_scheme_1d
+	return (function is kroupa or function is salpeter or
+		type(function) is interp_scheme_1d)
+
+
+cdef void setup_agb_grid(ELEMENT *e, element, study) except *:
+	r"""
+	Copy a built-in AGB star yield grid into an ELEMENT struct.
+
+	Parameters
+	----------
+	e : ELEMENT *
+		A pointer to the ELEMENT object
+	element : str
+		The symbol of the element
+	study : str
+		The keyword denoting the study to adopt the yield grid from
+
+	Raises
+	------
+	* IOError
+		- The file containing the yield grid was not found
+
+	Notes
+	-----
+	The grid is obtained from the registry of yield tables in
+	vice/yields/_registry.py, such that the file is only parsed the first time
+	it is requested. Any grid previously held by the element is freed.
+	"""
+	yields, masses, metallicities = agb._grid_reader.cached_grid(element,
+		study)
+	cdef INTERP_SCHEME_2D *is2d = e[0].agb_grid[0].interpolator
+	cdef unsigned long i
+	if is2d[0].zcoords is not NULL:
+		for i in range(is2d[0].n_x_values):
+			free(is2d[0].zcoords[i])
+		free(is2d[0].zcoords)
+	else: pass
+	if is2d[0].xcoords is not NULL: free(is2d[0].xcoords)
+	if is2d[0].ycoords is not NULL: free(is2d[0].ycoords)
+	is2d[0].n_x_values = <unsigned long> len(masses)
+	is2d[0].n_y_values = <unsigned long> len(metallicities)
+	is2d[0].xcoords = copy_pylist(masses)
+	is2d[0].ycoords = copy_pylist(metallicities)
+	is2d[0].zcoords = copy_2Dpylist(yields)
+
+
 cdef void set_string(char *dest, pystr) except *:
 	r"""
 	Sets a string value (char *) given the python string it should be
@@ -646,6 +894,27 @@ cdef double **copy_2Dpylist(pylist) except *:
 	return copy
 
 
+cdef void add_c_timings(timings, TIMINGS *c_timings) except *:
+	r"""
+	Add the time spent in each phase of a simulation timed in C to its
+	timings.
+
+	Parameters
+	----------
+	timings : dict
+		The timings of the simulation (see vice.core._pyutils.phase_timer).
+	c_timings : TIMINGS *
+		The timings object which recorded the phases timed in C. Phases which
+		were never entered are left out.
+	"""
+	for i in range(len(_pyutils._TIMED_PHASES_)):
+		if c_timings[0].calls[i]:
+			_pyutils.add_timing(timings, _pyutils._TIMED_PHASES_[i],
+				c_timings[0].wall[i], c_timings[0].cpu[i],
+				c_timings[0].calls[i])
+		else: pass
+
+
 cdef double *map_pyfunc_over_array(pyfunc, pyarray) except *:
 	r"""
 	Map a python function across an array of values and store the output in
@@ -9,6 +9,7 @@ Contains under-the-hood utility functions for VICE's python side.
 
 from __future__ import division
 from .._globals import _VERSION_ERROR_
+from .._globals import VisibleRuntimeWarning
 try:
 	ModuleNotFoundError
 except NameError:
@@ -25,8 +26,13 @@ except (ModuleNotFoundError, ImportError):
 	pass
 import math as m
 import inspect
+import hashlib
+import struct
 import numbers
 import array
+import warnings
+import json
+import time
 import sys
 if sys.version_info[:2] == (2, 7):
 	strcomp = basestring
@@ -305,3 +311,191 @@ def format_time(seconds):
 	else:
 		raise TypeError("Must be a real number. Got: %s" % (type(seconds)))
 
+
+"""
+The phases of a simulation timed in C when it is profiled, in the order of
+the TIMING_* constants declared in vice/src/timings.h.
+"""
+_TIMED_PHASES_ = [
+	"setup_CRF",
+	"setup_MSMF",
+	"setup_RIa",
+	"gas_evolution",
+	"ccsne",
+	"sneia",
+	"agb",
+	"recycling",
+	"migration",
+	"mdf",
+	"history_output",
+	"mdf_output",
+	"tracer_output"
+]
+
+
+class phase_timer(object):
+
+	r"""
+	A context manager which adds the wall-clock and CPU time spent in a phase
+	of a simulation, and the call itself, to the simulation's timings.
+
+	Parameters
+	----------
+	timings : dict or None
+		The timings of the simulation, with one entry per phase, each of which
+		is a dict with keys "wall", "cpu", and "calls". None if the
+		simulation is not being profiled, in which case nothing is recorded.
+	phase : str
+		The name of the phase.
+
+	Notes
+	-----
+	The CPU time is that of the calling thread, such that simulations ran
+	concurrently in separate threads are timed independently.
+	"""
+
+	def __init__(self, timings, phase):
+		self._timings = timings
+		self._phase = phase
+		self._start = None
+
+	def __enter__(self):
+		if self._timings is not None:
+			self._start = [time.perf_counter(), time.thread_time()]
+		else: pass
+		return self
+
+	def __exit__(self, exc_type, exc_value, exc_tb):
+		if self._timings is not None:
+			add_timing(self._timings, self._phase,
+				time.perf_counter() - self._start[0],
+				time.thread_time() - self._start[1], 1)
+		else: pass
+		return False
+
+
+def add_timing(timings, phase, wall, cpu, calls):
+	r"""
+	Add time spent in a phase of a simulation to its timings.
+
+	Parameters
+	----------
+	timings : dict
+		The timings of the simulation (see phase_timer).
+	phase : str
+		The name of the phase.
+	wall : float
+		The wall-clock time in seconds.
+	cpu : float
+		The CPU time in seconds.
+	calls : int
+		The number of calls to the phase.
+	"""
+	if phase not in timings.keys():
+		timings[phase] = {"wall": 0., "cpu": 0., "calls": 0}
+	else: pass
+	timings[phase]["wall"] += wall
+	timings[phase]["cpu"] += cpu
+	timings[phase]["calls"] += calls
+
+
+def callback_warning(timings):
+	r"""
+	Summarize the time a profiled simulation spent in functional attributes
+	which the C library called back into Python for, in a
+	``VisibleRuntimeWarning``, if they accounted for most of the time spent
+	setting up and evolving it.
+
+	Parameters
+	----------
+	timings : dict
+		The timings of the simulation (see phase_timer). No warning is raised
+		if it has no "callbacks" entry, i.e. if no such functions were called,
+		or if they accounted for no more than half of the time spent in the
+		"prep" and "evolve" phases. Either way, they remain available in the
+		timings.
+	"""
+	if "callbacks" in timings.keys():
+		total = sum([timings[i]["wall"] for i in ["prep", "evolve"] if i in
+			timings.keys()])
+		spent = sum([i["wall"] for i in timings["callbacks"].values()])
+	else:
+		total = spent = 0
+	if spent > 0.5 * total:
+		callbacks = sorted(timings["callbacks"].items(),
+			key = lambda x: x[1]["wall"], reverse = True)
+		msg = """\
+Functional attributes called from VICE's C library accounted for %.3g of \
+%.3g seconds spent setting up and evolving the simulation:""" % (spent,
+			total)
+		for label, record in callbacks:
+			msg += "\n\t%s: %d calls, %.3g seconds (%.3g microseconds per \
+call)" % (label, record["calls"], record["wall"],
+				1.e6 * record["wall"] / record["calls"])
+		msg += """
+Replacing the most expensive of these functions with tabulated values or \
+built-in settings where possible can reduce the required integration time."""
+		warnings.warn(msg, VisibleRuntimeWarning)
+	else: pass
+
+
+def write_timings(timings, name):
+	r"""
+	Write the timings of a simulation to the file timings.json in its output
+	directory.
+
+	Parameters
+	----------
+	timings : dict
+		The timings of the simulation (see phase_timer).
+	name : str
+		The name of the simulation, without the '.vice' extension.
+	"""
+	with open("%s.vice/timings.json" % (name), 'w') as out:
+		json.dump(timings, out, indent = 4)
+		out.write("\n")
+
+
+def settings_hash(settings):
+	r"""
+	Compute a hash of the settings of a simulation which is the same from
+	one python session to the next.
+
+	Parameters
+	----------
+	settings : object
+		Numbers, strings, ``None``, functions, and any lists, tuples, and
+		dictionaries of them.
+
+	Returns
+	-------
+	hash : int
+		The first 8 bytes of the SHA-256 digest of a description of
+		``settings``, as an unsigned integer.
+
+	Notes
+	-----
+	Unlike the built-in ``hash``, this value does not depend on the hash seed
+	of the python session or the memory address of any object. Functions are
+	described by their module and name, and any other object by its type, so
+	changes to the body of a function are not detected.
+	"""
+	def describe(value):
+		if isinstance(value, dict):
+			return "{%s}" % (", ".join(["%s: %s" % (describe(key),
+				describe(value[key])) for key in sorted(value.keys(),
+				key = str)]))
+		elif isinstance(value, (list, tuple)):
+			return "[%s]" % (", ".join([describe(i) for i in value]))
+		elif value is None or isinstance(value, (numbers.Number, strcomp)):
+			return repr(value)
+		else:
+			if not (hasattr(value, "__qualname__") or hasattr(value,
+				"__name__")):
+				# an instance of a class rather than a function
+				value = type(value)
+			else: pass
+			return "%s.%s" % (getattr(value, "__module__", None), getattr(
+				value, "__qualname__", getattr(value, "__name__", None)))
+	digest = hashlib.sha256(describe(settings).encode()).digest()
+	return struct.unpack("<Q", digest[:8])[0]
@@ -7,7 +7,7 @@ from ..objects._fromfile cimport fromfile_free
 from ._base cimport base
 
 cdef extern from "../../src/dataframe/fromfile.h":
-	unsigned short fromfile_read(FROMFILE *ff)
+	unsigned short fromfile_read(FROMFILE *ff) nogil
 	double *fromfile_column(FROMFILE *ff, char *label)
 	unsigned short fromfile_modify_column(FROMFILE *ff, char *label,
 		double *arr)
@@ -17,3 +17,6 @@ cdef extern from "../../src/dataframe/fromfile.h":
 cdef class fromfile(base):
 	cdef FROMFILE *_ff
 
+
+cdef void set_labels(fromfile obj, labels) except *
+cdef void adopt_data(fromfile obj, FROMFILE *ff, name, labels) except *
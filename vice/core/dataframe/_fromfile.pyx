@@ -133,31 +133,17 @@ cdef class fromfile(base):
 
 	def __init__(self, filename = None, labels = None,
 		adopted_solar_z = None):
+		cdef FROMFILE *ff = self._ff
 		super().__init__({})
 		if os.path.exists(filename):
-			# Set the filename and read in the data
+			# Set the filename and read in the data. The file parser is pure C,
+			# so other threads may proceed (see vice.load_many).
 			set_string(self._ff[0].name, filename)
-			_fromfile.fromfile_read(self._ff)
+			with nogil:
+				_fromfile.fromfile_read(ff)
 			if self._ff[0].data is NULL: # Error reading the file
 				raise IOError("Error reading square data file: %s" % (filename))
-			labels = _pyutils.copy_array_like_object(labels)
-			labels = list(dict.fromkeys(labels))
-			if len(labels) == self._ff[0].n_cols:
-				if all(map(_pyutils.is_ascii, labels)):
-					# Copy labels into C
-					self._ff[0].labels = <char **> malloc (
-						self._ff[0].n_cols * sizeof(char *))
-					for i in range(self._ff[0].n_cols):
-						self._ff[0].labels[i] = <char *> malloc (
-							(len(labels[i]) + 1) * sizeof(char))
-						set_string(self._ff[0].labels[i],
-							labels[i])
-				else:
-					raise ValueError("All labels must be ascii.")
-			else:
-				raise ValueError("""Keyword arg 'labels' must be of \
-length the file dimension. File dimension: %d. Got: %d""" % (
-					self._ff[0].n_cols, len(labels)))
+			set_labels(self, labels)
 		else:
 			raise IOError("File not found: %s" % (filename))
 
@@ -377,3 +363,63 @@ Got: %s""" % (type(key)))
 		# data is stored in C -> no keys to delete from
 		raise TypeError("This dataframe does not support item deletion.")
 
+
+cdef void set_labels(fromfile obj, labels) except *:
+	"""
+	Copy the column labels of a fromfile object into C.
+
+	Parameters
+	==========
+	obj :: fromfile
+		The fromfile object whose data has been read in.
+	labels :: array-like
+		The strings to assign the column labels.
+
+	Raises
+	======
+	ValueError ::
+		:: 	A label is not ascii
+		::	The number of labels does not match the file dimension
+	"""
+	labels = _pyutils.copy_array_like_object(labels)
+	labels = list(dict.fromkeys(labels))
+	if len(labels) == obj._ff[0].n_cols:
+		if all(map(_pyutils.is_ascii, labels)):
+			# Copy labels into C
+			obj._ff[0].labels = <char **> malloc (
+				obj._ff[0].n_cols * sizeof(char *))
+			for i in range(obj._ff[0].n_cols):
+				obj._ff[0].labels[i] = <char *> malloc (
+					(len(labels[i]) + 1) * sizeof(char))
+				set_string(obj._ff[0].labels[i], labels[i])
+		else:
+			raise ValueError("All labels must be ascii.")
+	else:
+		raise ValueError("""Keyword arg 'labels' must be of \
+length the file dimension. File dimension: %d. Got: %d""" % (
+			obj._ff[0].n_cols, len(labels)))
+
+
+cdef void adopt_data(fromfile obj, FROMFILE *ff, name, labels) except *:
+	"""
+	Set up a fromfile object storing data already held in memory, rather than
+	read from a file (e.g. singlezone output with in_memory = True).
+
+	Parameters
+	==========
+	obj :: fromfile
+		A new instance of fromfile or one of its subclasses, created via
+		__new__ rather than __init__.
+	ff :: FROMFILE *
+		The data itself, whose labels have not yet been assigned. The fromfile
+		object takes ownership of this memory.
+	name :: str
+		The name to assign to the data.
+	labels :: array-like
+		The strings to assign the column labels.
+	"""
+	base.__init__(obj, {})
+	_fromfile.fromfile_free(obj._ff)
+	obj._ff = ff
+	set_string(obj._ff[0].name, name)
+	set_labels(obj, labels)
@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 from ..objects._fromfile cimport FROMFILE
 from ._fromfile cimport fromfile
+from ._fromfile cimport adopt_data
 
 
 cdef extern from "../../src/dataframe/history.h":
@@ -27,3 +28,7 @@ cdef class history(fromfile):
 	cdef double *_solar
 	cdef double _Z_solar
 
+
+cdef void setup_elements(history obj, adopted_solar_z) except *
+cdef history history_from_memory(FROMFILE *ff, name, labels,
+	adopted_solar_z)
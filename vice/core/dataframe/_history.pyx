@@ -216,22 +216,11 @@ cdef class history(fromfile):
 		adopted_solar_z = None):
 		super().__init__(filename = filename, labels =
 			_output_utils._load_column_labels_from_file_header(filename))
-		elements = self._load_elements()
-		self._n_elements = <unsigned> len(elements)
-		self._elements = <char **> malloc (self._n_elements * sizeof(char *))
-		for i in range(self._n_elements):
-			self._elements[i] = <char *> malloc ((len(elements) + 1) *
-				sizeof(char))
-			set_string(self._elements[i], elements[i])
-		self._solar = <double *> malloc (self._n_elements * sizeof(double))
-		from ._builtin_dataframes import solar_z
-		for i in range(self._n_elements):
-			self._solar[i] = solar_z[elements[i]]
-		self._Z_solar = adopted_solar_z
+		setup_elements(self, adopted_solar_z)
 
 	def _load_elements(self):
 		elements = []
-		for i in _output_utils._load_column_labels_from_file_header(self.name):
+		for i in fromfile.keys(self):
 			if i.startswith("mass("):
 				# Find elements based on the columns of reported masses
 				elements.append("%s" % (i.split('(')[1][:-1].lower()))
@@ -441,3 +430,51 @@ cdef class history(fromfile):
 		if "he" in elements: keys.append("y")
 		return keys
 
+
+cdef void setup_elements(history obj, adopted_solar_z) except *:
+	"""
+	Store the elements whose abundances are reported in a history object
+	along with their solar abundances.
+
+	Parameters
+	==========
+	obj :: history
+		The history object, whose data and labels have been set.
+	adopted_solar_z :: real number
+		The metallicity by mass of the sun adopted in the simulation.
+	"""
+	elements = obj._load_elements()
+	obj._n_elements = <unsigned> len(elements)
+	obj._elements = <char **> malloc (obj._n_elements * sizeof(char *))
+	for i in range(obj._n_elements):
+		obj._elements[i] = <char *> malloc ((len(elements[i]) + 1) *
+			sizeof(char))
+		set_string(obj._elements[i], elements[i])
+	obj._solar = <double *> malloc (obj._n_elements * sizeof(double))
+	from ._builtin_dataframes import solar_z
+	for i in range(obj._n_elements):
+		obj._solar[i] = solar_z[elements[i]]
+	obj._Z_solar = adopted_solar_z
+
+
+cdef history history_from_memory(FROMFILE *ff, name, labels,
+	adopted_solar_z):
+	"""
+	Construct a history object from singlezone output retained in memory
+	rather than written to a history.out file.
+
+	Parameters
+	==========
+	ff :: FROMFILE *
+		The output itself. The history object takes ownership of this memory.
+	name :: str
+		The name to assign to the data.
+	labels :: array-like
+		The strings to assign the column labels.
+	adopted_solar_z :: real number
+		The metallicity by mass of the sun adopted in the simulation.
+	"""
+	cdef history obj = history.__new__(history)
+	adopt_data(obj, ff, name, labels)
+	setup_elements(obj, adopted_solar_z)
+	return obj
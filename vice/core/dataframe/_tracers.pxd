@@ -18,8 +18,11 @@ cdef extern from "../../src/dataframe/tracers.h":
 		char **elements, double *solar, double Z_solar)
 	double *tracers_logarithmic_scaled(FROMFILE *ff, unsigned int n_elements,
 		char **elements, double *solar)
+	double *tracers_grouped_histogram(double *values, double *groups,
+		double *weights, unsigned long n_rows, double *bins,
+		unsigned long n_bins, double *group_bins, unsigned long n_groups)
 
 
 cdef class tracers(history):
-	pass
+	cdef double *_column(self, key) except *
 
@@ -14,6 +14,8 @@ else:
 from libc.stdlib cimport malloc, free
 from libc.string cimport strlen
 from .._cutils cimport set_string
+from .._cutils cimport copy_pylist
+from . cimport _fromfile
 from . cimport _tracers
 from . cimport _base
 
@@ -305,6 +307,182 @@ cdef class tracers(history):
 			free(item)
 			return _base.base(dict(zip(self.keys(), x)))
 
+	def histogram(self, key, bins, by = None, by_bins = None,
+		weights = "mass", density = False):
+		r"""
+		Sort the star particles into a histogram in some quantity, optionally
+		separated into groups according to another quantity.
+
+		**Signature**: x.histogram(key, bins, by = None, by_bins = None,
+		weights = "mass", density = False)
+
+		.. versionadded:: 1.4.0
+
+		Parameters
+		----------
+		x : ``tracers``
+			An instance of this class
+		key : ``str`` [case-insensitive]
+			The quantity to sort the star particles by (e.g. "[fe/h]",
+			"[o/fe]", "age"). Any key of this dataframe is allowed.
+		bins : array-like [elements are real numbers]
+			The bin edges of the histogram.
+		by : ``str`` [case-insensitive] [default : None]
+			The quantity to group star particles by (e.g. "zone_final",
+			"zone_origin", "age"). If None, all star particles are sorted into
+			a single histogram.
+		by_bins : array-like [elements are real numbers] [default : None]
+			The bin edges defining each group. If ``by`` is "zone_origin" or
+			"zone_final", this defaults to one group per zone. Required
+			otherwise.
+		weights : ``str`` [case-insensitive] [default : "mass"]
+			The quantity to weight each star particle by. If None, each
+			star particle is given equal weight.
+		density : ``bool`` [default : False]
+			If True, each histogram is normalized to have an integral of 1.
+
+		Returns
+		-------
+		hist : ``list``
+			The (weighted) number of star particles in each bin. If ``by`` is
+			not None, this is a 2-dimensional list with one histogram for each
+			group (i.e. ``hist[i][j]`` is the value in the j'th bin of the i'th
+			group). If the star particles are grouped by zone number with
+			``by_bins = None`` and there are none, this is an empty list.
+
+		Raises
+		------
+		* KeyError
+			- ``key``, ``by`` or ``weights`` is not a key of this dataframe
+		* TypeError
+			- ``bins`` or ``by_bins`` is not array-like or contains a
+			  non-numerical value
+		* ValueError
+			- ``bins`` or ``by_bins`` contains fewer than two bin edges
+			- ``by_bins`` is None and ``by`` is not a zone number
+
+		Notes
+		-----
+		The histograms are computed in C in a single pass over the star
+		particles. Star particles whose value of ``key`` or ``by`` is not a
+		finite number or lies outside of the bins are excluded.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> stars = vice.stars("example")
+		>>> bins = [-1 + 0.05 * i for i in range(31)]
+		>>> mdfs = stars.histogram("[fe/h]", bins, by = "zone_final",
+			density = True)
+		>>> len(mdfs)
+			10
+		>>> len(mdfs[0])
+			30
+		>>> # [O/Fe] distribution in bins of stellar age
+		>>> stars.histogram("[o/fe]", [-0.2 + 0.02 * i for i in range(31)],
+			by = "age", by_bins = [0, 2, 4, 6, 8, 10, 12])
+		"""
+		cdef double *values = NULL
+		cdef double *groups = NULL
+		cdef double *weights_ = NULL
+		cdef double *bins_ = NULL
+		cdef double *by_bins_ = NULL
+		cdef double *hist = NULL
+		cdef unsigned long n_groups = 1ul
+		cdef unsigned long i
+		bins = self._histogram_bins(bins, "bins")
+		if by is not None:
+			if not isinstance(by, strcomp): raise TypeError("""Keyword arg \
+'by' must be of type str. Got: %s""" % (type(by)))
+			if by_bins is None:
+				if by.lower() in ["zone_origin", "zone_final"]:
+					zones = self.__getitem__(by)
+					if not len(zones):
+						# no star particles, and therefore no zones
+						return []
+					else: pass
+					n_zones = 1 + int(max(zones))
+					by_bins = [zone - 0.5 for zone in range(n_zones + 1)]
+				else:
+					raise ValueError("""Keyword arg 'by_bins' is required if \
+grouping star particles by a quantity other than zone number.""")
+			else: pass
+			by_bins = self._histogram_bins(by_bins, "by_bins")
+			n_groups = len(by_bins) - 1
+		else: pass
+		if weights is not None and not isinstance(weights, strcomp):
+			raise TypeError("""Keyword arg 'weights' must be either None or \
+of type str. Got: %s""" % (type(weights)))
+		else: pass
+
+		try:
+			values = self._column(key)
+			if by is not None: groups = self._column(by)
+			if weights is not None: weights_ = self._column(weights)
+			bins_ = copy_pylist(bins)
+			if by is not None: by_bins_ = copy_pylist(by_bins)
+			hist = _tracers.tracers_grouped_histogram(values, groups, weights_,
+				self._ff[0].n_rows, bins_, len(bins) - 1, by_bins_, n_groups)
+			if hist is NULL: raise MemoryError("Could not allocate histogram.")
+			result = []
+			for i in range(n_groups):
+				result.append([hist[i * (len(bins) - 1) + j] for j in range(
+					len(bins) - 1)])
+		finally:
+			free(values)
+			free(groups)
+			free(weights_)
+			free(bins_)
+			free(by_bins_)
+			free(hist)
+
+		if density:
+			for i in range(n_groups):
+				norm = sum([result[i][j] * (bins[j + 1] - bins[j]) for j in range(
+					len(bins) - 1)])
+				if norm: result[i] = [j / norm for j in result[i]]
+		else: pass
+		if by is None:
+			return result[0]
+		else:
+			return result
+
+	@staticmethod
+	def _histogram_bins(value, name):
+		"""
+		Type-check and sort the bin edges passed to the histogram function.
+		"""
+		value = _pyutils.copy_array_like_object(value)
+		_pyutils.numeric_check(value, TypeError, """Keyword arg '%s' must \
+contain only numerical values.""" % (name))
+		if len(value) < 2: raise ValueError("""Keyword arg '%s' must contain \
+at least two bin edges. Got: %d""" % (name, len(value)))
+		return sorted(value)
+
+	cdef double *_column(self, key) except *:
+		"""
+		Obtain a C-level copy of one of the quantities in this dataframe.
+		Columns of the output file are copied without creating a python list.
+		"""
+		cdef double *item = NULL
+		cdef char *copy
+		if not isinstance(key, strcomp): raise KeyError("""Dataframe key must \
+be of type str. Got: %s""" % (type(key)))
+		key = key.lower()
+		if not _pyutils.is_ascii(key): raise KeyError(
+			"All keys and labels must be ascii.")
+		copy = <char *> malloc ((len(key) + 1) * sizeof(char))
+		set_string(copy, key)
+		item = _fromfile.fromfile_column(self._ff, copy)
+		free(copy)
+		if item is NULL:
+			# Quantities computed from the output file (e.g. [m/h], age,
+			# [x/y]) are obtained from __getitem__, which also raises a
+			# KeyError for unrecognized keys.
+			item = copy_pylist(self.__getitem__(key))
+		else: pass
+		return item
+
 	def keys(self):
 		r"""
 		Returns the keys to the dataframe in their lower-case format
@@ -36,7 +36,8 @@ def test():
 		[
 			test_initialize(),
 			test_keys(),
-			test_getitem(run = False)
+			test_getitem(run = False),
+			test_histogram()
 		]
 	]
 
@@ -122,3 +123,30 @@ def test_keys():
 		return True
 	return ["vice.core.dataframe.tracers.keys", test]
 
+
+@unittest
+def test_histogram():
+	r"""
+	vice.core.dataframe.tracers.histogram unit test
+	"""
+	def test():
+		try:
+			bins = [-3 + 0.05 * i for i in range(81)]
+			mdfs = _TEST_.histogram("[fe/h]", bins, by = "zone_final",
+				density = True)
+			assert len(mdfs) == 1 + int(max(_TEST_["zone_final"]))
+			for mdf in mdfs:
+				assert len(mdf) == len(bins) - 1
+				assert all(map(lambda x: x >= 0, mdf))
+				integral = sum([0.05 * i for i in mdf])
+				assert integral == 0 or abs(integral - 1) < 1e-10
+			# every star particle lands in exactly one zone and one age bin
+			counts = _TEST_.histogram("zone_origin", [-0.5, 0.5, 1.5, 2.5],
+				by = "age", by_bins = [0, 5, 10 + 1e-6], weights = None)
+			assert sum([sum(i) for i in counts]) == _TEST_.size[0]
+			mass = _TEST_.histogram("age", [0, 10 + 1e-6])
+			assert abs(mass[0] / sum(_TEST_["mass"]) - 1) < 1e-10
+		except:
+			return False
+		return True
+	return ["vice.core.dataframe.tracers.histogram", test]
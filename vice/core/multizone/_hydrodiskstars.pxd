@@ -7,8 +7,7 @@ from ..objects._tracer cimport TRACER
 
 
 cdef extern from "../../src/multizone/hydrodiskstars.h":
-	void set_hydrodiskstars_object(unsigned long address)
-	unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
-		unsigned int birth_zone, unsigned long birth_timestep,
+	unsigned short setup_hydrodisk_tracer(MULTIZONE mz, HYDRODISKSTARS hds,
+		TRACER *t, unsigned int birth_zone, unsigned long birth_timestep,
 		long analog_index)
 
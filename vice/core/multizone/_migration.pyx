@@ -76,7 +76,7 @@ cdef class mig_specs:
 
 	def __repr__(self):
 		rep = "Stars: %s\n" % (str(self._stars))
-		for i in range(22):
+		for i in range(27):
 			rep += ' '
 		rep += "Gas: "
 		for i in str(self._gas).split('\n'):
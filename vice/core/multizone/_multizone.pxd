@@ -4,6 +4,7 @@ from __future__ import absolute_import
 from ..objects._multizone cimport MULTIZONE
 from ..objects._multizone cimport multizone_initialize
 from ..objects._multizone cimport multizone_evolve
+from ..objects._multizone cimport multizone_calls_python
 from ..objects._multizone cimport multizone_cancel
 from ..objects._multizone cimport multizone_free
 from ..objects._multizone cimport link_zone
@@ -33,8 +33,11 @@ from libc.stdlib cimport malloc, free
 from libc.string cimport strlen
 from .._cutils cimport set_string
 from .._cutils cimport copy_pylist
+from .._cutils cimport add_c_timings
 from ..objects cimport _singlezone
+from ..objects cimport _timings
 from ..objects._tracer cimport TRACER
+from ..objects._hydrodiskstars cimport HYDRODISKSTARS
 from .. cimport _mlr
 from . cimport _hydrodiskstars
 from . cimport _tracer
@@ -42,6 +45,18 @@ from . cimport _zone_array
 from . cimport _multizone
 from . cimport _migration
 
+"""
+The number of arrays of doubles with one element per timestep stored by each
+zone in addition to two per element (the metallicity and the metallicity of
+infall): the output times, the outflow mass loading factor, its enhancement
+in metallicity, the star formation efficiency timescale, the specified
+evolutionary parameter, the star formation history, the cumulative return
+fraction, the main sequence mass fraction, and the SN Ia rate. The fixed
+memory overhead of each zone in bytes is an approximate measurement.
+"""
+_ZONE_ARRAYS_ = 9
+_ZONE_OVERHEAD_ = 5.e4
+
 """
 NOTES
 =====
@@ -77,7 +92,9 @@ cdef class c_multizone:
 		name = "multizonemodel",
 		n_stars = 1,
 		simple = False,
-		verbose = False):
+		verbose = False,
+		star_cadence = 1,
+		migration_cadence = 1):
 
 		assert isinstance(n_zones, int), "Internal Error"
 		assert n_zones > 0, "Internal Error"
@@ -104,7 +121,9 @@ cdef class c_multizone:
 		name = "multizonemodel",
 		n_stars = 1,
 		simple = False,
-		verbose = False):
+		verbose = False,
+		star_cadence = 1,
+		migration_cadence = 1):
 
 		assert isinstance(n_zones, int), "Internal Error"
 		assert n_zones > 0, "Internal Error"
@@ -113,6 +132,8 @@ cdef class c_multizone:
 		self.n_tracers = n_stars
 		self.simple = simple
 		self.verbose = verbose
+		self.tracer_cadence = star_cadence
+		self.migration_cadence = migration_cadence
 
 	def __dealloc__(self):
 		_multizone.multizone_free(self._mz)
@@ -214,6 +235,69 @@ Got: %g""" % (value))
 			raise TypeError("""Attribute 'n_stars' must be an integer. \
 Got: %s""" % (type(value)))
 
+	@property
+	def tracer_cadence(self):
+		# docstring in python version
+		return self._mz[0].mig[0].tracer_cadence
+
+	@tracer_cadence.setter
+	def tracer_cadence(self, value):
+		"""
+		The number of timesteps between the formation of each set of tracer
+		particles
+
+		Allowed Types
+		=============
+		real number
+
+		Allowed Values
+		==============
+		Positive integers
+		"""
+		self._mz[0].mig[0].tracer_cadence = self.cadence_check(value,
+			"star_cadence")
+
+	@property
+	def migration_cadence(self):
+		# docstring in python version
+		return self._mz[0].mig[0].migration_cadence
+
+	@migration_cadence.setter
+	def migration_cadence(self, value):
+		"""
+		The number of timesteps between migrations of gas and tracer particles
+		between zones
+
+		Allowed Types
+		=============
+		real number
+
+		Allowed Values
+		==============
+		Positive integers
+		"""
+		self._mz[0].mig[0].migration_cadence = self.cadence_check(value,
+			"migration_cadence")
+
+	@staticmethod
+	def cadence_check(value, name):
+		"""
+		Checks the value of a cadence in timesteps, returning it as an int.
+		"""
+		if isinstance(value, numbers.Number):
+			if value > 0:
+				if value % 1 == 0:
+					return int(value)
+				else:
+					raise ValueError("""Attribute '%s' must be \
+interpretable as an integer. Got: %g""" % (name, value))
+			else:
+				raise ValueError("""Attribute '%s' must be positive. \
+Got: %g""" % (name, value))
+		else:
+			raise TypeError("""Attribute '%s' must be an integer. \
+Got: %s""" % (name, type(value)))
+
 	@property
 	def verbose(self):
 		# docstring in python version
@@ -303,45 +387,98 @@ migration.specs. Got: %s""" % (type(value)))
 
 
 	def run(self, output_times, capture = False, overwrite = False,
-		pickle = True):
+		pickle = True, checkpoint = None, resume = False, profile = False,
+		max_memory = None):
 		"""
 		See docstring in python version of this class.
 		"""
+		if max_memory is not None: self.memory_check(output_times, max_memory)
+		if checkpoint is not None:
+			if not isinstance(checkpoint, numbers.Number):
+				raise TypeError("""Keyword arg 'checkpoint' must be a real \
+number or None. Got: %s""" % (type(checkpoint)))
+			elif checkpoint <= 0:
+				raise ValueError("""Keyword arg 'checkpoint' must be \
+positive. Got: %g""" % (checkpoint))
+			elif self.simple:
+				raise ValueError("""Checkpoints are not supported for \
+simulations ran in simple mode.""")
+			else: pass
+		else: pass
 		self.align_name_attributes()
-		self.prep(output_times)
-		cdef int enrichment
-		if self.outfile_check(overwrite):
-			os.system("mkdir %s.vice" % (self.name))
-			for i in range(self._mz[0].mig[0].n_zones):
-				os.system("mkdir %s.vice" % (self._zones[i].name))
-			self.setup_migration() # used to be in self.prep
-			start = time.time()
-
-			# warn the user about r-process elements, bad solar calibrations,
-			# and mass-lifetime relation effects
-			self._zones[0]._singlezone__c_version.nsns_warning()
-			self._zones[0]._singlezone__c_version.solar_z_warning()
-			self._zones[0]._singlezone__c_version.mlr_warnings()
-
-			# take the current mass-lifetime relation setting
-			self.import_mlr_data()
-			_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
-
-			# just do it #nike
-			enrichment = _multizone.multizone_evolve(self._mz)
-			if pickle: self.pickle()
-			self.free_mlr_data()
-
-			# save yield settings and attributes always
-			for i in range(self._mz[0].mig[0].n_zones):
-				self._zones[i]._singlezone__c_version.pickle()
-			canceled = False
-		else:
-			_multizone.multizone_cancel(self._mz)
-			enrichment = 0
-			canceled = True
-
-		self.dealign_name_attributes()
+		timings = {} if profile else None
+		cdef int enrichment = 0
+		cdef MULTIZONE *mz = self._mz
+		try:
+			with _pyutils.phase_timer(timings, "prep"):
+				self.prep(output_times, timings = timings)
+			if checkpoint is None:
+				self._mz[0].checkpoint = 0
+			else:
+				self._mz[0].checkpoint = max(1, int(round(
+					checkpoint / self._mz[0].zones[0][0].dt)))
+			self._mz[0].resume = resume and not self.simple and all(
+				[os.path.exists("%s.vice/%s" % (self.name, i)) for i in
+					["checkpoint.bin", "checkpoint_migration.bin"]])
+			if self._mz[0].checkpoint or self._mz[0].resume:
+				self._mz[0].settings_hash = self.settings_hash()
+			else: pass
+			if self._mz[0].resume or self.outfile_check(overwrite):
+				if self._mz[0].resume:
+					# the gas migration matrix and tracer particles' zone
+					# histories are restored from the checkpoint
+					_migration.malloc_gas_migration(self._mz)
+					_tracer.malloc_tracers(self._mz)
+				else:
+					os.system("mkdir %s.vice" % (self.name))
+					for i in range(self._mz[0].mig[0].n_zones):
+						os.system("mkdir %s.vice" % (self._zones[i].name))
+					# used to be in self.prep
+					self.setup_migration(timings = timings)
+				start = time.time()
+
+				# warn the user about r-process elements, bad solar
+				# calibrations, and mass-lifetime relation effects
+				self._zones[0]._singlezone__c_version.nsns_warning()
+				self._zones[0]._singlezone__c_version.solar_z_warning()
+				self._zones[0]._singlezone__c_version.mlr_warnings()
+
+				# take the current mass-lifetime relation setting
+				self.import_mlr_data()
+				_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
+
+				# just do it #nike
+				if profile: self.allocate_timings()
+				with _pyutils.phase_timer(timings, "evolve"):
+					if _multizone.multizone_calls_python(self._mz[0]):
+						enrichment = _multizone.multizone_evolve(mz)
+					else:
+						# release the GIL, allowing other threads to run
+						with nogil:
+							enrichment = _multizone.multizone_evolve(mz)
+				if profile:
+					self.free_timings(timings)
+					_pyutils.callback_warning(timings)
+				else: pass
+				if pickle:
+					with _pyutils.phase_timer(timings, "pickle"): self.pickle()
+				else: pass
+				self.free_mlr_data()
+
+				# save yield settings and attributes always
+				for i in range(self._mz[0].mig[0].n_zones):
+					with _pyutils.phase_timer(timings, "pickle"):
+						self._zones[i]._singlezone__c_version.pickle()
+				if profile: _pyutils.write_timings(timings, self.name)
+				canceled = False
+			else:
+				_multizone.multizone_cancel(self._mz)
+				enrichment = 0
+				canceled = True
+		finally:
+			# stop timing callbacks if canceled or an exception was raised
+			if profile: self.free_timings(timings)
+			self.dealign_name_attributes()
 		stop = time.time()
 		if enrichment == 1:
 			_multizone.multizone_cancel(self._mz)
@@ -352,6 +489,20 @@ migration.specs. Got: %s""" % (type(value)))
 zone and at least one timestep larger than 1.""")
 		elif enrichment == 3:
 			raise IOError("Couldn't save star particle data.")
+		elif enrichment == 4:
+			_multizone.multizone_cancel(self._mz)
+			raise RuntimeError("""Couldn't resume from the checkpoint in the \
+output directory. It is either corrupted or was written by a simulation with \
+different settings.""")
+		elif enrichment == 5:
+			warnings.warn("""Couldn't write a checkpoint to the output \
+directory. Checkpoints were disabled for the remainder of the simulation.""",
+				UserWarning)
+		elif enrichment == 6:
+			_multizone.multizone_cancel(self._mz)
+			raise ValueError("""Sum of migration likelihoods over the %d \
+timesteps between migrations (see attribute 'migration_cadence') larger than 1 \
+for at least one zone.""" % (self._mz[0].mig[0].migration_cadence))
 		else:
 			pass
 
@@ -369,7 +520,121 @@ zone and at least one timestep larger than 1.""")
 
 
 
-	def prep(self, output_times):
+	def estimate_resources(self, output_times):
+		"""
+		See docstring in python version of this class.
+		"""
+		output_times = _pyutils.copy_array_like_object(output_times)
+		_pyutils.numeric_check(output_times, TypeError, """Non-numerical \
+value detected in output times.""")
+		if not len(output_times): raise ValueError("Output times are empty.")
+		n_zones = self._mz[0].mig[0].n_zones
+		n_tracers = self._mz[0].mig[0].n_tracers
+		n_elements = len(self._zones[0].elements)
+		tracer_cadence = self._mz[0].mig[0].tracer_cadence
+		migration_cadence = self._mz[0].mig[0].migration_cadence
+		# the number of timesteps allocated for and ran, as in C
+		n_steps = int(max(output_times) / self._zones[0].dt)
+		n = _singlezone.BUFFER + n_steps
+
+		# the gas migration matrix: n_zones x n_zones doubles at each timestep
+		gas_migration = n * (self.malloc_size(n_zones * sizeof(double *)) +
+			n_zones * self.malloc_size(n_zones * sizeof(double)))
+
+		# star particles: a pointer, the struct, and the zone history of each
+		max_tracers = n_zones * n_tracers * (
+			(n + tracer_cadence - 1) // tracer_cadence)
+		star_particles = max_tracers * (sizeof(TRACER *) +
+			self.malloc_size(sizeof(TRACER)) +
+			self.malloc_size(n * sizeof(int)))
+
+		# each zone's time-dependent quantities (see _ZONE_ARRAYS_ above),
+		# the abundances tabulated for the MDF, and a fixed overhead
+		zones = n_zones * (_ZONE_OVERHEAD_ +
+			n * (_ZONE_ARRAYS_ + 2 * n_elements) * sizeof(double) +
+			(n_steps + 1) * n_elements * sizeof(double))
+
+		# the number of times the migration prescriptions are evaluated
+		births = [i for i in range(0, n, tracer_cadence) if
+			i <= n - _singlezone.BUFFER + 1]
+		if self.simple:
+			setup_stars = 2 * len(births)
+		else:
+			setup_stars = sum([n - _singlezone.BUFFER + 1 - i for i in births])
+		setup_stars *= n_zones * n_tracers
+
+		if self.simple:
+			evolve_gas = 0
+			evolve_stars = 0
+		else:
+			evolve_gas = ((n_steps + migration_cadence - 1) //
+				migration_cadence) * n_zones * (n_zones - 1) * (1 + n_elements)
+			evolve_stars = n_zones * n_tracers * sum([n_steps - i for i in
+				range(0, n_steps, tracer_cadence)])
+
+		memory = {
+			"gas_migration": gas_migration / 1024**2,
+			"star_particles": star_particles / 1024**2,
+			"zones": zones / 1024**2
+		}
+		memory["total"] = sum(memory.values())
+		return {
+			"memory": memory,
+			"setup": {
+				"gas_migration": n * n_zones**2,
+				"star_particles": setup_stars
+			},
+			"evolve": {
+				"zones": n_zones * n_steps,
+				"gas_migration": evolve_gas,
+				"star_particles": evolve_stars
+			}
+		}
+
+	@staticmethod
+	def malloc_size(size):
+		"""
+		The number of bytes occupied by a block of memory of a given size
+		allocated with malloc, which stores its size alongside it and aligns it
+		to 16 bytes.
+		"""
+		return max(32, 16 * ((size + sizeof(size_t) + 15) // 16))
+
+	def memory_check(self, output_times, max_memory):
+		"""
+		Raises a MemoryError with the estimated memory required by each part of
+		the simulation if it exceeds the maximum specified by the user.
+
+		Parameters
+		==========
+		output_times :: array-like
+			The output times passed to the run function.
+		max_memory :: real number
+			The maximum memory the simulation may use, in MB.
+		"""
+		if not isinstance(max_memory, numbers.Number):
+			raise TypeError("""Keyword arg 'max_memory' must be a real number \
+or None. Got: %s""" % (type(max_memory)))
+		elif max_memory <= 0:
+			raise ValueError("""Keyword arg 'max_memory' must be positive. \
+Got: %g""" % (max_memory))
+		else: pass
+		memory = self.estimate_resources(output_times)["memory"]
+		if memory["total"] > max_memory:
+			raise MemoryError("""\
+Estimated memory required by this simulation is %.1f MB, exceeding \
+max_memory = %g MB:
+	gas_migration: %.1f MB
+	star_particles: %.1f MB
+	zones: %.1f MB
+Consider fewer zones, fewer star particles, a larger star_cadence, or a \
+larger timestep size.""" % (memory["total"], max_memory,
+				memory["gas_migration"], memory["star_particles"],
+				memory["zones"]))
+		else: pass
+
+
+	def prep(self, output_times, timings = None):
 		"""
 		Prepares the simulation to be ran based on the current settings.
 
@@ -377,6 +642,9 @@ zone and at least one timestep larger than 1.""")
 		==========
 		output_times :: array-like
 			The array of values the user passed to run()
+		timings :: dict [default : None]
+			The time spent in each phase of the simulation, if it is being
+			profiled.
 
 		Raises
 		======
@@ -392,8 +660,10 @@ zone and at least one timestep larger than 1.""")
 		self.zone_alignment_warnings()
 		self.timestep_alignment_error()
 		self.mode_alignment_error()
+		self.adaptive_warning()
 		for i in range(self._mz[0].mig[0].n_zones):
-			times = self._zones[i]._singlezone__zone_prep(output_times)
+			times = self._zones[i]._singlezone__zone_prep(output_times,
+				timings = timings)
 			self._mz[0].zones[i][0].output_times = copy_pylist(
 				times)
 			self._mz[0].zones[i][0].n_outputs = len(times)
@@ -444,12 +714,53 @@ leaving only the results of the current simulation.\nOutput directory: \
 				return True
 
 
-	def setup_migration(self):
+	def setup_migration(self, timings = None):
 		"""
 		Sets up both the gas and stellar migration for simulation
+
+		Parameters
+		==========
+		timings :: dict [default : None]
+			The time spent in each phase of the simulation, if it is being
+			profiled.
+		"""
+		with _pyutils.phase_timer(timings, "setup_gas_migration"):
+			self.setup_gas_migration()
+		with _pyutils.phase_timer(timings, "setup_tracers"):
+			self.setup_tracers()
+
+
+	def allocate_timings(self):
+		"""
+		Allocate the timings object which records the time spent in each
+		phase of the simulation timed in C, shared by every zone.
+		"""
+		cdef _timings.TIMINGS *shared = _timings.timings_initialize()
+		for i in range(self._mz[0].mig[0].n_zones):
+			self._mz[0].zones[i][0].timings = shared
+
+
+	def free_timings(self, timings):
+		"""
+		Add the time spent in each phase of the simulation timed in C and in
+		each zone's functional attributes called from C to its timings, then
+		free the timings object shared by every zone. Calling it again has no
+		effect, such that it also cleans up after simulations which were
+		canceled or raised an exception.
+
+		Parameters
+		==========
+		timings :: dict
+			The time spent in each phase of the simulation.
 		"""
-		self.setup_gas_migration()
-		self.setup_tracers()
+		if self._mz[0].zones[0][0].timings is not NULL:
+			add_c_timings(timings, self._mz[0].zones[0][0].timings)
+			_timings.timings_free(self._mz[0].zones[0][0].timings)
+		else: pass
+		for i in range(self._mz[0].mig[0].n_zones):
+			self._mz[0].zones[i][0].timings = NULL
+			self._zones[i]._singlezone__c_version.collect_callback_timings(
+				timings)
 
 
 	def setup_gas_migration(self):
@@ -463,6 +774,8 @@ leaving only the results of the current simulation.\nOutput directory: \
 			:: 	one of the migration specifications produces a value that is
 				not between 0 and 1 at any timestep.
 		"""
+		cdef double *copy
+		cdef unsigned short status
 		_migration.malloc_gas_migration(self._mz)
 		cdef long length = 10l + long(
 			self._mz[0].zones[0].output_times[
@@ -490,27 +803,19 @@ proceed faster or slower as a function of the timestep size."""
 				"""
 				if isinstance(self.migration.gas[i][j], numbers.Number):
 					arr = length * [self.migration.gas[i][j]]
-					if _migration.setup_migration_element(self._mz[0],
-						self._mz[0].mig[0].gas_migration,
-						i, j, copy_pylist(arr)):
-
-						_multizone.multizone_cancel(self._mz)
-						raise RuntimeError(errmsg)
-					else:
-						pass
-			
 				elif callable(self.migration.gas[i][j]):
 					arr = list(map(self.migration.gas[i][j], eval_times))
-					if _migration.setup_migration_element(self._mz[0],
-						self._mz[0].mig[0].gas_migration,
-						i, j, copy_pylist(arr)):
-
-						_multizone.multizone_cancel(self._mz)
-						raise RuntimeError(errmsg)
-					else:
-						pass
 				else:
 					raise SystemError("Internal Error")
+				copy = copy_pylist(arr)
+				status = _migration.setup_migration_element(self._mz[0],
+					self._mz[0].mig[0].gas_migration, i, j, copy)
+				free(copy)
+				if status:
+					_multizone.multizone_cancel(self._mz)
+					raise RuntimeError(errmsg)
+				else:
+					pass
 
 
 	def setup_tracers(self):
@@ -521,6 +826,7 @@ proceed faster or slower as a function of the timestep size."""
 		and simulation time, and expect an int to be returned describing the
 		zone occupation number of that tracer particle at that time.
 		"""
+		cdef HYDRODISKSTARS *hds = NULL
 		n = _singlezone.n_timesteps(self._mz[0].zones[0][0])
 		eval_times = [i * self._mz[0].zones[0][0].dt for i in range(n + 1)]
 		takes_keyword = True
@@ -538,9 +844,8 @@ proceed faster or slower as a function of the timestep size."""
 		# determine if the user is using the hydrodiskstars object
 		if isinstance(self.migration.stars, hydrodiskstars):
 			if self.migration.stars.mode is not None:
-				_hydrodiskstars.set_hydrodiskstars_object(
-					self.migration.stars._hydrodiskstars__object_address()
-				)
+				hds = <HYDRODISKSTARS *> <void *> <long> (
+					self.migration.stars._hydrodiskstars__object_address())
 				using_hydrodisk = True
 				if type(self.migration.stars) != hydrodiskstars:
 					# if subclass, they haven't overridden the built-in
@@ -560,7 +865,8 @@ None.""" % (self.migration.stars.mode), UserWarning)
 			start = time.time() # for printing total setup time
 			pbar = progressbar(maxval = n)
 		else: pass
-		for i in range(n): # for each timestep
+		# for each timestep at which star particles form
+		for i in range(0, n, self.tracer_cadence):
 			for j in range(self.n_zones): # for each zone
 				if using_hydrodisk:
 					for k in range(self.n_tracers):
@@ -580,10 +886,10 @@ None.""" % (self.migration.stars.mode), UserWarning)
 									i * self._mz[0].zones[0][0].dt)
 						else: pass
 						# The index of this tracer particle
-						idx = (i * (self.n_zones * self.n_tracers) +
-							j * self.n_tracers + k)
+						idx = (i // self.tracer_cadence * (self.n_zones *
+							self.n_tracers) + j * self.n_tracers + k)
 						if _hydrodiskstars.setup_hydrodisk_tracer(self._mz[0],
-							self._mz[0].mig[0].tracers[idx], j, i,
+							hds[0], self._mz[0].mig[0].tracers[idx], j, i,
 							self.migration.stars.analog_index):
 							raise SystemError("Internal Error")
 						else: pass
@@ -642,8 +948,8 @@ None.""" % (self.migration.stars.mode), UserWarning)
 			if not self.simple: self.check_zone_history(zone_history,
 				timestep, zone)
 			# The index of this tracer particle
-			idx = (timestep * (self.n_zones * self.n_tracers) +
-				zone * self.n_tracers + i)
+			idx = (timestep // self.tracer_cadence * (self.n_zones *
+				self.n_tracers) + zone * self.n_tracers + i)
 			self.copy_zone_history(zone_history, idx, timestep, n_timesteps)
 
 
@@ -902,6 +1208,19 @@ its time of formation, must equal its zone of origin.""")
 		else: pass
 
 
+	def adaptive_warning(self):
+		r"""
+		Raises a UserWarning if any zones use adaptive timestepping while the
+		simulation isn't ran in simple mode, in which case it's ignored.
+		"""
+		if not self.simple and any([self._zones[i].adaptive for i in range(
+			self._mz[0].mig[0].n_zones)]):
+			warnings.warn("""Adaptive timestepping is only supported for \
+multizone simulations ran in simple mode. Zones will evolve with a fixed \
+timestep size.""", UserWarning)
+		else: pass
+
+
 	def import_mlr_data(self):
 		# import the mass-lifetime relation data on this extension
 		if mlr.setting in ["vincenzo2016", "hpt2000", "ka1997"]:
@@ -927,6 +1246,38 @@ its time of formation, must equal its zone of origin.""")
 		else: pass
 
 
+	def settings_hash(self):
+		"""
+		Compute a hash of the attributes, yield settings, and output times of
+		this simulation. Checkpoints record it, such that a simulation resumes
+		only from a checkpoint written with the same settings.
+
+		Returns
+		=======
+		hash :: int
+			The hash of the settings, as computed by
+			vice.core._pyutils.settings_hash. The attributes of each zone are
+			those saved by its pickle function, excluding its name and
+			verbosity.
+
+		Notes
+		=====
+		This function assumes that the output times have already been set
+		up by the prep function.
+		"""
+		settings = [self.n_tracers, self.tracer_cadence,
+			self.migration_cadence, self.simple, self.migration.stars,
+			[self.migration.gas[i].tolist() for i in range(self.n_zones)]]
+		for i in range(self.n_zones):
+			zone = self._zones[i]._singlezone__c_version
+			attrs = zone.pickled_attributes()
+			for key in ["name", "verbose"]: del attrs[key]
+			settings.append([attrs, zone.yield_settings()])
+		settings.append([self._mz[0].zones[0][0].output_times[i] for i in
+			range(self._mz[0].zones[0][0].n_outputs)])
+		return _pyutils.settings_hash(settings)
+
+
 	def pickle(self):
 		"""
 		Saves the parameters of this object in a series of pickles. A
@@ -949,6 +1300,8 @@ its time of formation, must equal its zone of origin.""")
 			"name": 			self.name,
 			"n_zones": 			self.n_zones,
 			"n_stars": 			self.n_tracers,
+			"star_cadence": 	self.tracer_cadence,
+			"migration_cadence": self.migration_cadence,
 			"simple": 			self.simple,
 			"verbose": 			self.verbose
 		}
@@ -48,7 +48,8 @@ class multizone(object):
 	is an array of ``singlezone`` objects.
 
 	**Signature**: vice.multizone(name = "multizonemodel", n_zones = 10,
-	n_stars = 1, simple = False, verbose = False)
+	n_stars = 1, simple = False, verbose = False, star_cadence = 1,
+	migration_cadence = 1)
 
 	.. versionadded:: 1.2.0
 
@@ -64,6 +65,12 @@ class multizone(object):
 		The attribute ``simple``, initialized via keyword argument. See below.
 	verbose : ``bool`` [default : False]
 		The attribute ``verbose``, initialized via keyword argument. See below.
+	star_cadence : ``int`` [default : 1]
+		The attribute ``star_cadence``, initialized via keyword argument. See
+		below.
+	migration_cadence : ``int`` [default : 1]
+		The attribute ``migration_cadence``, initialized via keyword argument.
+		See below.
 
 	Attributes
 	----------
@@ -88,9 +95,16 @@ class multizone(object):
 
 	n_stars : ``int`` [default : 1]
 		The number of star particles forming in each zone at each timestep.
+	star_cadence : ``int`` [default : 1]
+		The number of timesteps between the formation of each set of star
+		particles.
+	migration_cadence : ``int`` [default : 1]
+		The number of timesteps between migrations of gas and star particles
+		between zones.
 	simple : ``bool`` [default : False]
 		If True, each individual zone will be simulated as a one-zone model,
-		ignoring all migration prescriptions.
+		ignoring all migration prescriptions. This is the only mode in which
+		each zone's attribute ``adaptive`` is taken into account.
 	verbose : ``bool`` [default : False]
 		Whether or not to print to the console as the simulation runs.
 
@@ -98,6 +112,8 @@ class multizone(object):
 	---------
 	run : [instancemethod]
 		Run the simulation
+	estimate_resources : [instancemethod]
+		Estimate the memory and computational cost of running the simulation.
 	from_output : [classmethod]
 		Obtain a ``multizone`` object with the parameters of one that produced
 		an output.
@@ -154,6 +170,14 @@ class multizone(object):
 	~8.5 GB of data. Using 40 zones instead of 200 then requires ~250 MB of RAM
 	and fully integrates inover ~7 GB of total data in ~11 seconds.
 
+	**Adaptive Timestepping** :raw-html:`<br />`
+	Unless the simulation is ran in simple mode, all zones evolve with the
+	same fixed timestep size, as star particles must form and migrate between
+	zones at the same times in each of them. The attribute ``adaptive`` of
+	each zone is therefore ignored, and ``run`` raises a ``UserWarning`` if it
+	is turned on for any of them. In simple mode, each zone chooses the size
+	of its timesteps independently.
+
 	**Relationship to ``vice.singlezone``** :raw-html:`<br />`
 	This object makes use of composition. At its core, it is simply an array of
 	``singlezone`` objects, which the user may manipulate like all other
@@ -165,14 +189,16 @@ class multizone(object):
 	>>> mz = vice.multizone(n_zones = 3)
 	>>> mz
 		vice.multizone{
-			name -----------> multizonemodel
-			n_zones --------> 3
-			n_stars --------> 1
-			verbose --------> False
-			simple ---------> False
-			zones ----------> ['zone0', 'zone1', 'zone2']
-			migration ------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x10e2150e0>
-							  ISM:     MigrationMatrix{
+			name ----------------> multizonemodel
+			n_zones -------------> 3
+			n_stars -------------> 1
+			star_cadence --------> 1
+			migration_cadence ---> 1
+			verbose -------------> False
+			simple --------------> False
+			zones ---------------> ['zone0', 'zone1', 'zone2']
+			migration -----------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x10e2150e0>
+								   Gas:     MigrationMatrix{
 			0 ---------> {0.0, 0.0, 0.0}
 			1 ---------> {0.0, 0.0, 0.0}
 			2 ---------> {0.0, 0.0, 0.0}
@@ -213,6 +239,8 @@ Got: %s""" % (type(n_zones)))
 			"name": 			self.name,
 			"n_zones": 			self.n_zones,
 			"n_stars": 			self.n_stars,
+			"star_cadence": 	self.star_cadence,
+			"migration_cadence": self.migration_cadence,
 			"verbose": 			self.verbose,
 			"simple": 			self.simple,
 			"zones": 			[self.zones[i].name for i in range(
@@ -223,7 +251,7 @@ Got: %s""" % (type(n_zones)))
 		rep = "vice.multizone{\n"
 		for i in attrs.keys():
 			rep += "    %s " % (i)
-			for j in range(15 - len(i)):
+			for j in range(20 - len(i)):
 				rep += '-'
 			rep += "> %s\n" % (str(attrs[i]))
 		rep += '}'
@@ -310,14 +338,16 @@ Got: %s""" % (type(n_zones)))
 		>>> mz = vice.multizone.from_output("example")
 		>>> mz
 			vice.multizone{
-				name -----------> example
-				n_zones --------> 3
-				n_stars --------> 1
-				verbose --------> False
-				simple ---------> False
-				zones ----------> ['zone0', 'zone1', 'zone2']
-				migration ------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x111393f80>
-								  ISM:     MigrationMatrix{
+				name ----------------> example
+				n_zones -------------> 3
+				n_stars -------------> 1
+				star_cadence --------> 1
+				migration_cadence ---> 1
+				verbose -------------> False
+				simple --------------> False
+				zones ---------------> ['zone0', 'zone1', 'zone2']
+				migration -----------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x111393f80>
+									   Gas:     MigrationMatrix{
 					0 ---------> {0.0, 0.0, 0.0}
 					1 ---------> {0.0, 0.0, 0.0}
 					2 ---------> {0.0, 0.0, 0.0}
@@ -351,6 +381,10 @@ Got: %s""" % (type(arg)))
 			mz = cls(n_zones = attrs["n_zones"])
 			mz.name = attrs["name"]
 			mz.n_stars = attrs["n_stars"]
+			if "star_cadence" in attrs.keys():
+				mz.star_cadence = attrs["star_cadence"]
+				mz.migration_cadence = attrs["migration_cadence"]
+			else: pass
 			mz.simple = attrs["simple"]
 			mz.verbose = attrs["verbose"]
 			for i in range(mz.n_zones):
@@ -602,6 +636,90 @@ simulation was ran.""" % (i, j), UserWarning)
 	def n_stars(self, value):
 		self.__c_version.n_tracers = value
 
+	@property
+	def star_cadence(self):
+		r"""
+		Type : ``int``
+
+		Default : 1
+
+		The number of timesteps between the formation of each set of star
+		particles. Each set, ``n_stars`` per zone, stands in for all of the
+		stars which form in its zone of origin until the next set forms, and
+		has the abundances of the interstellar medium at the time it formed.
+		The gas and metals returned by these stars are computed as if they all
+		formed along with the set, which advances them by at most
+		``star_cadence`` timesteps.
+
+		.. versionadded:: 1.4.0
+
+		The memory required to store the star particles and the time spent
+		computing the enrichment from them scale with the number of star
+		particles. Forming them only every so many timesteps therefore makes
+		models with fine timesteps cheaper to integrate, without coarsening the
+		evolution of the gas in each zone, at the cost of lower resolution on
+		the ages and abundances of the star particles. The stellar
+		metallicity distribution functions are still weighted by the mass of
+		stars formed at each timestep.
+
+		.. seealso::
+			- vice.multizone.n_stars
+			- vice.multizone.migration_cadence
+
+		Example Code
+		------------
+		>>> import vice
+		>>> mz = vice.multizone(name = "example")
+		>>> mz.star_cadence
+			1
+		>>> mz.star_cadence = 5
+		"""
+		return self.__c_version.tracer_cadence
+
+	@star_cadence.setter
+	def star_cadence(self, value):
+		self.__c_version.tracer_cadence = value
+
+	@property
+	def migration_cadence(self):
+		r"""
+		Type : ``int``
+
+		Default : 1
+
+		The number of timesteps between migrations of gas and star particles
+		between zones. Each migration moves gas according to the attribute
+		``migration.gas`` summed over the timesteps since the previous one,
+		and moves star particles to the zone they occupy at the following
+		timestep according to ``migration.stars``. Migration also always
+		occurs at the final timestep.
+
+		.. versionadded:: 1.4.0
+
+		.. note:: The migration probabilities out of each zone, summed over
+			the timesteps between migrations, must not exceed 1. Otherwise,
+			the simulation will raise a ValueError when it runs. Increasing
+			this attribute therefore may require decreasing the entries of
+			``migration.gas``.
+
+		.. seealso::
+			- vice.multizone.migration
+			- vice.multizone.star_cadence
+
+		Example Code
+		------------
+		>>> import vice
+		>>> mz = vice.multizone(name = "example")
+		>>> mz.migration_cadence
+			1
+		>>> mz.migration_cadence = 10
+		"""
+		return self.__c_version.migration_cadence
+
+	@migration_cadence.setter
+	def migration_cadence(self, value):
+		self.__c_version.migration_cadence = value
+
 	@property
 	def verbose(self):
 		r"""
@@ -660,12 +778,14 @@ simulation was ran.""" % (i, j), UserWarning)
 		self.__c_version.simple = value
 
 	def run(self, output_times, capture = False, overwrite = False,
-		pickle = True):
+		pickle = True, checkpoint = None, resume = False, profile = False,
+		max_memory = None):
 		r"""
 		Run the simulation.
 
 		**Signature**: x.run(output_times, capture = False, overwrite = False,
-			pickle = True)
+			pickle = True, checkpoint = None, resume = False, profile = False,
+			max_memory = None)
 
 		Parameters
 		----------
@@ -683,6 +803,35 @@ simulation was ran.""" % (i, j), UserWarning)
 		pickle : ``bool`` [default : True]
 			If ``True``, VICE will save the attributes of this object with the
 			output. See below.
+		checkpoint : real number [default : None]
+			The interval in Gyr of simulated time at which VICE should save
+			the state of the simulation to the output directory, allowing it
+			to be resumed if interrupted. ``None`` to write no checkpoints.
+			See below.
+
+			.. versionadded:: 1.4.0
+
+		resume : ``bool`` [default : False]
+			If ``True`` and the output directory holds a checkpoint of this
+			simulation, VICE will continue the simulation from there rather
+			than starting from the beginning. See below.
+
+			.. versionadded:: 1.4.0
+
+		profile : ``bool`` [default : False]
+			If ``True``, the time spent in each phase of the simulation is
+			recorded and written to the file timings.json in the output
+			directory. See below.
+
+			.. versionadded:: 1.4.0
+
+		max_memory : real number [default : None]
+			The maximum memory in MB that the simulation may use, as estimated
+			by ``estimate_resources``. If the estimate exceeds it, a
+			``MemoryError`` is raised before any memory is allocated or output
+			written. ``None`` to not check.
+
+			.. versionadded:: 1.4.0
 
 		Returns
 		-------
@@ -691,16 +840,36 @@ simulation was ran.""" % (i, j), UserWarning)
 
 		Raises
 		------
+		* TypeError
+			- 	``checkpoint`` is neither a real number nor ``None``.
+			- 	``max_memory`` is neither a real number nor ``None``.
+		* ValueError
+			- 	``checkpoint`` is not positive, or is specified for a
+				simulation in simple mode.
+			- 	``max_memory`` is not positive.
+			- 	The migration probabilities out of any zone, summed over the
+				timesteps between migrations (see ``migration_cadence``),
+				exceed 1.
+		* MemoryError
+			- 	The estimated memory required by the simulation exceeds
+				``max_memory``. The error message lists the estimate for
+				each part of the simulation.
 		* RuntimeError
 			- 	A migration matrix cannot be setup properly according to the
 				current specifications.
 			- 	Any of the zones have duplicate names.
 			- 	The timestep size is not uniform across all zones.
+			- 	``resume == True`` and the checkpoint in the output directory
+				was written by a simulation with different settings.
 		* ScienceWarning
 			-	Any of the attributes ``IMF``, ``recycling``, ``delay``,
 				``RIa``, ``schmidt``, ``schmidt_index``, ``MgSchmidt``,
 				``m_upper``, ``m_lower``, or ``Z_solar`` aren't uniform across
 				all zones.
+		* UserWarning
+			-	Any of the zones has the attribute ``adaptive`` turned on
+				while ``simple == False``. The zones then evolve with a fixed
+				timestep size.
 
 		Other exceptions are raised by ``vice.singlezone.run``.
 
@@ -735,6 +904,26 @@ simulation was ran.""" % (i, j), UserWarning)
 			simulation. This may be one timestep beyond the last element of
 			the specified ``output_times`` array.
 
+		.. note::
+
+			When ``checkpoint`` is specified, VICE saves the gas migration
+			matrix and the zone histories of the star particles at the start
+			of the simulation, and the state of each zone and star particle
+			every ``checkpoint`` Gyr of simulated time thereafter, to binary
+			files in the output directory. These are removed once the
+			simulation finishes. Running the same simulation again with
+			``resume = True`` after an interruption restores the most recent
+			checkpoint without calling the migration prescriptions again, and
+			produces the same output as if the simulation had not been
+			interrupted. If there is no checkpoint to resume from, the
+			simulation starts from the beginning, subject to ``overwrite``.
+			Each checkpoint records a hash of the attributes of the simulation
+			and its zones, the yield settings, and the output times, and VICE
+			refuses to resume from it if any of these have changed. Functional
+			attributes are identified by their name, so changes to the body of
+			a function are not detected. Checkpoints are not portable between
+			machines, and are not supported in simple mode.
+
 		.. note::
 
 			If the keyword argument ``pickle == True``, VICE will attempt to
@@ -749,6 +938,32 @@ simulation was ran.""" % (i, j), UserWarning)
 			storage space required. This will, however, render the
 			vice.multizone.from_output function useless for that output.
 
+		.. note::
+
+			With ``profile == True``, VICE records the wall-clock time, the
+			CPU time of the thread running the simulation, and the number of
+			calls to each phase of the simulation listed in the docstring of
+			``vice.singlezone.run``, summed over all zones, along with the
+			following phases:
+
+				- setup_gas_migration: Evaluating the gas migration matrix at
+				  each timestep.
+				- setup_tracers: Computing the zone history of each star
+				  particle.
+				- migration: Moving gas and star particles between zones.
+				- tracer_output: Writing the star particle data to the
+				  tracers.out file.
+
+			In full mode, the phases sneia, agb, and recycling include the
+			sums over all star particles, and mdf includes adding each star
+			particle to the stellar metallicity distribution functions as it
+			forms. Calls to functional attributes defined in Python are timed
+			under the "callbacks" entry, summed over all zones, and summarized
+			in a ``VisibleRuntimeWarning`` if they account for more than half
+			of the time spent setting up and evolving the simulation. These
+			timings are available as the attribute ``timings`` of the
+			``multioutput`` object.
+
 		Example Code
 		------------
 		>>> import numpy as np
@@ -756,7 +971,94 @@ simulation was ran.""" % (i, j), UserWarning)
 		>>> mz = vice.multizone(name = "example")
 		>>> outtimes = np.linspace(0, 10, 1001)
 		>>> mz.run(outtimes)
+		>>> # checkpoint every Gyr, resuming if a previous run was interrupted
+		>>> mz.run(outtimes, overwrite = True, checkpoint = 1, resume = True)
+		>>> out = mz.run(outtimes, overwrite = True, capture = True,
+			profile = True)
+		>>> out.timings["setup_tracers"]
+		{'wall': 1.5731, 'cpu': 1.5729, 'calls': 1}
+		>>> # fail fast rather than exhausting the memory of the machine
+		>>> mz.run(outtimes, overwrite = True, max_memory = 8000)
 		"""
 		return self.__c_version.run(output_times, capture = capture,
-			overwrite = overwrite, pickle = pickle)
+			overwrite = overwrite, pickle = pickle, checkpoint = checkpoint,
+			resume = resume, profile = profile, max_memory = max_memory)
+
+	def estimate_resources(self, output_times):
+		r"""
+		Estimate the memory and computational cost of running the simulation
+		with its current parameters.
+
+		**Signature**: x.estimate_resources(output_times)
+
+		.. versionadded:: 1.4.0
+
+		Parameters
+		----------
+		x : ``multizone``
+			An instance of this class.
+		output_times : array-like [elements are real numbers]
+			The times in Gyr at which VICE would record output from the
+			simulation, as passed to the ``run`` function.
+
+		Returns
+		-------
+		resources : ``dict``
+			The estimated cost under the following keys:
+
+				- memory: The memory in MB required by the gas migration
+				  matrix ("gas_migration"), the star particles
+				  ("star_particles"), and the zones ("zones"), along with
+				  their sum ("total").
+				- setup: The number of elements of the gas migration matrix
+				  evaluated over all timesteps ("gas_migration"), and the
+				  number of zone numbers of star particles computed from the
+				  attribute ``migration.stars`` ("star_particles").
+				- evolve: The number of zone-steps ("zones"), the number of
+				  elements of the gas migration matrix applied to the gas and
+				  each element ("gas_migration"), and the number of times a
+				  star particle is evolved over one timestep
+				  ("star_particles").
+
+		Raises
+		------
+		* TypeError
+			- 	``output_times`` contains a non-numerical value.
+		* ValueError
+			- 	``output_times`` is empty.
+
+		Notes
+		-----
+		The memory required by the gas migration matrix grows with the square
+		of the number of zones, and that of the star particles with the number
+		of zones, the number of star particles formed per zone (see the
+		attributes ``n_stars`` and ``star_cadence``), and the square of the
+		number of timesteps. Both are allocated before the simulation begins.
+		The estimate of their size is exact up to the bookkeeping of the
+		system's memory allocator, while the memory required by each zone is
+		approximate. It does not include the memory used by Python and VICE
+		itself, which is typically about 100 MB.
+
+		The time spent setting up the simulation is roughly proportional to
+		the number of evaluations under the key "setup", and is dominated by
+		those of ``migration.stars`` when it is a function defined in Python
+		(it is one in C when using the ``hydrodiskstars`` object). The time
+		spent evolving it is roughly proportional to the number of
+		star particle-steps when there are many star particles, and to the
+		number of zone-steps otherwise. In simple mode, the zones evolve
+		independently, and there is no cost of migration while evolving.
+
+		Example Code
+		------------
+		>>> import numpy as np
+		>>> import vice
+		>>> mz = vice.multizone(name = "example", n_zones = 100, n_stars = 8)
+		>>> estimate = mz.estimate_resources(np.linspace(0, 10, 1001))
+		>>> estimate["memory"]
+		{'gas_migration': 79.4, 'star_particles': 3162.4, 'zones': 20.1,
+		'total': 3261.9}
+		>>> estimate["evolve"]["star_particles"]
+		400400000
+		"""
+		return self.__c_version.estimate_resources(output_times)
 
@@ -10,6 +10,11 @@ if not __VICE_SETUP__:
 	__all__ = ["test"]
 	from ....testing import moduletest
 	from .from_output import test_from_output
+	from .checkpoint import test_checkpoint
+	from .cadence import test_cadence
+	from .profile import test_profile
+	from .resources import test_resources
+	from .adaptive import test_adaptive
 	from . import mig_matrix_row
 	from . import mig_matrix
 	from . import mig_specs
@@ -25,6 +30,11 @@ if not __VICE_SETUP__:
 		return ["vice.multizone",
 			[
 				test_from_output(),
+				test_checkpoint(),
+				test_cadence(),
+				test_profile(),
+				test_resources(),
+				test_adaptive(),
 				mig_matrix_row.test(run = False),
 				mig_matrix.test(run = False),
 				mig_specs.test(run = False),
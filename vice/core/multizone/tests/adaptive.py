@@ -0,0 +1,37 @@
+from __future__ import absolute_import
+__all__ = ["test_adaptive"]
+from ..multizone import multizone
+from ....testing import unittest
+import warnings
+import os
+
+
+@unittest
+def test_adaptive():
+	r"""
+	vice.multizone adaptive timestepping unittest
+	"""
+	def test():
+		r"""
+		Simulations with adaptive timestepping turned on in any zone must
+		warn that it's ignored unless they're ran in simple mode.
+		"""
+		def ignored(simple):
+			mz = multizone(name = "test_adaptive", n_zones = 2)
+			mz.zones[1].adaptive = True
+			with warnings.catch_warnings(record = True) as caught:
+				warnings.simplefilter("always")
+				mz.simple = simple
+				mz.run([0.05 * i for i in range(21)], overwrite = True)
+			return any([issubclass(i.category, UserWarning) and
+				"Adaptive timestepping" in str(i.message) for i in caught])
+		try:
+			status = ignored(False)
+			status &= not ignored(True)
+			if os.path.exists("test_adaptive.vice"):
+				os.system("rm -rf test_adaptive.vice")
+			else: pass
+		except:
+			return False
+		return status
+	return ["vice.multizone.adaptive", test]
@@ -0,0 +1,58 @@
+from __future__ import absolute_import
+__all__ = ["test_cadence"]
+from ..multizone import multizone
+from ...outputs import output
+from ....testing import unittest
+
+
+@unittest
+def test_cadence():
+	r"""
+	vice.multizone star_cadence and migration_cadence unittest
+	"""
+	def test():
+		r"""
+		Runs the same simulation with star particles forming and migrating
+		every timestep and only every few timesteps. The coarser cadences must
+		produce fewer star particles of the same total mass, and must predict
+		similar gas masses and abundances after the first Gyr. Migration
+		summed over the timesteps between migrations must not exceed 1.
+		"""
+		def model(name, star_cadence, migration_cadence):
+			mz = multizone(name = name, n_zones = 3, n_stars = 2,
+				star_cadence = star_cadence,
+				migration_cadence = migration_cadence)
+			for i in range(mz.n_zones):
+				mz.zones[i].elements = ("fe", "sr", "o")
+			mz.migration.gas[0][1] = 0.01
+			mz.migration.gas[1][2] = 0.005
+			return mz
+		times = [0.05 * i for i in range(101)]
+		try:
+			model("test", 1, 1).run(times, overwrite = True)
+			model("test_cadence", 5, 4).run(times, overwrite = True)
+			a = output("test")
+			b = output("test_cadence")
+			status = 5 * (len(b.stars["mass"]) - 6) == len(a.stars["mass"]) - 6
+			mass = [sum(a.stars["mass"]), sum(b.stars["mass"])]
+			status &= abs(mass[1] - mass[0]) <= 0.01 * mass[0]
+			for i in range(3):
+				x = a.zones["zone%d" % (i)].history
+				y = b.zones["zone%d" % (i)].history
+				for j in range(20, len(times)):
+					status &= abs(x["mgas"][j] - y["mgas"][j]) <= (
+						0.05 * x["mgas"][j])
+					status &= abs(x["[o/h]"][j] - y["[o/h]"][j]) <= 0.02
+					status &= abs(x["[o/fe]"][j] - y["[o/fe]"][j]) <= 0.02
+			mz = model("test_cadence", 1, 4)
+			mz.migration.gas[0][1] = 0.3
+			try:
+				mz.run(times[:3], overwrite = True)
+				status = False
+			except ValueError:
+				pass
+		except:
+			return False
+		return status
+	return ["vice.multizone.cadence", test]
+
@@ -0,0 +1,117 @@
+from __future__ import absolute_import
+__all__ = ["test_checkpoint"]
+from ..multizone import multizone
+from ....testing import unittest
+import filecmp
+import shutil
+import os
+
+_FILES_ = ["checkpoint_migration.bin", "checkpoint.bin"]
+
+
+class snapshot:
+
+	r"""
+	A constant star formation efficiency timescale which, the first time it
+	is called at or after a given time, copies the checkpoint of the
+	simulation calling it and the length of its history files at that moment
+	into another directory. Being called from the simulation itself, the copy
+	is taken in the same thread at the same timestep on every run.
+	"""
+
+	def __init__(self, source, dest, time):
+		self.source = source
+		self.dest = dest
+		self.time = time
+		self.lengths = None
+
+	def __call__(self, t, mgas):
+		if (self.lengths is None and t >= self.time and
+			os.path.exists("%s.vice/%s" % (self.source, _FILES_[1]))):
+			os.mkdir(self.dest)
+			for i in _FILES_: shutil.copy("%s.vice/%s" % (self.source, i),
+				"%s/%s" % (self.dest, i))
+			self.lengths = [os.path.getsize(
+				"%s.vice/zone%d.vice/history.out" % (self.source, i)) for i in
+				range(3)]
+		else: pass
+		return 2
+
+
+@unittest
+def test_checkpoint():
+	r"""
+	vice.multizone checkpoint unittest
+	"""
+	def test():
+		r"""
+		Runs a simulation to completion while copying one of its checkpoints,
+		then truncates its output back to that checkpoint and resumes from
+		it, comparing the output to that of the uninterrupted simulation.
+		A simulation with different settings or a truncated checkpoint must
+		refuse to resume.
+		"""
+		def model(name, tau_star):
+			mz = multizone(name = name, n_zones = 3, n_stars = 2)
+			for i in range(mz.n_zones):
+				mz.zones[i].elements = ("fe", "sr", "o")
+				mz.zones[i].tau_star = tau_star
+			mz.migration.gas[0][1] = 0.05
+			mz.migration.gas[1][2] = 0.02
+			return mz
+		def truncate(lengths):
+			# the output as it would be had the simulation been interrupted
+			if os.path.exists("test_resumed.vice"):
+				shutil.rmtree("test_resumed.vice")
+			else: pass
+			shutil.copytree("test_checkpoint", "test_resumed.vice")
+			for i in range(3):
+				os.mkdir("test_resumed.vice/zone%d.vice" % (i))
+				with open("test.vice/zone%d.vice/history.out" % (i), 'rb') as f:
+					history = f.read(lengths[i])
+				with open("test_resumed.vice/zone%d.vice/history.out" % (i),
+					'wb') as f:
+					f.write(history)
+		times = [0.01 * i for i in range(501)]
+		try:
+			for name in ["test.vice", "test_resumed.vice", "test_checkpoint"]:
+				if os.path.exists(name): shutil.rmtree(name)
+			tau_star = snapshot("test", "test_checkpoint", 2.5)
+			model("test", tau_star).run(times, overwrite = True,
+				checkpoint = 0.1)
+			status = tau_star.lengths is not None
+			status &= not any([os.path.exists("test.vice/%s" % (i)) for i in
+				_FILES_])
+			truncate(tau_star.lengths)
+			changed = model("test_resumed", tau_star)
+			changed.zones[0].tau_star = 3
+			try:
+				changed.run(times, resume = True)
+				status = False
+			except RuntimeError:
+				pass
+			truncate(tau_star.lengths)
+			# cut off the end of the last star particle's data
+			with open("test_resumed.vice/%s" % (_FILES_[1]), 'rb') as f:
+				state = f.read()
+			with open("test_resumed.vice/%s" % (_FILES_[1]), 'wb') as f:
+				f.write(state[:-16])
+			try:
+				model("test_resumed", tau_star).run(times, resume = True)
+				status = False
+			except RuntimeError:
+				pass
+			truncate(tau_star.lengths)
+			model("test_resumed", tau_star).run(times, resume = True)
+			status &= not any([os.path.exists("test_resumed.vice/%s" % (i))
+				for i in _FILES_])
+			outputs = ["tracers.out"]
+			for i in range(3): outputs += [
+				"zone%d.vice/history.out" % (i), "zone%d.vice/mdf.out" % (i)]
+			for i in outputs:
+				status &= filecmp.cmp("test.vice/%s" % (i),
+					"test_resumed.vice/%s" % (i), shallow = False)
+		except:
+			return False
+		return status
+	return ["vice.multizone.checkpoint", test]
@@ -0,0 +1,63 @@
+from __future__ import absolute_import
+__all__ = ["test_profile"]
+from ..multizone import multizone
+from ...outputs import output
+from ..._cutils import _CALLBACK_TIMINGS_
+from ....testing import unittest
+import os
+
+
+@unittest
+def test_profile():
+	r"""
+	vice.multizone profiling unittest
+	"""
+	def test():
+		r"""
+		Profiled simulations must record the setup of the migration and the
+		per-timestep work of every zone, and write them to timings.json.
+		Calls to functional attributes must stop being timed even if the
+		simulation raises an exception.
+		"""
+		def func(t):
+			# the setter checks that the function can be called at t = 1
+			if 0.5 < t < 0.9: raise ValueError("test")
+			return 10
+		mz = multizone(name = "test", n_zones = 3)
+		for i in range(mz.n_zones):
+			mz.zones[i].elements = ("fe", "sr", "o")
+		mz.migration.gas[0][1] = 0.01
+		times = [0.05 * i for i in range(21)]
+		try:
+			out = mz.run(times, overwrite = True, capture = True,
+				profile = True)
+			status = os.path.exists("test.vice/timings.json")
+			status &= output("test").timings == out.timings
+			for phase in ["prep", "setup_elements", "setup_gas_migration",
+				"setup_tracers", "evolve", "migration", "tracer_output",
+				"pickle"]:
+				status &= phase in out.timings.keys()
+			n = out.timings["gas_evolution"]["calls"]
+			status &= out.timings["migration"]["calls"] == n
+			status &= out.timings["ccsne"]["calls"] == 9 * n
+			status &= out.timings["setup_elements"]["calls"] == 3
+			mz.simple = True
+			out = mz.run(times, overwrite = True, capture = True,
+				profile = True)
+			status &= "migration" not in out.timings.keys()
+			status &= out.timings["ccsne"]["calls"] == 9 * (
+				out.timings["gas_evolution"]["calls"] // 3)
+			mz.simple = False
+			mz.zones[0].tau_star = lambda t, mgas: 2
+			mz.zones[1].func = func
+			try:
+				mz.run(times, overwrite = True, profile = True)
+				status = False
+			except ValueError:
+				pass
+			status &= not _CALLBACK_TIMINGS_
+		except:
+			return False
+		return status
+	return ["vice.multizone.profile", test]
+
@@ -0,0 +1,64 @@
+from __future__ import absolute_import
+__all__ = ["test_resources"]
+from ..multizone import multizone
+from ....testing import unittest
+import os
+
+
+@unittest
+def test_resources():
+	r"""
+	vice.multizone.estimate_resources unittest
+	"""
+	def test():
+		r"""
+		The estimated cost of the gas migration matrix must scale with the
+		number of zones squared and the number of timesteps, and simulations
+		whose estimated memory exceeds max_memory must fail before writing
+		any output.
+		"""
+		times = [0.05 * i for i in range(21)]
+		try:
+			small = multizone(name = "test_resources", n_zones = 3)
+			large = multizone(name = "test_resources", n_zones = 6,
+				n_stars = 2)
+			for mz in [small, large]:
+				for i in range(mz.n_zones): mz.zones[i].dt = 0.05
+			estimates = [small.estimate_resources(times),
+				large.estimate_resources(times),
+				small.estimate_resources([2 * i for i in times])]
+			status = all([abs(sum([i["memory"][key] for key in [
+				"gas_migration", "star_particles", "zones"]]) -
+				i["memory"]["total"]) < 1.e-9 for i in estimates])
+			# 10 timesteps of memory are allocated beyond the final one
+			status &= estimates[0]["setup"]["gas_migration"] == 9 * 30
+			status &= estimates[1]["setup"]["gas_migration"] == 36 * 30
+			status &= estimates[2]["setup"]["gas_migration"] == 9 * 50
+			status &= estimates[0]["evolve"]["zones"] == 3 * 20
+			status &= estimates[1]["memory"]["gas_migration"] > (
+				estimates[0]["memory"]["gas_migration"])
+			# twice as many zones with twice as many star particles each
+			status &= abs(estimates[1]["memory"]["star_particles"] /
+				estimates[0]["memory"]["star_particles"] - 4) < 1.e-9
+			small.simple = True
+			status &= small.estimate_resources(times)["evolve"][
+				"star_particles"] == 0
+			if os.path.exists("test_resources.vice"):
+				os.system("rm -rf test_resources.vice")
+			else: pass
+			try:
+				small.run(times, overwrite = True, max_memory = 1.e-3)
+				status = False
+			except MemoryError:
+				pass
+			status &= not os.path.exists("test_resources.vice")
+			for value, error in [("1000", TypeError), (-1, ValueError)]:
+				try:
+					small.run(times, overwrite = True, max_memory = value)
+					status = False
+				except error:
+					pass
+		except:
+			return False
+		return status
+	return ["vice.multizone.estimate_resources", test]
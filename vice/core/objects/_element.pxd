@@ -24,6 +24,7 @@ cdef extern from "../../src/objects.h":
 		double unretained
 		double mass
 		double solar
+		unsigned short is_helium
 
 cdef extern from "../../src/objects/element.h":
 	ELEMENT *element_initialize()
@@ -10,11 +10,17 @@ cdef extern from "../../src/objects.h":
 		double m_lower
 		double m_upper
 		CALLBACK_1ARG *custom_imf
+		double *mass_distribution
+		double *mass_cumulative
+		double *returned_cumulative
 
 
 cdef extern from "../../src/imf.h":
+	unsigned long IMF_N_MASSES
 	IMF_ *imf_initialize(double m_lower, double m_upper)
 	void imf_free(IMF_ *imf)
+	double imf_tabulation_mass(IMF_ imf, unsigned long index)
+	unsigned short imf_integrate_table(IMF_ *imf)
 
 
 cdef IMF_ *imf_object(user_spec, m_lower, m_upper) except *
@@ -6,7 +6,8 @@ from ._imf cimport IMF_
 
 cdef extern from "../../src/objects.h":
 	ctypedef struct INTEGRAL:
-		double (*func)(double)
+		double (*func)(double, void *)
+		void *params
 		double a
 		double b
 		double tolerance
@@ -19,6 +19,7 @@ cdef extern from "../../src/objects.h":
 		double mgschmidt
 		double smoothing_time
 		int schmidt
+		unsigned long mode_code
 
 cdef extern from "../../src/objects/ism.h":
 	ISM *ism_initialize()
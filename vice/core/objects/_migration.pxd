@@ -14,6 +14,8 @@ cdef extern from "../../src/objects.h":
 		double ***gas_migration
 		_tracer.TRACER **tracers
 		FILE *tracers_output
+		unsigned long tracer_cadence
+		unsigned long migration_cadence
 
 
 cdef extern from "../../src/objects/migration.h":
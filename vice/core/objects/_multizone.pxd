@@ -11,6 +11,10 @@ cdef extern from "../../src/objects.h":
 		_migration.MIGRATION *mig
 		unsigned short verbose
 		unsigned short simple
+		unsigned long checkpoint
+		unsigned short resume
+		unsigned long settings_hash
+		long n_written
 
 
 cdef extern from "../../src/multizone/multizone.h":
@@ -18,6 +22,7 @@ cdef extern from "../../src/multizone/multizone.h":
 	void multizone_free(MULTIZONE *mz)
 	void link_zone(MULTIZONE *mz, unsigned long address,
 		unsigned int zone_index)
-	unsigned short multizone_evolve(MULTIZONE *mz)
+	unsigned short multizone_evolve(MULTIZONE *mz) nogil
+	unsigned short multizone_calls_python(MULTIZONE mz)
 	void multizone_cancel(MULTIZONE *mz)
 
@@ -6,6 +6,8 @@ from ._element cimport ELEMENT
 from ._ism cimport ISM
 from ._mdf cimport MDF
 from ._ssp cimport SSP
+from ._fromfile cimport FROMFILE
+from ._timings cimport TIMINGS
 
 cdef extern from "../../src/objects.h":
 	ctypedef struct SINGLEZONE:
@@ -24,6 +26,13 @@ cdef extern from "../../src/objects.h":
 		ISM *ism
 		MDF *mdf
 		SSP *ssp
+		unsigned short retain_ssp
+		unsigned short in_memory
+		FROMFILE *history_data
+		FROMFILE *mdf_data
+		double adaptive
+		unsigned long stride
+		TIMINGS *timings
 
 
 cdef extern from "../../src/singlezone.h":
@@ -32,7 +41,12 @@ cdef extern from "../../src/singlezone.h":
 	SINGLEZONE *singlezone_initialize()
 	void singlezone_free(SINGLEZONE *sz)
 	long singlezone_address(SINGLEZONE *sz)
-	unsigned short singlezone_evolve(SINGLEZONE *sz)
+	unsigned short singlezone_evolve(SINGLEZONE *sz) nogil
+	unsigned short singlezone_calls_python(SINGLEZONE sz)
 	void singlezone_cancel(SINGLEZONE *sz)
+	void singlezone_free_ssp(SINGLEZONE *sz)
 	unsigned long n_timesteps(SINGLEZONE sz)
 
+
+cdef extern from "../../src/io.h":
+	void singlezone_free_output(SINGLEZONE *sz)
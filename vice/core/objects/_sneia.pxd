@@ -9,6 +9,7 @@ cdef extern from "../../src/objects.h":
 	ctypedef struct SNEIA_YIELD_SPECS:
 		CALLBACK_1ARG *yield_
 		double *RIa
+		unsigned short RIa_borrowed
 		char *dtd
 		double tau_ia
 		double t_d
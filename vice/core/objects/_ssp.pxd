@@ -9,6 +9,7 @@ cdef extern from "../../src/objects.h":
 		IMF_ *imf
 		double *crf
 		double *msmf
+		unsigned short borrowed
 		double postMS
 		double R0
 		int continuous
@@ -0,0 +1,18 @@
+# cython: language_level = 3, boundscheck = False
+
+cdef extern from "../../src/objects.h":
+	ctypedef struct TIMINGS:
+		double *wall
+		double *cpu
+		unsigned long *calls
+		double *start_wall
+		double *start_cpu
+
+
+cdef extern from "../../src/objects/timings.h":
+	TIMINGS *timings_initialize()
+	void timings_free(TIMINGS *timings)
+
+
+cdef extern from "../../src/timings.h":
+	unsigned short N_TIMED_PHASES
@@ -11,6 +11,7 @@ if not __VICE_SETUP__:
 		"mdf",
 		"output",
 		"multioutput",
+		"load_many",
 		"stars",
 		"test"
 	]
@@ -18,6 +19,7 @@ if not __VICE_SETUP__:
 	from ._mdf import mdf
 	from .output import output
 	from .multioutput import multioutput
+	from .load_many import load_many
 	from ._tracers import tracers as stars
 	from .tests import test
 else:
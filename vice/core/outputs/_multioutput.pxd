@@ -8,4 +8,5 @@ cdef class c_multioutput:
 	cdef base _zones
 	cdef fromfile _stars
 	cdef object _name
+	cdef object _timings
 
@@ -38,6 +38,7 @@ cdef class c_multioutput:
 
 		# setup the tracers attribute as a tracers object
 		self._stars = _tracers.c_tracers(self._name)
+		self._timings = _output_utils._load_timings(self._name)
 
 	@property
 	def name(self):
@@ -72,3 +73,13 @@ cdef class c_multioutput:
 		"""
 		return self._stars
 
+	@property
+	def timings(self):
+		"""
+		Type :: dict
+
+		The time spent in each phase of the simulation, if it was profiled.
+		None otherwise.
+		"""
+		return self._timings
+
@@ -13,5 +13,7 @@ cdef class c_output:
 	cdef saved_yields _sneia_yields
 	cdef saved_yields _agb_yields
 	cdef object _name
+	cdef object _timings
 
-
+cdef c_output c_output_from_memory(name, history hist, fromfile mdf,
+	timings = *)
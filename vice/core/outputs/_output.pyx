@@ -58,6 +58,7 @@ cdef class c_output:
 		self._agb_yields = self.__load_saved_yields("agb", agb.settings)
 		self._ccsne_yields = self.__load_saved_yields("ccsne", ccsne.settings)
 		self._sneia_yields = self.__load_saved_yields("sneia", sneia.settings)
+		self._timings = _output_utils._load_timings(self._name)
 
 	@property
 	def name(self):
@@ -94,6 +95,11 @@ cdef class c_output:
 		# docstring in python version
 		return self._agb_yields
 
+	@property
+	def timings(self):
+		# docstring in python version
+		return self._timings
+
 	def show(self, key, xlim = None, ylim = None):
 		# docstring in python version
 		try:
@@ -285,3 +291,43 @@ ran.""" % (channel, i), UserWarning)
 				copy[i] = yields[i]
 		return saved_yields(copy, channel)
 
+
+cdef c_output c_output_from_memory(name, history hist, fromfile mdf,
+	timings = None):
+	"""
+	Construct a c_output object from singlezone output retained in memory
+	rather than written to files (see vice.singlezone.run).
+
+	Parameters
+	==========
+	name :: str
+		The name of the simulation.
+	hist :: history
+		The history output.
+	mdf :: fromfile
+		The stellar metallicity distribution function.
+	timings :: dict [default : None]
+		The time spent in each phase of the simulation, if it was profiled.
+
+	Returns
+	=======
+	The c_output object. Its yield settings are copies of the current ones,
+	which are those adopted by the simulation that has just ran.
+	"""
+	from ...yields import agb
+	from ...yields import ccsne
+	from ...yields import sneia
+	cdef c_output out = c_output.__new__(c_output)
+	out._name = "%s.vice" % (name)
+	out._hist = hist
+	out._mdf = mdf
+	out._elements = hist._load_elements()
+	elements = out._elements
+	out._agb_yields = saved_yields(dict(zip(elements,
+		[agb.settings[i] for i in elements])), "agb")
+	out._ccsne_yields = saved_yields(dict(zip(elements,
+		[ccsne.settings[i] for i in elements])), "ccsne")
+	out._sneia_yields = saved_yields(dict(zip(elements,
+		[sneia.settings[i] for i in elements])), "sneia")
+	out._timings = timings
+	return out
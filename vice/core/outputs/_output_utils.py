@@ -5,6 +5,7 @@ access or use of these functions is discouraged.
 
 from __future__ import absolute_import
 from ..._globals import _VERSION_ERROR_
+import json
 import sys
 import os
 if sys.version_info[:2] == (2, 7):
@@ -50,6 +51,43 @@ def _get_name(name):
 			type(name)))
 
 
+def _history_column_labels(elements):
+	"""
+	Obtain the column labels of the history output of a singlezone object,
+	in the order that they appear in the history.out file.
+
+	Args
+	====
+	elements :: array-like
+		The symbols of the elements tracked by the simulation, in the order
+		they are stored in C.
+	"""
+	labels = ["time", "mgas", "mstar", "sfr", "ifr", "ofr", "eta_0", "r_eff"]
+	for prefix in ["z_in", "z_out", "mass"]:
+		labels += ["%s(%s)" % (prefix, i.lower()) for i in elements]
+	return tuple(labels)
+
+
+def _mdf_column_labels(elements):
+	"""
+	Obtain the column labels of the metallicity distribution function output
+	of a singlezone object, in the order that they appear in the mdf.out file.
+
+	Args
+	====
+	elements :: array-like
+		The symbols of the elements tracked by the simulation, in the order
+		they are stored in C.
+	"""
+	elements = [i.lower() for i in elements]
+	labels = ["bin_edge_left", "bin_edge_right"]
+	labels += ["dn/d[%s/h]" % (i) for i in elements]
+	for i in range(1, len(elements)):
+		for j in range(i):
+			labels.append("dn/d[%s/%s]" % (elements[i], elements[j]))
+	return tuple(labels)
+
+
 def _check_singlezone_output(name):
 	"""
 	Checks the output from a singlezone object to ensure that all files are
@@ -151,3 +189,25 @@ def _load_column_labels_from_file_header(filename):
 			raise IOError("Output file not formatted correctly: %s" % (
 				filename))
 
+
+def _load_timings(name):
+	"""
+	Read the time spent in each phase of a simulation from the timings.json
+	file in its output directory.
+
+	Args
+	====
+	name :: str
+		The name of the output directory, including the '.vice' extension
+
+	Returns
+	=======
+	A dictionary with one entry per phase, each a dictionary with keys
+	"wall", "cpu", and "calls". None if the simulation was not profiled.
+	"""
+	filename = "%s/timings.json" % (name)
+	if os.path.exists(filename):
+		with open(filename, 'r') as f:
+			return json.load(f)
+	else:
+		return None
@@ -0,0 +1,193 @@
+r"""
+This file implements the load_many function, which reads in many VICE outputs
+at once across a pool of threads.
+"""
+
+from __future__ import absolute_import
+from ..._globals import _VERSION_ERROR_
+from .output import output
+from concurrent.futures import ThreadPoolExecutor
+import numbers
+import time
+import sys
+if sys.version_info[:2] == (2, 7):
+	strcomp = basestring
+elif sys.version_info[:2] >= (3, 5):
+	strcomp = str
+else:
+	_VERSION_ERROR_()
+
+
+def load_many(names, workers = 1, strict = False):
+	r"""
+	Read in the output from many ``singlezone`` and/or ``multizone``
+	simulations in parallel.
+
+	**Signature**: vice.load_many(names, workers = 1, strict = False)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	names : array-like [elements of type ``str``]
+		The full or relative paths to the output directories. The '.vice'
+		extension is not required.
+	workers : ``int`` [default : 1]
+		The number of threads to read outputs with. See note below regarding
+		the speedup this affords.
+	strict : ``bool`` [default : False]
+		If True, the first error encountered while reading an output is
+		raised. Otherwise, errors are recorded in the ``failures`` attribute of
+		the returned object and the remaining outputs are still read in.
+
+	Returns
+	-------
+	outputs : ``loaded_outputs`` [``dict`` derived class]
+		A dictionary mapping each name as specified in ``names`` to its
+		corresponding ``output`` or ``multioutput`` object. This object
+		additionally has the following attributes:
+
+		- timings : ``dict``
+			The wall time in seconds it took to read in each output,
+			including those that failed.
+		- failures : ``dict``
+			The exception raised while reading each output that could not be
+			read in. Outputs which failed are not included in the mapping.
+
+	Raises
+	------
+	* TypeError
+		- ``names`` is not an array-like object of strings
+		- ``workers`` is not an integer
+	* ValueError
+		- ``workers`` is not positive
+	* Other exceptions
+		- Any error raised while reading an output if ``strict = True``
+
+	.. note:: Outputs are read with threads rather than processes because
+		``output`` and ``multioutput`` objects store their data in C and
+		cannot be passed between processes.
+
+	.. note:: Only reading the contents of each file from disk releases the
+		global interpreter lock. Parsing them into the data stored by the
+		output object, reading the pickled attributes, and constructing the
+		``dataframe`` objects all take place in python, and are therefore
+		not done concurrently. The speedup from multiple workers is thus
+		largest for outputs which are slow to read from disk (e.g. on a
+		network file system) and modest otherwise.
+
+	.. seealso::
+		- vice.output
+		- vice.multioutput
+
+	Example Code
+	------------
+	>>> import vice
+	>>> outputs = vice.load_many(["example1", "example2"], workers = 2)
+	>>> outputs["example1"]
+		<VICE output from singlezone: example1>
+	>>> outputs.timings
+		{'example1': 0.01735, 'example2': 0.01693}
+	>>> outputs.failures
+		{}
+	"""
+	if isinstance(names, strcomp): names = [names]
+	try:
+		names = list(names)
+	except TypeError:
+		raise TypeError("""Must be an array-like object of strings. \
+Got: %s""" % (type(names)))
+	if not all([isinstance(i, strcomp) for i in names]): raise TypeError(
+		"All output names must be of type str.")
+	if not isinstance(workers, numbers.Number) or workers % 1 != 0:
+		raise TypeError("Keyword arg 'workers' must be an integer. Got: %s" % (
+			type(workers)))
+	elif workers <= 0:
+		raise ValueError("""Keyword arg 'workers' must be positive. \
+Got: %d""" % (workers))
+	else:
+		workers = int(workers)
+	names = list(dict.fromkeys(names)) # remove duplicates, preserve order
+	results = loaded_outputs()
+	if workers == 1:
+		loaded = map(_timed_load, names)
+		for name, (out, elapsed, error) in zip(names, loaded):
+			results._record(name, out, elapsed, error, strict)
+	else:
+		with ThreadPoolExecutor(max_workers = workers) as executor:
+			loaded = executor.map(_timed_load, names)
+			for name, (out, elapsed, error) in zip(names, loaded):
+				results._record(name, out, elapsed, error, strict)
+	return results
+
+
+def _timed_load(name):
+	r"""
+	Read in a single output, timing the process and catching any error.
+
+	Parameters
+	----------
+	name : ``str``
+		The full or relative path to the output directory.
+
+	Returns
+	-------
+	out : ``output``, ``multioutput``, or ``None``
+		The output object, or None if it could not be read in.
+	elapsed : ``float``
+		The wall time in seconds spent reading in the output.
+	error : ``Exception`` or ``None``
+		The exception raised in reading in the output, if any.
+	"""
+	start = time.perf_counter()
+	try:
+		out = output(name)
+		error = None
+	except Exception as exc:
+		out = None
+		error = exc
+	return [out, time.perf_counter() - start, error]
+
+
+class loaded_outputs(dict):
+
+	r"""
+	The return value of ``vice.load_many``: a ``dict`` mapping output names
+	onto the output objects themselves, with additional ``timings`` and
+	``failures`` attributes. See docstring of ``vice.load_many`` for details.
+	"""
+
+	def __init__(self):
+		super().__init__()
+		self._timings = {}
+		self._failures = {}
+
+	@property
+	def timings(self):
+		r"""
+		Type : ``dict``
+
+		The wall time in seconds it took to read in each output.
+		"""
+		return self._timings
+
+	@property
+	def failures(self):
+		r"""
+		Type : ``dict``
+
+		The exception raised while reading in each output that failed.
+		"""
+		return self._failures
+
+	def _record(self, name, out, elapsed, error, strict):
+		r"""
+		Store the result of reading in a single output.
+		"""
+		self._timings[name] = elapsed
+		if error is None:
+			self[name] = out
+		elif strict:
+			raise error
+		else:
+			self._failures[name] = error
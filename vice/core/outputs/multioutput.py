@@ -33,6 +33,8 @@ class multioutput:
 		contained in the ``multizone`` object which produced the output.
 	stars : ``dataframe``
 		A dataframe containing all star particle data.
+	timings : ``dict`` or ``None``
+		The time spent in each phase of the simulation, if it was profiled.
 
 	Example Code
 	------------
@@ -215,3 +217,33 @@ class multioutput:
 		"""
 		return self.__c_version.stars
 
+	@property
+	def timings(self):
+		r"""
+		Type : ``dict`` or ``None``
+
+		The time spent in each phase of the simulation, read from the file
+		timings.json in the output directory. ``None`` if the simulation was
+		not profiled.
+
+		.. versionadded:: 1.4.0
+
+		Each key is the name of a phase, and each value a ``dict`` with keys
+		"wall", "cpu", and "calls" storing the wall-clock and CPU time in
+		seconds spent in that phase and the number of times it was entered.
+		The "callbacks" entry, if present, stores the wall-clock time and
+		number of calls for each functional attribute called from C. See the
+		``profile`` keyword argument of ``vice.multizone.run`` for a
+		description of each phase.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> mz = vice.multizone(name = "example", n_zones = 3)
+		>>> mz.run([0.01 * i for i in range(1001)], profile = True)
+		>>> example = vice.output("example")
+		>>> example.timings["migration"]
+			{'wall': 0.0169, 'cpu': 0.0169, 'calls': 1000}
+		"""
+		return self.__c_version.timings
+
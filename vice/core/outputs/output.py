@@ -47,6 +47,8 @@ class output:
 		The core-collapse supernova yields employed in the simulation.
 	sneia_yields : ``dataframe``
 		The type Ia supernova yields employed in the simulation.
+	timings : ``dict`` or ``None``
+		The time spent in each phase of the simulation, if it was profiled.
 
 	.. note:: Reinstancing functional yields and simulation parameters
 		requires dill_, an extension to ``pickle`` in the python standard
@@ -130,6 +132,17 @@ class output:
 	def __init__(self, name):
 		self.__c_version = c_output(name)
 
+	@classmethod
+	def _from_c_version(cls, c_version):
+		"""
+		Construct an output object wrapping an existing c_output object
+		without reading anything from disk (e.g. the output of a singlezone
+		simulation ran with in_memory = True).
+		"""
+		out = object.__new__(cls)
+		out.__c_version = c_version
+		return out
+
 	def __repr__(self):
 		"""
 		Prints the name of the simulation
@@ -359,6 +372,37 @@ class output:
 		"""
 		return self.__c_version.sneia_yields
 
+	@property
+	def timings(self):
+		r"""
+		Type : ``dict`` or ``None``
+
+		The time spent in each phase of the simulation, read from the file
+		timings.json in the output directory, or retained in memory for
+		simulations ran with ``in_memory = True``. ``None`` if the simulation
+		was not profiled.
+
+		.. versionadded:: 1.4.0
+
+		Each key is the name of a phase, and each value a ``dict`` with keys
+		"wall", "cpu", and "calls" storing the wall-clock and CPU time in
+		seconds spent in that phase and the number of times it was entered.
+		The "callbacks" entry, if present, stores the wall-clock time and
+		number of calls for each functional attribute called from C. See the
+		``profile`` keyword argument of ``vice.singlezone.run`` for a
+		description of each phase.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> sz = vice.singlezone(name = "example")
+		>>> out = sz.run([0.01 * i for i in range(1001)], capture = True,
+			profile = True)
+		>>> out.timings["recycling"]
+			{'wall': 0.0073, 'cpu': 0.0073, 'calls': 3000}
+		"""
+		return self.__c_version.timings
+
 	def show(self, key, xlim = None, ylim = None):
 		r"""
 		Show a plot of the given quantity referenced by a keyword argument.
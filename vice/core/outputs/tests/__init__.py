@@ -14,6 +14,7 @@ if not __VICE_SETUP__:
 	from .mdf import test_mdf
 	from .stars import test_stars
 	from .multioutput import test_multioutput
+	from .load_many import test_load_many
 
 	@moduletest
 	def test():
@@ -26,7 +27,8 @@ if not __VICE_SETUP__:
 				test_history(),
 				test_mdf(),
 				test_stars(),
-				test_multioutput()
+				test_multioutput(),
+				test_load_many()
 			]
 		]
 
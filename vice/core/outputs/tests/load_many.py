@@ -0,0 +1,30 @@
+
+from __future__ import absolute_import
+__all__ = ["test_load_many"]
+from ....testing import unittest
+from ..load_many import load_many
+from ..output import output
+
+
+@unittest
+def test_load_many():
+	r"""
+	vice.load_many unit test
+	"""
+	from ...singlezone import singlezone
+	def test():
+		try:
+			names = ["test_load_many%d" % (i) for i in range(3)]
+			for name in names:
+				singlezone(name = name).run([0.01 * i for i in range(1001)],
+					overwrite = True)
+			test_ = load_many(names + ["test_load_many_missing"],
+				workers = 2)
+		except:
+			return False
+		return (
+			all([isinstance(test_[i], output) for i in names]) and
+			len(test_.timings) == len(names) + 1 and
+			list(test_.failures.keys()) == ["test_load_many_missing"]
+		)
+	return ["vice.load_many", test]
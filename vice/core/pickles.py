@@ -134,13 +134,12 @@ class jar:
 		"""
 		if os.path.exists(self.name): os.system("rm -rf %s" % (self.name))
 		os.system("mkdir %s" % (self.name))
-		old_path = os.getcwd()
-		os.chdir(self.name)
+		# paths are joined rather than changing directories such that
+		# simulations in separate threads can save their pickles concurrently
 		for i in self.objects.keys():
 			# dill will taken care of down the line
-			pickled_object(self.objects[i], name = i,
+			pickled_object(self.objects[i], name = os.path.join(self.name, i),
 				default = self._default).save()
-		os.chdir(old_path)
 
 	@staticmethod
 	def open(dirname):
@@ -176,17 +175,14 @@ class jar:
 		"""
 		if isinstance(dirname, strcomp):
 			if os.path.isdir(dirname):
-				old_path = os.getcwd()
-				os.chdir(dirname)
 				pickles = list(filter(lambda x: x.endswith(".obj"),
-					os.listdir('.')))
+					os.listdir(dirname)))
 				if len(pickles) > 0:
 					names = [i[:-4] for i in pickles]
-					objects = [pickled_object.from_pickle(i) for i in pickles]
-					os.chdir(old_path)
+					objects = [pickled_object.from_pickle(os.path.join(dirname,
+						i)) for i in pickles]
 					return dict(zip(names, objects))
 				else:
-					os.chdir(old_path)
 					raise IOError("No pickled objects found in directory: %s" % (
 						dirname))
 			else:
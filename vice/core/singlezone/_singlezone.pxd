@@ -20,4 +20,5 @@ cdef class c_singlezone:
 	cdef object _callback_cc
 	cdef object _callback_ia
 	cdef object _callback_agb
+	cdef object _ssp_fingerprint
 
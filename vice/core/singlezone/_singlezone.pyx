@@ -29,6 +29,7 @@ from ..dataframe import solar_z
 from ..dataframe import sources
 from ..dataframe import base
 from ..outputs import output
+from ..outputs import _output_utils
 from ..pickles import jar
 from ...yields import agb
 from ...yields import ccsne
@@ -54,14 +55,25 @@ from libc.string cimport strlen
 from .._cutils cimport set_string
 from .._cutils cimport copy_pylist
 from .._cutils cimport setup_imf
+from .._cutils cimport setup_agb_grid
 from .._cutils cimport callback_1arg_setup
 from .._cutils cimport callback_2arg_setup
 from .._cutils cimport copy_2Dpylist
+from .._cutils cimport add_c_timings
+from .._cutils cimport callback_timing_register
+from .._cutils cimport callback_timing_collect
 from ..objects cimport _element
 from ..objects cimport _singlezone
 from ..objects cimport _sneia
 from ..objects cimport _agb
+from ..objects cimport _timings
+from ..objects._imf cimport IMF_N_MASSES
+from ..objects._fromfile cimport FROMFILE
 from .. cimport _mlr
+from ..dataframe._fromfile cimport fromfile
+from ..dataframe._fromfile cimport adopt_data
+from ..dataframe._history cimport history_from_memory
+from ..outputs._output cimport c_output_from_memory
 from . cimport _singlezone
 
 _RECOGNIZED_MODES_ = tuple(["ifr", "sfr", "gas"])
@@ -124,6 +136,7 @@ cdef class c_singlezone:
 		tau_ia = 1.5,
 		tau_star = 2.0,
 		dt = 0.01,
+		adaptive = False,
 		schmidt = False,
 		MgSchmidt = 6.0e9,
 		schmidt_index = 0.5,
@@ -160,6 +173,7 @@ cdef class c_singlezone:
 		self.tau_ia = tau_ia
 		self.tau_star = tau_star
 		self.dt = dt
+		self.adaptive = adaptive
 		self.schmidt = schmidt
 		self.MgSchmidt = MgSchmidt
 		self.schmidt_index = schmidt_index
@@ -383,6 +397,8 @@ proceeding.""")
 					x = self._sz[0].elements[0][0].sneia_yields[0].t_d
 					y = self._sz[0].elements[0][0].sneia_yields[0].tau_ia
 					assign_ia_params = True
+					_singlezone.singlezone_free_ssp(self._sz)
+					self._ssp_fingerprint = None
 					for i in range(self._sz[0].n_elements):
 						_element.element_free(self._sz[0].elements[i])
 				else:
@@ -981,6 +997,41 @@ numerical value or a callable function.""")
 			raise TypeError("""Attribute 'dt' must be a numerical value. \
 Got: %s""" % (type(value)))
 
+	@property
+	def adaptive(self):
+		# docstring in python version
+		if self._sz[0].adaptive:
+			return self._sz[0].adaptive
+		else:
+			return False
+
+	@adaptive.setter
+	def adaptive(self, value):
+		"""
+		Whether or not to choose the timestep size adaptively, and if so the
+		tolerance on the fractional change per timestep.
+
+		Allowed Types
+		=============
+		bool, real number
+
+		Allowed Values
+		==============
+		bool :: True for a tolerance of 0.01, False for fixed timesteps
+		real number :: 0 <= x < 1
+		"""
+		if isinstance(value, bool):
+			self._sz[0].adaptive = 0.01 if value else 0
+		elif isinstance(value, numbers.Number):
+			if 0 <= value < 1:
+				self._sz[0].adaptive = value
+			else:
+				raise ValueError("""Attribute 'adaptive', when a real number, \
+must be between 0 and 1. Got: %g""" % (value))
+		else:
+			raise TypeError("""Attribute 'adaptive' must be either a boolean \
+or a real number. Got: %s""" % (type(value)))
+
 	@property
 	def schmidt(self):
 		# docstring in python version
@@ -1297,53 +1348,112 @@ All elemental yields in the current simulation will be set to the table of \
 
 
 	# ------------------------ RUN THE SIMULATION ------------------------ #
-	def run(self, output_times, capture = False, overwrite = False):
+	def run(self, output_times, capture = False, overwrite = False,
+		in_memory = False, profile = False):
 		
 		r"""
 		See docstring in singlezone.py.
 		"""
 
-		output_times = self.prep(output_times)
-		cdef int enrichment
-		if self.open_output_dir(overwrite):
-
-			# warn the user about r-process elements, bad solar calibrations,
-			# and mass-lifetime relation effects
-			self.nsns_warning()
-			self.solar_z_warning()
-			self.mlr_warnings()
-
-			# take the current mass-lifetime relation setting
-			self.import_mlr_data()
-			_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
-
-			# just do it #nike
-			self._sz[0].output_times = copy_pylist(output_times)
-			self._sz[0].n_outputs = len(output_times)
-			enrichment = _singlezone.singlezone_evolve(self._sz)
-
-			# save yield settings and attributes, free mass-lifetime data
-			self.pickle()
-			self.free_mlr_data()
+		timings = {} if profile else None
+		cdef int enrichment = 0
+		cdef SINGLEZONE *sz = self._sz
+		try:
+			with _pyutils.phase_timer(timings, "prep"):
+				output_times = self.prep(output_times, retain_ssp = True,
+					in_memory = in_memory, timings = timings)
+			if in_memory or self.open_output_dir(overwrite):
+
+				# warn the user about r-process elements, bad solar
+				# calibrations, and mass-lifetime relation effects
+				self.nsns_warning()
+				self.solar_z_warning()
+				self.mlr_warnings()
+
+				# take the current mass-lifetime relation setting
+				self.import_mlr_data()
+				_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
+
+				# just do it #nike
+				self._sz[0].output_times = copy_pylist(output_times)
+				self._sz[0].n_outputs = len(output_times)
+				if profile: self._sz[0].timings = _timings.timings_initialize()
+				with _pyutils.phase_timer(timings, "evolve"):
+					if _singlezone.singlezone_calls_python(self._sz[0]):
+						enrichment = _singlezone.singlezone_evolve(sz)
+					else:
+						# release the GIL, allowing other threads to run
+						with nogil:
+							enrichment = _singlezone.singlezone_evolve(sz)
+				if profile:
+					self.free_timings(timings)
+					_pyutils.callback_warning(timings)
+				else: pass
 
-		else:
-			_singlezone.singlezone_cancel(self._sz)
-			enrichment = 0
+				# save yield settings and attributes, free mass-lifetime data
+				if not in_memory:
+					with _pyutils.phase_timer(timings, "pickle"): self.pickle()
+					if profile: _pyutils.write_timings(timings, self.name)
+				else: pass
+				self.free_mlr_data()
 
-		if isinstance(self._imf, callback1_nan_inf_positive):
-			self._imf = self._imf.function
-		else:
-			pass
+			else:
+				_singlezone.singlezone_cancel(self._sz)
+				enrichment = 0
+				self._ssp_fingerprint = None
+		finally:
+			# stop timing callbacks if canceled or an exception was raised
+			if profile: self.free_timings(timings)
+			if isinstance(self._imf, callback1_nan_inf_positive):
+				self._imf = self._imf.function
+			else:
+				pass
 
 		if enrichment:
+			_singlezone.singlezone_free_ssp(self._sz)
+			_singlezone.singlezone_free_output(self._sz)
+			self._ssp_fingerprint = None
 			raise SystemError("Internal Error")
+		elif in_memory:
+			return self.output_from_memory(timings = timings)
 		elif capture:
 			return output(self.name)
 		else:
 			pass
 
 
-	def prep(self, output_times):
+	def output_from_memory(self, timings = None):
+		"""
+		Construct an output object from the results of the simulation that
+		has just ran with in_memory = True, taking ownership of the history
+		and MDF output stored in C.
+
+		Parameters
+		==========
+		timings :: dict [default : None]
+			The time spent in each phase of the simulation, if it was
+			profiled.
+
+		Returns
+		=======
+		out :: output
+			The output object, backed directly by the data computed in C.
+		"""
+		hist = history_from_memory(self._sz[0].history_data,
+			"%s.vice/history.out" % (self.name),
+			_output_utils._history_column_labels(self.elements),
+			self.Z_solar)
+		self._sz[0].history_data = NULL
+		mdf = adopt_mdf(self._sz[0].mdf_data,
+			"%s.vice/mdf.out" % (self.name),
+			_output_utils._mdf_column_labels(self.elements))
+		self._sz[0].mdf_data = NULL
+		return output._from_c_version(
+			c_output_from_memory(self.name, hist, mdf, timings = timings))
+
+
+	def prep(self, output_times, retain_ssp = False, in_memory = False,
+		timings = None):
 		"""
 		Prepares the simulation to be ran based on the current settings.
 
@@ -1351,6 +1461,19 @@ All elemental yields in the current simulation will be set to the table of \
 		==========
 		output_times :: array-like
 			The array of values the user passed to run()
+		retain_ssp :: bool [default : False]
+			Whether or not to keep the tables describing single stellar
+			populations in memory after the simulation, reusing those of the
+			previous simulation if the settings they depend on have not
+			changed. Multizone models set up these tables themselves, and
+			prepare each zone with the default of False.
+		in_memory :: bool [default : False]
+			Whether or not to retain the output in memory rather than writing
+			it to files. Multizone models prepare each zone with the default
+			of False.
+		timings :: dict [default : None]
+			The time spent in each phase of the simulation, if it is being
+			profiled. The time spent setting up the elements is added to it.
 
 		Returns
 		=======
@@ -1366,9 +1489,35 @@ All elemental yields in the current simulation will be set to the table of \
 		self._sz[0].ism[0].mass = self._Mg0 # reset initial gas supply
 		if callable(self._imf):
 			self._imf = callback1_nan_inf_positive(self._imf)
+			if timings is not None: callback_timing_register(self._imf, "IMF")
 		else: pass
 		setup_imf(self._sz[0].ssp[0].imf, self._imf)
-		self.setup_elements()
+
+		"""
+		Reuse the cumulative return fraction, main sequence mass fraction,
+		SN Ia rates, and AGB star yield grids from the previous simulation if
+		none of the settings they depend on have changed (e.g. when only the
+		star formation history varies between runs). Otherwise, free them,
+		and they are computed from scratch.
+		"""
+		ria = self.map_ria() if callable(self._ria) else None
+		if retain_ssp:
+			fingerprint = self.ssp_fingerprint(output_times, ria)
+			reuse = (fingerprint == self._ssp_fingerprint and
+				self._sz[0].ssp[0].crf is not NULL)
+		else:
+			fingerprint = None
+			reuse = False
+		if not reuse: _singlezone.singlezone_free_ssp(self._sz)
+		self._sz[0].retain_ssp = <unsigned short> retain_ssp
+		self._sz[0].in_memory = <unsigned short> bool(in_memory)
+		self._ssp_fingerprint = fingerprint
+		with _pyutils.phase_timer(timings, "setup_elements"):
+			self.setup_elements(agb_grids = not reuse)
+		if timings is not None:
+			for value, label in self.callbacks():
+				callback_timing_register(value, label)
+		else: pass
 
 		"""
 		Construct the array of times at which the simulation will evaluate,
@@ -1446,8 +1595,8 @@ attribute '%s' evaluated to inf or NaN for at least one timestep.""" % (name))
 				lambda t: 1.e9 * self._func(t), "func"))
 
 		# Set a custom DTD if specified
-		if callable(self._ria):
-			self.set_ria()
+		if callable(self._ria) and not reuse:
+			self.set_ria(ria)
 		else: pass
 
 		self.setup_Zin(output_times[-1])
@@ -1584,9 +1733,16 @@ simulation.\nOutput directory: %s.vice\nOverwite? (y | n) """ % (self.name))
 			return True
 
 
-	def setup_elements(self):
+	def setup_elements(self, agb_grids = True):
 		"""
 		Setup each element's AGB grid, CCSNe yield grid, and SNe Ia yield
+
+		Parameters
+		==========
+		agb_grids :: bool [default : True]
+			Whether or not to copy the built-in AGB star yield grids into each
+			element. False when they are retained from the previous
+			simulation.
 		"""
 		self._callback_cc = self._sz[0].n_elements * [None]
 		self._callback_ia = self._sz[0].n_elements * [None]
@@ -1644,18 +1800,119 @@ especially for fine timestepping.""", VisibleRuntimeWarning)
 for asymptotic giant branch star yields may significantly increase the \
 required integration time, especially for fine \
 timestepping.""", VisibleRuntimeWarning)
-			else:
-				agbfile = agb._grid_reader.find_yield_file(self.elements[i],
+			elif agb_grids:
+				setup_agb_grid(self._sz[0].elements[i], self.elements[i],
 					agb.settings[self.elements[i]])
-				_agb.import_agb_grid(self._sz[0].elements[i],
-					agbfile.encode("latin-1"))
+			else: pass
+
 
+	def callbacks(self):
+		"""
+		The functional attributes which the C library calls back into Python
+		for as the simulation evolves.
 
-	def set_ria(self):
+		Returns
+		=======
+		callbacks :: list
+			The callback objects for each function, each paired with the
+			label under which it is timed in a profiled simulation.
+		"""
+		callbacks = []
+		for i in range(self._sz[0].n_elements):
+			callbacks.append((self._callback_cc[i],
+				"ccsne yield of %s" % (self.elements[i])))
+			callbacks.append((self._callback_ia[i],
+				"sneia yield of %s" % (self.elements[i])))
+			callbacks.append((self._callback_agb[i],
+				"agb yield of %s" % (self.elements[i])))
+		if isinstance(self._tau_star, callback2_nan_positive):
+			callbacks.append((self._tau_star, "tau_star"))
+		else: pass
+		return list(filter(lambda x: x[0] is not None, callbacks))
+
+
+	def free_timings(self, timings):
+		"""
+		Add the time spent in each phase of the simulation timed in C and in
+		the functional attributes called from C to its timings, then free the
+		timings object. Calling it again has no effect, such that it also
+		cleans up after simulations which were canceled or raised an
+		exception.
+
+		Parameters
+		==========
+		timings :: dict
+			The time spent in each phase of the simulation.
+		"""
+		if self._sz[0].timings is not NULL:
+			add_c_timings(timings, self._sz[0].timings)
+			_timings.timings_free(self._sz[0].timings)
+			self._sz[0].timings = NULL
+		else: pass
+		self.collect_callback_timings(timings)
+
+
+	def collect_callback_timings(self, timings):
+		"""
+		Add the time spent in the functional attributes which the C library
+		called back into Python for, including the custom IMF, to the timings
+		of a profiled simulation under the "callbacks" entry.
+
+		Parameters
+		==========
+		timings :: dict
+			The time spent in each phase of the simulation.
+		"""
+		callback_timing_collect(timings,
+			[self._imf] + [i[0] for i in self.callbacks()])
+
+
+	def ssp_fingerprint(self, output_times, ria):
+		"""
+		Determine the settings on which the tables describing single stellar
+		populations depend: the cumulative return fraction, main sequence
+		mass fraction, SN Ia rates, and AGB star yield grids.
+
+		Parameters
+		==========
+		output_times :: list
+			The vetted output times of the simulation
+		ria :: list or None
+			The custom SN Ia DTD mapped across time by map_ria, if applicable
+
+		Returns
+		=======
+		fingerprint :: tuple
+			The settings themselves. Two runs with the same fingerprint can
+			share the same tables.
+		"""
+		if callable(self._imf):
+			# the tabulated IMF, in case the function itself has changed
+			imf = (<char *> self._sz[0].ssp[0].imf[0].mass_distribution)[
+				:IMF_N_MASSES * sizeof(double)]
+		else:
+			imf = self._imf
+		if callable(self._ria):
+			dtd = tuple(ria)
+		else:
+			dtd = (self._ria, self.tau_ia)
+		agb_grids = tuple([agb.settings[i] if isinstance(agb.settings[i],
+			strcomp) else None for i in self.elements])
+		return (self.elements, self.dt, output_times[-1], imf, self.m_lower,
+			self.m_upper, self.postMS, mlr.setting, self.delay, dtd,
+			agb_grids)
+
+
+	def map_ria(self):
 		"""
 		Maps a custom SNe Ia DTD across the evalutation times of the
 		simulation.
 
+		Returns
+		=======
+		ria :: list
+			The DTD at each timestep, prior to normalization
+
 		Raises
 		======
 		ArithmeticError ::
@@ -1678,13 +1935,27 @@ timestepping.""", VisibleRuntimeWarning)
 negative, NaN, or inf for at least one timestep.""")
 			else:
 				continue
+		return ria
+
 
+	def set_ria(self, ria):
 		"""
+		Copies a custom SNe Ia DTD into each element.
+
+		Parameters
+		==========
+		ria :: list
+			The DTD at each timestep as returned by map_ria
+
+		Notes
+		=====
 		setup_RIa in src/sneia.c will do the normalization, no need to worry
-		about that here.
+		about that here. Every element shares the same DTD, and thus the same
+		buffer.
 		"""
+		cdef double *shared = copy_pylist(ria)
 		for i in range(self._sz[0].n_elements):
-			self._sz[0].elements[i][0].sneia_yields[0].RIa = copy_pylist(ria)
+			self._sz[0].elements[i][0].sneia_yields[0].RIa = shared
 
 
 	def setup_Zin(self, endtime):
@@ -1888,26 +2159,51 @@ timestepping.""" % (names[mlr.setting])
 		if os.path.exists("%s.vice/yields" % (self.name)):
 			os.system("rm -rf %s.vice/yields" % (self.name))
 		os.system("mkdir %s.vice/yields" % (self.name))
-		ccsne_yields = dict(zip(
-			self.elements,
-			[ccsne.settings[i] for i in self.elements]
-		))
-		sneia_yields = dict(zip(
-			self.elements,
-			[sneia.settings[i] for i in self.elements]
-		))
-		agb_yields = dict(zip(
-			self.elements,
-			[agb.settings[i] for i in self.elements]
-		))
+		yields = self.yield_settings()
 
 		# Save them in their own jars
-		jar(ccsne_yields, name = "%s.vice/yields/ccsne" % (self.name)).close()
-		jar(sneia_yields, name = "%s.vice/yields/sneia" % (self.name)).close()
-		jar(agb_yields, name = "%s.vice/yields/agb" % (self.name)).close()
+		for i in ["ccsne", "sneia", "agb"]:
+			jar(yields[i], name = "%s.vice/yields/%s" % (self.name, i)).close()
 
 		# The attributes, in their own jar
+		jar(self.pickled_attributes(),
+			name = "%s.vice/attributes" % (self.name)).close()
+
+
+	def yield_settings(self):
+		"""
+		Get the current nucleosynthetic yield settings of each element tracked
+		by this simulation, as they are saved by the pickle function.
+
+		Returns
+		=======
+		yields :: dict
+			The yield settings of each element from each enrichment channel,
+			keyed by "ccsne", "sneia", and "agb".
+		"""
+		return {
+			"ccsne": dict(zip(self.elements,
+				[ccsne.settings[i] for i in self.elements])),
+			"sneia": dict(zip(self.elements,
+				[sneia.settings[i] for i in self.elements])),
+			"agb": dict(zip(self.elements,
+				[agb.settings[i] for i in self.elements]))
+		}
+
+
+	def pickled_attributes(self):
+		"""
+		Get the attributes of this class as they are saved by the pickle
+		function.
+
+		Returns
+		=======
+		attrs :: dict
+			The attributes, keyed by their names, with dataframes converted
+			to dictionaries.
+		"""
 		attrs = {
+			"adaptive": 			self.adaptive,
 			"agb_model":			self.agb_model,
 			"bins": 				self.bins,
 			"delay": 				self.delay,
@@ -1939,5 +2235,15 @@ timestepping.""" % (names[mlr.setting])
 		}
 		for i in attrs.keys():
 			if isinstance(attrs[i], base): attrs[i] = attrs[i].todict()
-		jar(attrs, name = "%s.vice/attributes" % (self.name)).close()
+		return attrs
 
+
+cdef fromfile adopt_mdf(FROMFILE *ff, name, labels):
+	"""
+	Construct a fromfile object storing the stellar metallicity distribution
+	function of a simulation ran with in_memory = True, taking ownership of
+	the data stored in C.
+	"""
+	cdef fromfile mdf = fromfile.__new__(fromfile)
+	adopt_data(mdf, ff, name, labels)
+	return mdf
@@ -0,0 +1,72 @@
+r"""
+This file implements the ensemble_outputs object, the return value of
+vice.singlezone.run_many.
+"""
+
+from __future__ import absolute_import
+from ..._globals import _VERSION_ERROR_
+import sys
+if sys.version_info[:2] == (2, 7):
+	strcomp = basestring
+elif sys.version_info[:2] >= (3, 5):
+	strcomp = str
+else:
+	_VERSION_ERROR_()
+
+
+class ensemble_outputs(list):
+
+	r"""
+	The return value of ``vice.singlezone.run_many``: a ``list`` of the
+	``output`` objects of each simulation in the ensemble, in the order in
+	which they were specified, with an additional ``stack`` function. See
+	docstring of ``vice.singlezone.run_many`` for details.
+	"""
+
+	def __repr__(self):
+		return "<VICE ensemble of %d singlezone outputs>" % (len(self))
+
+	def stack(self, key):
+		r"""
+		Obtain a quantity from the output of every simulation in the ensemble.
+
+		**Signature**: x.stack(key)
+
+		Parameters
+		----------
+		x : ``ensemble_outputs``
+			An instance of this class.
+		key : ``str`` [case-insensitive]
+			A key to either the history or the MDF of each output (e.g.
+			"[o/fe]" or "dn/d[o/fe]").
+
+		Returns
+		-------
+		values : ``list``
+			A 2-D list, where ``values[i]`` is the quantity from the i'th
+			simulation, with one element per output time for history keys or
+			per bin for MDF keys.
+
+		Raises
+		------
+		* TypeError
+			- ``key`` is not of type ``str``
+		* KeyError
+			- ``key`` is not recognized by the history or the MDF
+
+		Example Code
+		------------
+		>>> import vice
+		>>> outs = vice.singlezone.run_many([{"eta": 1}, {"eta": 2}],
+			[0.01 * i for i in range(1001)])
+		>>> [i[-1] for i in outs.stack("[o/h]")]
+		[-0.20859201228413854, -0.4155282698154893]
+		"""
+		if not isinstance(key, strcomp): raise TypeError("""Key must be of \
+type str. Got: %s""" % (type(key)))
+		if key.lower() in ["bin_edge_left", "bin_edge_right"] or (
+			key.lower().startswith("dn/d")):
+			return [out.mdf[key] for out in self]
+		else:
+			return [out.history[key] for out in self]
+
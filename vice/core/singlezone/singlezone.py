@@ -8,7 +8,10 @@ from ..outputs._output_utils import _get_name
 from ..outputs import multioutput
 from ..outputs import output
 from .. import pickles
+from .ensemble import ensemble_outputs
+from concurrent.futures import ThreadPoolExecutor
 import warnings
+import numbers
 import sys
 if sys.version_info[:2] == (2, 7):
 	strcomp = basestring
@@ -129,6 +132,10 @@ class singlezone:
 
 	dt : real number [default : 0.01]
 		The timestep size in Gyr.
+	adaptive : ``bool`` or real number [default : False]
+		Whether or not to choose the timestep size adaptively, and if so the
+		tolerance on the fractional change in the gas supply, star formation
+		rate, and element masses per timestep.
 	schmidt : ``bool`` [default : False]
 		A boolean describing whether or not to implement a gas-dependent star
 		formation efficiency. Overridden when the attribute ``tau_star`` is a
@@ -173,6 +180,8 @@ class singlezone:
 	---------
 	run : [instancemethod]
 		Run the simulation.
+	run_many : [staticmethod]
+		Run an ensemble of related simulations.
 	from_output : [classmethod]
 		Obtain a ``singlezone`` object with the parameters of the one
 		that produced an output.
@@ -237,6 +246,7 @@ class singlezone:
 			schmidt_index --> 0.5
 			MgSchmidt ------> 6000000000.0
 			dt -------------> 0.01
+			adaptive -------> False
 			m_upper --------> 100.0
 			m_lower --------> 0.08
 			postMS ---------> 0.1
@@ -286,6 +296,7 @@ class singlezone:
 			"schmidt_index": 	self.schmidt_index,
 			"MgSchmidt": 		self.MgSchmidt,
 			"dt": 				self.dt,
+			"adaptive": 		self.adaptive,
 			"m_upper": 			self.m_upper,
 			"m_lower": 			self.m_lower,
 			"postMS": 			self.postMS,
@@ -335,7 +346,7 @@ class singlezone:
 		"""
 		return self.__c_version.object_address()
 
-	def __zone_prep(self, output_times):
+	def __zone_prep(self, output_times, timings = None):
 		"""
 		Runs the setup functions to prep a singlezone object for simulation.
 		For usage in preparation of multizone simulations; usage of this
@@ -345,6 +356,9 @@ class singlezone:
 		==========
 		output_times :: array-like
 			The array of output times that the user passed
+		timings :: dict [default : None]
+			The time spent in each phase of the multizone simulation, if it is
+			being profiled.
 
 		Returns
 		=======
@@ -355,7 +369,7 @@ class singlezone:
 		======
 		Exceptions raised by subroutines
 		"""
-		return self.__c_version.prep(output_times)
+		return self.__c_version.prep(output_times, timings = timings)
 
 	@classmethod
 	def from_output(cls, arg):
@@ -435,6 +449,7 @@ class singlezone:
 				schmidt_index --> 0.5
 				MgSchmidt ------> 6000000000.0
 				dt -------------> 0.01
+				adaptive -------> False
 				m_upper --------> 100.0
 				m_lower --------> 0.08
 				postMS ---------> 0.1
@@ -1405,6 +1420,60 @@ ran.""" % (i, j), UserWarning)
 	def dt(self, value):
 		self.__c_version.dt = value
 
+	@property
+	def adaptive(self):
+		r"""
+		Type : ``bool`` or real number
+
+		Default : False
+
+		Whether or not to choose the size of each timestep adaptively. If
+		True, the tolerance is 0.01; a real number between 0 and 1 specifies
+		the tolerance directly, and False or 0 turns it off.
+
+		.. versionadded:: 1.4.0
+
+		When turned on, each timestep spans an integer number of timesteps of
+		size ``dt``, which then sets the resolution on which the star
+		formation history and the enrichment from previous generations of
+		stars are tracked. The size of each timestep is chosen such that the
+		gas supply, star formation rate, and the mass of each element are
+		expected to change by no more than this fraction of their values. It
+		is also no larger than 50 Myr, at most twice as large as the previous
+		one, never skips over an output time, and stops short of any sudden
+		change in the user's specified inputs (e.g. ``func``, ``eta``, or
+		``tau_star``). The star formation history and abundances at the
+		intermediate timesteps are interpolated linearly.
+
+		During smoothly evolving phases, the integration thus takes many
+		fewer timesteps than with a fixed timestep size at the cost of small
+		differences in the predicted abundances, on the order of the
+		tolerance. When False, the integration proceeds with a timestep size
+		of ``dt`` and is unaffected.
+
+		.. note:: Multi-zone models take this attribute into account only
+			when ran in simple mode (see ``vice.multizone.simple``).
+			Otherwise they integrate with a fixed timestep size and raise a
+			``UserWarning`` if any zone has this attribute turned on.
+
+		.. seealso:: vice.singlezone.dt
+
+		Example Code
+		------------
+		>>> import vice
+		>>> sz = vice.singlezone(name = "example", dt = 0.001)
+		>>> sz.adaptive = True
+		>>> sz.adaptive
+		0.01
+		>>> sz.adaptive = 0.005
+		>>> sz.adaptive = False
+		"""
+		return self.__c_version.adaptive
+
+	@adaptive.setter
+	def adaptive(self, value):
+		self.__c_version.adaptive = value
+
 	@property
 	def schmidt(self):
 		r"""
@@ -1704,11 +1773,13 @@ ran.""" % (i, j), UserWarning)
 	def agb_model(self, value):
 		self.__c_version.agb_model = value
 
-	def run(self, output_times, capture = False, overwrite = False):
+	def run(self, output_times, capture = False, overwrite = False,
+		in_memory = False, profile = False):
 		r"""
 		Run the simulation.
 
-		**Signature**: x.run(output_times, capture = False, overwrite = False)
+		**Signature**: x.run(output_times, capture = False, overwrite = False,
+		in_memory = False, profile = False)
 
 		Parameters
 		----------
@@ -1723,10 +1794,24 @@ ran.""" % (i, j), UserWarning)
 		overwrite : ``bool`` [default : False]
 			If ``True``, will force overwrite any files with the same name as
 			the simulation output files.
+		in_memory : ``bool`` [default : False]
+			If ``True``, no output files are written, and an output object
+			storing the results of the simulation in memory is returned.
+
+			.. versionadded:: 1.4.0
+
+		profile : ``bool`` [default : False]
+			If ``True``, the time spent in each phase of the simulation is
+			recorded and written to the file timings.json in the output
+			directory. It is also available as the attribute ``timings`` of
+			the output object. See note below.
+
+			.. versionadded:: 1.4.0
 
 		Returns
 		-------
-		out : ``output`` [only returned if ``capture == True``]
+		out : ``output`` [only returned if ``capture == True`` or
+		``in_memory == True``]
 			An ``output`` object produced from this simulation's output.
 
 		Raises
@@ -1754,6 +1839,9 @@ ran.""" % (i, j), UserWarning)
 			- 	The model is running with a mass-lifetime relation which
 				requires numerical solutions to the inverse function (i.e.
 				mass as a function of lifetime).
+			- 	``profile == True`` and functional attributes called from C
+				accounted for more than half of the time spent setting up and
+				evolving the simulation.
 
 		Notes
 		-----
@@ -1786,6 +1874,69 @@ ran.""" % (i, j), UserWarning)
 			simulation. This may be one timestep beyond the last element of
 			the specified ``output_times`` array.
 
+		.. note::
+
+			Simulations of different ``singlezone`` objects under different
+			names may be ran concurrently in separate threads (e.g. with a
+			``concurrent.futures.ThreadPoolExecutor``). Unless the yields,
+			the star formation efficiency timescale ``tau_star`` as a function
+			of time and gas supply, or the IMF call python functions as the
+			simulation evolves, the global interpreter lock is released while
+			it does so, allowing simulations to evolve in parallel.
+
+		.. note::
+
+			With ``in_memory == True``, nothing is written to disk: VICE does
+			not create the output directory, write the history.out and mdf.out
+			files, or save the yields and attributes. The ``output`` object
+			returned is instead backed directly by the results computed in C,
+			and its ``history`` and ``mdf`` dataframes are not rounded to the
+			precision of the output files. This avoids the file I/O overhead
+			when running many simulations (e.g. when fitting a model to data),
+			but the output will not be available later under this
+			simulation's name, and ``overwrite`` has no effect.
+
+		.. note::
+
+			With ``profile == True``, VICE records the wall-clock time, the
+			CPU time of the thread running the simulation, and the number of
+			calls to each of the following phases:
+
+				- prep: Preparing the simulation in python, including
+				  setup_elements.
+				- setup_elements: Setting up the yields and AGB star yield grids
+				  of each element.
+				- setup_CRF, setup_MSMF, setup_RIa: Tabulating the cumulative
+				  return fraction, the main sequence mass fraction, and the
+				  SN Ia rate (skipped when reused from the previous simulation).
+				- evolve: The entire simulation in C, including every phase
+				  listed below.
+				- gas_evolution: Updating the gas supply, star formation rate,
+				  infall rate and outflow rate.
+				- ccsne, sneia, agb, recycling: Computing the enrichment from
+				  each channel and the return of metals from previous
+				  generations of stars.
+				- mdf: Updating the stellar metallicity distribution function.
+				- history_output, mdf_output: Writing output to the
+				  history.out and mdf.out files (or to memory).
+				- pickle: Saving the yield settings and attributes.
+
+			Phases which are never entered are left out. The timers are read
+			only when profiling, such that the simulation is not slowed down
+			otherwise.
+
+			Profiling also records the wall-clock time and number of calls
+			from C to each of the functional attributes defined in Python: a
+			custom IMF (while it is tabulated), functional yields from core
+			collapse supernovae (labeled "ccsne yield of fe", etc.), type Ia
+			supernovae, and AGB stars, and a ``tau_star`` which depends on the
+			gas supply. These are stored under the "callbacks" entry of the
+			timings, such that users can identify which functions may be
+			worth tabulating or replacing with built-in settings. If they
+			account for more than half of the time spent setting up and
+			evolving the simulation, VICE also raises a
+			``VisibleRuntimeWarning`` after the simulation summarizing them.
+
 		Example Code
 		------------
 		>>> import numpy as np
@@ -1793,7 +1944,183 @@ ran.""" % (i, j), UserWarning)
 		>>> sz = vice.singlezone(name = "example")
 		>>> outtimes = np.linspace(0, 10, 1001)
 		>>> sz.run(outtimes)
+		>>> out = sz.run(outtimes, in_memory = True)
+		>>> out.history["[o/fe]"][-1]
+		-0.30705166231381653
+		>>> out = sz.run(outtimes, in_memory = True, profile = True)
+		>>> out.timings["sneia"]
+		{'wall': 0.0064, 'cpu': 0.0064, 'calls': 3000}
+		>>> vice.yields.sneia.settings['fe'] = lambda z: 0.0012 * (z / 0.014)
+		>>> out = sz.run(outtimes, in_memory = True, profile = True)
+		>>> out.timings["callbacks"]["sneia yield of fe"]
+		{'wall': 0.0041, 'calls': 1000}
 		"""
 		return self.__c_version.run(output_times, capture = capture,
-			overwrite = overwrite)
+			overwrite = overwrite, in_memory = in_memory, profile = profile)
+
+	@staticmethod
+	def run_many(configs, output_times, workers = 1, **kwargs):
+		r"""
+		Run an ensemble of related simulations, returning their output from
+		memory.
+
+		**Signature**: vice.singlezone.run_many(configs, output_times,
+		workers = 1, \*\*kwargs)
+
+		.. versionadded:: 1.4.0
+
+		Parameters
+		----------
+		configs : array-like [elements of type ``dict``]
+			The attributes of each simulation in the ensemble which differ
+			from ``kwargs``. Each dictionary maps attribute names onto their
+			values, as they would be passed to the ``singlezone`` constructor.
+		output_times : array-like [elements are real numbers]
+			The times in Gyr at which VICE should record output from each
+			simulation. See ``vice.singlezone.run``.
+		workers : ``int`` [default : 1]
+			The number of threads to run simulations with.
+		kwargs : varying types
+			The attributes shared by all simulations in the ensemble.
+			Attributes specified by neither ``kwargs`` nor an element of
+			``configs`` take on their default values.
+
+		Returns
+		-------
+		outputs : ``ensemble_outputs`` [``list`` derived class]
+			The ``output`` objects of each simulation, where ``outputs[i]`` is
+			that of ``configs[i]``. This object additionally has a function
+			``stack``, which takes a key to the history or the MDF and returns
+			that quantity from every simulation as a 2-D list.
+
+		Raises
+		------
+		* TypeError
+			- ``configs`` is not an array-like object of dictionaries
+			- ``workers`` is not an integer
+		* ValueError
+			- ``workers`` is not positive
+		* Other exceptions
+			- The first error encountered in setting up or running any
+			  simulation in the ensemble
+
+		Notes
+		-----
+		Each simulation runs with ``in_memory = True`` (see
+		``vice.singlezone.run``), so nothing is written to disk. Each thread
+		runs its share of ``configs`` in order with one ``singlezone`` object,
+		changing only the attributes which differ from the previous
+		simulation. The tables describing single stellar populations (the
+		cumulative return fraction, main sequence mass fraction, SN Ia rates,
+		and AGB star yield grids) are therefore reused between consecutive
+		simulations which do not change the settings they depend on, and it
+		is most efficient to vary attributes such as ``elements``, ``dt``,
+		``IMF``, or ``RIa`` as infrequently as possible across ``configs``.
+		Mass-lifetime relation data are read in only once for the entire
+		ensemble.
+
+		.. note:: Simulations run in threads rather than processes because
+			``output`` objects store their data in C and cannot be passed
+			between processes. Simulations release the global interpreter lock
+			as they evolve unless they call python functions along the way
+			(see ``vice.singlezone.run``).
+
+		Example Code
+		------------
+		>>> import vice
+		>>> outs = vice.singlezone.run_many(
+			[{"eta": 1, "tau_star": 2}, {"eta": 2, "tau_star": 3}],
+			[0.01 * i for i in range(1001)], workers = 2,
+			elements = ["fe", "o"])
+		>>> outs
+		<VICE ensemble of 2 singlezone outputs>
+		>>> outs[0].history["[o/fe]"][-1]
+		-0.29393045563492637
+		>>> [i[-1] for i in outs.stack("[fe/h]")]
+		[0.0853384400372092, -0.12091251445189728]
+		"""
+		try:
+			configs = list(configs)
+		except TypeError:
+			raise TypeError("""Must be an array-like object of dictionaries. \
+Got: %s""" % (type(configs)))
+		if not all([isinstance(i, dict) for i in configs]): raise TypeError(
+			"All simulation configurations must be of type dict.")
+		if not isinstance(workers, numbers.Number) or workers % 1 != 0:
+			raise TypeError("""Keyword arg 'workers' must be an integer. \
+Got: %s""" % (type(workers)))
+		elif workers <= 0:
+			raise ValueError("""Keyword arg 'workers' must be positive. \
+Got: %d""" % (workers))
+		else:
+			workers = min(int(workers), max(len(configs), 1))
+
+		# Each thread runs a contiguous block of the ensemble.
+		blocks = [configs[(i * len(configs)) // workers:
+			((i + 1) * len(configs)) // workers] for i in range(workers)]
+		def run_block(block):
+			sz = singlezone(**kwargs)
+			outputs = []
+			applied = {}
+			for config in block:
+				_apply_ensemble_config(sz, template, kwargs, applied, config)
+				outputs.append(sz.run(output_times, in_memory = True))
+			return outputs
+
+		# Hold the mass-lifetime relation data for the whole ensemble.
+		template = singlezone(**kwargs)
+		template.__c_version.import_mlr_data()
+		try:
+			if workers == 1:
+				results = [run_block(block) for block in blocks]
+			else:
+				with ThreadPoolExecutor(max_workers = workers) as executor:
+					results = list(executor.map(run_block, blocks))
+		finally:
+			template.__c_version.free_mlr_data()
+		outputs = ensemble_outputs()
+		for i in results: outputs.extend(i)
+		return outputs
+
+
+def _apply_ensemble_config(sz, template, kwargs, applied, config):
+	r"""
+	Assign the attributes of one member of an ensemble of simulations to the
+	singlezone object which runs it (see vice.singlezone.run_many).
+
+	Parameters
+	----------
+	sz : ``singlezone``
+		The object running the ensemble member.
+	template : ``singlezone``
+		An object constructed with the attributes shared by all members.
+	kwargs : ``dict``
+		The attributes shared by all members.
+	applied : ``dict``
+		The attributes which ``sz`` has taken on for previous members, which
+		is updated in place. Attributes of a previous member not specified by
+		this one are reverted to their shared or default values, and
+		attributes whose values are unchanged are not re-assigned, allowing
+		``sz`` to reuse its single stellar population tables.
+	config : ``dict``
+		The attributes of this member.
+	"""
+	def unchanged(current, value):
+		if current is value: return True
+		try:
+			return bool(current == value)
+		except Exception:
+			return False
+	for key in list(applied.keys()) + [i for i in config.keys() if i not in
+		applied.keys()]:
+		if key in config.keys():
+			value = config[key]
+		elif key in kwargs.keys():
+			value = kwargs[key]
+		else:
+			value = getattr(template, key)
+		if key not in applied.keys() or not unchanged(applied[key], value):
+			setattr(sz, key, value)
+			applied[key] = value
+		else: pass
 
@@ -13,6 +13,13 @@ if not __VICE_SETUP__:
 	from . import trials
 	from . import sanitychecks
 	from .from_output import test_from_output
+	from .retain_ssp import test_retain_ssp
+	from .threads import test_threads
+	from .in_memory import test_in_memory
+	from .run_many import test_run_many
+	from .adaptive import test_adaptive
+	from .profile import test_profile
+	from .profile import test_profile_callbacks
 	from ....src.singlezone.tests import test as src_test
 
 	@moduletest
@@ -23,6 +30,13 @@ if not __VICE_SETUP__:
 		return ["vice.singlezone",
 			[
 				test_from_output(),
+				test_retain_ssp(),
+				test_threads(),
+				test_in_memory(),
+				test_run_many(),
+				test_adaptive(),
+				test_profile(),
+				test_profile_callbacks(),
 				_singlezone.test(run = False),
 				trials.test(run = False),
 				sanitychecks.test(run = False),
@@ -745,7 +745,7 @@ cdef class singlezone_tester:
 			try:
 				# This function only works with custom RIa's
 				self.RIa = lambda t: t**-1.5
-				self.set_ria()
+				self.set_ria(self.map_ria())
 				e = self._sz[0].elements
 				x = True
 				for i in range(self._sz[0].n_elements):
@@ -828,7 +828,7 @@ cdef class singlezone_tester:
 					self.elements) and
 				len(os.listdir("%s.vice/yields/sneia" % (self.name))) == len(
 					self.elements) and
-				len(os.listdir("%s.vice/attributes" % (self.name))) == 28
+				len(os.listdir("%s.vice/attributes" % (self.name))) == 29
 			)
 			os.system("rm -rf %s.vice" % (self.name))
 			return x
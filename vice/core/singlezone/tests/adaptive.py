@@ -0,0 +1,39 @@
+from __future__ import absolute_import
+__all__ = ["test_adaptive"]
+from ..singlezone import singlezone
+from ....testing import unittest
+
+
+@unittest
+def test_adaptive():
+	r"""
+	vice.singlezone adaptive timestepping unittest
+	"""
+	def test():
+		r"""
+		Simulations ran with adaptive timestepping must write output at the
+		same times as those ran with a fixed timestep size, and predict
+		abundances within a small multiple of the tolerance.
+		"""
+		times = [0.05 * i for i in range(201)]
+		kwargs = {
+			"elements": ("fe", "sr", "o"),
+			"func": lambda t: 5 if t < 5 else 10
+		}
+		try:
+			fixed = singlezone(name = "test", **kwargs).run(times,
+				in_memory = True)
+			adaptive = singlezone(name = "test", adaptive = True,
+				**kwargs).run(times, in_memory = True)
+			status = fixed.history["time"] == adaptive.history["time"]
+			for key in ["[fe/h]", "[o/h]", "[sr/h]", "[o/fe]"]:
+				status &= all([abs(a - b) < 0.02 for a, b in zip(
+					fixed.history[key][1:], adaptive.history[key][1:])])
+			for key in ["mgas", "mstar"]:
+				status &= all([abs(a - b) <= 0.02 * a for a, b in zip(
+					fixed.history[key][1:], adaptive.history[key][1:])])
+		except:
+			return False
+		return status
+	return ["vice.singlezone.adaptive", test]
+
@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+__all__ = ["test_in_memory"]
+from ..singlezone import singlezone
+from ....testing import unittest
+import math
+import os
+
+
+@unittest
+def test_in_memory():
+	r"""
+	vice.singlezone in-memory output unittest
+	"""
+	def test():
+		r"""
+		Simulations ran with in_memory = True must not write anything to disk,
+		and must predict the same results as those written to the output files
+		up to the precision of the files.
+		"""
+		def close(x, y):
+			if math.isnan(x) or math.isnan(y):
+				return math.isnan(x) and math.isnan(y)
+			elif math.isinf(x) or math.isinf(y):
+				return x == y
+			else:
+				return abs(x - y) <= 1.e-5 * max(abs(x), abs(y)) + 1.e-6
+		times = [0.05 * i for i in range(21)]
+		kwargs = {
+			"elements": ("fe", "sr", "o"),
+			"dt": 0.01
+		}
+		try:
+			ondisk = singlezone(name = "test", **kwargs).run(times,
+				overwrite = True, capture = True)
+			inmemory = singlezone(name = "test_in_memory", **kwargs).run(
+				times, in_memory = True)
+			status = not os.path.exists("test_in_memory.vice")
+			status &= inmemory.elements == ondisk.elements
+			for frame in ["history", "mdf"]:
+				a = getattr(ondisk, frame)
+				b = getattr(inmemory, frame)
+				status &= a.keys() == b.keys() and a.size == b.size
+				for key in a.keys():
+					status &= all(map(close, a[key], b[key]))
+			for channel in ["agb_yields", "ccsne_yields", "sneia_yields"]:
+				a = getattr(ondisk, channel)
+				b = getattr(inmemory, channel)
+				status &= all([a[i] == b[i] for i in kwargs["elements"]])
+		except:
+			return False
+		return status
+	return ["vice.singlezone.in_memory", test]
+
@@ -0,0 +1,107 @@
+from __future__ import absolute_import
+__all__ = ["test_profile", "test_profile_callbacks"]
+from ..singlezone import singlezone
+from ...outputs import output
+from ..._cutils import _CALLBACK_TIMINGS_
+from ....testing import unittest
+import warnings
+import os
+
+
+@unittest
+def test_profile():
+	r"""
+	vice.singlezone profiling unittest
+	"""
+	def test():
+		r"""
+		Profiled simulations must record every phase they enter, once per
+		timestep for each element where applicable, write the timings to
+		timings.json, and predict the same results as unprofiled simulations.
+		"""
+		times = [0.05 * i for i in range(21)]
+		kwargs = {
+			"elements": ("fe", "sr", "o"),
+			"dt": 0.01
+		}
+		phases = ["prep", "setup_elements", "setup_CRF", "setup_MSMF",
+			"setup_RIa", "evolve", "gas_evolution", "ccsne", "sneia", "agb",
+			"recycling", "mdf", "history_output", "mdf_output", "pickle"]
+		try:
+			plain = singlezone(name = "test", **kwargs).run(times,
+				overwrite = True, capture = True)
+			status = plain.timings is None
+			profiled = singlezone(name = "test_profile", **kwargs).run(times,
+				overwrite = True, capture = True, profile = True)
+			status &= os.path.exists("test_profile.vice/timings.json")
+			status &= sorted(profiled.timings.keys()) == sorted(phases)
+			for phase in phases:
+				status &= profiled.timings[phase]["wall"] >= 0
+				status &= profiled.timings[phase]["cpu"] >= 0
+				status &= profiled.timings[phase]["calls"] > 0
+			n = profiled.timings["gas_evolution"]["calls"]
+			for phase in ["ccsne", "sneia", "agb", "recycling"]:
+				status &= profiled.timings[phase]["calls"] == 3 * n
+			status &= profiled.timings["mdf"]["calls"] == n
+			status &= profiled.timings["evolve"]["wall"] >= (
+				profiled.timings["agb"]["wall"])
+			for key in plain.history.keys():
+				# [X/Y] ratios are NaN at time zero
+				status &= (plain.history[key][1:] ==
+					profiled.history[key][1:])
+			inmemory = singlezone(name = "test_profile", **kwargs).run(times,
+				in_memory = True, profile = True)
+			status &= "evolve" in inmemory.timings.keys()
+			status &= "pickle" not in inmemory.timings.keys()
+		except:
+			return False
+		return status
+	return ["vice.singlezone.profile", test]
+
+
+@unittest
+def test_profile_callbacks():
+	r"""
+	vice.singlezone profiling of functional attributes unittest
+	"""
+	def test():
+		r"""
+		Profiled simulations must record each call from C to functional
+		attributes defined in Python, and leave no records of them behind,
+		including when they raise an exception.
+		"""
+		def func(t):
+			# the setter checks that the function can be called at t = 1
+			if 0.5 < t < 0.9: raise ValueError("test")
+			return 10
+		times = [0.05 * i for i in range(21)]
+		sz = singlezone(name = "test_profile", elements = ("fe", "o"),
+			dt = 0.01, IMF = lambda m: m**-2.35,
+			tau_star = lambda t, mgas: 2 + mgas / 1.e10)
+		try:
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				out = sz.run(times, in_memory = True, profile = True)
+			status = sorted(out.timings["callbacks"].keys()) == ["IMF",
+				"tau_star"]
+			status &= out.timings["callbacks"]["IMF"]["calls"] > 0
+			status &= out.timings["callbacks"]["tau_star"]["calls"] >= (
+				out.timings["gas_evolution"]["calls"])
+			status &= out.timings["callbacks"]["tau_star"]["wall"] <= (
+				out.timings["evolve"]["wall"])
+			status &= not _CALLBACK_TIMINGS_
+			out = sz.run(times, in_memory = True)
+			status &= out.timings is None
+			status &= not _CALLBACK_TIMINGS_
+			sz.func = func
+			try:
+				sz.run(times, in_memory = True, profile = True)
+				status = False
+			except ValueError:
+				pass
+			status &= not _CALLBACK_TIMINGS_
+			status &= not hasattr(sz.IMF, "function")
+		except:
+			return False
+		return status
+	return ["vice.singlezone.profile.callbacks", test]
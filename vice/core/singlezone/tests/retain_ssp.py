@@ -0,0 +1,42 @@
+from __future__ import absolute_import
+__all__ = ["test_retain_ssp"]
+from ..singlezone import singlezone
+from ....testing import unittest
+import math
+
+
+@unittest
+def test_retain_ssp():
+	r"""
+	vice.singlezone single stellar population tables reuse unittest
+	"""
+	def test():
+		r"""
+		Repeated simulations with the same singlezone object, which reuse the
+		tables describing single stellar populations when the settings they
+		depend on are unchanged, must predict the same abundances as a new
+		singlezone object with the same settings.
+		"""
+		times = [0.05 * i for i in range(21)]
+		kwargs = {
+			"elements": ("fe", "sr", "o"),
+			"dt": 0.01,
+			"RIa": lambda t: t**-1.1
+		}
+		try:
+			sz = singlezone(name = "test", **kwargs)
+			status = True
+			for i in range(3):
+				sz.func = lambda t, i = i: 5 + i * math.sin(t)
+				if i == 2: sz.postMS = 0.2 # tables must be recomputed
+				reused = sz.run(times, overwrite = True, capture = True)
+				fresh = singlezone(name = "test", func = sz.func,
+					postMS = sz.postMS, **kwargs).run(times, overwrite = True,
+					capture = True)
+				for key in ["mstar", "z(fe)", "z(sr)", "z(o)"]:
+					status &= reused.history[key] == fresh.history[key]
+		except:
+			return False
+		return status
+	return ["vice.singlezone.retain_ssp", test]
+
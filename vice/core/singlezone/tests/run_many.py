@@ -0,0 +1,44 @@
+from __future__ import absolute_import
+__all__ = ["test_run_many"]
+from ..singlezone import singlezone
+from ....testing import unittest
+
+
+@unittest
+def test_run_many():
+	r"""
+	vice.singlezone.run_many unittest
+	"""
+	def test():
+		r"""
+		Each member of an ensemble of simulations, ran across a pool of
+		threads with objects that are reused between members, must predict
+		the same abundances as the same simulation ran on its own.
+		"""
+		times = [0.05 * i for i in range(21)]
+		kwargs = {
+			"elements": ("fe", "o"),
+			"dt": 0.01
+		}
+		configs = [
+			{"eta": 1.5},
+			{"eta": 2, "IMF": "salpeter"},
+			{"eta": 2},
+			{"tau_star": lambda t: 2 + t},
+			{}
+		]
+		try:
+			ensemble = singlezone.run_many(configs, times, workers = 2,
+				**kwargs)
+			status = len(ensemble) == len(configs)
+			for i in range(len(configs)):
+				single = singlezone(**dict(kwargs, **configs[i])).run(times,
+					in_memory = True)
+				for key in ["mstar", "z(fe)", "z(o)"]:
+					status &= ensemble[i].history[key] == single.history[key]
+			status &= ensemble.stack("z(o)") == [i.history["z(o)"] for i in
+				ensemble]
+		except:
+			return False
+		return status
+	return ["vice.singlezone.run_many", test]
@@ -0,0 +1,42 @@
+from __future__ import absolute_import
+__all__ = ["test_threads"]
+from ..singlezone import singlezone
+from ....testing import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+
+@unittest
+def test_threads():
+	r"""
+	vice.singlezone concurrent simulations unittest
+	"""
+	def test():
+		r"""
+		Simulations ran concurrently across a pool of threads, some of which
+		release the global interpreter lock as they evolve, must predict the
+		same abundances as the same simulations ran one after another.
+		"""
+		times = [0.05 * i for i in range(21)]
+		settings = [
+			{"eta": 1.5, "tau_star": 1.5},
+			{"eta": 2.5, "tau_star": 2},
+			{"eta": 2.5, "tau_star": lambda t: 2 + t}, 	# holds the GIL
+			{"eta": 0.5, "RIa": "exp", "IMF": lambda m: m**-2.3}
+		]
+		def run(i):
+			return singlezone(name = "test%d" % (i), elements = ("fe", "o"),
+				dt = 0.01, **settings[i]).run(times, overwrite = True,
+				capture = True).history
+		try:
+			serial = [run(i) for i in range(len(settings))]
+			with ThreadPoolExecutor(max_workers = len(settings)) as executor:
+				threaded = list(executor.map(run, range(len(settings))))
+			status = True
+			for i in range(len(settings)):
+				for key in ["mstar", "z(fe)", "z(o)"]:
+					status &= serial[i][key] == threaded[i][key]
+		except:
+			return False
+		return status
+	return ["vice.singlezone.threads", test]
+
@@ -8,12 +8,14 @@ except NameError:
 if not __VICE_SETUP__:
 	__all__ = [
 		"single_stellar_population",
+		"single_stellar_population_many",
 		"cumulative_return_fraction",
 		"main_sequence_mass_fraction",
 		"imf",
 		"test"
 	]
 	from ._ssp import single_stellar_population
+	from ._ssp import single_stellar_population_many
 	from ._crf import cumulative_return_fraction
 	from ._msmf import main_sequence_mass_fraction
 	from . import _imf as imf
@@ -10,6 +10,9 @@ from ..objects._ssp cimport ssp_free
 cdef extern from "../../src/ssp.h":
 	double *single_population_enrichment(SSP *ssp, ELEMENT *e,
 		double Z, double *times, unsigned long n_times, double mstar)
+	double *single_population_enrichment_many(SSP *ssp, ELEMENT *e,
+		double *Z, double *mstar, unsigned long n_pops, double *times,
+		unsigned long n_times)
 	double CRF(SSP ssp, double time)
 	double MSMF(SSP ssp, double time)
 
@@ -37,6 +37,7 @@ from .._cutils cimport copy_2Dpylist
 from .._cutils cimport copy_pylist
 from .._cutils cimport set_string
 from .._cutils cimport setup_imf
+from .._cutils cimport setup_agb_grid
 from .._cutils cimport binspace
 from ..objects._element cimport ELEMENT
 from ..objects._ssp cimport SSP
@@ -199,60 +200,8 @@ def single_stellar_population(element, mstar = 1e6, Z = 0.014, time = 10,
 	_ssp_utils._ssp_type_checks(element, **kwargs)
 	_ssp_utils._ssp_value_checks(element, **kwargs)
 
-	# Necessary C structs for calling _ssp.single_population_enrichment
-	cdef SSP *ssp = _ssp.ssp_initialize()
-	cdef ELEMENT *e = _element.element_initialize()
-	# set_string(ssp[0].imf, IMF.lower())
-	ssp[0].postMS = postMS
-	ssp[0].imf[0].m_upper = m_upper
-	ssp[0].imf[0].m_lower = m_lower
-
-	# Setup the yields
-	if callable(ccsne.settings[element]):
-		callback_cc = callback1_nan_inf(ccsne.settings[element])
-		callback_1arg_setup(e[0].ccsne_yields[0].yield_, callback_cc)
-	else:
-		callback_1arg_setup(e[0].ccsne_yields[0].yield_,
-			ccsne.settings[element])
-
-	if callable(sneia.settings[element]):
-		callback_ia = callback1_nan_inf(sneia.settings[element])
-		callback_1arg_setup(e[0].sneia_yields[0].yield_, callback_ia)
-	else:
-		callback_1arg_setup(e[0].sneia_yields[0].yield_,
-			sneia.settings[element])
-
-	# callback_1arg_setup(e[0].ccsne_yields[0].yield_,
-	# 	ccsne.settings[element],
-	# 	callback1_nan_inf)
-	# callback_1arg_setup(e[0].sneia_yields[0].yield_, sneia.settings[element],
-	# 	callback1_nan_inf)
-
-
 	# Take into account deprecation of the keyword arg "agb_model"
-	def builtin_agb_grid(model):
-		agbfile = find_agb_yield_file(element, model)
-		if os.path.exists(agbfile):
-			if _agb.import_agb_grid(e, agbfile.encode("latin-1")):
-				raise IOError("Failed to read AGB yield file.")
-			else:
-				pass
-		else:
-			raise IOError("AGB yield file not found. Please re-install VICE.")
-	if agb_model is None:
-		# take into account deprecation of the keyword arg 'agb_model'
-		if callable(agb.settings[element]):
-			callback_agb = callback2_nan_inf(agb.settings[element])
-			callback_2arg_setup(
-				e[0].agb_grid[0].custom_yield,
-				callback_agb
-			)
-			# e[0].agb_grid[0].custom_yield = callback_2arg_from_pyfunc(
-			# 	agb.settings[element]
-			# )
-		else:
-			builtin_agb_grid(agb.settings[element.lower()])
-	else:
+	if agb_model is not None:
 		msg = """\
 Setting AGB star yield model via keyword argument to this function is \
 deprecated in this version of VICE (%s). Instead, modify the yield settings \
@@ -265,80 +214,240 @@ with linear interpolation between masses and metallicities on the grid.
 This feature will be removed in a future release of VICE.
 """ % (version, _ssp_utils._AGB_STUDIES_[agb_model])
 		warnings.warn(msg, DeprecationWarning)
-		builtin_agb_grid(agb_model)
-		
+	else: pass
+
+	mass, times = _enrichment([element], [Z], [mstar], time, dt, m_upper,
+		m_lower, postMS, IMF, RIa, delay, agb_model = agb_model)
+	return [mass[0][0], times]
+
+
+def single_stellar_population_many(element, Z, mstar = 1e6, time = 10,
+	dt = 0.01, m_upper = 100, m_lower = 0.08, postMS = 0.1, IMF = "kroupa",
+	RIa = "plaw", delay = 0.15):
+	r"""
+	Simulate the nucleosynthesis of one or more elements from many star
+	clusters of different metallicities and masses at once. Each cluster is
+	treated in the same manner as by ``vice.single_stellar_population``.
+
+	**Signature**: vice.single_stellar_population_many(element, Z,
+	mstar = 1.0e+06, time = 10, dt = 0.01, m_upper = 100, m_lower = 0.08,
+	postMS = 0.1, IMF = "kroupa", RIa = "plaw", delay = 0.15)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	element : ``str`` [case-insensitive] or array-like of ``str``
+		The symbol of the element to simulate the enrichment for, or a list
+		of symbols to simulate the enrichment for each of them.
+	Z : array-like
+		The metallicity by mass of the stars in each cluster.
+	mstar : real number or array-like [default : 1.0e+06]
+		The birth mass of each star cluster in solar masses. If array-like,
+		it must be of the same length as ``Z``, with one mass per cluster.
+	time : real number [default : 10]
+		The amount of time in Gyr to run the simulations for.
+	dt : real number [default : 0.01]
+		The size of each timestep in Gyr.
+	m_upper : real number [default : 100]
+		The upper mass limit on star formation in solar masses.
+	m_lower : real number [default : 0.08]
+		The lower mass limit on star formation in solar masses.
+	postMS : real number [default : 0.1]
+		The ratio of a star's post main sequence lifetime to its main sequence
+		lifetime.
+	IMF : ``str`` [case-insensitive] or ``<function>`` [default : "kroupa"]
+		The stellar initial mass function (IMF) to assume. See docstring of
+		``vice.single_stellar_population`` for details.
+	RIa : ``str`` [case-insensitive] or ``<function>`` [default : "plaw"]
+		The delay-time distribution for type Ia supernovae to adopt. See
+		docstring of ``vice.single_stellar_population`` for details.
+	delay : real number [default : 0.15]
+		The minimum delay time following the formation of a single stellar
+		population before the onset of type Ia supernovae in Gyr.
 
-	# Map RIa across time
-	if RIa == "exp":
+	Returns
+	-------
+	mass : list or ``dict``
+		If ``element`` is a string, a 2-D list where ``mass[i][j]`` is the net
+		mass of the element in solar masses produced by the i'th star cluster
+		at the j'th timestep. If ``element`` is a list of symbols, a ``dict``
+		mapping each symbol to such a list.
+	times : list
+		The times in Gyr corresponding to each mass yield.
+
+	Raises
+	------
+	* TypeError
+		- 	``Z`` or ``mstar`` contain non-numerical values.
+	* ValueError
+		- 	``Z`` is empty.
+		- 	``mstar`` is array-like but not of the same length as ``Z``.
+	* Other exceptions are raised under the same circumstances as by
+	  ``vice.single_stellar_population``.
+
+	Notes
+	-----
+	The stellar initial mass function, the main sequence mass fraction, the
+	SN Ia delay-time distribution and the mass-lifetime relation are set up
+	only once and shared between all clusters and elements, and each element
+	is simulated for all clusters in a single call to VICE's C library. This
+	function is therefore significantly faster than calling
+	``vice.single_stellar_population`` for each cluster and element,
+	particularly with custom functions for the IMF or delay-time
+	distribution. Its results are identical.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> mass, times = vice.single_stellar_population_many("fe",
+		[0.001, 0.014])
+	>>> mass[1][-1]
+		2645.0340871188687
+	>>> mass, times = vice.single_stellar_population_many(["o", "fe"],
+		[0.001, 0.014], mstar = [1.e5, 1.e6])
+	>>> list(mass.keys())
+		['o', 'fe']
+	"""
+	if isinstance(element, strcomp):
+		elements = [element]
+	else:
+		elements = list(element)
+	Z, mstar = _ssp_utils._ssp_many_checks(Z, mstar)
+	for elem in elements:
+		kwargs = {
+			"mstar": 				min(mstar),
+			"Z": 					min(Z),
+			"time": 				time,
+			"dt": 					dt,
+			"m_upper": 				m_upper,
+			"m_lower": 				m_lower,
+			"postMS": 				postMS,
+			"RIa": 					RIa,
+			"delay": 				delay,
+			"RIA_MAX_EVAL_TIME": 	_sneia.RIA_MAX_EVAL_TIME
+		}
+		_ssp_utils._ssp_type_checks(elem, **kwargs)
+		_ssp_utils._ssp_value_checks(elem, **kwargs)
+
+	mass, times = _enrichment(elements, Z, mstar, time, dt, m_upper, m_lower,
+		postMS, IMF, RIa, delay)
+	if isinstance(element, strcomp):
+		return [mass[0], times]
+	else:
+		return [dict(zip(elements, mass)), times]
+
+
+def _enrichment(elements, Z, mstar, time, dt, m_upper, m_lower, postMS, IMF,
+	RIa, delay, agb_model = None):
+	r"""
+	Run the simulations of single stellar population enrichment for the
+	single_stellar_population and single_stellar_population_many functions.
+	Arguments are assumed to have passed type and value checks.
+
+	Parameters
+	----------
+	elements : list
+		The symbols of the elements to simulate.
+	Z : list
+		The metallicity by mass of each star cluster.
+	mstar : list
+		The mass of each star cluster, of the same length as Z.
+	agb_model : str or None [default : None]
+		The deprecated keyword argument to single_stellar_population.
+
+	Other arguments are as they are passed to single_stellar_population.
+
+	Returns
+	-------
+	mass : list
+		A 3-D list where mass[i][j][k] is the mass of the i'th element produced
+		by the j'th star cluster at the k'th timestep.
+	times : list
+		The times in Gyr corresponding to each mass.
+	"""
+	# The SN Ia delay-time distribution is mapped once for all elements
+	if isinstance(RIa, strcomp) and RIa.lower() == "exp":
 		# built-in exponential delay-time distribution
-		e[0].sneia_yields[0].RIa = map_pyfunc_over_array(
-			lambda t: 0 if t < delay else m.exp(-t / 1.5),
-			_pyutils.range_(0, _sneia.RIA_MAX_EVAL_TIME, dt))
-	elif RIa == "plaw":
+		dtd = list(map(lambda t: 0 if t < delay else m.exp(-t / 1.5),
+			_pyutils.range_(0, _sneia.RIA_MAX_EVAL_TIME, dt)))
+	elif isinstance(RIa, strcomp) and RIa.lower() == "plaw":
 		# power-law delay-time distribution
-		e[0].sneia_yields[0].RIa = map_pyfunc_over_array(
-			lambda t: 0 if t < delay else (t + 1.e-12)**(
+		dtd = list(map(lambda t: 0 if t < delay else (t + 1.e-12)**(
 				-1 * _sneia.PLAW_DTD_INDEX),
-			_pyutils.range_(0, _sneia.RIA_MAX_EVAL_TIME, dt))
+			_pyutils.range_(0, _sneia.RIA_MAX_EVAL_TIME, dt)))
 	elif callable(RIa):
 		# custom functional delay-time distribution
-		arr = list(map(lambda t: 0 if t < delay else RIa(t),
+		dtd = list(map(lambda t: 0 if t < delay else RIa(t),
 			_pyutils.range_(0, _sneia.RIA_MAX_EVAL_TIME, dt)))
-		_pyutils.numeric_check(arr, ArithmeticError,
+		_pyutils.numeric_check(dtd, ArithmeticError,
 			"Custom RIa evaluated to non-numerical value")
-		e[0].sneia_yields[0].RIa = copy_pylist(arr)
 	else:
 		# failsafe ---> should already be caught
 		raise SystemError("Internal Error")
-	_sneia.normalize_RIa(e, _sneia.RIA_MAX_EVAL_TIME / dt + 1)
 
-	# Call the C routines
-	if callable(IMF):
-		callback_imf = callback1_nan_inf_positive(IMF)
-		setup_imf(ssp[0].imf, callback_imf)
-	else:
-		setup_imf(ssp[0].imf, IMF)
-
-	# Set up any mass-lifetime relation data on this extension
-	# other forms don't have required data
-	_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
-	if mlr.setting in ["vincenzo2016", "hpt2000", "ka1997"]:
-		func = {
-			"vincenzo2016": _mlr.vincenzo2016_import,
-			"hpt2000": _mlr.hpt2000_import,
-			"ka1997": _mlr.ka1997_import
-		}[mlr.setting]
-		path = "%ssrc/ssp/mlr/%s.dat" % (_DIRECTORY_, mlr.setting)
-		func(path.encode("latin-1"))
-	else: pass
+	# Necessary C structs for calling _ssp.single_population_enrichment_many
+	cdef SSP *ssp = _ssp.ssp_initialize()
+	cdef ELEMENT *e = NULL
+	cdef double *cresults = NULL
+	cdef double *evaltimes = NULL
+	cdef double *cZ = copy_pylist(Z)
+	cdef double *cmstar = copy_pylist(mstar)
+	ssp[0].postMS = postMS
+	ssp[0].imf[0].m_upper = m_upper
+	ssp[0].imf[0].m_lower = m_lower
 
 	# patch note (versions >= 1.2.1): long(time / dt) + 10l used to be +11l.
 	# Although well into the buffer of extra timesteps added, thus not
 	# affecting the returned values, this used to raise an erroneous error
 	# about a NaN main sequence turnoff mass.
-	cdef double *evaltimes = binspace(0, time + 10 * dt,
-		long((time + 10 * dt) / dt))
-
-	cdef double *cresults = _ssp.single_population_enrichment(ssp, e,
-		Z,
-		evaltimes,
-		long(time / dt) + 10l,
-		mstar)
-	if cresults is NULL:
-		raise MemoryError("Internal Error")
-	else:
-		pass
-
+	cdef unsigned long n_times = long(time / dt) + 10l
+	n_out = int(time / dt) + 1
+	mass = []
 	try:
-		# pull the data into python
-		pyresults = [cresults[i] for i in range(int(time / dt) + 1)]
-		times = [evaltimes[i] for i in range(int(time / dt) + 1)]
+		if callable(IMF):
+			callback_imf = callback1_nan_inf_positive(IMF)
+			setup_imf(ssp[0].imf, callback_imf)
+		else:
+			setup_imf(ssp[0].imf, IMF)
+
+		# Set up any mass-lifetime relation data on this extension
+		# other forms don't have required data
+		_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
+		if mlr.setting in ["vincenzo2016", "hpt2000", "ka1997"]:
+			func = {
+				"vincenzo2016": _mlr.vincenzo2016_import,
+				"hpt2000": _mlr.hpt2000_import,
+				"ka1997": _mlr.ka1997_import
+			}[mlr.setting]
+			path = "%ssrc/ssp/mlr/%s.dat" % (_DIRECTORY_, mlr.setting)
+			func(path.encode("latin-1"))
+		else: pass
+
+		evaltimes = binspace(0, time + 10 * dt, long((time + 10 * dt) / dt))
+		times = [evaltimes[i] for i in range(n_out)]
+		for element in elements:
+			e = _element.element_initialize()
+			try:
+				setup_yields(e, element, agb_model = agb_model)
+				e[0].sneia_yields[0].RIa = copy_pylist(dtd)
+				_sneia.normalize_RIa(e, _sneia.RIA_MAX_EVAL_TIME / dt + 1)
+				cresults = _ssp.single_population_enrichment_many(ssp, e,
+					cZ, cmstar, len(Z), evaltimes, n_times)
+				if cresults is NULL: raise MemoryError("Internal Error")
+				mass.append([[cresults[i * n_times + j] for j in range(
+					n_out)] for i in range(len(Z))])
+			finally:
+				_element.element_free(e)
+				e = NULL
+				free(cresults)
+				cresults = NULL
 	finally:
 		# always free the memory
-		_element.element_free(e)
 		_ssp.ssp_free(ssp)
-		free(cresults)
 		free(evaltimes)
+		free(cZ)
+		free(cmstar)
 
 		# take down mass-lifetime relation data
 		# other forms don't have required data
@@ -351,7 +460,46 @@ This feature will be removed in a future release of VICE.
 			func()
 		else: pass
 
-	return [pyresults, times]
+	return [mass, times]
+
+
+cdef void setup_yields(ELEMENT *e, element, agb_model = None) except *:
+	r"""
+	Set up the nucleosynthetic yields of a given element from CCSNe, SNe Ia,
+	and AGB stars according to the current settings in ``vice.yields``.
+
+	Parameters
+	----------
+	e : ``ELEMENT *``
+		The element to set up the yields for.
+	element : ``str``
+		The symbol of the element.
+	agb_model : ``str`` or None [default : None]
+		The deprecated keyword argument to single_stellar_population. If not
+		None, this AGB star yield model is adopted rather than the current
+		setting.
+	"""
+	if callable(ccsne.settings[element]):
+		callback_cc = callback1_nan_inf(ccsne.settings[element])
+		callback_1arg_setup(e[0].ccsne_yields[0].yield_, callback_cc)
+	else:
+		callback_1arg_setup(e[0].ccsne_yields[0].yield_,
+			ccsne.settings[element])
+
+	if callable(sneia.settings[element]):
+		callback_ia = callback1_nan_inf(sneia.settings[element])
+		callback_1arg_setup(e[0].sneia_yields[0].yield_, callback_ia)
+	else:
+		callback_1arg_setup(e[0].sneia_yields[0].yield_,
+			sneia.settings[element])
+
+	if agb_model is not None:
+		setup_agb_grid(e, element, agb_model)
+	elif callable(agb.settings[element]):
+		callback_agb = callback2_nan_inf(agb.settings[element])
+		callback_2arg_setup(e[0].agb_grid[0].custom_yield, callback_agb)
+	else:
+		setup_agb_grid(e, element, agb.settings[element.lower()])
 
 
 ######## DEPRECATED IN DEVELOPMENT REPO AFTER RELEASE OF VERSION 1.0.0 ########
@@ -230,6 +230,55 @@ re-install VICE from source (https://github.com/giganano/VICE.git).""")
 	else: pass
 
 
+def _ssp_many_checks(Z, mstar):
+	"""
+	Does type and value checking of the metallicities and masses of star
+	clusters passed to the single_stellar_population_many function.
+
+	Parameters
+	==========
+	Z :: array-like
+		The metallicity by mass of each star cluster
+	mstar :: real number or array-like
+		The mass of each star cluster, or one mass for all of them
+
+	Returns
+	=======
+	Z :: list
+		The metallicities as a list
+	mstar :: list
+		The mass of each star cluster as a list of the same length as Z
+
+	Raises
+	======
+	TypeError ::
+		::	Z is not array-like
+		::	Z or mstar contain a non-numerical value
+	ValueError ::
+		::	Z is empty
+		::	mstar is array-like and not of the same length as Z
+	"""
+	if not hasattr(Z, "__iter__") or isinstance(Z, strcomp):
+		raise TypeError("Z must be an array-like object. Got: %s" % (type(Z)))
+	else:
+		Z = list(Z)
+	if not len(Z): raise ValueError("Z must contain at least one metallicity.")
+	if isinstance(mstar, numbers.Number):
+		mstar = len(Z) * [mstar]
+	elif hasattr(mstar, "__iter__") and not isinstance(mstar, strcomp):
+		mstar = list(mstar)
+		if len(mstar) != len(Z): raise ValueError("""\
+Keyword arg 'mstar' must be of the same length as Z. Got: %d. Required: \
+%d.""" % (len(mstar), len(Z)))
+	else:
+		raise TypeError("""Keyword arg 'mstar' must be a real number or an \
+array-like object. Got: %s""" % (type(mstar)))
+	for i in range(len(Z)):
+		_numeric_checker(Z[i], "Z")
+		_numeric_checker(mstar[i], "mstar")
+	return [Z, mstar]
+
+
 def _msmf_crf_value_checks(m_upper = 100, m_lower = 0.08, postMS = 0.1):
 	"""
 	Ensures that each keyword arg is in the allowed range.
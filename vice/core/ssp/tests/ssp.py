@@ -12,6 +12,7 @@ from ...._globals import _RECOGNIZED_ELEMENTS_
 from ...._globals import _VERSION_ERROR_
 from ...dataframe._builtin_dataframes import atomic_number
 from .._ssp import single_stellar_population
+from .._ssp import single_stellar_population_many
 from ....yields import agb
 from ....testing import moduletest
 from ....testing import unittest
@@ -101,6 +102,30 @@ class mlr_generator(generator):
 		return [self.msg, test]
 
 
+@unittest
+def test_many():
+	r"""
+	vice.core.single_stellar_population_many unit test
+	"""
+	def test():
+		elements = ["c", "n", "o", "fe", "sr"]
+		Z = [0., 0.001, 0.014, 0.03]
+		mstar = [1.e5, 1.e6, 1.e4, 1.e7]
+		try:
+			mass, times = single_stellar_population_many(elements, Z,
+				mstar = mstar, time = 3)
+			for elem in elements:
+				for i in range(len(Z)):
+					if mass[elem][i] != single_stellar_population(elem,
+						Z = Z[i], mstar = mstar[i], time = 3)[0]: return False
+			mass, times = single_stellar_population_many("fe", Z, time = 3)
+			return len(mass) == len(Z) and all([len(_) == len(times) for _ in
+				mass])
+		except:
+			return False
+	return ["vice.core.single_stellar_population_many", test]
+
+
 @moduletest
 def test():
 	"""
@@ -116,5 +141,6 @@ def test():
 			"vice.core.single_stellar_population [RIa :: %s]" % (str(i)),
 			RIa = i, time = 3)())
 	for i in mlr.recognized: trials.append(mlr_generator(mlr = i)())
+	trials.append(test_many())
 	return ["vice.core.single_stellar_population trial tests", trials]
 
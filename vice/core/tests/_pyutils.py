@@ -9,6 +9,7 @@ from .._pyutils import range_
 from .._pyutils import args
 from .._pyutils import arg_count
 from .._pyutils import is_ascii
+from .._pyutils import callback_warning
 try:
 	ModuleNotFoundError
 except NameError:
@@ -23,6 +24,7 @@ try:
 	import pandas as pd
 except:
 	pass
+import warnings
 import array
 import sys
 
@@ -40,7 +42,8 @@ def test():
 			test_range_(),
 			test_args(),
 			test_arg_count(),
-			test_is_ascii()
+			test_is_ascii(),
+			test_callback_warning()
 		]
 	]
 
@@ -180,3 +183,28 @@ def test_is_ascii():
 		return is_ascii("test") and not is_ascii(chr(129))
 	return ["vice.core._pyutils.is_ascii", test]
 
+
+@unittest
+def test_callback_warning():
+	r"""
+	vice.core._pyutils.callback_warning unit test
+	"""
+	def test():
+		def warns(wall):
+			timings = {
+				"prep": {"wall": 1., "cpu": 1., "calls": 1},
+				"evolve": {"wall": 1., "cpu": 1., "calls": 1},
+				"callbacks": {"tau_star": {"wall": wall, "calls": 10}}
+			}
+			with warnings.catch_warnings(record = True) as caught:
+				warnings.simplefilter("always")
+				callback_warning(timings)
+			return len(caught) > 0
+		status = not warns(0.5)
+		status &= warns(1.5)
+		with warnings.catch_warnings(record = True) as caught:
+			warnings.simplefilter("always")
+			callback_warning({"evolve": {"wall": 1., "cpu": 1., "calls": 1}})
+		status &= not caught
+		return status
+	return ["vice.core._pyutils.callback_warning", test]
@@ -183,6 +183,7 @@ static double *logarithmic_abundance(FROMFILE *ff, char *element,
 	double *onH = Z_element(ff, element);
 	if (onH != NULL) {
 		unsigned long i;
+		double Z_previous = 0;
 		int index = get_element_index(elements, element, n_elements);
 
 		switch (index) {
@@ -193,7 +194,17 @@ static double *logarithmic_abundance(FROMFILE *ff, char *element,
 
 			default:
 				for (i = 0ul; i < (*ff).n_rows; i++) {
-					onH[i] = log10(onH[i] / solar[index]);
+					/*
+					 * Tracer particles born in the same zone at the same
+					 * time are stored in adjacent rows and share the same
+					 * abundances; reuse the previous row where possible.
+					 */
+					if (i && onH[i] == Z_previous) {
+						onH[i] = onH[i - 1ul];
+					} else {
+						Z_previous = onH[i];
+						onH[i] = log10(onH[i] / solar[index]);
+					}
 				}
 				return onH;
 
@@ -301,7 +312,12 @@ static double *logarithmic_scaled(FROMFILE *ff, unsigned int n_elements,
 		unsigned long i;
 		double *scaled = (double *) malloc ((*ff).n_rows * sizeof(double));
 		for (i = 0ul; i < (*ff).n_rows; i++) {
-			scaled[i] = log10(total_by_element[i] / solar_by_element);
+			if (i && total_by_element[i] == total_by_element[i - 1ul]) {
+				/* adjacent rows with equal abundances -> reuse */
+				scaled[i] = scaled[i - 1ul];
+			} else {
+				scaled[i] = log10(total_by_element[i] / solar_by_element);
+			}
 		}
 		free(total_by_element);
 		return scaled;
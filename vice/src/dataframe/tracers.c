@@ -170,3 +170,64 @@ extern unsigned int tracers_row_length(FROMFILE *ff, unsigned int n_elements,
 
 }
 
+
+
+/*
+ * Compute weighted histograms of a quantity across the star particles in a
+ * tracers object, separated into groups according to the value of another
+ * quantity, in a single pass over the star particles.
+ *
+ * Parameters
+ * ==========
+ * values: 		The quantity to histogram for each star particle
+ * groups: 		The quantity to group star particles by. NULL to place all star
+ * 				particles in a single group.
+ * weights: 	The weight of each star particle. NULL for uniform weights.
+ * n_rows: 		The number of star particles
+ * bins: 		The bin edges of the histogram
+ * n_bins: 		The number of bins. This is always 1 less than the number of
+ * 				bin edges.
+ * group_bins: 	The bin edges defining each group. Ignored if groups is NULL.
+ * n_groups: 	The number of groups. This is always 1 less than the number of
+ * 				group bin edges. Must be 1 if groups is NULL.
+ *
+ * Returns
+ * =======
+ * The histogram within each group, stored as a flattened array of length
+ * n_groups * n_bins, with the histogram of the i'th group starting at index
+ * i * n_bins. NULL on failure to allocate memory.
+ *
+ * Notes
+ * =====
+ * Star particles whose value or group quantity is not finite or does not lie
+ * within the bins are excluded.
+ *
+ * header: tracers.h
+ */
+extern double *tracers_grouped_histogram(double *values, double *groups,
+	double *weights, unsigned long n_rows, double *bins, unsigned long n_bins,
+	double *group_bins, unsigned long n_groups) {
+
+	double *hist = (double *) malloc (n_groups * n_bins * sizeof(double));
+	if (hist == NULL) return NULL;
+	unsigned long i;
+	for (i = 0ul; i < n_groups * n_bins; i++) hist[i] = 0;
+
+	for (i = 0ul; i < n_rows; i++) {
+		if (!isfinite(values[i])) continue;
+		long group = 0l;
+		if (groups != NULL) {
+			if (!isfinite(groups[i])) continue;
+			group = get_bin_number(group_bins, n_groups, groups[i]);
+			if (group == -1l) continue;
+		} else {}
+		long bin = get_bin_number(bins, n_bins, values[i]);
+		if (bin != -1l) {
+			hist[(unsigned long) group * n_bins + (unsigned long) bin] += (
+				weights != NULL ? weights[i] : 1);
+		} else {}
+	}
+
+	return hist;
+
+}
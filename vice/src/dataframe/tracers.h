@@ -51,6 +51,42 @@ extern double *tracers_row(FROMFILE *ff, unsigned long row, char **elements,
 extern unsigned int tracers_row_length(FROMFILE *ff, unsigned int n_elements,
 	char **elements);
 
+/*
+ * Compute weighted histograms of a quantity across the star particles in a
+ * tracers object, separated into groups according to the value of another
+ * quantity, in a single pass over the star particles.
+ *
+ * Parameters
+ * ==========
+ * values: 		The quantity to histogram for each star particle
+ * groups: 		The quantity to group star particles by. NULL to place all star
+ * 				particles in a single group.
+ * weights: 	The weight of each star particle. NULL for uniform weights.
+ * n_rows: 		The number of star particles
+ * bins: 		The bin edges of the histogram
+ * n_bins: 		The number of bins. This is always 1 less than the number of
+ * 				bin edges.
+ * group_bins: 	The bin edges defining each group. Ignored if groups is NULL.
+ * n_groups: 	The number of groups. This is always 1 less than the number of
+ * 				group bin edges. Must be 1 if groups is NULL.
+ *
+ * Returns
+ * =======
+ * The histogram within each group, stored as a flattened array of length
+ * n_groups * n_bins, with the histogram of the i'th group starting at index
+ * i * n_bins. NULL on failure to allocate memory.
+ *
+ * Notes
+ * =====
+ * Star particles whose value or group quantity is not finite or does not lie
+ * within the bins are excluded.
+ *
+ * source: tracers.c
+ */
+extern double *tracers_grouped_histogram(double *values, double *groups,
+	double *weights, unsigned long n_rows, double *bins, unsigned long n_bins,
+	double *group_bins, unsigned long n_groups);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -10,6 +10,10 @@
 #include "imf.h"
 #include "utils.h"
 #include "debug.h"
+#include "ssp/remnants.h"
+
+static double imf_mass_weight(double m);
+static double imf_returned_weight(double m);
 
 
 /*
@@ -66,6 +70,150 @@ extern double imf_evaluate(IMF_ imf, double m) {
 }
 
 
+/*
+ * Determine the stellar mass at which an IMF is sampled when it is
+ * tabulated.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object containing the mass limits of star formation
+ * index: 		The index of the sampled mass, between 0 and IMF_N_MASSES - 1
+ *
+ * Returns
+ * =======
+ * The stellar mass in Msun. The first and last masses are exactly the lower
+ * and upper mass limits of star formation.
+ *
+ * header: imf.h
+ */
+extern double imf_tabulation_mass(IMF_ imf, unsigned long index) {
+
+	if (!index) {
+		return imf.m_lower;
+	} else if (index >= IMF_N_MASSES - 1ul) {
+		return imf.m_upper;
+	} else {
+		double dlnm = log(imf.m_upper / imf.m_lower) / (IMF_N_MASSES - 1ul);
+		return imf.m_lower * exp(index * dlnm);
+	}
+
+}
+
+
+/*
+ * Integrate a tabulated IMF once for each of the weightings required by the
+ * cumulative return fraction and the main sequence mass fraction, storing
+ * the results in the mass_cumulative and returned_cumulative attributes.
+ *
+ * Parameters
+ * ==========
+ * imf: 		A pointer to the IMF object, with its mass_distribution already
+ * 				tabulated
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the IMF has not been tabulated
+ *
+ * header: imf.h
+ */
+extern unsigned short imf_integrate_table(IMF_ *imf) {
+
+	if ((*imf).mass_distribution == NULL) return 1u;
+	if ((*imf).mass_cumulative != NULL) free(imf -> mass_cumulative);
+	if ((*imf).returned_cumulative != NULL) free(imf -> returned_cumulative);
+	imf -> mass_cumulative = imf_cumulative_integral(*imf,
+		&imf_mass_weight);
+	imf -> returned_cumulative = imf_cumulative_integral(*imf,
+		&imf_returned_weight);
+	return 0u;
+
+}
+
+
+/*
+ * Integrate a weighted, tabulated IMF from the lower mass limit of star
+ * formation up to each of the sampled masses.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object, with its mass_distribution already tabulated
+ * weight: 		The function of stellar mass weighting the IMF in the integral
+ *
+ * Returns
+ * =======
+ * A pointer to the IMF_N_MASSES values of the integral of weight(m) * IMF(m)
+ * dm from m_lower up to each of the sampled masses. NULL if the IMF has not
+ * been tabulated.
+ *
+ * header: imf.h
+ */
+extern double *imf_cumulative_integral(IMF_ imf, double (*weight)(double)) {
+
+	if (imf.mass_distribution == NULL) return NULL;
+
+	/*
+	 * With x = ln(m), the integral of weight(m) * IMF(m) dm is the integral
+	 * of weight(m) * IMF(m) * m dx, which is integrated with the trapezoid
+	 * rule on the evenly spaced grid in x.
+	 */
+	unsigned long i;
+	double dlnm = log(imf.m_upper / imf.m_lower) / (IMF_N_MASSES - 1ul);
+	double *cumulative = (double *) malloc (IMF_N_MASSES * sizeof(double));
+	double m = imf_tabulation_mass(imf, 0ul);
+	double previous = weight(m) * imf.mass_distribution[0] * m;
+	cumulative[0] = 0;
+	for (i = 1ul; i < IMF_N_MASSES; i++) {
+		m = imf_tabulation_mass(imf, i);
+		double current = weight(m) * imf.mass_distribution[i] * m;
+		cumulative[i] = cumulative[i - 1ul] + 0.5 * dlnm * (previous +
+			current);
+		previous = current;
+	}
+	return cumulative;
+
+}
+
+
+/*
+ * Evaluate a cumulative integral of the IMF at an arbitrary stellar mass by
+ * interpolating between its values at the sampled masses.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object whose mass limits the integral was computed over
+ * cumulative: 	The integral as returned by imf_cumulative_integral
+ * m: 			The stellar mass to evaluate the integral up to
+ *
+ * Returns
+ * =======
+ * The integral from m_lower up to the mass m. This is zero for masses below
+ * m_lower and the integral over the full mass range for masses above
+ * m_upper.
+ *
+ * header: imf.h
+ */
+extern double imf_cumulative_evaluate(IMF_ imf, double *cumulative, double m) {
+
+	if (m <= imf.m_lower) {
+		return 0;
+	} else if (m >= imf.m_upper) {
+		return cumulative[IMF_N_MASSES - 1ul];
+	} else {
+		/*
+		 * The sampled masses are evenly spaced in ln(m), so the bin number
+		 * follows directly from the logarithm of the mass.
+		 */
+		double x = (IMF_N_MASSES - 1ul) * log(m / imf.m_lower) / log(
+			imf.m_upper / imf.m_lower);
+		unsigned long i = (unsigned long) x;
+		if (i >= IMF_N_MASSES - 1ul) i = IMF_N_MASSES - 2ul;
+		return cumulative[i] + (x - i) * (cumulative[i + 1ul] -
+			cumulative[i]);
+	}
+
+}
+
+
 /*
  * The Salpeter (1955) stellar initial mass function (IMF) up to a
  * normalization constant.
@@ -152,3 +300,41 @@ extern double kroupa01(double m) {
 
 }
 
+
+/*
+ * Weight the IMF by the initial stellar mass.
+ *
+ * Parameters
+ * ==========
+ * m: 		The stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * m itself
+ */
+static double imf_mass_weight(double m) {
+
+	return m;
+
+}
+
+
+/*
+ * Weight the IMF by the mass that a star returns to the ISM over its
+ * lifetime, under the Kalirai et al. (2008) initial-final remnant mass
+ * relation.
+ *
+ * Parameters
+ * ==========
+ * m: 		The stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * The initial mass minus the remnant mass, in Msun
+ */
+static double imf_returned_weight(double m) {
+
+	return m - Kalirai08_remnant_mass(m);
+
+}
+
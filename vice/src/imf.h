@@ -26,10 +26,14 @@ extern "C" {
 #define SPEC_CHARP_SIZE 100
 #endif /* SPEC_CHARP_SIZE */
 
-/* The stepsize taken in sampling a functional IMF */
-#ifndef IMF_STEPSIZE
-#define IMF_STEPSIZE 1e-3
-#endif /* IMF_STEPSIZE */
+/*
+ * The number of stellar masses at which a functional IMF is sampled. These
+ * are evenly spaced in the logarithm of mass between the lower and upper
+ * mass limits of star formation, inclusive.
+ */
+#ifndef IMF_N_MASSES
+#define IMF_N_MASSES 4096ul
+#endif /* IMF_N_MASSES */
 
 #include "objects.h"
 #include "objects/imf.h"
@@ -50,6 +54,87 @@ extern "C" {
  */
 extern double imf_evaluate(IMF_ imf, double m);
 
+/*
+ * Determine the stellar mass at which an IMF is sampled when it is
+ * tabulated.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object containing the mass limits of star formation
+ * index: 		The index of the sampled mass, between 0 and IMF_N_MASSES - 1
+ *
+ * Returns
+ * =======
+ * The stellar mass in Msun. The first and last masses are exactly the lower
+ * and upper mass limits of star formation.
+ *
+ * source: imf.c
+ */
+extern double imf_tabulation_mass(IMF_ imf, unsigned long index);
+
+/*
+ * Integrate a tabulated IMF once for each of the weightings required by the
+ * cumulative return fraction and the main sequence mass fraction, storing
+ * the results in the mass_cumulative and returned_cumulative attributes.
+ *
+ * Parameters
+ * ==========
+ * imf: 		A pointer to the IMF object, with its mass_distribution already
+ * 				tabulated
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the IMF has not been tabulated
+ *
+ * source: imf.c
+ */
+extern unsigned short imf_integrate_table(IMF_ *imf);
+
+/*
+ * Integrate a weighted, tabulated IMF from the lower mass limit of star
+ * formation up to each of the sampled masses.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object, with its mass_distribution already tabulated
+ * weight: 		The function of stellar mass weighting the IMF in the integral
+ *
+ * Returns
+ * =======
+ * A pointer to the IMF_N_MASSES values of the integral of weight(m) * IMF(m)
+ * dm from m_lower up to each of the sampled masses. NULL if the IMF has not
+ * been tabulated.
+ *
+ * Notes
+ * =====
+ * The integrals are computed with the trapezoid rule in the logarithm of
+ * stellar mass, making them accurate across many decades of mass for only
+ * IMF_N_MASSES evaluations of the IMF.
+ *
+ * source: imf.c
+ */
+extern double *imf_cumulative_integral(IMF_ imf, double (*weight)(double));
+
+/*
+ * Evaluate a cumulative integral of the IMF at an arbitrary stellar mass by
+ * interpolating between its values at the sampled masses.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF object whose mass limits the integral was computed over
+ * cumulative: 	The integral as returned by imf_cumulative_integral
+ * m: 			The stellar mass to evaluate the integral up to
+ *
+ * Returns
+ * =======
+ * The integral from m_lower up to the mass m. This is zero for masses below
+ * m_lower and the integral over the full mass range for masses above
+ * m_upper.
+ *
+ * source: imf.c
+ */
+extern double imf_cumulative_evaluate(IMF_ imf, double *cumulative, double m);
+
 /*
  * The Salpeter (1955) stellar initial mass function (IMF) up to a
  * normalization constant.
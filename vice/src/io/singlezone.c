@@ -12,9 +12,19 @@
 #include "../io.h"
 #include "singlezone.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned int history_columns(SINGLEZONE sz);
+static unsigned int mdf_columns(SINGLEZONE sz);
+static double *zone_history_row(SINGLEZONE sz, double mstar,
+	double mass_recycled, double *unretained);
+static void append_row(FROMFILE *ff, double *row);
+
+
 /*
  * Open the history.out and mdf.out output files associated with a SINGLEZONE
- * object.
+ * object. If the output is to be retained in memory, the structs which store
+ * it are allocated instead, discarding any output from a previous simulation
+ * that python did not take ownership of.
  *
  * Returns
  * =======
@@ -24,6 +34,15 @@
  */
 extern unsigned short singlezone_open_files(SINGLEZONE *sz) {
 
+	if ((*sz).in_memory) {
+		singlezone_free_output(sz);
+		sz -> history_data = fromfile_initialize();
+		sz -> mdf_data = fromfile_initialize();
+		sz -> history_data -> n_cols = history_columns(*sz);
+		sz -> mdf_data -> n_cols = mdf_columns(*sz);
+		return 0;
+	} else {}
+
 	char *history_file = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
 	char *mdf_file = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
 
@@ -65,6 +84,55 @@ extern void singlezone_close_files(SINGLEZONE *sz) {
 
 }
 
+/*
+ * Free up the output of a SINGLEZONE object retained in memory and set the
+ * values back to NULL.
+ *
+ * header: singlezone.h
+ */
+extern void singlezone_free_output(SINGLEZONE *sz) {
+
+	if ((*sz).history_data != NULL) {
+		fromfile_free(sz -> history_data);
+		sz -> history_data = NULL;
+	} else {}
+	if ((*sz).mdf_data != NULL) {
+		fromfile_free(sz -> mdf_data);
+		sz -> mdf_data = NULL;
+	} else {}
+
+}
+
+/*
+ * Determine the number of columns in the history output of a SINGLEZONE
+ * object: the 8 evolutionary parameters, followed by the inflow metallicity,
+ * outflow metallicity, and ISM mass of each element.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ */
+static unsigned int history_columns(SINGLEZONE sz) {
+
+	return 8u + 3u * sz.n_elements;
+
+}
+
+/*
+ * Determine the number of columns in the MDF output of a SINGLEZONE object:
+ * the two bin edges, followed by the distribution in [X/H] of each element
+ * and in [X/Y] of each combination of elements.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ */
+static unsigned int mdf_columns(SINGLEZONE sz) {
+
+	return 2u + sz.n_elements + sz.n_elements * (sz.n_elements - 1u) / 2u;
+
+}
+
 /*
  * Writes the header to the history file
  *
@@ -124,7 +192,8 @@ extern void write_history_header(SINGLEZONE sz) {
 }
 
 /*
- * Write output to the history.out file at the current timestep.
+ * Write output to the history.out file at the current timestep, or retain
+ * it in memory.
  *
  * Parameters
  * ==========
@@ -176,16 +245,6 @@ extern void write_zone_history(SINGLEZONE sz, double mstar,
 	 * accepted as parameters here.
 	 */
 
-	/*
-	 * Write the evolutionary parameters
-	 *
-	 * Notes
-	 * =====
-	 * Factor of 1e9 on star formation rate, infall rate, and outflow rate
-	 * converts from Msun/Gyr to Msun/yr to report quantities in conventional
-	 * units.
-	 */
-
 	if (sz.current_time < sz.output_times[sz.n_outputs - 1l] + sz.dt) {
 
 		/*
@@ -194,46 +253,103 @@ extern void write_zone_history(SINGLEZONE sz, double mstar,
 		 * timesteps from being written to the output file.
 		 */
 
-		fprintf(sz.history_writer, "%e\t", sz.current_time);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).mass);
-		fprintf(sz.history_writer, "%e\t", mstar);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).star_formation_rate / 1e9);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).infall_rate / 1e9);
-		fprintf(sz.history_writer, "%e\t",
-			(get_outflow_rate(sz) + sum(unretained, sz.n_elements)) / 1e9);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).eta[sz.timestep]);
-		if ((*sz.ssp).continuous) {
-			/* effective recycling factor in case of continuous recycling */
-			fprintf(sz.history_writer, "%e\t", mass_recycled /
-				((*sz.ism).star_formation_rate * sz.dt));
+		double *row = zone_history_row(sz, mstar, mass_recycled, unretained);
+		if (sz.in_memory) {
+			append_row(sz.history_data, row);
 		} else {
-			/* instantaneous recycling parameter otherwise */
-			fprintf(sz.history_writer, "%e\t", (*sz.ssp).R0);
-		}
-		unsigned int i;
-		for (i = 0; i < sz.n_elements; i++) {
-			/* infall metallicity */
-			fprintf(sz.history_writer, "%e\t",
-				(*sz.elements[i]).Zin[sz.timestep] +
-				(*sz.elements[i]).primordial);
-		}
-		for (i = 0; i < sz.n_elements; i++) {
-			/* outflow metallicity = enhancement factor x ISM metallicity */
-			fprintf(sz.history_writer, "%e\t",
-				((*sz.ism).enh[sz.timestep] * (*sz.elements[i]).Z[sz.timestep] *
-					get_outflow_rate(sz) + unretained[i]) /
-				(get_outflow_rate(sz) + sum(unretained, sz.n_elements)));
-		}
-		for (i = 0; i < sz.n_elements; i++) {
-			/* total ISM mass of each element */
-			fprintf(sz.history_writer, "%e\t", (*sz.elements[i]).mass);
+			unsigned int i;
+			for (i = 0u; i < history_columns(sz); i++) {
+				fprintf(sz.history_writer, "%e\t", row[i]);
+			}
+			fprintf(sz.history_writer, "\n");
+			free(row);
 		}
-		fprintf(sz.history_writer, "\n");
 
 	} else {}
 
 }
 
+/*
+ * Compute one row of a zone's history output.
+ *
+ * Parameters
+ * ==========
+ * sz: 				The singlezone object associated with the zone
+ * mstar: 			The stellar mass in the zone
+ * mass_recycled: 	The recycled mass in the zone
+ * unretained: 		The amount of mass unretained in the given zone for each
+ * 					element
+ *
+ * Returns
+ * =======
+ * The values of each column of the history output at the current timestep,
+ * in the order described by write_history_header.
+ */
+static double *zone_history_row(SINGLEZONE sz, double mstar,
+	double mass_recycled, double *unretained) {
+
+	/*
+	 * Notes
+	 * =====
+	 * Factor of 1e9 on star formation rate, infall rate, and outflow rate
+	 * converts from Msun/Gyr to Msun/yr to report quantities in conventional
+	 * units.
+	 */
+
+	double *row = (double *) malloc (history_columns(sz) * sizeof(double));
+	row[0] = sz.current_time;
+	row[1] = (*sz.ism).mass;
+	row[2] = mstar;
+	row[3] = (*sz.ism).star_formation_rate / 1e9;
+	row[4] = (*sz.ism).infall_rate / 1e9;
+	row[5] = (get_outflow_rate(sz) + sum(unretained, sz.n_elements)) / 1e9;
+	row[6] = (*sz.ism).eta[sz.timestep];
+	if ((*sz.ssp).continuous) {
+		/* effective recycling factor in case of continuous recycling */
+		row[7] = mass_recycled / ((*sz.ism).star_formation_rate * sz.dt);
+	} else {
+		/* instantaneous recycling parameter otherwise */
+		row[7] = (*sz.ssp).R0;
+	}
+	unsigned int i, n = 8u;
+	for (i = 0; i < sz.n_elements; i++) {
+		/* infall metallicity */
+		row[n++] = (*sz.elements[i]).Zin[sz.timestep] +
+			(*sz.elements[i]).primordial;
+	}
+	for (i = 0; i < sz.n_elements; i++) {
+		/* outflow metallicity = enhancement factor x ISM metallicity */
+		row[n++] = ((*sz.ism).enh[sz.timestep] *
+			(*sz.elements[i]).Z[sz.timestep] * get_outflow_rate(sz) +
+			unretained[i]) / (get_outflow_rate(sz) +
+			sum(unretained, sz.n_elements));
+	}
+	for (i = 0; i < sz.n_elements; i++) {
+		/* total ISM mass of each element */
+		row[n++] = (*sz.elements[i]).mass;
+	}
+	return row;
+
+}
+
+/*
+ * Append a row to the output of a simulation retained in memory.
+ *
+ * Parameters
+ * ==========
+ * ff: 		The fromfile object storing the output
+ * row: 	The row to append, of length (*ff).n_cols. The fromfile object
+ * 			takes ownership of this memory.
+ */
+static void append_row(FROMFILE *ff, double *row) {
+
+	ff -> data = (double **) realloc (ff -> data,
+		((*ff).n_rows + 1ul) * sizeof(double *));
+	ff -> data[(*ff).n_rows] = row;
+	ff -> n_rows++;
+
+}
+
 /*
  * Writes the header to the mdf output file.
  *
@@ -268,7 +384,8 @@ extern void write_mdf_header(SINGLEZONE sz) {
 }
 
 /*
- * Write to the mdf.out output file at the final timestep.
+ * Write to the mdf.out output file at the final timestep, or retain the
+ * distributions in memory.
  *
  * Parameters
  * ==========
@@ -283,18 +400,24 @@ extern void write_mdf_output(SINGLEZONE sz) {
 	unsigned long i, n = (unsigned long) (sz.n_elements *
 		(sz.n_elements - 1) / 2);
 	for (i = 0l; i < (*sz.mdf).n_bins; i++) {
-		fprintf(sz.mdf_writer, "%e\t%e\t", (*sz.mdf).bins[i],
-			(*sz.mdf).bins[i + 1l]);
+		double *row = (double *) malloc (mdf_columns(sz) * sizeof(double));
+		row[0] = (*sz.mdf).bins[i];
+		row[1] = (*sz.mdf).bins[i + 1l];
 		for (j = 0; j < sz.n_elements; j++) {
-			fprintf(sz.mdf_writer, "%e\t",
-				(*sz.mdf).abundance_distributions[j][i]);
+			row[2u + j] = (*sz.mdf).abundance_distributions[j][i];
 		}
 		for (j = 0; j < n; j++) {
-			fprintf(sz.mdf_writer, "%e\t",
-				(*sz.mdf).ratio_distributions[j][i]);
+			row[2u + sz.n_elements + j] = (*sz.mdf).ratio_distributions[j][i];
+		}
+		if (sz.in_memory) {
+			append_row(sz.mdf_data, row);
+		} else {
+			for (j = 0; j < mdf_columns(sz); j++) {
+				fprintf(sz.mdf_writer, "%e\t", row[j]);
+			}
+			fprintf(sz.mdf_writer, "\n");
+			free(row);
 		}
-		fprintf(sz.mdf_writer, "\n");
 	}
 
 }
-
@@ -10,7 +10,8 @@ extern "C" {
 
 /*
  * Open the history.out and mdf.out output files associated with a SINGLEZONE
- * object.
+ * object. If the output is to be retained in memory, the structs which store
+ * it are allocated instead.
  *
  * Returns
  * =======
@@ -28,6 +29,14 @@ extern unsigned short singlezone_open_files(SINGLEZONE *sz);
  */
 extern void singlezone_close_files(SINGLEZONE *sz);
 
+/*
+ * Free up the output of a SINGLEZONE object retained in memory and set the
+ * values back to NULL.
+ *
+ * source: singlezone.c
+ */
+extern void singlezone_free_output(SINGLEZONE *sz);
+
 /*
  * Writes the header to the history file
  *
@@ -40,7 +49,8 @@ extern void singlezone_close_files(SINGLEZONE *sz);
 extern void write_history_header(SINGLEZONE sz);
 
 /*
- * Write output to the history.out file at the current timestep.
+ * Write output to the history.out file at the current timestep, or retain
+ * it in memory.
  *
  * Parameters
  * ==========
@@ -79,7 +89,8 @@ extern void write_zone_history(SINGLEZONE sz, double mstar,
 extern void write_mdf_header(SINGLEZONE sz);
 
 /*
- * Write to the mdf.out output file at the final timestep.
+ * Write to the mdf.out output file at the final timestep, or retain the
+ * distributions in memory.
  *
  * Parameters
  * ==========
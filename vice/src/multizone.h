@@ -10,6 +10,7 @@ extern "C"{
 #include "objects/multizone.h"
 #include "multizone/agb.h"
 #include "multizone/channel.h"
+#include "multizone/checkpoint.h"
 #include "multizone/element.h"
 #include "multizone/ism.h"
 #include "multizone/mdf.h"
@@ -34,6 +34,14 @@ extern double *m_AGB_from_tracers(MULTIZONE mz, unsigned short index) {
 	for (i = 0l; i < (*mz.mig).n_zones; i++) {
 		mass[i] = 0;
 	}
+
+	/*
+	 * Tracer particles are stored in order of formation, so consecutive
+	 * tracers usually share a metallicity and have similar turnoff masses.
+	 * The bins of the yield grid found for one are the starting point of
+	 * the search for the next.
+	 */
+	long mass_bin = -1l, Z_bin = -1l;
 	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
 		/*
 		 * Get the tracer particle's current zone and metallicity. Use the SSP
@@ -48,8 +56,10 @@ extern double *m_AGB_from_tracers(MULTIZONE mz, unsigned short index) {
 		double Z = tracer_metallicity(mz, *t);
 		unsigned long n = timestep - (*t).timestep_origin;
 		mass[(*t).zone_current] += (
-			get_AGB_yield( *(*mz.zones[(*t).zone_origin]).elements[index],
-				Z, dying_star_mass(n * (*sz).dt, (*ssp).postMS, Z)) *
+			get_AGB_yield_bracketed(
+				*(*mz.zones[(*t).zone_origin]).elements[index], Z,
+				dying_star_mass(n * (*sz).dt, (*ssp).postMS, Z),
+				&mass_bin, &Z_bin) *
 			(*t).mass *
 			((*ssp).msmf[n] - (*ssp).msmf[n + 1l])
 		);
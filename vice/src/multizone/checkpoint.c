@@ -0,0 +1,724 @@
+/*
+ * This file implements checkpoints of multizone simulations, which allow long
+ * integrations to resume from where they left off if they are interrupted.
+ *
+ * A checkpoint consists of two binary files in the output directory. The
+ * first is written once at the start of the simulation, and holds the gas
+ * migration matrix and the zone history of each tracer particle. These are
+ * fixed during setup, but are expensive to compute for large models and may
+ * depend on random numbers. The second holds the state of each zone and
+ * tracer particle at a given timestep, and is replaced each time a checkpoint
+ * is taken. Both are written in the native byte order of the machine.
+ */
+
+#include <stdlib.h>
+#include <string.h>
+#include <stdio.h>
+#include "../multizone.h"
+#include "../singlezone.h"
+#include "../tracer.h"
+#include "../utils.h"
+#include "../io.h"
+#include "checkpoint.h"
+
+/* The names of the checkpoint files within the output directory */
+static const char *MIGRATION_FILE = "checkpoint_migration.bin";
+static const char *STATE_FILE = "checkpoint.bin";
+
+/* Identifies checkpoint files and the version of their layout */
+static const char MAGIC[8] = {'V', 'I', 'C', 'E', 'C', 'K', 'P', 'T'};
+static const unsigned int VERSION = 2u;
+
+/* The number of characters stored for each element's symbol */
+#define SYMBOL_LENGTH 4
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static void checkpoint_filename(MULTIZONE mz, const char *file,
+	unsigned short tmp, char *dest);
+static unsigned short checkpoint_commit(MULTIZONE mz, const char *file);
+static unsigned short write_header(MULTIZONE mz, FILE *out);
+static unsigned short read_header(MULTIZONE mz, FILE *in);
+static unsigned short write_zone(SINGLEZONE sz, FILE *out);
+static unsigned short read_zone(SINGLEZONE *sz, FILE *in);
+static unsigned short read_migration(MULTIZONE *mz, FILE *in);
+static char **read_histories(MULTIZONE mz, long *offsets);
+static unsigned short restore_histories(MULTIZONE *mz, char **histories,
+	long *offsets);
+static void free_histories(MULTIZONE mz, char **histories);
+static void free_resumed_tracers(MULTIZONE *mz);
+static unsigned short write_values(FILE *out, const void *ptr, size_t size,
+	size_t n);
+static unsigned short read_values(FILE *in, void *ptr, size_t size,
+	size_t n);
+
+
+/*
+ * Write the time-independent part of a multizone simulation's checkpoint:
+ * the gas migration matrix and the zone histories of every tracer particle.
+ * These are computed once during setup and are written only at the start of
+ * the simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object, set up to run
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * header: checkpoint.h
+ */
+extern unsigned short multizone_write_checkpoint_migration(MULTIZONE mz) {
+
+	char filename[MAX_FILENAME_SIZE];
+	checkpoint_filename(mz, MIGRATION_FILE, 1u, filename);
+	FILE *out = fopen(filename, "wb");
+	if (out == NULL) return 1u;
+
+	unsigned long i, length = n_timesteps(*mz.zones[0]);
+	unsigned long n = max_tracers(mz);
+	unsigned short status = write_header(mz, out);
+	for (i = 0ul; i < length && !status; i++) {
+		unsigned int j;
+		for (j = 0u; j < (*mz.mig).n_zones && !status; j++) {
+			status |= write_values(out, (*mz.mig).gas_migration[i][j],
+				sizeof(double), (*mz.mig).n_zones);
+		}
+	}
+	for (i = 0ul; i < n && !status; i++) {
+		TRACER *t = (*mz.mig).tracers[i];
+		status |= write_values(out, &(*t).zone_origin, sizeof(unsigned int),
+			1);
+		status |= write_values(out, &(*t).timestep_origin,
+			sizeof(unsigned long), 1);
+		status |= write_values(out, (*t).zone_history, sizeof(int), length);
+	}
+
+	status |= fclose(out) != 0;
+	if (!status) status = checkpoint_commit(mz, MIGRATION_FILE);
+	return status;
+
+}
+
+
+/*
+ * Write the state of a multizone simulation at the current timestep to its
+ * checkpoint file, replacing the previous checkpoint.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * n: 		The number of outputs written to the history files so far
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * header: checkpoint.h
+ */
+extern unsigned short multizone_write_checkpoint(MULTIZONE mz, long n) {
+
+	char filename[MAX_FILENAME_SIZE];
+	checkpoint_filename(mz, STATE_FILE, 1u, filename);
+	FILE *out = fopen(filename, "wb");
+	if (out == NULL) return 1u;
+
+	unsigned int i;
+	unsigned short status = write_header(mz, out);
+	status |= write_values(out, &n, sizeof(long), 1);
+	status |= write_values(out, &(*mz.mig).tracer_count,
+		sizeof(unsigned long), 1);
+
+	/*
+	 * Record the length of each zone's history file, such that any output
+	 * written after this checkpoint can be discarded upon resuming.
+	 */
+	for (i = 0u; i < (*mz.mig).n_zones && !status; i++) {
+		FILE *history = (*mz.zones[i]).history_writer;
+		long offset;
+		status |= fflush(history) != 0;
+		offset = ftell(history);
+		status |= offset < 0l;
+		status |= write_values(out, &offset, sizeof(long), 1);
+	}
+	for (i = 0u; i < (*mz.mig).n_zones && !status; i++) {
+		status |= write_zone(*mz.zones[i], out);
+	}
+
+	unsigned long j;
+	for (j = 0ul; j < (*mz.mig).tracer_count && !status; j++) {
+		TRACER *t = (*mz.mig).tracers[j];
+		status |= write_values(out, &(*t).mass, sizeof(double), 1);
+		status |= write_values(out, &(*t).zone_current, sizeof(unsigned int),
+			1);
+	}
+
+	status |= fclose(out) != 0;
+	if (!status) status = checkpoint_commit(mz, STATE_FILE);
+	return status;
+
+}
+
+
+/*
+ * Set up a multizone simulation to resume from its checkpoint in place of
+ * multizone_setup.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object, with memory allocated for its
+ * 			gas migration matrix and tracer particles
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on zone setup failure, 2 on migration normalization
+ * error, 4 if the checkpoint could not be read, was written by a simulation
+ * with different settings, or the output up to it could not be restored.
+ *
+ * Notes
+ * =====
+ * On failure, the tracer particles are freed, and if the zones were already
+ * set up, the memory allocated in doing so is freed by multizone_clean. The
+ * caller is then left to cancel the simulation as it would if the setup
+ * had failed.
+ *
+ * header: checkpoint.h
+ */
+extern unsigned short multizone_resume(MULTIZONE *mz) {
+
+	char filename[MAX_FILENAME_SIZE];
+	checkpoint_filename(*mz, MIGRATION_FILE, 0u, filename);
+	FILE *in = fopen(filename, "rb");
+	if (in == NULL) {
+		free_resumed_tracers(mz);
+		return 4u;
+	} else {}
+	unsigned short status = read_header(*mz, in) || read_migration(mz, in);
+	fclose(in);
+	if (status) {
+		free_resumed_tracers(mz);
+		return 4u;
+	} else {}
+
+	checkpoint_filename(*mz, STATE_FILE, 0u, filename);
+	in = fopen(filename, "rb");
+	if (in == NULL) {
+		free_resumed_tracers(mz);
+		return 4u;
+	} else {}
+	long n, *offsets = (long *) malloc ((*(*mz).mig).n_zones * sizeof(long));
+	unsigned long tracer_count;
+	status = read_header(*mz, in);
+	status |= read_values(in, &n, sizeof(long), 1);
+	status |= read_values(in, &tracer_count, sizeof(unsigned long), 1);
+	status |= tracer_count > max_tracers(*mz);
+	status |= read_values(in, offsets, sizeof(long), (*(*mz).mig).n_zones);
+
+	/*
+	 * Setting up each zone opens its history file for writing, discarding
+	 * its contents. Hold on to the output written up to the checkpoint
+	 * first, and put it back once the files are open again.
+	 */
+	char **histories = status ? NULL : read_histories(*mz, offsets);
+	if (histories == NULL) {
+		free(offsets);
+		fclose(in);
+		free_resumed_tracers(mz);
+		return 4u;
+	} else {}
+	unsigned short x = multizone_setup(mz);
+	if (x) {
+		free_histories(*mz, histories);
+		free(offsets);
+		fclose(in);
+		free_resumed_tracers(mz);
+		return x;
+	} else {}
+	status |= restore_histories(mz, histories, offsets);
+	free_histories(*mz, histories);
+	free(offsets);
+
+	unsigned int i;
+	for (i = 0u; i < (*(*mz).mig).n_zones && !status; i++) {
+		status |= read_zone(mz -> zones[i], in);
+	}
+	unsigned long j;
+	for (j = 0ul; j < tracer_count && !status; j++) {
+		TRACER *t = mz -> mig -> tracers[j];
+		status |= read_values(in, &(t -> mass), sizeof(double), 1);
+		status |= read_values(in, &(t -> zone_current), sizeof(unsigned int),
+			1);
+	}
+	fclose(in);
+	if (status) {
+		/* the zones are set up, and share their tables with one another */
+		free_resumed_tracers(mz);
+		multizone_clean(mz);
+		return 4u;
+	} else {}
+
+	mz -> mig -> tracer_count = tracer_count;
+	mz -> n_written = n;
+	return 0u;
+
+}
+
+
+/*
+ * Remove the checkpoint files of a multizone simulation once it has finished.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ *
+ * header: checkpoint.h
+ */
+extern void multizone_remove_checkpoint(MULTIZONE mz) {
+
+	char filename[MAX_FILENAME_SIZE];
+	checkpoint_filename(mz, STATE_FILE, 0u, filename);
+	remove(filename);
+	checkpoint_filename(mz, MIGRATION_FILE, 0u, filename);
+	remove(filename);
+
+}
+
+
+/*
+ * Determine the path to one of the checkpoint files of a multizone
+ * simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * file: 	The name of the checkpoint file within the output directory
+ * tmp: 	boolean int describing whether or not to give the path to the
+ * 			temporary file which is written before replacing the checkpoint
+ * dest: 	The string to store the path in
+ */
+static void checkpoint_filename(MULTIZONE mz, const char *file,
+	unsigned short tmp, char *dest) {
+
+	strcpy(dest, mz.name);
+	strcat(dest, "/");
+	strcat(dest, file);
+	if (tmp) strcat(dest, ".tmp");
+
+}
+
+
+/*
+ * Replace one of the checkpoint files of a multizone simulation with the
+ * temporary file that was just written. Since renaming a file is atomic, an
+ * interruption while writing a checkpoint leaves the previous one intact.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * file: 	The name of the checkpoint file within the output directory
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short checkpoint_commit(MULTIZONE mz, const char *file) {
+
+	char tmp[MAX_FILENAME_SIZE], dest[MAX_FILENAME_SIZE];
+	checkpoint_filename(mz, file, 1u, tmp);
+	checkpoint_filename(mz, file, 0u, dest);
+	return rename(tmp, dest) != 0;
+
+}
+
+
+/*
+ * Write the header of a checkpoint file, which records the settings that
+ * determine its layout and the hash of the simulation's settings.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * out: 	The checkpoint file
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short write_header(MULTIZONE mz, FILE *out) {
+
+	SINGLEZONE sz = *mz.zones[0];
+	unsigned long length = n_timesteps(sz);
+	unsigned short status = write_values(out, MAGIC, sizeof(char), 8);
+	status |= write_values(out, &VERSION, sizeof(unsigned int), 1);
+	status |= write_values(out, &(*mz.mig).n_zones, sizeof(unsigned int), 1);
+	status |= write_values(out, &(*mz.mig).n_tracers, sizeof(unsigned int),
+		1);
+	status |= write_values(out, &(*mz.mig).tracer_cadence,
+		sizeof(unsigned long), 1);
+	status |= write_values(out, &(*mz.mig).migration_cadence,
+		sizeof(unsigned long), 1);
+	status |= write_values(out, &sz.n_elements, sizeof(unsigned int), 1);
+	status |= write_values(out, &length, sizeof(unsigned long), 1);
+	status |= write_values(out, &(*sz.mdf).n_bins, sizeof(unsigned long), 1);
+	status |= write_values(out, &sz.dt, sizeof(double), 1);
+	status |= write_values(out, &mz.settings_hash, sizeof(unsigned long), 1);
+
+	unsigned int i;
+	for (i = 0u; i < sz.n_elements; i++) {
+		char symbol[SYMBOL_LENGTH] = {0};
+		strncpy(symbol, (*sz.elements[i]).symbol, SYMBOL_LENGTH - 1);
+		status |= write_values(out, symbol, sizeof(char), SYMBOL_LENGTH);
+	}
+	return status;
+
+}
+
+
+/*
+ * Read the header of a checkpoint file and compare it to the settings of a
+ * multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * in: 		The checkpoint file
+ *
+ * Returns
+ * =======
+ * 0 if the checkpoint was written by a simulation with the same settings,
+ * 1 otherwise or if the file could not be read.
+ */
+static unsigned short read_header(MULTIZONE mz, FILE *in) {
+
+	SINGLEZONE sz = *mz.zones[0];
+	char magic[8];
+	unsigned int version, n_zones, n_tracers, n_elements;
+	unsigned long tracer_cadence, migration_cadence, length, n_bins;
+	unsigned long settings_hash;
+	double dt;
+	if (read_values(in, magic, sizeof(char), 8) ||
+		read_values(in, &version, sizeof(unsigned int), 1) ||
+		read_values(in, &n_zones, sizeof(unsigned int), 1) ||
+		read_values(in, &n_tracers, sizeof(unsigned int), 1) ||
+		read_values(in, &tracer_cadence, sizeof(unsigned long), 1) ||
+		read_values(in, &migration_cadence, sizeof(unsigned long), 1) ||
+		read_values(in, &n_elements, sizeof(unsigned int), 1) ||
+		read_values(in, &length, sizeof(unsigned long), 1) ||
+		read_values(in, &n_bins, sizeof(unsigned long), 1) ||
+		read_values(in, &dt, sizeof(double), 1) ||
+		read_values(in, &settings_hash, sizeof(unsigned long), 1)) return 1u;
+
+	if (memcmp(magic, MAGIC, 8) ||
+		version != VERSION ||
+		n_zones != (*mz.mig).n_zones ||
+		n_tracers != (*mz.mig).n_tracers ||
+		tracer_cadence != (*mz.mig).tracer_cadence ||
+		migration_cadence != (*mz.mig).migration_cadence ||
+		n_elements != sz.n_elements ||
+		length != n_timesteps(sz) ||
+		n_bins != (*sz.mdf).n_bins ||
+		dt != sz.dt ||
+		settings_hash != mz.settings_hash) return 1u;
+
+	unsigned int i;
+	for (i = 0u; i < sz.n_elements; i++) {
+		char symbol[SYMBOL_LENGTH];
+		if (read_values(in, symbol, sizeof(char), SYMBOL_LENGTH) ||
+			strncmp(symbol, (*sz.elements[i]).symbol, SYMBOL_LENGTH - 1)) {
+			return 1u;
+		} else continue;
+	}
+	return 0u;
+
+}
+
+
+/*
+ * Write the state of one zone of a multizone simulation to its checkpoint:
+ * the time, the ISM mass, star formation and infall rates and the star
+ * formation history, the mass and metallicity history of each element, and
+ * the stellar MDF.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The zone
+ * out: 	The checkpoint file
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short write_zone(SINGLEZONE sz, FILE *out) {
+
+	unsigned long n = sz.timestep + 1ul;
+	unsigned short status = write_values(out, &sz.current_time,
+		sizeof(double), 1);
+	status |= write_values(out, &sz.timestep, sizeof(unsigned long), 1);
+	status |= write_values(out, &(*sz.ism).mass, sizeof(double), 1);
+	status |= write_values(out, &(*sz.ism).star_formation_rate,
+		sizeof(double), 1);
+	status |= write_values(out, &(*sz.ism).infall_rate, sizeof(double), 1);
+	status |= write_values(out, (*sz.ism).star_formation_history,
+		sizeof(double), n);
+
+	unsigned int i;
+	for (i = 0u; i < sz.n_elements; i++) {
+		status |= write_values(out, &(*sz.elements[i]).mass, sizeof(double),
+			1);
+		status |= write_values(out, &(*sz.elements[i]).unretained,
+			sizeof(double), 1);
+		status |= write_values(out, (*sz.elements[i]).Z, sizeof(double), n);
+	}
+	for (i = 0u; i < sz.n_elements; i++) {
+		status |= write_values(out, (*sz.mdf).abundance_distributions[i],
+			sizeof(double), (*sz.mdf).n_bins);
+	}
+	for (i = 0u; i < choose(sz.n_elements, 2); i++) {
+		status |= write_values(out, (*sz.mdf).ratio_distributions[i],
+			sizeof(double), (*sz.mdf).n_bins);
+	}
+	return status;
+
+}
+
+
+/*
+ * Restore the state of one zone of a multizone simulation from its
+ * checkpoint. See write_zone.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the zone, set up to run
+ * in: 		The checkpoint file
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short read_zone(SINGLEZONE *sz, FILE *in) {
+
+	if (read_values(in, &(sz -> current_time), sizeof(double), 1) ||
+		read_values(in, &(sz -> timestep), sizeof(unsigned long), 1) ||
+		(*sz).timestep >= n_timesteps(*sz)) return 1u;
+
+	unsigned long n = (*sz).timestep + 1ul;
+	unsigned short status = read_values(in, &(sz -> ism -> mass),
+		sizeof(double), 1);
+	status |= read_values(in, &(sz -> ism -> star_formation_rate),
+		sizeof(double), 1);
+	status |= read_values(in, &(sz -> ism -> infall_rate), sizeof(double),
+		1);
+	status |= read_values(in, sz -> ism -> star_formation_history,
+		sizeof(double), n);
+
+	unsigned int i;
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		status |= read_values(in, &(sz -> elements[i] -> mass),
+			sizeof(double), 1);
+		status |= read_values(in, &(sz -> elements[i] -> unretained),
+			sizeof(double), 1);
+		status |= read_values(in, sz -> elements[i] -> Z, sizeof(double), n);
+	}
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		status |= read_values(in, sz -> mdf -> abundance_distributions[i],
+			sizeof(double), (*(*sz).mdf).n_bins);
+	}
+	for (i = 0u; i < choose((*sz).n_elements, 2); i++) {
+		status |= read_values(in, sz -> mdf -> ratio_distributions[i],
+			sizeof(double), (*(*sz).mdf).n_bins);
+	}
+	return status;
+
+}
+
+
+/*
+ * Restore the gas migration matrix and the tracer particles' zone histories
+ * of a multizone simulation from its checkpoint. See
+ * multizone_write_checkpoint_migration.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ * in: 		The checkpoint file, positioned after its header
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short read_migration(MULTIZONE *mz, FILE *in) {
+
+	unsigned long i, length = n_timesteps(*(*mz).zones[0]);
+	unsigned long n = max_tracers(*mz);
+	unsigned short status = 0u;
+	for (i = 0ul; i < length && !status; i++) {
+		unsigned int j;
+		for (j = 0u; j < (*(*mz).mig).n_zones && !status; j++) {
+			status |= read_values(in, mz -> mig -> gas_migration[i][j],
+				sizeof(double), (*(*mz).mig).n_zones);
+		}
+	}
+	for (i = 0ul; i < n && !status; i++) {
+		TRACER *t = mz -> mig -> tracers[i];
+		status |= read_values(in, &(t -> zone_origin), sizeof(unsigned int),
+			1);
+		status |= read_values(in, &(t -> timestep_origin),
+			sizeof(unsigned long), 1);
+		t -> zone_history = (int *) malloc (length * sizeof(int));
+		status |= read_values(in, t -> zone_history, sizeof(int), length);
+		t -> zone_current = (*t).zone_origin;
+	}
+	return status;
+
+}
+
+
+/*
+ * Read the output written to each zone's history file up to a checkpoint.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object
+ * offsets: 	The length of each zone's history file at the checkpoint
+ *
+ * Returns
+ * =======
+ * The first offsets[i] bytes of the i'th zone's history file. NULL if any
+ * of the files could not be read or are shorter than at the checkpoint.
+ */
+static char **read_histories(MULTIZONE mz, long *offsets) {
+
+	char **histories = (char **) malloc ((*mz.mig).n_zones * sizeof(char *));
+	unsigned int i;
+	for (i = 0u; i < (*mz.mig).n_zones; i++) histories[i] = NULL;
+	for (i = 0u; i < (*mz.mig).n_zones; i++) {
+		char filename[MAX_FILENAME_SIZE];
+		strcpy(filename, (*mz.zones[i]).name);
+		strcat(filename, "/history.out");
+		FILE *in = offsets[i] < 0l ? NULL : fopen(filename, "rb");
+		if (in != NULL) histories[i] = (char *) malloc (
+			(size_t) offsets[i] * sizeof(char));
+		if (in == NULL || read_values(in, histories[i], sizeof(char),
+			(size_t) offsets[i])) {
+			if (in != NULL) fclose(in);
+			free_histories(mz, histories);
+			return NULL;
+		} else {
+			fclose(in);
+		}
+	}
+	return histories;
+
+}
+
+
+/*
+ * Write the output recorded up to a checkpoint back to each zone's history
+ * file, leaving the files positioned to continue writing from there.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object, set up to run
+ * histories: 	The output returned by read_histories
+ * offsets: 	The length of each zone's history file at the checkpoint
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short restore_histories(MULTIZONE *mz, char **histories,
+	long *offsets) {
+
+	unsigned int i;
+	for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
+		FILE *history = mz -> zones[i] -> history_writer;
+		if (fseek(history, 0l, SEEK_SET) || write_values(history,
+			histories[i], sizeof(char), (size_t) offsets[i])) return 1u;
+	}
+	return 0u;
+
+}
+
+
+/*
+ * Free the memory returned by read_histories.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object
+ * histories: 	The output returned by read_histories
+ */
+static void free_histories(MULTIZONE mz, char **histories) {
+
+	unsigned int i;
+	for (i = 0u; i < (*mz.mig).n_zones; i++) free(histories[i]);
+	free(histories);
+
+}
+
+
+/*
+ * Write an array of values to a checkpoint file.
+ *
+ * Parameters
+ * ==========
+ * out: 	The checkpoint file
+ * ptr: 	The values to write
+ * size: 	The size of each value in bytes
+ * n: 		The number of values
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short write_values(FILE *out, const void *ptr, size_t size,
+	size_t n) {
+
+	return fwrite(ptr, size, n, out) != n;
+
+}
+
+
+/*
+ * Read an array of values from a checkpoint file.
+ *
+ * Parameters
+ * ==========
+ * in: 		The checkpoint file
+ * ptr: 	Where to store the values
+ * size: 	The size of each value in bytes
+ * n: 		The number of values
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short read_values(FILE *in, void *ptr, size_t size,
+	size_t n) {
+
+	return fread(ptr, size, n, in) != n;
+
+}
+
+
+/*
+ * Free the tracer particles of a multizone simulation which failed to resume
+ * from its checkpoint. Memory for all of them is allocated before resuming,
+ * and none of them have been counted as formed yet.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ */
+static void free_resumed_tracers(MULTIZONE *mz) {
+
+	if ((*(*mz).mig).tracers != NULL) {
+		unsigned long i, n = max_tracers(*mz);
+		for (i = 0ul; i < n; i++) tracer_free(mz -> mig -> tracers[i]);
+		free(mz -> mig -> tracers);
+		mz -> mig -> tracers = NULL;
+	} else {}
+	mz -> mig -> tracer_count = 0ul;
+
+}
+
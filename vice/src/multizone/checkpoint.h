@@ -0,0 +1,87 @@
+
+#ifndef MULTIZONE_CHECKPOINT_H
+#define MULTIZONE_CHECKPOINT_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../objects.h"
+
+/*
+ * Write the time-independent part of a multizone simulation's checkpoint:
+ * the gas migration matrix and the zone histories of every tracer particle.
+ * These are computed once during setup and are written only at the start of
+ * the simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object, set up to run
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * source: checkpoint.c
+ */
+extern unsigned short multizone_write_checkpoint_migration(MULTIZONE mz);
+
+/*
+ * Write the state of a multizone simulation at the current timestep to its
+ * checkpoint file, replacing the previous checkpoint.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * n: 		The number of outputs written to the history files so far
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * Notes
+ * =====
+ * This is called at the top of the timestep loop, after the tracer particles
+ * of the current timestep have been injected and before deciding whether or
+ * not to write history output.
+ *
+ * source: checkpoint.c
+ */
+extern unsigned short multizone_write_checkpoint(MULTIZONE mz, long n);
+
+/*
+ * Set up a multizone simulation to resume from its checkpoint in place of
+ * multizone_setup.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object, with memory allocated for its
+ * 			gas migration matrix and tracer particles
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on zone setup failure, 2 on migration normalization
+ * error, 4 if the checkpoint could not be read, was written by a simulation
+ * with different settings, or the output up to it could not be restored.
+ *
+ * source: checkpoint.c
+ */
+extern unsigned short multizone_resume(MULTIZONE *mz);
+
+/*
+ * Remove the checkpoint files of a multizone simulation once it has finished.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ *
+ * source: checkpoint.c
+ */
+extern void multizone_remove_checkpoint(MULTIZONE mz);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* MULTIZONE_CHECKPOINT_H */
+
@@ -7,6 +7,7 @@
 #include <string.h>
 #include "../multizone.h"
 #include "../singlezone.h"
+#include "../timings.h"
 #include "element.h"
 
 
@@ -30,6 +31,7 @@ extern void update_elements(MULTIZONE *mz) {
 	 */
 
 	unsigned int i, j;
+	TIMINGS *timings = (*(*mz).zones[0]).timings;
 	for (i = 0u; i < (*(*mz).zones[0]).n_elements; i++) {
 
 		/*
@@ -41,9 +43,15 @@ extern void update_elements(MULTIZONE *mz) {
 		 * Enrichment from AGB stars
 		 * Re-enrichment from recycled stellar envelopes
 		 */
+		timer_start(timings, TIMING_SNEIA);
 		double *sneia = m_sneia_from_tracers(*mz, i);
+		timer_stop(timings, TIMING_SNEIA);
+		timer_start(timings, TIMING_AGB);
 		double *agb = m_AGB_from_tracers(*mz, i);
+		timer_stop(timings, TIMING_AGB);
+		timer_start(timings, TIMING_RECYCLING);
 		double *recycled = recycled_mass(*mz, i);
+		timer_stop(timings, TIMING_RECYCLING);
 
 		for (j = 0u; j < (*(*mz).mig).n_zones; j++) {
 
@@ -61,7 +69,9 @@ extern void update_elements(MULTIZONE *mz) {
 			ELEMENT *e = mz -> zones[j] -> elements[i];
 
 			double dm = 0;
+			timer_start(timings, TIMING_CCSNE);
 			double m_cc = mdot_ccsne(sz, *e) * sz.dt;
+			timer_stop(timings, TIMING_CCSNE);
 			double m_ia = sneia[j];
 			double m_agb = agb[j];
 
@@ -91,7 +101,7 @@ extern void update_elements(MULTIZONE *mz) {
 			double Z = (*e).mass / (*sz.ism).mass;
 			dm += recycled[j];
 			dm -= (*sz.ism).star_formation_rate * sz.dt * Z;
-			if (strcmp((*e).symbol, "he")) {
+			if (!(*e).is_helium) {
 				dm -= (
 					(*sz.ism).enh[sz.timestep] * get_outflow_rate(sz) *
 					sz.dt * Z
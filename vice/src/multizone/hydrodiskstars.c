@@ -10,32 +10,6 @@
 #include "../utils.h"
 #include "../singlezone.h"
 
-/* The hydrodiskstars object that drives this module */
-static HYDRODISKSTARS *HDS;
-
-
-/*
- * Set the hydrodiskstars object globally.
- *
- * Parameters
- * ==========
- * address: The address of the hydrodiskstars object
- *
- * Notes
- * =====
- * This is necessary to avoid issues with the Cython compiler. Since the
- * multizone and hydrodiskstars objects are separate, the _hds attribute of
- * the c_hydrodiskstars object cannot be accessed by the multizone object.
- *
- * header: hydrodiskstars.h
- */
-extern void set_hydrodiskstars_object(unsigned long address) {
-
-	HDS = (HYDRODISKSTARS *) ((void *) address);
-
-}
-
-
 /*
  * Setup the zone history for a single tracer object born in a given zone and
  * at a given timestep.
@@ -55,14 +29,15 @@ extern void set_hydrodiskstars_object(unsigned long address) {
  *
  * header: hydrodiskstars.h
  */
-extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
-	unsigned int birth_zone, unsigned long birth_timestep, long analog_index) {
+extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz,
+	HYDRODISKSTARS hds, TRACER *t, unsigned int birth_zone,
+	unsigned long birth_timestep, long analog_index) {
 
 	/* The timestep size plus time and radius at which the star is born */
 	double dt = (*mz.zones[0]).dt;
 	double birth_time = birth_timestep * dt;
 	double birth_radius = (
-		((*HDS).rad_bins[birth_zone] + (*HDS).rad_bins[birth_zone + 1u]) / 2
+		(hds.rad_bins[birth_zone] + hds.rad_bins[birth_zone + 1u]) / 2
 	);
 
 	/* In case of sudden migration, this can't be done in the for-loop */
@@ -76,6 +51,9 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 	unsigned long i, N = n_timesteps(*mz.zones[0]);
 	t -> zone_history = (int *) malloc (N * sizeof(int));
 
+	/* Hash the migration mode once rather than at every timestep */
+	unsigned long mode = checksum(hds.mode);
+
 	for (i = 0ul; i < N; i++) {
 
 		if (i < birth_timestep) {
@@ -115,21 +93,21 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 			 * number.
 			 */
 
-			switch(checksum((*HDS).mode)) {
+			switch (mode) {
 
 				case LINEAR_MIGRATION:
-					t -> zone_history[i] = (int) calczone_linear(*HDS,
+					t -> zone_history[i] = (int) calczone_linear(hds,
 						birth_time, birth_radius, HYDRODISK_END_TIME,
 						analog_index, i * dt);
 					break;
 
 				case SUDDEN_MIGRATION:
-					t -> zone_history[i] = (int) calczone_sudden(*HDS,
+					t -> zone_history[i] = (int) calczone_sudden(hds,
 						migration_time, birth_radius, analog_index, i * dt);
 					break;
 
 				case DIFFUSION_MIGRATION:
-					t -> zone_history[i] = (int) calczone_diffusive(*HDS,
+					t -> zone_history[i] = (int) calczone_diffusive(hds,
 						birth_time, birth_radius, HYDRODISK_END_TIME,
 						analog_index, i * dt);
 					break;
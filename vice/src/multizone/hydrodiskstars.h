@@ -23,23 +23,6 @@ extern "C" {
 #define DIFFUSION_MIGRATION 967
 #endif /* DIFFUSION_MIGRATION */
 
-/*
- * Set the hydrodiskstars object globally.
- *
- * Parameters
- * ==========
- * address: The address of the hydrodiskstars object
- *
- * Notes
- * =====
- * This is necessary to avoid issues with the Cython compiler. Since the
- * multizone and hydrodiskstars objects are separate, the _hds attribute of
- * the c_hydrodiskstars object cannot be accessed by the multizone object.
- *
- * source: hydrodiskstars.c
- */
-extern void set_hydrodiskstars_object(unsigned long address);
-
 /*
  * Setup the zone history for a single tracer object born in a given zone and
  * at a given timestep.
@@ -59,8 +42,9 @@ extern void set_hydrodiskstars_object(unsigned long address);
  *
  * source: hydrodiskstars.c
  */
-extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
-	unsigned int birth_zone, unsigned long birth_timestep, long analog_index);
+extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz,
+	HYDRODISKSTARS hds, TRACER *t, unsigned int birth_zone,
+	unsigned long birth_timestep, long analog_index);
 
 #ifdef __cplusplus
 }
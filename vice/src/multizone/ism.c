@@ -73,7 +73,7 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
 		 * correction was previously unaccounted for.
 		 */
 
-		switch (checksum((*(*sz).ism).mode)) {
+		switch ((*(*sz).ism).mode_code) {
 
 			case GAS:
 				sz -> ism -> mass = (*(*sz).ism).specified[(*sz).timestep + 1l];
@@ -113,6 +113,7 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
 
 			default:
 				free(mass_recycled);
+				free(migration_deltas);
 				return 1;
 
 		}
@@ -124,6 +125,7 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
 	}
 
 	free(mass_recycled);
+	free(migration_deltas);
 	return 0;
 
 }
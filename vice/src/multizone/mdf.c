@@ -3,6 +3,7 @@
  * functions (MDFs) in VICE's multizone simulations.
  */
 
+#include <stdlib.h>
 #include <stdio.h>
 #include <math.h>
 #include "../multizone.h"
@@ -13,7 +14,12 @@
 #include "mdf.h"
 
 /* ---------- Static function comment headers not duplicated here ---------- */
-static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t);
+static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t, double **onH);
+static double **log_abundance_table(MULTIZONE mz);
+static void log_abundance_table_free(MULTIZONE mz, double **table);
+static void update_MDF_from_abundances(SINGLEZONE *final, double *onH,
+	unsigned int n_elements, double mass);
+static unsigned long final_timestep(MULTIZONE mz);
 static void reset_MDF(SINGLEZONE *sz);
 
 
@@ -40,14 +46,16 @@ extern void tracers_MDF(MULTIZONE *mz) {
 	 * being used uninitialized as a failsafe.
 	 */
 	PROGRESSBAR *pb = progressbar_initialize((*(*mz).mig).tracer_count);
+	double **onH = log_abundance_table(*mz);
 	if ((*mz).verbose) printf("Computing distribution functions....\n");
 	for (i = 0l; i < (*(*mz).mig).tracer_count; i++) {
 		/* ... then update with each tracer particle ... */
-		update_MDF_from_tracer(mz, *(*(*mz).mig).tracers[i]);
+		update_MDF_from_tracer(mz, *(*(*mz).mig).tracers[i], onH);
 		if ((*mz).verbose) progressbar_update(pb, i + 1ul);
 	}
 	if ((*mz).verbose) progressbar_finish(pb);
 	progressbar_free(pb);
+	log_abundance_table_free(*mz, onH);
 	
 	for (i = 0l; i < (*(*mz).mig).n_zones; i++) {
 		/* ... and finally normalize it within each zone */
@@ -57,6 +65,188 @@ extern void tracers_MDF(MULTIZONE *mz) {
 }
 
 
+/*
+ * Adds the tracer particles about to be injected into a multizone object to
+ * the MDF of the zone they will occupy at the end of the simulation. Since
+ * each tracer particle's zone history is known ahead of time, this allows
+ * the MDFs to be computed as the simulation evolves, and the logarithmic
+ * abundances are computed only once for all tracer particles born in the
+ * same zone at the same timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object whose MDFs are to be updated
+ * start: 	The index of the first tracer particle in the set being injected
+ * growth: 	0 if the set is being injected, 1 if the masses of the most
+ * 			recently injected set are being corrected
+ *
+ * Notes
+ * =====
+ * Tracer particles being injected are weighted by their mass. When tracer
+ * particles form only every so many timesteps, this is called again for the
+ * most recently injected set at each timestep in between, weighting each
+ * tracer particle by the correction to its mass (see inject_tracers).
+ *
+ * header: mdf.h
+ */
+extern void update_MDF_from_injection(MULTIZONE *mz, unsigned long start,
+	unsigned short growth) {
+
+	MIGRATION *mig = mz -> mig;
+	unsigned long i, last = final_timestep(*mz);
+	double *onH = (double *) malloc ((*(*mz).zones[0]).n_elements *
+		sizeof(double));
+
+	for (i = start; i < start + (*mig).n_tracers * (*mig).n_zones;
+		i += (*mig).n_tracers) {
+
+		/*
+		 * Tracer particles born in the same zone at the same timestep are
+		 * stored contiguously, and they share the same abundances.
+		 */
+		TRACER *first = (*mig).tracers[i];
+		SINGLEZONE *origin = (*mz).zones[(*first).zone_origin];
+		unsigned int j;
+		for (j = 0u; j < (*origin).n_elements; j++) {
+			onH[j] = log10(
+				(*(*origin).elements[j]).Z[(*first).timestep_origin] /
+				(*(*origin).elements[j]).solar
+			);
+		}
+
+		unsigned long k;
+		double correction = ((*(*origin).ism).star_formation_rate -
+			(*(*origin).ism).star_formation_history[(*first).timestep_origin]) *
+			(*origin).dt / (*mig).n_tracers;
+		for (k = i; k < i + (*mig).n_tracers; k++) {
+			TRACER *t = (*mig).tracers[k];
+			update_MDF_from_abundances(
+				(*mz).zones[(*t).zone_history[last]],
+				onH, (*origin).n_elements, growth ? correction : (*t).mass);
+		}
+
+	}
+
+	free(onH);
+
+}
+
+
+/*
+ * Normalize the MDFs of a multizone object at the end of a simulation in
+ * which they were updated upon the injection of each tracer particle. If any
+ * tracer particle did not end the simulation in the zone that it was counted
+ * toward, all MDFs are recomputed from the tracer particles.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object whose MDFs are to be finalized
+ *
+ * header: mdf.h
+ */
+extern void finalize_tracers_MDF(MULTIZONE *mz) {
+
+	unsigned long i, last = final_timestep(*mz);
+	for (i = 0ul; i < (*(*mz).mig).tracer_count; i++) {
+		TRACER *t = (*(*mz).mig).tracers[i];
+		if ((*t).zone_current != (unsigned) (*t).zone_history[last]) {
+			/* fall back on the full calculation */
+			tracers_MDF(mz);
+			return;
+		} else continue;
+	}
+
+	for (i = 0ul; i < (*(*mz).mig).n_zones; i++) {
+		normalize_MDF(mz -> zones[i]);
+	}
+
+}
+
+
+/*
+ * Determine the final timestep in a multizone object's tracer particle zone
+ * histories. These are constant over the timesteps in the buffer, and thus
+ * give the zone each tracer particle occupies at the end of the simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ *
+ * Returns
+ * =======
+ * The index of the final element of each tracer particle's zone history.
+ */
+static unsigned long final_timestep(MULTIZONE mz) {
+
+	return n_timesteps(*mz.zones[0]) - 1ul;
+
+}
+
+
+/*
+ * Tabulate the logarithmic abundance [X/H] of each element in the ISM of each
+ * zone at each timestep of a multizone simulation. Since a tracer particle's
+ * abundances depend only on the zone and timestep of its formation, this
+ * requires only one evaluation of log10 per element per zone per timestep,
+ * rather than one per element per tracer particle.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object to tabulate the abundances for
+ *
+ * Returns
+ * =======
+ * A 2-D array indexed via table[zone][timestep * n_elements + element], where
+ * timestep runs up to and including the current timestep of the simulation.
+ * Each zone's abundances are stored in one contiguous block.
+ *
+ * Notes
+ * =====
+ * The abundances are known only up to the current timestep; those in the
+ * buffer beyond it have not been computed. No tracer particle forms after
+ * the current timestep.
+ */
+static double **log_abundance_table(MULTIZONE mz) {
+
+	unsigned long i, n = (*mz.zones[0]).timestep + 1ul;
+	double **table = (double **) malloc ((*mz.mig).n_zones *
+		sizeof(double *));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) {
+		SINGLEZONE *zone = mz.zones[i];
+		unsigned long j;
+		table[i] = (double *) malloc (n * (*zone).n_elements *
+			sizeof(double));
+		for (j = 0ul; j < n; j++) {
+			unsigned int k;
+			for (k = 0u; k < (*zone).n_elements; k++) {
+				table[i][j * (*zone).n_elements + k] = log10(
+					(*(*zone).elements[k]).Z[j] / (*(*zone).elements[k]).solar
+				);
+			}
+		}
+	}
+	return table;
+
+}
+
+
+/*
+ * Free up the memory stored in a table of logarithmic abundances.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object the table was computed from
+ * table: 	The table returned by log_abundance_table
+ */
+static void log_abundance_table_free(MULTIZONE mz, double **table) {
+
+	unsigned long i;
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) free(table[i]);
+	free(table);
+
+}
+
+
 /*
  * Updates the MDF of a multizone object given a tracer particle.
  *
@@ -64,59 +254,68 @@ extern void tracers_MDF(MULTIZONE *mz) {
  * ==========
  * mz: 		A pointer to the multizone object with the MDF to update
  * t: 		The tracer particle to update the MDF from
+ * onH: 	The logarithmic abundances of each zone at each timestep, as
+ * 			returned by log_abundance_table
  */
-static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
+static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t, double **onH) {
 
-	SINGLEZONE *origin = (*mz).zones[t.zone_origin];
-	SINGLEZONE *final = (*mz).zones[t.zone_current];
+	/*
+	 * The value of [X/H] of the ISM for each element at the timestep and in
+	 * the zone that the tracer particle formed.
+	 */
+	unsigned int n_elements = (*(*mz).zones[t.zone_origin]).n_elements;
+	update_MDF_from_abundances((*mz).zones[t.zone_current],
+		onH[t.zone_origin] + t.timestep_origin * n_elements, n_elements,
+		t.mass);
 
-	unsigned int i;
-	/* --------------------- for each tracked element --------------------- */
-	for (i = 0; i < (*origin).n_elements; i++) {
+}
 
-		/*
-		 * The value of [X/H] of the ISM for the i'th element at the timestep
-		 * and in the zone that the tracer particle formed. Get the bin number
-		 * of this value and increment that bin in the FINAL zone by the mass
-		 * of the tracer particle (prefactors cancel in normalization).
-		 */
-		double onH_ = log10(
-			/* trailing underscore to not override function in element.h */
-			(*(*origin).elements[i]).Z[t.timestep_origin] /
-			(*(*origin).elements[i]).solar
-		);
 
+/*
+ * Increment the MDF of a given zone by the mass of a tracer particle with
+ * known logarithmic abundances.
+ *
+ * Parameters
+ * ==========
+ * final: 			The zone the tracer particle occupies at the end of the
+ * 					simulation
+ * onH: 			The logarithmic abundance [X/H] of each element
+ * n_elements: 		The number of elements tracked by the simulation
+ * mass: 			The mass of the tracer particle
+ */
+static void update_MDF_from_abundances(SINGLEZONE *final, double *onH,
+	unsigned int n_elements, double mass) {
+
+	/*
+	 * Get the bin number of each [X/H] abundance and [X/Y] abundance ratio
+	 * and increment that bin in the FINAL zone by the mass of the tracer
+	 * particle (prefactors cancel in normalization).
+	 */
+	unsigned int i;
+	/* --------------------- for each tracked element --------------------- */
+	for (i = 0u; i < n_elements; i++) {
 		long bin = get_bin_number(
 			(*(*final).mdf).bins,
 			(*(*final).mdf).n_bins,
-			onH_
+			onH[i]
 		);
 		if (bin != -1l) {
-			final -> mdf -> abundance_distributions[i][bin] += t.mass;
+			final -> mdf -> abundance_distributions[i][bin] += mass;
 		} else {}
-
 	}
 
-	unsigned int n = 0;
+	unsigned int n = 0u;
 	/* --------------------- for each abundance ratio --------------------- */
-	for (i = 1; i < (*origin).n_elements; i++) {
+	for (i = 1u; i < n_elements; i++) {
 		unsigned int j;
-		for (j = 0; j < i; j++) {
-			double onH1 = log10(
-				(*(*origin).elements[i]).Z[t.timestep_origin] /
-				(*(*origin).elements[i]).solar
-			);
-			double onH2 = log10(
-				(*(*origin).elements[j]).Z[t.timestep_origin] /
-				(*(*origin).elements[j]).solar
-			);
+		for (j = 0u; j < i; j++) {
 			long bin = get_bin_number(
 				(*(*final).mdf).bins,
 				(*(*final).mdf).n_bins,
-				onH1 - onH2
+				onH[i] - onH[j]
 			);
 			if (bin != -1l) {
-				final -> mdf -> ratio_distributions[n][bin] += t.mass;
+				final -> mdf -> ratio_distributions[n][bin] += mass;
 			} else {}
 			n++;
 		}
@@ -20,6 +20,47 @@ extern "C" {
  */
 extern void tracers_MDF(MULTIZONE *mz);
 
+/*
+ * Adds the tracer particles about to be injected into a multizone object to
+ * the MDF of the zone they will occupy at the end of the simulation. Since
+ * each tracer particle's zone history is known ahead of time, this allows
+ * the MDFs to be computed as the simulation evolves, and the logarithmic
+ * abundances are computed only once for all tracer particles born in the
+ * same zone at the same timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object whose MDFs are to be updated
+ * start: 	The index of the first tracer particle in the set being injected
+ * growth: 	0 if the set is being injected, 1 if the masses of the most
+ * 			recently injected set are being corrected
+ *
+ * Notes
+ * =====
+ * Tracer particles being injected are weighted by their mass. When tracer
+ * particles form only every so many timesteps, this is called again for the
+ * most recently injected set at each timestep in between, weighting each
+ * tracer particle by the correction to its mass (see inject_tracers).
+ *
+ * source: mdf.c
+ */
+extern void update_MDF_from_injection(MULTIZONE *mz, unsigned long start,
+	unsigned short growth);
+
+/*
+ * Normalize the MDFs of a multizone object at the end of a simulation in
+ * which they were updated upon the injection of each tracer particle. If any
+ * tracer particle did not end the simulation in the zone that it was counted
+ * toward, all MDFs are recomputed from the tracer particles.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object whose MDFs are to be finalized
+ *
+ * source: mdf.c
+ */
+extern void finalize_tracers_MDF(MULTIZONE *mz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -16,7 +16,11 @@ static void migrate_tracer(MULTIZONE mz, TRACER *t);
 static void migrate_gas_element(MULTIZONE *mz, int index);
 static void migration_sanity_check(MULTIZONE *mz);
 static double **setup_changes(unsigned int n_zones);
+static void free_changes(double **changes, unsigned int n_zones);
 static double **get_changes(MULTIZONE mz, int index);
+static unsigned short migration_timestep(MULTIZONE mz);
+static double migration_fraction(MULTIZONE mz, unsigned int i,
+	unsigned int j);
 
 
 /*
@@ -61,6 +65,46 @@ extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
 }
 
 
+/*
+ * Performs a sanity check on a given migration matrix when gas migrates only
+ * every so many timesteps by making sure the sum of migration probabilities
+ * out of a given zone, summed over the timesteps between migrations, is <= 1.
+ *
+ * Parameters
+ * ==========
+ * migration_matrix: 		The migration matrix to sanity check
+ * n_times: 				The number of times the simulation will evaluate
+ * n_zones: 				The number of zones in the simulation
+ * cadence: 				The number of timesteps between migrations
+ *
+ * Returns
+ * =======
+ * 0 on passing sanity check, 1 on failure
+ *
+ * header: migration.h
+ */
+extern unsigned short migration_cadence_sanitycheck(
+	double ***migration_matrix, unsigned long n_times, unsigned int n_zones,
+	unsigned long cadence) {
+
+	unsigned long i, n;
+	for (i = 0l; i < n_times; i += cadence) {
+		unsigned int j, k;
+		for (j = 0; j < n_zones; j++) {
+			double total = 0;
+			for (n = i; n < i + cadence && n < n_times; n++) {
+				for (k = 0; k < n_zones; k++) {
+					if (j != k) total += migration_matrix[n][j][k];
+				}
+			}
+			if (total > 1) return 1;
+		}
+	}
+	return 0;
+
+}
+
+
 /*
  * Allocates memory for the gas migration matrix.
  *
@@ -197,6 +241,8 @@ static unsigned short normalize_migration_element(MULTIZONE mz,
  */
 extern void migrate(MULTIZONE *mz) {
 
+	if (!migration_timestep(*mz)) return;
+
 	/* Migrate gas and all elements between zones */
 	int i;
 	for (i = -1; i < (signed) (*(*mz).zones[0]).n_elements; i++) {
@@ -248,6 +294,7 @@ extern double *migration_gas_changes_by_zone(MULTIZONE mz) {
 		for (j = 0u; j < (*mz.mig).n_zones; j++) deltas[i] -= changes[j][i];
 	}
 
+	free_changes(changes, (*mz.mig).n_zones);
 	return deltas;
 
 }
@@ -309,7 +356,7 @@ static void migrate_gas_element(MULTIZONE *mz, int index) {
 			}
 		}
 	}
-	free(changes);
+	free_changes(changes, (*(*mz).mig).n_zones);
 
 }
 
@@ -362,8 +409,8 @@ static void migration_sanity_check(MULTIZONE *mz) {
 static double **get_changes(MULTIZONE mz, int index) {
 
 	unsigned int i, j;
-	unsigned long timestep = (*mz.zones[0]).timestep;
 	double **changes = setup_changes((*mz.mig).n_zones);
+	if (!migration_timestep(mz)) return changes;
 
 	for (i = 0; i < (*mz.mig).n_zones; i++) {
 		for (j = 0; j < (*mz.mig).n_zones; j++) {
@@ -375,14 +422,14 @@ static double **get_changes(MULTIZONE mz, int index) {
 					case -1:
 						/* gas reservoir */
 						changes[i][j] = (
-							(*mz.mig).gas_migration[timestep][i][j] *
+							migration_fraction(mz, i, j) *
 							(*(*mz.zones[i]).ism).mass
 						);
 						break;
 					default:
 						/* element in the i'th zone */
 						changes[i][j] = (
-							(*mz.mig).gas_migration[timestep][i][j] *
+							migration_fraction(mz, i, j) *
 							(*(*mz.zones[i]).elements[index]).mass
 						);
 						break;
@@ -395,6 +442,58 @@ static double **get_changes(MULTIZONE mz, int index) {
 }
 
 
+/*
+ * Determine whether or not gas and tracer particles migrate between zones at
+ * the current timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation
+ *
+ * Returns
+ * =======
+ * 1 if the next timestep is a multiple of the migration cadence or the
+ * simulation is about to end, 0 otherwise.
+ */
+static unsigned short migration_timestep(MULTIZONE mz) {
+
+	SINGLEZONE sz = *mz.zones[0];
+	return ((sz.timestep + 1ul) % (*mz.mig).migration_cadence == 0ul ||
+		sz.current_time + sz.dt > sz.output_times[sz.n_outputs - 1l]);
+
+}
+
+
+/*
+ * Determine the fraction of the gas in one zone that migrates to another at
+ * the current timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation
+ * i: 		The zone the gas migrates from
+ * j: 		The zone the gas migrates to
+ *
+ * Returns
+ * =======
+ * The [i][j]'th element of the migration matrix, summed over all timesteps
+ * since gas last migrated when it migrates only every so many timesteps.
+ */
+static double migration_fraction(MULTIZONE mz, unsigned int i,
+	unsigned int j) {
+
+	unsigned long n, timestep = (*mz.zones[0]).timestep;
+	unsigned long cadence = (*mz.mig).migration_cadence;
+	if (cadence == 1ul) return (*mz.mig).gas_migration[timestep][i][j];
+	double fraction = 0;
+	for (n = (timestep / cadence) * cadence; n <= timestep; n++) {
+		fraction += (*mz.mig).gas_migration[n][i][j];
+	}
+	return fraction;
+
+}
+
+
 /*
  * Sets up a n_zones x n_zones 2D-array of zeroes, within which the change in
  * masses for ISM phase elements and gas can be temporarily stored.
@@ -421,3 +520,21 @@ static double **setup_changes(unsigned int n_zones) {
 
 }
 
+
+/*
+ * Frees the memory stored by a 2D-array of changes in masses set up by
+ * setup_changes.
+ *
+ * Parameters
+ * ==========
+ * changes: 	The 2D-array to free
+ * n_zones: 	The number of zones in the simulation
+ */
+static void free_changes(double **changes, unsigned int n_zones) {
+
+	unsigned int i;
+	for (i = 0; i < n_zones; i++) free(changes[i]);
+	free(changes);
+
+}
+
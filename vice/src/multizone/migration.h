@@ -57,6 +57,28 @@ extern double *migration_gas_changes_by_zone(MULTIZONE mz);
 extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
 	unsigned long n_times, unsigned int n_zones);
 
+/*
+ * Performs a sanity check on a given migration matrix when gas migrates only
+ * every so many timesteps by making sure the sum of migration probabilities
+ * out of a given zone, summed over the timesteps between migrations, is <= 1.
+ *
+ * Parameters
+ * ==========
+ * migration_matrix: 		The migration matrix to sanity check
+ * n_times: 				The number of times the simulation will evaluate
+ * n_zones: 				The number of zones in the simulation
+ * cadence: 				The number of timesteps between migrations
+ *
+ * Returns
+ * =======
+ * 0 on passing sanity check, 1 on failure
+ *
+ * source: migration.c
+ */
+extern unsigned short migration_cadence_sanitycheck(
+	double ***migration_matrix, unsigned long n_times, unsigned int n_zones,
+	unsigned long cadence);
+
 /*
  * Allocates memory for the gas migration matrix.
  *
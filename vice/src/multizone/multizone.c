@@ -6,15 +6,25 @@
 #include <string.h>
 #include "../multizone.h"
 #include "../singlezone.h"
+#include "../imf.h"
+#include "../ssp.h"
+#include "../sneia.h"
 #include "../tracer.h"
 #include "../utils.h"
 #include "../io.h"
+#include "../ism.h"
+#include "../timings.h"
 #include "multizone.h"
+#include "checkpoint.h"
 #include "tracer.h"
 
 /* ---------- Static function comment headers not duplicated here ---------- */
 static unsigned short multizone_timestepper(MULTIZONE *mz);
 static void verbosity(MULTIZONE mz);
+static unsigned short multizone_setup_ssp(MULTIZONE *mz, unsigned int index);
+static unsigned short same_ssp_tables(SINGLEZONE sz1, SINGLEZONE sz2);
+static double *RIa_from_previous_zone(MULTIZONE mz, unsigned int index,
+	ELEMENT e);
 
 
 /*
@@ -37,6 +47,33 @@ extern void link_zone(MULTIZONE *mz, unsigned long address,
 }
 
 
+/*
+ * Determine whether or not a multizone simulation will call any python
+ * functions as it evolves, in which case the python interpreter must not run
+ * concurrently (i.e. the global interpreter lock must be held).
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation, set up to run
+ *
+ * Returns
+ * =======
+ * 1 if any zone will call a python function (see singlezone_calls_python),
+ * 0 otherwise.
+ *
+ * header: multizone.h
+ */
+extern unsigned short multizone_calls_python(MULTIZONE mz) {
+
+	unsigned int i;
+	for (i = 0u; i < (*mz.mig).n_zones; i++) {
+		if (singlezone_calls_python(*mz.zones[i])) return 1u;
+	}
+	return 0u;
+
+}
+
+
 /*
  * Runs the multizone simulation under current user settings.
  *
@@ -47,7 +84,9 @@ extern void link_zone(MULTIZONE *mz, unsigned long address,
  * Returns
  * =======
  * 0 on success, 1 on zone setup failure, 2 on migration normalization
- * error, 3 on tracer particle file I/O error.
+ * error, 3 on tracer particle file I/O error, 4 if the simulation could not
+ * be resumed from its checkpoint, 5 if a checkpoint could not be written, 6
+ * if the migration summed over the timesteps between migrations exceeds 1.
  *
  * header: multizone.h
  */
@@ -57,8 +96,11 @@ extern unsigned short multizone_evolve(MULTIZONE *mz) {
 	 * x differentiates between failed setup and migration matrix failing
 	 * the sanity check.
 	 */
-	unsigned short x = multizone_setup(mz);
+	unsigned short x = (*mz).resume ? multizone_resume(mz) :
+		multizone_setup(mz);
 	if (x) return x;
+	unsigned long checkpoint = (*mz).checkpoint;
+	TIMINGS *timings = (*(*mz).zones[0]).timings;
 
 	/*
 	 * Run either the simple or full evolution depending on the user's
@@ -66,8 +108,21 @@ extern unsigned short multizone_evolve(MULTIZONE *mz) {
 	 */
 	if ((*mz).simple) {
 		multizone_evolve_simple(mz);
+		timer_start(timings, TIMING_MDF);
+		tracers_MDF(mz);
+		timer_stop(timings, TIMING_MDF);
 	} else {
+		/*
+		 * In full mode, the MDFs are updated as tracer particles are
+		 * injected, and need only be normalized.
+		 */
 		multizone_evolve_full(mz);
+		timer_start(timings, TIMING_MDF);
+		finalize_tracers_MDF(mz);
+		timer_stop(timings, TIMING_MDF);
+
+		/* checkpoints are switched off if one could not be written */
+		if (checkpoint && !(*mz).checkpoint) x = 5;
 	}
 
 	/*
@@ -76,14 +131,18 @@ extern unsigned short multizone_evolve(MULTIZONE *mz) {
 	 * timestep after the user's specified ending time, and will mess up
 	 * age calculations from the output.
 	 */
-	tracers_MDF(mz);
+	timer_start(timings, TIMING_MDF_OUTPUT);
 	write_multizone_mdf(*mz);
+	timer_stop(timings, TIMING_MDF_OUTPUT);
 
 	/* Write the tracer particle data */
 	if (!multizone_open_tracer_file(mz)) {
+		timer_start(timings, TIMING_TRACER_OUTPUT);
 		write_tracers_header(*mz);
 		write_tracers_output(*mz);
 		multizone_close_tracer_file(mz);
+		timer_stop(timings, TIMING_TRACER_OUTPUT);
+		multizone_remove_checkpoint(*mz);
 	} else {
 		x = 3;
 	}
@@ -128,8 +187,9 @@ extern void multizone_evolve_simple(MULTIZONE *mz) {
 	 * Note: +1l accounts for time = 0 or final timestep populations,
 	 * depending on which one is viewed as the "extra" set.
 	 */
+	unsigned long cadence = (*(*mz).mig).tracer_cadence;
 	mz -> mig -> tracer_count = (
-		(n_timesteps(*(*mz).zones[0]) - BUFFER + 1l) *
+		((n_timesteps(*(*mz).zones[0]) - BUFFER + cadence) / cadence) *
 		(*(*mz).mig).n_zones *
 		(*(*mz).mig).n_tracers
 	);
@@ -158,8 +218,29 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
 	 */
 	long n = 0l;
 	SINGLEZONE *sz = mz -> zones[0];
-	inject_tracers(mz);
+	unsigned long start = (*sz).timestep;
+	if ((*mz).resume) {
+		/*
+		 * The state was restored from a checkpoint taken after the tracer
+		 * particles of the current timestep were injected.
+		 */
+		n = (*mz).n_written;
+	} else {
+		inject_tracers(mz);
+		if ((*mz).checkpoint && multizone_write_checkpoint_migration(*mz)) {
+			mz -> checkpoint = 0ul;
+		} else {}
+	}
 	while ((*sz).current_time <= (*sz).output_times[(*sz).n_outputs - 1l]) {
+		/*
+		 * Take a checkpoint every so many timesteps, but not at the
+		 * timestep the simulation started or resumed from.
+		 */
+		if ((*mz).checkpoint && (*sz).timestep > start &&
+			!((*sz).timestep % (*mz).checkpoint) &&
+			multizone_write_checkpoint(*mz, n)) {
+			mz -> checkpoint = 0ul;
+		} else {}
 		/*
 		 * Run the simulation until the time reaches the final output time
 		 * specified by the user. Write to each zone's history.out file
@@ -168,7 +249,9 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
 		 */
 		if ((*sz).current_time >= (*sz).output_times[n] ||
 			2 * (*sz).output_times[n] < 2 * (*sz).current_time + (*sz).dt) {
+			timer_start((*sz).timings, TIMING_HISTORY_OUTPUT);
 			write_multizone_history(*mz);
+			timer_stop((*sz).timings, TIMING_HISTORY_OUTPUT);
 			n++;
 		} else {}
 		if (multizone_timestepper(mz)) break;
@@ -176,7 +259,9 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
 	}
 	verbosity(*mz);
 	inject_tracers(mz);
+	timer_start((*sz).timings, TIMING_HISTORY_OUTPUT);
 	write_multizone_history(*mz);
+	timer_stop((*sz).timings, TIMING_HISTORY_OUTPUT);
 
 }
 
@@ -207,17 +292,23 @@ static unsigned short multizone_timestepper(MULTIZONE *mz) {
 	 * Runtime Error raised in Python in vice/core/multizone/_multizone.pyx.
 	 */
 
-	if (strcmp((*(*(*mz).zones[0]).ism).mode, "ifr")) {
+	TIMINGS *timings = (*(*mz).zones[0]).timings;
+	if ((*(*(*mz).zones[0]).ism).mode_code != IFR) {
+		timer_start(timings, TIMING_GAS_EVOLUTION);
 		update_zone_evolution(mz);
+		timer_stop(timings, TIMING_GAS_EVOLUTION);
 		update_elements(mz);
 	} else {
 		update_elements(mz);
+		timer_start(timings, TIMING_GAS_EVOLUTION);
 		update_zone_evolution(mz);
+		timer_stop(timings, TIMING_GAS_EVOLUTION);
 	}
 
 	/*
 	 * Now each element and the ISM in each zone are at the next timestep.
-	 * bookkeep the new metallicity and update the MDF in each zone.
+	 * bookkeep the new metallicity in each zone. The MDFs are updated from
+	 * the tracer particles as they're injected.
 	 */
 	unsigned int i, j;
 
@@ -228,14 +319,15 @@ static unsigned short multizone_timestepper(MULTIZONE *mz) {
 				(*(*sz).elements[j]).mass / (*(*sz).ism).mass
 			);
 		}
-		update_MDF(sz);
 	}
 
 	/*
 	 * Migrating gas and stars before injecting tracers ensures that stars
 	 * will never migrate the timestep they're born.
 	 */
+	timer_start(timings, TIMING_MIGRATION);
 	migrate(mz);
+	timer_stop(timings, TIMING_MIGRATION);
 	inject_tracers(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
 		mz -> zones[i] -> current_time += (*(*mz).zones[i]).dt;
@@ -265,12 +357,22 @@ extern unsigned short multizone_setup(MULTIZONE *mz) {
 
 	unsigned int i;
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		if (singlezone_setup(mz -> zones[i])) return 1;
+		if (multizone_setup_ssp(mz, i) ||
+			singlezone_setup_evolution(mz -> zones[i])) {
+			multizone_unshare_ssp(mz);
+			return 1;
+		} else continue;
 	}
 
 	if (migration_matrix_sanitycheck((*(*mz).mig).gas_migration,
 		n_timesteps((*(*mz).zones[0])), (*(*mz).mig).n_zones)) {
+		multizone_unshare_ssp(mz);
 		return 2;
+	} else if (migration_cadence_sanitycheck((*(*mz).mig).gas_migration,
+		n_timesteps((*(*mz).zones[0])), (*(*mz).mig).n_zones,
+		(*(*mz).mig).migration_cadence)) {
+		multizone_unshare_ssp(mz);
+		return 6;
 	} else {
 		mz -> mig -> tracer_count = 0l;
 		return 0;
@@ -279,6 +381,228 @@ extern unsigned short multizone_setup(MULTIZONE *mz) {
 }
 
 
+/*
+ * Setup the single stellar population tables of one zone in a multizone
+ * object: the cumulative return fraction (CRF), the main sequence mass fraction
+ * (MSMF), and the SN Ia delay-time distribution (DTD) of each element. Tables
+ * are computed only if no previous zone has the same parameters; otherwise
+ * that zone's tables are shared.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ * index: 	The index of the zone to setup
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * Notes
+ * =====
+ * In most multizone models, the IMF, mass range of star formation, postMS
+ * lifetime ratio, and SN Ia DTDs are the same in every zone. Sharing the
+ * tables reduces the time and memory spent on them by a factor of the
+ * number of zones. Zones which share another zone's tables are marked as
+ * borrowing them, such that only the zone which computed them frees them,
+ * regardless of the order in which the zones are freed.
+ */
+static unsigned short multizone_setup_ssp(MULTIZONE *mz, unsigned int index) {
+
+	unsigned int i, j;
+	SINGLEZONE *sz = mz -> zones[index];
+
+	for (i = 0u; i < index; i++) {
+		if (same_ssp_tables(*(*mz).zones[i], *sz)) break;
+	}
+	if (i < index) {
+		sz -> ssp -> crf = (*(*(*mz).zones[i]).ssp).crf;
+		sz -> ssp -> msmf = (*(*(*mz).zones[i]).ssp).msmf;
+		sz -> ssp -> borrowed = 1u;
+	} else {
+		unsigned short status;
+		timer_start((*sz).timings, TIMING_SETUP_CRF);
+		status = setup_CRF(sz);
+		timer_stop((*sz).timings, TIMING_SETUP_CRF);
+		if (status) return 1u;
+		timer_start((*sz).timings, TIMING_SETUP_MSMF);
+		status = setup_MSMF(sz);
+		timer_stop((*sz).timings, TIMING_SETUP_MSMF);
+		if (status) return 1u;
+	}
+
+	/*
+	 * SN Ia rates are shared between elements within a zone by setup_RIa in
+	 * vice/src/singlezone/sneia.c. Across zones, built-in DTDs are compared
+	 * by their parameters. Custom DTDs are mapped into each zone from
+	 * python, and are compared by value once normalized.
+	 */
+	timer_start((*sz).timings, TIMING_SETUP_RIA);
+	for (j = 0u; j < (*sz).n_elements; j++) {
+		ELEMENT *e = sz -> elements[j];
+		for (i = 0u; i < j; i++) {
+			if (same_RIa(*(*sz).elements[i], *e)) break;
+		}
+		if (i < j) {
+			e -> sneia_yields -> RIa = (*(*(*sz).elements[i]).sneia_yields).RIa;
+			e -> sneia_yields -> RIa_borrowed = (
+				*(*(*sz).elements[i]).sneia_yields).RIa_borrowed;
+			continue;
+		} else {}
+		if (checksum((*(*e).sneia_yields).dtd) == CUSTOM) {
+			/* normalize first, then compare */
+			if (setup_element_RIa(sz, j)) return 1u;
+			double *own = (*(*e).sneia_yields).RIa;
+			double *shared = RIa_from_previous_zone(*mz, index, *e);
+			if (shared != NULL) {
+				/*
+				 * The buffer from python may be referenced by later elements
+				 * in this zone too; replace every reference, then free it.
+				 */
+				for (i = j; i < (*sz).n_elements; i++) {
+					if ((*(*(*sz).elements[i]).sneia_yields).RIa == own) {
+						sz -> elements[i] -> sneia_yields -> RIa = shared;
+						sz -> elements[i] -> sneia_yields -> RIa_borrowed = 1u;
+					} else {}
+				}
+				free(own);
+			} else {}
+		} else {
+			double *shared = RIa_from_previous_zone(*mz, index, *e);
+			if (shared != NULL) {
+				e -> sneia_yields -> RIa = shared;
+				e -> sneia_yields -> RIa_borrowed = 1u;
+			} else if (setup_element_RIa(sz, j)) {
+				return 1u;
+			} else {}
+		}
+	}
+	timer_stop((*sz).timings, TIMING_SETUP_RIA);
+
+	return 0u;
+
+}
+
+
+/*
+ * Determine whether or not two zones would compute identical cumulative
+ * return fractions and main sequence mass fractions.
+ *
+ * Parameters
+ * ==========
+ * sz1: 	The first zone, whose tables have already been computed
+ * sz2: 	The second zone
+ *
+ * Returns
+ * =======
+ * 1 if the tables are identical, 0 otherwise
+ *
+ * Notes
+ * =====
+ * Custom IMFs are only compared by their tabulated values. Those which have
+ * not been tabulated are never considered identical.
+ */
+static unsigned short same_ssp_tables(SINGLEZONE sz1, SINGLEZONE sz2) {
+
+	IMF_ imf1 = *(*sz1.ssp).imf;
+	IMF_ imf2 = *(*sz2.ssp).imf;
+
+	if (sz1.dt != sz2.dt ||
+		n_timesteps(sz1) != n_timesteps(sz2) ||
+		(*sz1.ssp).postMS != (*sz2.ssp).postMS ||
+		imf1.m_lower != imf2.m_lower ||
+		imf1.m_upper != imf2.m_upper ||
+		strcmp(imf1.spec, imf2.spec)) {
+		return 0u;
+	} else if (checksum(imf1.spec) == CUSTOM) {
+		return (imf1.mass_distribution != NULL &&
+			imf2.mass_distribution != NULL &&
+			!memcmp(imf1.mass_distribution, imf2.mass_distribution,
+				IMF_N_MASSES * sizeof(double)));
+	} else {
+		return 1u;
+	}
+
+}
+
+
+/*
+ * Search the zones preceding a given zone for an SN Ia rate buffer that an
+ * element in this zone can share.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ * index: 	The index of the zone being setup
+ * e: 		The element in that zone
+ *
+ * Returns
+ * =======
+ * The buffer to share, or NULL if there isn't one
+ *
+ * Notes
+ * =====
+ * Built-in DTDs are compared by their parameters. Custom DTDs are compared by
+ * value, and are assumed to be normalized already.
+ */
+static double *RIa_from_previous_zone(MULTIZONE mz, unsigned int index,
+	ELEMENT e) {
+
+	unsigned int i, j;
+	unsigned long length = (unsigned long) (
+		RIA_MAX_EVAL_TIME / (*mz.zones[index]).dt);
+	unsigned short custom = checksum((*e.sneia_yields).dtd) == CUSTOM;
+	for (i = 0u; i < index; i++) {
+		SINGLEZONE sz = *mz.zones[i];
+		if (sz.dt != (*mz.zones[index]).dt) continue;
+		for (j = 0u; j < sz.n_elements; j++) {
+			SNEIA_YIELD_SPECS ia = *(*sz.elements[j]).sneia_yields;
+			if (ia.RIa == NULL || strcmp(ia.dtd, (*e.sneia_yields).dtd)) {
+				continue;
+			} else if (custom) {
+				if ((*e.sneia_yields).RIa != NULL &&
+					!memcmp(ia.RIa, (*e.sneia_yields).RIa,
+						length * sizeof(double))) return ia.RIa;
+			} else if (same_RIa(*sz.elements[j], e)) {
+				return ia.RIa;
+			} else continue;
+		}
+	}
+	return NULL;
+
+}
+
+
+/*
+ * Separate the single stellar population tables shared between zones, such
+ * that each one is referenced only by the zone that computed it.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ *
+ * header: multizone.h
+ */
+extern void multizone_unshare_ssp(MULTIZONE *mz) {
+
+	unsigned int i, j;
+	for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
+		SINGLEZONE *sz = mz -> zones[i];
+		if ((*(*sz).ssp).borrowed) {
+			sz -> ssp -> crf = NULL;
+			sz -> ssp -> msmf = NULL;
+			sz -> ssp -> borrowed = 0u;
+		} else {}
+		for (j = 0u; j < (*sz).n_elements; j++) {
+			if ((*(*(*sz).elements[j]).sneia_yields).RIa_borrowed) {
+				sz -> elements[j] -> sneia_yields -> RIa = NULL;
+				sz -> elements[j] -> sneia_yields -> RIa_borrowed = 0u;
+			} else {}
+		}
+	}
+
+}
+
+
 /*
  * Frees up the memory allocated in running a multizone simulation. This does
  * not free up the memory stored by simplying having a multizone object in the
@@ -294,6 +618,7 @@ extern void multizone_clean(MULTIZONE *mz) {
 
 	/* clean each singlezone object */
 	unsigned int i;
+	multizone_unshare_ssp(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
 		singlezone_close_files(mz -> zones[i]);
 		singlezone_clean(mz -> zones[i]);
@@ -328,6 +653,7 @@ extern void multizone_clean(MULTIZONE *mz) {
 extern void multizone_cancel(MULTIZONE *mz) {
 
 	unsigned int i;
+	multizone_unshare_ssp(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
 		singlezone_cancel(mz -> zones[i]);
 	}
@@ -383,7 +709,7 @@ static void verbosity(MULTIZONE mz) {
 
 	if (mz.verbose) {
 		if (!(*mz.zones[0]).verbose) mz.zones[0] -> verbose = 1u;
-		singlezone_verbosity(*mz.zones[0]);
+		singlezone_verbosity(mz.zones[0]);
 	} else {}
 
 }
@@ -23,6 +23,24 @@ extern "C" {
 extern void link_zone(MULTIZONE *mz, unsigned long address,
 	unsigned int zone_index);
 
+/*
+ * Determine whether or not a multizone simulation will call any python
+ * functions as it evolves, in which case the python interpreter must not run
+ * concurrently (i.e. the global interpreter lock must be held).
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation, set up to run
+ *
+ * Returns
+ * =======
+ * 1 if any zone will call a python function (see singlezone_calls_python),
+ * 0 otherwise.
+ *
+ * source: multizone.h
+ */
+extern unsigned short multizone_calls_python(MULTIZONE mz);
+
 /*
  * Runs the multizone simulation under current user settings.
  *
@@ -33,7 +51,9 @@ extern void link_zone(MULTIZONE *mz, unsigned long address,
  * Returns
  * =======
  * 0 on success, 1 on zone setup failure, 2 on migration normalization
- * error, 3 on tracer particle file I/O error.
+ * error, 3 on tracer particle file I/O error, 4 if the simulation could not
+ * be resumed from its checkpoint, 5 if a checkpoint could not be written, 6
+ * if the migration summed over the timesteps between migrations exceeds 1.
  *
  * source: multizone.c
  */
@@ -78,6 +98,18 @@ extern void multizone_evolve_full(MULTIZONE *mz);
  */
 extern unsigned short multizone_setup(MULTIZONE *mz);
 
+/*
+ * Separate the single stellar population tables shared between zones, such
+ * that each one is referenced only by the zone that computed it.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ *
+ * source: multizone.c
+ */
+extern void multizone_unshare_ssp(MULTIZONE *mz);
+
 /*
  * Frees up the memory allocated in running a multizone simulation. This does
  * not free up the memory stored by simplying having a multizone object in the
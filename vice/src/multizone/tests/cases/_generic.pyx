@@ -48,6 +48,12 @@ cdef class generic:
 		if "name" in kwargs.keys(): del kwargs["name"]
 		super().__init__(name = "test", **kwargs)
 
+	def __dealloc__(self):
+		# The unit tests read the simulation's data after it runs, so the
+		# memory allocated in running it is freed only once they're done.
+		# This also applies to the no migration and separation cases.
+		_generic.multizone_clean(self._mz)
+
 	def run(self):
 		r"""
 		Runs the simulation
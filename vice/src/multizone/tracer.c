@@ -8,8 +8,13 @@
 #include "../singlezone.h"
 #include "../tracer.h"
 #include "../utils.h"
+#include "../mdf.h"
+#include "../timings.h"
 #include "tracer.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned long tracer_window(MULTIZONE mz);
+
 /*
  * Injects tracer particles into a multizone object for the current timestep
  *
@@ -23,6 +28,14 @@
  * formed before the final output time. This'll ensure that superfluous tracer
  * particles are left out of the output and distribution function calculations.
  *
+ * When tracer particles form only every so many timesteps, each set of tracer
+ * particles is given at birth the mass that its zone would form over that
+ * window at the current star formation rate. The subsequent calls within the
+ * window then correct this estimate by the change in the star formation
+ * rate, such that the stellar mass formed is conserved. Assigning the bulk of
+ * the mass at birth ensures that their recycled gas and nucleosynthetic
+ * products are computed from the birth of the stars.
+ *
  * header: tracer.h
  */
 extern void inject_tracers(MULTIZONE *mz) {
@@ -32,18 +45,44 @@ extern void inject_tracers(MULTIZONE *mz) {
 
 		unsigned long i, timestep = (*(*mz).zones[0]).timestep;
 		MIGRATION *mig = mz -> mig;
-		for (i = (*mig).tracer_count;
-			i < (*mig).tracer_count + (*mig).n_tracers * (*mig).n_zones;
-			i++) {
+		unsigned long batch = (*mig).n_tracers * (*mig).n_zones;
+
+		/*
+		 * The first call injects the tracer particles born at the start of
+		 * the simulation; each subsequent call those born at the next
+		 * timestep.
+		 */
+		unsigned long origin = (*mig).tracer_count ? timestep + 1ul : 0ul;
+		if (origin % (*mig).tracer_cadence) {
+			for (i = (*mig).tracer_count - batch; i < (*mig).tracer_count;
+				i++) {
+				TRACER *t = mz -> mig -> tracers[i];
+				SINGLEZONE sz = *(*mz).zones[(*t).zone_origin];
+				t -> mass += ((*sz.ism).star_formation_rate -
+					(*sz.ism).star_formation_history[(*t).timestep_origin]) *
+					sz.dt / (*mig).n_tracers;
+			}
+			timer_start((*(*mz).zones[0]).timings, TIMING_MDF);
+			update_MDF_from_injection(mz, (*mig).tracer_count - batch, 1u);
+			timer_stop((*(*mz).zones[0]).timings, TIMING_MDF);
+			return;
+		} else {}
+
+		unsigned long window = tracer_window(*mz);
+		for (i = (*mig).tracer_count; i < (*mig).tracer_count + batch; i++) {
 
 			SINGLEZONE sz = *(*mz).zones[(*(*mig).tracers[i]).zone_origin];
 			TRACER *t = mz -> mig -> tracers[i];
-			t -> mass = (*sz.ism).star_formation_rate * sz.dt / (*mig).n_tracers;
+			t -> mass = (*sz.ism).star_formation_rate * sz.dt * window /
+				(*mig).n_tracers;
 			t -> zone_current = (unsigned) (
 				(*(*mig).tracers[i]).zone_history[timestep + 1l]);
 		}
 
-		mig -> tracer_count += (*mig).n_tracers * (*mig).n_zones;
+		timer_start((*(*mz).zones[0]).timings, TIMING_MDF);
+		update_MDF_from_injection(mz, (*mig).tracer_count, 0u);
+		timer_stop((*(*mz).zones[0]).timings, TIMING_MDF);
+		mig -> tracer_count += batch;
 
 	} else {}
 
@@ -61,7 +100,7 @@ extern void inject_tracers(MULTIZONE *mz) {
  */
 extern void compute_tracer_masses(MULTIZONE *mz) {
 
-	unsigned long i;
+	unsigned long i, j;
 	for (i = 0l; i < (*(*mz).mig).tracer_count; i++) {
 		TRACER *t = (*(*mz).mig).tracers[i];
 		SINGLEZONE origin = *(*mz).zones[(*t).zone_origin];
@@ -70,6 +109,14 @@ extern void compute_tracer_masses(MULTIZONE *mz) {
 			(*origin.ism).star_formation_history[(*t).timestep_origin] *
 			origin.dt / (*(*mz).mig).n_tracers
 		);
+		/* stars formed before the next set of tracer particles */
+		for (j = 1ul; j < (*(*mz).mig).tracer_cadence &&
+			(*t).timestep_origin + j <= origin.timestep; j++) {
+			t -> mass += (
+				(*origin.ism).star_formation_history[(*t).timestep_origin + j] *
+				origin.dt / (*(*mz).mig).n_tracers
+			);
+		}
 	}
 
 }
@@ -108,10 +155,7 @@ extern double tracer_metallicity(MULTIZONE mz, TRACER t) {
  */
 extern void malloc_tracers(MULTIZONE *mz) {
 
-	unsigned long i, n = (
-		(*(*mz).mig).n_zones * (*(*mz).mig).n_tracers *
-		n_timesteps(*(*mz).zones[0])
-	);
+	unsigned long i, n = max_tracers(*mz);
 	mz -> mig -> tracers = (TRACER **) malloc (n * sizeof(TRACER *));
 	for (i = 0l; i < n; i++) {
 		mz -> mig -> tracers[i] = tracer_initialize();
@@ -119,3 +163,63 @@ extern void malloc_tracers(MULTIZONE *mz) {
 
 }
 
+
+/*
+ * Determine the number of tracer particles for which memory is allocated in
+ * a multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of tracer particles per zone per set times the number of zones
+ * times the number of timesteps at which a set of tracer particles forms.
+ *
+ * header: tracer.h
+ */
+extern unsigned long max_tracers(MULTIZONE mz) {
+
+	unsigned long cadence = (*mz.mig).tracer_cadence;
+	return (*mz.mig).n_zones * (*mz.mig).n_tracers * (
+		(n_timesteps(*mz.zones[0]) + cadence - 1ul) / cadence);
+
+}
+
+/*
+ * Determine the number of timesteps whose star formation will be assigned to
+ * the set of tracer particles about to be injected. This is the tracer
+ * cadence, unless the simulation ends before the next set would form.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of timesteps, between 1 and the tracer cadence
+ */
+static unsigned long tracer_window(MULTIZONE mz) {
+
+	SINGLEZONE sz = *mz.zones[0];
+	unsigned long j, window = 1ul;
+
+	/*
+	 * Step through the times at which the subsequent calls to inject_tracers
+	 * would be made, accumulating the timestep size in the same manner as
+	 * the zones themselves. The first call is made at the start of the
+	 * simulation, before the first timestep.
+	 */
+	double time = (*mz.mig).tracer_count ? sz.current_time :
+		sz.current_time - sz.dt;
+	for (j = 1ul; j < (*mz.mig).tracer_cadence; j++) {
+		time += sz.dt;
+		if (time <= sz.output_times[sz.n_outputs - 1l]) {
+			window++;
+		} else break;
+	}
+	return window;
+
+}
+
@@ -64,6 +64,23 @@ extern double tracer_metallicity(MULTIZONE mz, TRACER t);
  */
 extern void malloc_tracers(MULTIZONE *mz);
 
+/*
+ * Determine the number of tracer particles for which memory is allocated in
+ * a multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of tracer particles per zone per set times the number of zones
+ * times the number of timesteps at which a set of tracer particles forms.
+ *
+ * source: tracer.c
+ */
+extern unsigned long max_tracers(MULTIZONE mz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -26,6 +26,7 @@ extern "C" {
 #include "objects/singlezone.h"
 #include "objects/sneia.h"
 #include "objects/ssp.h"
+#include "objects/timings.h"
 #include "objects/tracer.h"
 
 #ifdef __cplusplus
@@ -25,6 +25,8 @@ extern ELEMENT *element_initialize(void) {
 	e -> sneia_yields = sneia_yield_initialize();
 	e -> channels = NULL;
 	e -> n_channels = 0u;
+	e -> unretained = 0;
+	e -> is_helium = 0u;
 	return e;
 
 }
@@ -58,6 +58,10 @@ extern void fromfile_free(FROMFILE *ff) {
 		} else {}
 
 		if ((*ff).data != NULL) {
+			unsigned long i;
+			for (i = 0ul; i < (*ff).n_rows; i++) {
+				free(ff -> data[i]);
+			}
 			free(ff -> data);
 			ff -> data = NULL;
 		} else {}
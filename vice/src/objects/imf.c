@@ -30,6 +30,9 @@ extern IMF_ *imf_initialize(double m_lower, double m_upper) {
 	imf -> m_lower = m_lower;
 	imf -> m_upper = m_upper;
 	imf -> custom_imf = callback_1arg_initialize();
+	imf -> mass_distribution = NULL;
+	imf -> mass_cumulative = NULL;
+	imf -> returned_cumulative = NULL;
 	return imf;
 
 }
@@ -58,6 +61,21 @@ extern void imf_free(IMF_ *imf) {
 			imf -> custom_imf = NULL;
 		} else {}
 
+		if ((*imf).mass_distribution != NULL) {
+			free(imf -> mass_distribution);
+			imf -> mass_distribution = NULL;
+		} else {}
+
+		if ((*imf).mass_cumulative != NULL) {
+			free(imf -> mass_cumulative);
+			imf -> mass_cumulative = NULL;
+		} else {}
+
+		if ((*imf).returned_cumulative != NULL) {
+			free(imf -> returned_cumulative);
+			imf -> returned_cumulative = NULL;
+		} else {}
+
 		free(imf);
 		imf = NULL;
 
@@ -15,7 +15,10 @@
  */
 extern INTEGRAL *integral_initialize(void) {
 
-	return (INTEGRAL *) malloc (sizeof(INTEGRAL));
+	INTEGRAL *intgrl = (INTEGRAL *) malloc (sizeof(INTEGRAL));
+	intgrl -> func = NULL;
+	intgrl -> params = NULL;
+	return intgrl;
 
 }
 
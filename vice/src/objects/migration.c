@@ -26,6 +26,8 @@ extern MIGRATION *migration_initialize(unsigned int n) {
 	mig -> gas_migration = NULL;
 	mig -> tracers = NULL;
 	mig -> tracers_output = NULL;
+	mig -> tracer_cadence = 1ul;
+	mig -> migration_cadence = 1ul;
 	return mig;
 
 }
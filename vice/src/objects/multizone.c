@@ -32,6 +32,10 @@ extern MULTIZONE *multizone_initialize(unsigned int n) {
 	mz -> name = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
 	mz -> mig = migration_initialize(n);
 	mz -> verbose = 0;
+	mz -> checkpoint = 0ul;
+	mz -> resume = 0u;
+	mz -> settings_hash = 0ul;
+	mz -> n_written = 0l;
 	return mz;
 
 }
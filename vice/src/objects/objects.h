@@ -164,6 +164,8 @@ typedef struct sneia_yield_specs {
 	 * yield_: A callback object corresponding to the user's yield settings.
 	 * 		Both functionals values and constant values are stored there.
 	 * RIa: The normed Ia rate itself
+	 * RIa_borrowed: 1 if RIa belongs to another zone of a multizone object,
+	 * 		which is responsible for freeing it, 0 otherwise.
 	 * dtd: A string denoting a built-in Ia delay-time distribution, if adopted
 	 * 		by the user
 	 * tau_ia: The e-folding timescale of SNe Ia, when dtd == "exp".
@@ -174,6 +176,7 @@ typedef struct sneia_yield_specs {
 
 	CALLBACK_1ARG *yield_;
 	double *RIa;
+	unsigned short RIa_borrowed;
 	char *dtd;
 	double tau_ia;
 	double t_d;
@@ -220,6 +223,9 @@ typedef struct element {
 	 * unretained: Unretained mass in the outflow at the current timestep.
 	 * mass: The total mass in Msun of the element in the ISM
 	 * solar: The abundance by mass of this element in the sun
+	 * is_helium: A boolean describing whether or not this element is helium,
+	 * 		resolved from the symbol at setup so that the timestep loop need
+	 * 		not compare strings.
 	 */
 
 	AGB_YIELD_GRID *agb_grid;
@@ -234,6 +240,7 @@ typedef struct element {
 	double unretained;
 	double mass;
 	double solar;
+	unsigned short is_helium;
 
 } ELEMENT;
 
@@ -266,6 +273,9 @@ typedef struct interstellar_medium {
 	 * smoothing_time: The outflow smoothing time
 	 * schmidt: A boolean int describing whether or not to adopt
 	 * 		Kennicutt-Schmidt law driven star formation efficiency.
+	 * mode_code: The hash code of the mode string (GAS, IFR, or SFR),
+	 * 		resolved at setup so that the timestep loop can dispatch on an
+	 * 		integer rather than a string.
 	 */
 
 	char *mode;
@@ -282,6 +292,7 @@ typedef struct interstellar_medium {
 	double mgschmidt;
 	double smoothing_time;
 	int schmidt;
+	unsigned long mode_code;
 
 } ISM;
 
@@ -321,9 +332,16 @@ typedef struct initial_mass_function {
 	 * 		"salpeter", or "custom"
 	 * m_lower: The lower mass limit on star formation
 	 * m_upper: The upper mass limit on star formation
-	 * mass_distribution: The un-normalized value of the IMF at stellar masses
-	 * 		in steps of IMF_STEPSIZE (declared in imf.h) from m_lower to
-	 *		m_upper.
+	 * custom_imf: The user's function of stellar mass for custom IMFs
+	 * mass_distribution: The un-normalized value of a custom IMF at
+	 * 		IMF_N_MASSES (declared in imf.h) stellar masses evenly spaced in
+	 * 		the logarithm of mass from m_lower to m_upper. NULL if the IMF
+	 * 		has not been tabulated.
+	 * mass_cumulative: The integral of m * IMF(m) from m_lower up to each of
+	 * 		the tabulated masses. NULL if the IMF has not been tabulated.
+	 * returned_cumulative: The same integral, weighted by the mass returned
+	 * 		to the ISM rather than the initial mass. NULL if the IMF has not
+	 * 		been tabulated.
 	 *
 	 * Notes
 	 * =====
@@ -337,6 +355,9 @@ typedef struct initial_mass_function {
 	double m_lower;
 	double m_upper;
 	CALLBACK_1ARG *custom_imf;
+	double *mass_distribution;
+	double *mass_cumulative;
+	double *returned_cumulative;
 
 } IMF_;
 
@@ -351,6 +372,8 @@ typedef struct single_stellar_population {
 	 * recycling: The cumulative return fraction at each timestep starting at
 	 * 		t = 0
 	 * msmf: The main sequence mass fraction at each timestep starting at t = 0
+	 * borrowed: 1 if crf and msmf belong to another zone of a multizone
+	 * 		object, which is responsible for freeing them, 0 otherwise.
 	 * postMS: The ratio of a star's post main-sequence lifetime to its main
 	 * 		sequence lifetime.
 	 * m_upper: The upper mass limit on star formation in Msun
@@ -363,6 +386,7 @@ typedef struct single_stellar_population {
 	IMF_ *imf;
 	double *crf;
 	double *msmf;
+	unsigned short borrowed;
 	double postMS;
 	double R0;
 	int continuous;
@@ -370,6 +394,29 @@ typedef struct single_stellar_population {
 } SSP;
 
 
+typedef struct timings {
+
+	/*
+	 * The time spent in each phase of a simulation when it is profiled. Each
+	 * array is indexed by the TIMING_* constants declared in timings.h.
+	 *
+	 * wall: The wall-clock time in seconds spent in each phase
+	 * cpu: The CPU time in seconds spent in each phase by the thread running
+	 * 		the simulation
+	 * calls: The number of times each phase was entered
+	 * start_wall: The wall-clock time at which each phase was last entered
+	 * start_cpu: The CPU time at which each phase was last entered
+	 */
+
+	double *wall;
+	double *cpu;
+	unsigned long *calls;
+	double *start_wall;
+	double *start_cpu;
+
+} TIMINGS;
+
+
 typedef struct singlezone {
 
 	/*
@@ -394,6 +441,31 @@ typedef struct singlezone {
 	 * ism: The time evolution information for the interstellar medium (ISM)
 	 * mdf: The stellar metallicity distribution function (MDF) information
 	 * ssp: Information relevant to single stellar populations
+	 * retain_ssp: A boolean describing whether or not to keep the tables
+	 * 		describing single stellar populations (the cumulative return
+	 * 		fraction, main sequence mass fraction, SN Ia rates, and AGB star
+	 * 		yield grids) in memory after the simulation, such that the next
+	 * 		one can reuse them.
+	 * pb: The progressbar printed as the simulation evolves when verbose.
+	 * 		This is stored here rather than globally so that simulations can
+	 * 		run concurrently in separate threads. NULL when not running.
+	 * in_memory: A boolean describing whether or not to retain the output
+	 * 		in memory rather than writing it to the history.out and mdf.out
+	 * 		files.
+	 * history_data: The rows of history output, when retained in memory.
+	 * 		NULL otherwise, or once python has taken ownership of them.
+	 * mdf_data: The rows of the stellar metallicity distribution function,
+	 * 		when retained in memory. NULL otherwise, or once python has taken
+	 * 		ownership of them.
+	 * adaptive: The tolerance on the fractional change in the gas supply, star
+	 * 		formation rate, and element masses per timestep when the timestep
+	 * 		size is chosen adaptively. 0 for timesteps of fixed size dt.
+	 * stride: The number of timesteps of size dt spanned by the current
+	 * 		timestep. Always 1 when the timestep size is fixed, and between 1
+	 * 		and ADAPTIVE_MAX_TIMESTEP / dt when it is adaptive.
+	 * timings: The time spent in each phase of the simulation when it is
+	 * 		profiled. NULL otherwise. The zones of a multizone simulation
+	 * 		share the same timings object.
 	 */
 
 	char *name;
@@ -411,6 +483,14 @@ typedef struct singlezone {
 	ISM *ism;
 	MDF *mdf;
 	SSP *ssp;
+	unsigned short retain_ssp;
+	struct progressbar *pb;
+	unsigned short in_memory;
+	struct fromfile *history_data;
+	struct fromfile *mdf_data;
+	double adaptive;
+	unsigned long stride;
+	TIMINGS *timings;
 
 } SINGLEZONE;
 
@@ -451,6 +531,11 @@ typedef struct migration {
 	 * tracer_count: The number of active tracer particles
 	 * gas_migration: The migration matrix associated with the ISM gas
 	 * tracers: Pointers to the tracer particles themselves
+	 * tracer_cadence: The number of timesteps between the formation of each
+	 * 		set of tracer particles. Each set accumulates the stars formed in
+	 * 		its zone of origin until the next one forms.
+	 * migration_cadence: The number of timesteps between migrations of gas
+	 * 		and tracer particles between zones.
 	 */
 
 	unsigned int n_zones;
@@ -459,6 +544,8 @@ typedef struct migration {
 	double ***gas_migration;
 	TRACER **tracers;
 	FILE *tracers_output;
+	unsigned long tracer_cadence;
+	unsigned long migration_cadence;
 
 } MIGRATION;
 
@@ -473,6 +560,18 @@ typedef struct multizone {
 	 * mig: The migration settings for this simulation
 	 * verbose: boolean int describing whether or not to print the time as the
 	 * 		simulation evolves
+	 * checkpoint: The number of timesteps between checkpoints of the state of
+	 * 		the simulation written to its output directory. 0 if no
+	 * 		checkpoints are to be written.
+	 * resume: boolean int describing whether or not to restore the state of
+	 * 		the simulation from the checkpoint in its output directory rather
+	 * 		than starting from the beginning.
+	 * settings_hash: A hash of the attributes, yield settings, and output
+	 * 		times of the simulation, computed in python. Recorded in each
+	 * 		checkpoint such that a simulation resumes only from a checkpoint
+	 * 		written with the same settings.
+	 * n_written: The number of outputs written to the history files so far.
+	 * 		Restored from the checkpoint when resuming a simulation.
 	 */
 
 	char *name;
@@ -480,6 +579,10 @@ typedef struct multizone {
 	MIGRATION *mig;
 	unsigned short verbose;
 	unsigned short simple;
+	unsigned long checkpoint;
+	unsigned short resume;
+	unsigned long settings_hash;
+	long n_written;
 
 } MULTIZONE;
 
@@ -490,6 +593,7 @@ typedef struct integral {
 	 * This struct encodes information on a definite integral.
 	 *
 	 * func: The function to integrate
+	 * params: Additional parameters to pass to func (may be NULL)
 	 * a: The lower bound of integration
 	 * b: The upper bound of integration
 	 * tolerance: The maximum allowed numerical tolerance
@@ -502,7 +606,8 @@ typedef struct integral {
 	 * 		at the time of convergence.
 	 */
 
-	double (*func)(double);
+	double (*func)(double, void *);
+	void *params;
 	double a;
 	double b;
 	double tolerance;
@@ -27,6 +27,14 @@ extern SINGLEZONE *singlezone_initialize(void) {
 	sz -> ism = ism_initialize();
 	sz -> mdf = mdf_initialize();
 	sz -> ssp = ssp_initialize();
+	sz -> retain_ssp = 0u;
+	sz -> pb = NULL;
+	sz -> in_memory = 0u;
+	sz -> history_data = NULL;
+	sz -> mdf_data = NULL;
+	sz -> adaptive = 0.0;
+	sz -> stride = 1ul;
+	sz -> timings = NULL;
 	return sz;
 
 }
@@ -42,9 +50,11 @@ extern void singlezone_free(SINGLEZONE *sz) {
 	if (sz != NULL) {
 
 		singlezone_close_files(sz);
+		singlezone_free_output(sz);
 
 		if ((*sz).elements != NULL) {
 			unsigned int i;
+			unshare_RIa(sz); /* elements may share their SN Ia rates */
 			for (i = 0; i < (*sz).n_elements; i++) {
 				element_free(sz -> elements[i]);
 			}
@@ -23,6 +23,7 @@ extern SNEIA_YIELD_SPECS *sneia_yield_initialize(void) {
 	/* some defaults to prevent errors */
 	sneia_yields -> yield_ = callback_1arg_initialize();
 	sneia_yields -> RIa = NULL;
+	sneia_yields -> RIa_borrowed = 0u;
 	sneia_yields -> dtd = (char *) malloc (100 * sizeof(char));
 	sneia_yields -> tau_ia = 1.5;
 	sneia_yields -> t_d = 0.15;
@@ -47,7 +48,7 @@ extern void sneia_yield_free(SNEIA_YIELD_SPECS *sneia_yields) {
 			sneia_yields -> yield_ = NULL;
 		} else {}
 
-		if ((*sneia_yields).RIa != NULL) {
+		if ((*sneia_yields).RIa != NULL && !(*sneia_yields).RIa_borrowed) {
 			free(sneia_yields -> RIa);
 			sneia_yields -> RIa = NULL;
 		} else {}
@@ -30,6 +30,7 @@ extern SSP *ssp_initialize(void) {
 	);
 	ssp -> crf = NULL;
 	ssp -> msmf = NULL;
+	ssp -> borrowed = 0u;
 	return ssp;
 
 }
@@ -44,12 +45,13 @@ extern void ssp_free(SSP *ssp) {
 
 	if (ssp != NULL) {
 
-		if ((*ssp).crf != NULL) {
+		/* tables borrowed from another zone are freed by that zone */
+		if ((*ssp).crf != NULL && !(*ssp).borrowed) {
 			free(ssp -> crf);
 			ssp -> crf = NULL;
 		} else {}
 
-		if ((*ssp).msmf != NULL) {
+		if ((*ssp).msmf != NULL && !(*ssp).borrowed) {
 			free(ssp -> msmf);
 			ssp -> msmf = NULL;
 		} else {}
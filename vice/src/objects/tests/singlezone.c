@@ -28,6 +28,8 @@ extern unsigned short test_singlezone_initialize(void) {
 		(*test).name != NULL &&
 		(*test).history_writer == NULL &&
 		(*test).mdf_writer == NULL &&
+		(*test).history_data == NULL &&
+		(*test).mdf_data == NULL &&
 		(*test).output_times == NULL &&
 		(*test).elements == NULL &&
 		(*test).ism != NULL &&
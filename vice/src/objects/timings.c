@@ -0,0 +1,49 @@
+/*
+ * This file implements memory management for the timings object.
+ */
+
+#include <stdlib.h>
+#include "../timings.h"
+#include "objects.h"
+#include "timings.h"
+
+
+/*
+ * Allocate memory for and return a pointer to a TIMINGS object, with the time
+ * spent in and number of calls to each phase initialized to zero.
+ *
+ * header: timings.h
+ */
+extern TIMINGS *timings_initialize(void) {
+
+	TIMINGS *timings = (TIMINGS *) malloc (sizeof(TIMINGS));
+	timings -> wall = (double *) calloc (N_TIMED_PHASES, sizeof(double));
+	timings -> cpu = (double *) calloc (N_TIMED_PHASES, sizeof(double));
+	timings -> calls = (unsigned long *) calloc (N_TIMED_PHASES,
+		sizeof(unsigned long));
+	timings -> start_wall = (double *) calloc (N_TIMED_PHASES,
+		sizeof(double));
+	timings -> start_cpu = (double *) calloc (N_TIMED_PHASES, sizeof(double));
+	return timings;
+
+}
+
+
+/*
+ * Free up the memory stored in a TIMINGS object.
+ *
+ * header: timings.h
+ */
+extern void timings_free(TIMINGS *timings) {
+
+	if (timings != NULL) {
+		free(timings -> wall);
+		free(timings -> cpu);
+		free(timings -> calls);
+		free(timings -> start_wall);
+		free(timings -> start_cpu);
+		free(timings);
+	} else {}
+
+}
+
@@ -0,0 +1,31 @@
+
+#ifndef OBJECTS_TIMINGS_H
+#define OBJECTS_TIMINGS_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "objects.h"
+
+/*
+ * Allocate memory for and return a pointer to a TIMINGS object, with the time
+ * spent in and number of calls to each phase initialized to zero.
+ *
+ * source: timings.c
+ */
+extern TIMINGS *timings_initialize(void);
+
+/*
+ * Free up the memory stored in a TIMINGS object.
+ *
+ * source: timings.c
+ */
+extern void timings_free(TIMINGS *timings);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* OBJECTS_TIMINGS_H */
+
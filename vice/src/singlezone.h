@@ -22,6 +22,14 @@ extern "C" {
 #define BUFFER 10l
 #endif /* BUFFER */
 
+/*
+ * The maximum size in Gyr of a single timestep when singlezone simulations
+ * choose their timestep size adaptively
+ */
+#ifndef ADAPTIVE_MAX_TIMESTEP
+#define ADAPTIVE_MAX_TIMESTEP 0.05
+#endif /* ADAPTIVE_MAX_TIMESTEP */
+
 #include "objects.h"
 #include "objects/singlezone.h"
 #include "singlezone/agb.h"
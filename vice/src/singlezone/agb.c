@@ -34,6 +34,7 @@ extern double m_AGB(SINGLEZONE sz, ELEMENT e) {
 		return 0; /* No star's yet */
 	} else {
 		unsigned long i;
+		long mass_bin = -1l, Z_bin = -1l;
 		double mass = 0;
 		for (i = 0l; i <= sz.timestep; i++) {
 			/* The metallicity of the stars that formed i timesteps ago */
@@ -41,10 +42,11 @@ extern double m_AGB(SINGLEZONE sz, ELEMENT e) {
 
 			/* From section 4.4 of VICE's science documentation */
 			mass += (
-				get_AGB_yield(e, Z,
-					dying_star_mass(i * sz.dt, (*sz.ssp).postMS, Z)) *
+				get_AGB_yield_bracketed(e, Z,
+					dying_star_mass(i * sz.dt, (*sz.ssp).postMS, Z),
+					&mass_bin, &Z_bin) *
 				(*sz.ism).star_formation_history[sz.timestep - i] * sz.dt *
-				((*sz.ssp).msmf[i] - (*sz.ssp).msmf[i + 1l])
+				((*sz.ssp).msmf[i] - (*sz.ssp).msmf[i + sz.stride])
 			);
 			
 		}
@@ -76,6 +78,37 @@ extern double m_AGB(SINGLEZONE sz, ELEMENT e) {
  */
 extern double get_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass) {
 
+	long mass_bin = -1l, Z_bin = -1l;
+	return get_AGB_yield_bracketed(e, Z_stars, turnoff_mass, &mass_bin,
+		&Z_bin);
+
+}
+
+
+/*
+ * Determine the fractional yield of a given element from AGB stars at a
+ * given mass and metallicity, starting the search for the bins of the yield
+ * grid they lie in from those of a previous call.
+ *
+ * Parameters
+ * ==========
+ * e: 				The element struct containing AGB yield information
+ * Z_stars: 		The metallicity by mass Z of the AGB stars
+ * turnoff_mass:	The mass of the AGB stars
+ * mass_bin: 		A pointer to the bin number in stellar mass from the
+ * 					previous call, or -1 if there was none. Overwritten with
+ * 					that of the current turnoff mass.
+ * Z_bin: 			Same as mass_bin, but for the metallicity.
+ *
+ * Returns
+ * =======
+ * The same value as get_AGB_yield(e, Z_stars, turnoff_mass).
+ *
+ * header: agb.h
+ */
+extern double get_AGB_yield_bracketed(ELEMENT e, double Z_stars,
+	double turnoff_mass, long *mass_bin, long *Z_bin) {
+
 	if (turnoff_mass < MIN_AGB_MASS || turnoff_mass > MAX_AGB_MASS) {
 
 		/*
@@ -103,8 +136,9 @@ extern double get_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass) {
 		 * probably more physical for the yields to flatten off. To mitigate
 		 * this issue, we don't allow negative AGB star yields below 1.5 Msun.
 		 */
-		double yield = interp_scheme_2d_evaluate(*(*e.agb_grid).interpolator,
-			turnoff_mass, Z_stars);
+		double yield = interp_scheme_2d_evaluate_bracketed(
+			*(*e.agb_grid).interpolator, turnoff_mass, Z_stars, mass_bin,
+			Z_bin);
 		if (turnoff_mass < 1.5 && yield < 0) {
 			return 0;
 		} else {
@@ -45,6 +45,30 @@ extern double m_AGB(SINGLEZONE sz, ELEMENT e);
  */
 extern double get_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass);
 
+/*
+ * Determine the fractional yield of a given element from AGB stars at a
+ * given mass and metallicity, starting the search for the bins of the yield
+ * grid they lie in from those of a previous call.
+ *
+ * Parameters
+ * ==========
+ * e: 				The element struct containing AGB yield information
+ * Z_stars: 		The metallicity by mass Z of the AGB stars
+ * turnoff_mass:	The mass of the AGB stars
+ * mass_bin: 		A pointer to the bin number in stellar mass from the
+ * 					previous call, or -1 if there was none. Overwritten with
+ * 					that of the current turnoff mass.
+ * Z_bin: 			Same as mass_bin, but for the metallicity.
+ *
+ * Returns
+ * =======
+ * The same value as get_AGB_yield(e, Z_stars, turnoff_mass).
+ *
+ * source: agb.c
+ */
+extern double get_AGB_yield_bracketed(ELEMENT e, double Z_stars,
+	double turnoff_mass, long *mass_bin, long *Z_bin);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -9,6 +9,7 @@
 #include "../singlezone.h"
 #include "../ssp.h"
 #include "../element.h"
+#include "../timings.h"
 #include "element.h"
 
 
@@ -77,9 +78,15 @@ extern void update_element_mass(SINGLEZONE sz, ELEMENT *e) {
 	 */
 
 	double dm = 0;
-	double m_cc = mdot_ccsne(sz, *e) * sz.dt;
-	double m_ia = mdot_sneia(sz, *e) * sz.dt;
+	timer_start(sz.timings, TIMING_CCSNE);
+	double m_cc = mdot_ccsne(sz, *e) * sz.dt * sz.stride;
+	timer_stop(sz.timings, TIMING_CCSNE);
+	timer_start(sz.timings, TIMING_SNEIA);
+	double m_ia = mdot_sneia(sz, *e) * sz.dt * sz.stride;
+	timer_stop(sz.timings, TIMING_SNEIA);
+	timer_start(sz.timings, TIMING_AGB);
 	double m_agb = m_AGB(sz, *e);
+	timer_stop(sz.timings, TIMING_AGB);
 
 	/* enrichment immediately lost to outflows */
 	e -> unretained = 0;
@@ -97,13 +104,16 @@ extern void update_element_mass(SINGLEZONE sz, ELEMENT *e) {
 	 * outflows proceed at the abundance by mass in the ISM Z.
 	 */
 	double Z = (*e).mass / (*sz.ism).mass;
+	timer_start(sz.timings, TIMING_RECYCLING);
 	dm += mass_recycled(sz, e);
-	dm -= (*sz.ism).star_formation_rate * sz.dt * Z;
-	if (strcmp((*e).symbol, "he")) {
-		dm -= (*sz.ism).enh[sz.timestep] * get_outflow_rate(sz) * sz.dt * Z;
+	timer_stop(sz.timings, TIMING_RECYCLING);
+	dm -= (*sz.ism).star_formation_rate * sz.dt * sz.stride * Z;
+	if (!(*e).is_helium) {
+		dm -= (*sz.ism).enh[sz.timestep] * get_outflow_rate(sz) * sz.dt *
+			sz.stride * Z;
 	} else {
 		/* Don't eject helium at an enhanced metallicity */
-		dm -= get_outflow_rate(sz) * sz.dt * Z;
+		dm -= get_outflow_rate(sz) * sz.dt * sz.stride * Z;
 	}
 	if ((*sz.ism).infall_rate > 0) {
 		/*
@@ -115,7 +125,7 @@ extern void update_element_mass(SINGLEZONE sz, ELEMENT *e) {
 		 * infall mode, and vice versa when in infall mode.
 		 */
  		double Zin = (*e).Zin[sz.timestep] + (*e).primordial;
-	 	dm += (*sz.ism).infall_rate * sz.dt * Zin;
+	 	dm += (*sz.ism).infall_rate * sz.dt * sz.stride * Zin;
 	} else {}
 
 	e -> mass += dm;
@@ -31,7 +31,9 @@ extern unsigned short setup_gas_evolution(SINGLEZONE *sz) {
 
 	/* SFR = MG * tau_star^-1 */
 
-	switch (checksum((*(*sz).ism).mode)) {
+	/* resolve the mode once here; the timestep loop switches on the code */
+	sz -> ism -> mode_code = checksum((*(*sz).ism).mode);
+	switch ((*(*sz).ism).mode_code) {
 
 		case GAS:
 			/*
@@ -140,15 +142,16 @@ extern unsigned short update_gas_evolution(SINGLEZONE *sz) {
 	 * NaN by the time primordial_inflow is called after one timestep has
 	 * passed.
 	 */
-	switch (checksum((*(*sz).ism).mode)) {
+	switch ((*(*sz).ism).mode_code) {
 
 		case GAS:
-			sz -> ism -> mass = (*(*sz).ism).specified[(*sz).timestep + 1l];
+			sz -> ism -> mass = (*(*sz).ism).specified[(*sz).timestep +
+				(*sz).stride];
 			sz -> ism -> star_formation_rate = ((*(*sz).ism).mass /
 				get_SFE_timescale(*sz, 0u));
 			sz -> ism -> infall_rate = (
 				((*(*sz).ism).mass - (*(*sz).ism).specified[(*sz).timestep] -
-					mass_recycled(*sz, NULL)) / (*sz).dt +
+					mass_recycled(*sz, NULL)) / ((*sz).dt * (*sz).stride) +
 				(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
 			);
 			break;
@@ -156,20 +159,21 @@ extern unsigned short update_gas_evolution(SINGLEZONE *sz) {
 		case IFR:
 			sz -> ism -> mass += (
 				((*(*sz).ism).infall_rate - (*(*sz).ism).star_formation_rate -
-					get_outflow_rate(*sz)) * (*sz).dt + mass_recycled(*sz, NULL)
+					get_outflow_rate(*sz)) * (*sz).dt * (*sz).stride +
+				mass_recycled(*sz, NULL)
 			);
 			sz -> ism -> infall_rate = (*(*sz).ism).specified[(
-				*sz).timestep + 1l];
+				*sz).timestep + (*sz).stride];
 			sz -> ism -> star_formation_rate = ((*(*sz).ism).mass /
 				get_SFE_timescale(*sz, 0u));
 			break;
 
 		case SFR:
 			sz -> ism -> star_formation_rate = (
-				*(*sz).ism).specified[(*sz).timestep + 1l];
+				*(*sz).ism).specified[(*sz).timestep + (*sz).stride];
 			double dMg = get_ism_mass_SFRmode(*sz, 0u) - (*(*sz).ism).mass;
 			sz -> ism -> infall_rate = (
-				(dMg - mass_recycled(*sz, NULL)) / (*sz).dt +
+				(dMg - mass_recycled(*sz, NULL)) / ((*sz).dt * (*sz).stride) +
 				(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
 			);
 			sz -> ism -> mass += dMg;
@@ -181,7 +185,7 @@ extern unsigned short update_gas_evolution(SINGLEZONE *sz) {
 	}
 
 	update_gas_evolution_sanitycheck(sz);
-	sz -> ism -> star_formation_history[(*sz).timestep + 1l] = (
+	sz -> ism -> star_formation_history[(*sz).timestep + (*sz).stride] = (
 		*(*sz).ism).star_formation_rate;
 	return 0u;
 
@@ -215,12 +219,12 @@ extern double get_SFE_timescale(SINGLEZONE sz, unsigned short setup) {
 			sz.current_time, (*sz.ism).mass);
 	} else if ((*sz.ism).schmidt) {
 		/* Single-zone implementation of Kennicutt-Schmidt Law */
-		return ((*sz.ism).tau_star[sz.timestep + setup] *
+		return ((*sz.ism).tau_star[sz.timestep + setup * sz.stride] *
 			pow((*sz.ism).mass / (*sz.ism).mgschmidt,
 				-(*sz.ism).schmidt_index));
 	} else {
 		/* Instantaneous star formation efficiency */
-		return (*sz.ism).tau_star[sz.timestep + setup];
+		return (*sz.ism).tau_star[sz.timestep + setup * sz.stride];
 	}
 
 }
@@ -270,7 +274,7 @@ extern double get_ism_mass_SFRmode(SINGLEZONE sz, unsigned short setup) {
 			/* The value implied by the current star formation rate */
 			tau_star = (
 				pow(
-					(*sz.ism).tau_star[sz.timestep + setup],
+					(*sz.ism).tau_star[sz.timestep + setup * sz.stride],
 					1 / (1 + (*sz.ism).schmidt_index)
 				) * pow(
 					(*sz.ism).star_formation_rate / (*sz.ism).mgschmidt,
@@ -281,7 +285,7 @@ extern double get_ism_mass_SFRmode(SINGLEZONE sz, unsigned short setup) {
 			tau_star = 0;
 		}
 	} else {
-		tau_star = (*sz.ism).tau_star[sz.timestep + setup];
+		tau_star = (*sz.ism).tau_star[sz.timestep + setup * sz.stride];
 	}
 
 	return (*sz.ism).star_formation_rate * tau_star;
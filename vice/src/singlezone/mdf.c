@@ -103,11 +103,12 @@ extern void update_MDF(SINGLEZONE *sz) {
 			(*(*sz).mdf).n_bins, onH1);
 		if (bin != -1l) {
 			/*
-			 * Increment the bin number by the star formation rate. Prefactors
-			 * cancel in normalization at the end of the simulation
+			 * Increment the bin number by the star formation rate times the
+			 * number of timesteps of size dt spanned by this timestep.
+			 * Prefactors cancel in normalization at the end of the simulation
 			 */
 			sz -> mdf -> abundance_distributions[i][bin] += (
-				*(*sz).ism).star_formation_rate;
+				*(*sz).ism).star_formation_rate * (*sz).stride;
 		} else {}
 	}
 
@@ -127,7 +128,7 @@ extern void update_MDF(SINGLEZONE *sz) {
 				 * simulation.
 				 */
 				sz -> mdf -> ratio_distributions[n][bin] += (
-					*(*sz).ism).star_formation_rate;
+					*(*sz).ism).star_formation_rate * (*sz).stride;
 			} else {}
 			n++;
 		}
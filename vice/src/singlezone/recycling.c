@@ -39,20 +39,32 @@ extern double mass_recycled(SINGLEZONE sz, ELEMENT *e) {
 		for (i = 0l; i <= sz.timestep; i++) {
 			if (e == NULL) { 		/* This is the gas supply */
 				mass += ((*sz.ism).star_formation_history[sz.timestep - i] *
-					sz.dt * ((*sz.ssp).crf[i + 1l] - (*sz.ssp).crf[i]));
+					sz.dt * ((*sz.ssp).crf[i + sz.stride] - (*sz.ssp).crf[i]));
 			} else { 			/* element -> weight by Z */
 				mass += ((*sz.ism).star_formation_history[sz.timestep - i] *
-					sz.dt * ((*sz.ssp).crf[i + 1l] - (*sz.ssp).crf[i]) *
+					sz.dt * ((*sz.ssp).crf[i + sz.stride] - (*sz.ssp).crf[i]) *
 					(*e).Z[sz.timestep - i]);
 			}
 		}
+		/*
+		 * When the timestep spans several timesteps of size dt, stars that
+		 * form during it also return mass before it ends.
+		 */
+		for (i = 1l; i < sz.stride; i++) {
+			double dm = ((*sz.ism).star_formation_history[sz.timestep] *
+				sz.dt * ((*sz.ssp).crf[i] - (*sz.ssp).crf[0]));
+			if (e != NULL) dm *= (*e).Z[sz.timestep];
+			mass += dm;
+		}
 		return mass;
 	/* ---------------------- Instantaneous recycling ---------------------- */
 	} else {
 		if (e == NULL) {			/* gas supply */
-			return (*sz.ism).star_formation_rate * sz.dt * (*sz.ssp).R0;
+			return ((*sz.ism).star_formation_rate * sz.dt * sz.stride *
+				(*sz.ssp).R0);
 		} else { 				/* element -> weight by Z */
-			return ((*sz.ism).star_formation_rate * sz.dt * (*sz.ssp).R0 *
+			return ((*sz.ism).star_formation_rate * sz.dt * sz.stride *
+				(*sz.ssp).R0 *
 				(*e).mass / (*sz.ism).mass);
 		}
 	}
@@ -10,13 +10,21 @@
 #include "../singlezone.h"
 #include "../ssp.h"
 #include "../io.h"
+#include "../ism.h"
+#include "../imf.h"
+#include "../utils.h"
+#include "../timings.h"
 #include "singlezone.h"
 
 /* ---------- Static function comment headers not duplicated here ---------- */
 static unsigned short singlezone_timestepper(SINGLEZONE *sz);
-
-/* A progressbar that will run for the singlezone object */
-static PROGRESSBAR *PB = NULL;
+static unsigned long adaptive_stride(SINGLEZONE sz, long n,
+	unsigned long previous, double rate);
+static unsigned short input_changes(double *x, unsigned long timestep,
+	unsigned long j, double tolerance);
+static void adaptive_snapshot(SINGLEZONE sz, double *state);
+static double adaptive_rate(SINGLEZONE sz, double *state,
+	unsigned long stride);
 
 
 /*
@@ -35,6 +43,44 @@ extern long singlezone_address(SINGLEZONE *sz) {
 }
 
 
+/*
+ * Determine whether or not a singlezone simulation will call any python
+ * functions as it evolves, in which case the python interpreter must not run
+ * concurrently (i.e. the global interpreter lock must be held).
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation, set up to run
+ *
+ * Returns
+ * =======
+ * 1 if the nucleosynthetic yields of any element, the star formation
+ * efficiency timescale, or an untabulated IMF are python functions, 0
+ * otherwise.
+ *
+ * header: singlezone.h
+ */
+extern unsigned short singlezone_calls_python(SINGLEZONE sz) {
+
+	if ((*(*sz.ism).functional_tau_star).user_func != NULL) return 1u;
+	if (checksum((*(*sz.ssp).imf).spec) == CUSTOM &&
+		(*(*sz.ssp).imf).mass_distribution == NULL) return 1u;
+
+	unsigned int i, j;
+	for (i = 0u; i < sz.n_elements; i++) {
+		ELEMENT e = *sz.elements[i];
+		if ((*(*e.ccsne_yields).yield_).user_func != NULL ||
+			(*(*e.sneia_yields).yield_).user_func != NULL ||
+			(*(*e.agb_grid).custom_yield).user_func != NULL) return 1u;
+		for (j = 0u; j < e.n_channels; j++) {
+			if ((*(*e.channels[j]).yield_).user_func != NULL) return 1u;
+		}
+	}
+	return 0u;
+
+}
+
+
 /*
  * Runs the singlezone simulation under current user settings.
  *
@@ -55,7 +101,9 @@ extern unsigned short singlezone_evolve(SINGLEZONE *sz) {
 
 	/* Normalize the MDF, write it out, close the files */
 	normalize_MDF(sz);
+	timer_start((*sz).timings, TIMING_MDF_OUTPUT);
 	write_mdf_output(*sz);
+	timer_stop((*sz).timings, TIMING_MDF_OUTPUT);
 	singlezone_close_files(sz);
 	singlezone_clean(sz);
 
@@ -77,6 +125,18 @@ extern unsigned short singlezone_evolve(SINGLEZONE *sz) {
 extern void singlezone_evolve_no_setup_no_clean(SINGLEZONE *sz) {
 
 	long n = 0l; 	/* keep track of the number of outputs */
+
+	/*
+	 * With adaptive timestepping, the gas supply, star formation rate, and
+	 * element masses are recorded before each timestep to determine how
+	 * quickly they're changing, which sets the size of the next one.
+	 */
+	unsigned long stride = 1ul;
+	double rate = 0, *state = NULL;
+	if ((*sz).adaptive) {
+		state = (double *) malloc (((*sz).n_elements + 2u) * sizeof(double));
+	} else {}
+
 	while ((*sz).current_time <= (*sz).output_times[(*sz).n_outputs - 1l]) {
 		/*
 		 * Run the simulation until the time reaches the final output time
@@ -86,14 +146,25 @@ extern void singlezone_evolve_no_setup_no_clean(SINGLEZONE *sz) {
 		 */
 		if ((*sz).current_time >= (*sz).output_times[n] ||
 			2 * (*sz).output_times[n] < 2 * (*sz).current_time + (*sz).dt) {
+			timer_start((*sz).timings, TIMING_HISTORY_OUTPUT);
 			write_singlezone_history(*sz);
+			timer_stop((*sz).timings, TIMING_HISTORY_OUTPUT);
 			n++;
 		} else {}
+		if (state != NULL) {
+			stride = adaptive_stride(*sz, n, stride, rate);
+			sz -> stride = stride;
+			adaptive_snapshot(*sz, state);
+		} else {}
 		if (singlezone_timestepper(sz)) break;
-		singlezone_verbosity(*sz);
+		if (state != NULL) rate = adaptive_rate(*sz, state, stride);
+		singlezone_verbosity(sz);
 	}
-	singlezone_verbosity(*sz);
+	singlezone_verbosity(sz);
+	timer_start((*sz).timings, TIMING_HISTORY_OUTPUT);
 	write_singlezone_history(*sz);
+	timer_stop((*sz).timings, TIMING_HISTORY_OUTPUT);
+	if (state != NULL) free(state);
 
 }
 
@@ -130,24 +201,213 @@ static unsigned short singlezone_timestepper(SINGLEZONE *sz) {
 	 * account in each of the following subroutines.
 	 */
 	unsigned int i;
-	if (strcmp((*(*sz).ism).mode, "ifr")) update_gas_evolution(sz);
+	unsigned long j, k = (*sz).timestep, stride = (*sz).stride;
+	if ((*(*sz).ism).mode_code != IFR) {
+		timer_start((*sz).timings, TIMING_GAS_EVOLUTION);
+		update_gas_evolution(sz);
+		timer_stop((*sz).timings, TIMING_GAS_EVOLUTION);
+	} else {}
 	for (i = 0; i < (*sz).n_elements; i++) {
 		update_element_mass(*sz, (*sz).elements[i]);
 		/* Now the ISM and this element are at the next timestep */
-		sz -> elements[i] -> Z[(*sz).timestep + 1l] = (
+		sz -> elements[i] -> Z[(*sz).timestep + stride] = (
 			(*(*sz).elements[i]).mass / (*(*sz).ism).mass);
 	}
-	if (!strcmp((*(*sz).ism).mode, "ifr")) update_gas_evolution(sz);
+	if ((*(*sz).ism).mode_code == IFR) {
+		timer_start((*sz).timings, TIMING_GAS_EVOLUTION);
+		update_gas_evolution(sz);
+		timer_stop((*sz).timings, TIMING_GAS_EVOLUTION);
+	} else {}
+	timer_start((*sz).timings, TIMING_MDF);
 	update_MDF(sz);
+	timer_stop((*sz).timings, TIMING_MDF);
+
+	if (stride > 1ul) {
+		/*
+		 * The star formation history and abundances are stored at every
+		 * timestep of size dt for the enrichment from previous generations
+		 * of stars. Fill in those skipped over by linear interpolation, and
+		 * express the mass lost to outflows per timestep of size dt.
+		 */
+		double *sfh = (*(*sz).ism).star_formation_history;
+		for (j = 1ul; j < stride; j++) {
+			sfh[k + j] = sfh[k] + (sfh[k + stride] - sfh[k]) * j / stride;
+			for (i = 0; i < (*sz).n_elements; i++) {
+				double *Z = (*(*sz).elements[i]).Z;
+				Z[k + j] = Z[k] + (Z[k + stride] - Z[k]) * j / stride;
+			}
+		}
+		for (i = 0; i < (*sz).n_elements; i++) {
+			sz -> elements[i] -> unretained /= stride;
+		}
+	} else {}
 
-	sz -> current_time += (*sz).dt;
-	sz -> timestep++;
+	for (j = 0ul; j < stride; j++) sz -> current_time += (*sz).dt;
+	sz -> timestep += stride;
+	sz -> stride = 1ul;
 
 	return (*sz).current_time >= (*sz).output_times[(*sz).n_outputs - 1l];
 	
 }
 
 
+/*
+ * Determine the number of timesteps of size dt that the next timestep of a
+ * singlezone simulation should span when its timestep size is chosen
+ * adaptively.
+ *
+ * Parameters
+ * ==========
+ * sz: 			The singlezone object for the current simulation
+ * n: 			The index of the next output time to be written
+ * previous: 	The number of timesteps of size dt spanned by the previous
+ * 				timestep
+ * rate: 		The largest fractional change per timestep of size dt of the
+ * 				gas supply, star formation rate, and element masses over the
+ * 				previous timestep
+ *
+ * Returns
+ * =======
+ * The number of timesteps of size dt to take at once, at least 1. The
+ * timestep is no longer than ADAPTIVE_MAX_TIMESTEP, at most twice as long as
+ * the previous one, short enough that the fractional change in each quantity
+ * is expected to be within the tolerance, and ends no later than the
+ * timestep at which the next output is written. It also ends before any
+ * user-specified input to the simulation changes by more than the tolerance.
+ */
+static unsigned long adaptive_stride(SINGLEZONE sz, long n,
+	unsigned long previous, double rate) {
+
+	unsigned long j, stride = (unsigned long) (ADAPTIVE_MAX_TIMESTEP / sz.dt);
+	if (stride > 2ul * previous) stride = 2ul * previous;
+	if (rate > 0 && sz.adaptive / rate < stride) {
+		stride = (unsigned long) (sz.adaptive / rate);
+	} else {}
+	if (stride < 1ul) return 1ul;
+	if (n >= (long) sz.n_outputs) return 1ul;
+
+	/* Land on the timestep at which the next output would be written */
+	double time = sz.current_time;
+	for (j = 1ul; j <= stride; j++) {
+		time += sz.dt;
+		if (time >= sz.output_times[n] ||
+			2 * sz.output_times[n] < 2 * time + sz.dt) {
+			stride = j;
+			break;
+		} else {}
+	}
+
+	/* Stop short of any sudden change in the user's inputs */
+	for (j = 1ul; j <= stride; j++) {
+		if (input_changes((*sz.ism).specified, sz.timestep, j, sz.adaptive) ||
+			input_changes((*sz.ism).eta, sz.timestep, j, sz.adaptive) ||
+			input_changes((*sz.ism).enh, sz.timestep, j, sz.adaptive) || (
+				(*(*sz.ism).functional_tau_star).user_func == NULL &&
+				input_changes((*sz.ism).tau_star, sz.timestep, j,
+					sz.adaptive))) {
+			stride = j - 1ul;
+			break;
+		} else {}
+	}
+
+	return stride > 1ul ? stride : 1ul;
+
+}
+
+
+/*
+ * Determine whether or not an input to a singlezone simulation, mapped onto
+ * timesteps of size dt, changes by more than some tolerance.
+ *
+ * Parameters
+ * ==========
+ * x: 			The input array
+ * timestep: 	The current timestep number
+ * j: 			The number of timesteps of size dt ahead to compare to
+ * tolerance: 	The maximum allowed fractional change
+ *
+ * Returns
+ * =======
+ * 1 if the input changes by more than the tolerance between the current
+ * timestep and j timesteps later, 0 otherwise.
+ */
+static unsigned short input_changes(double *x, unsigned long timestep,
+	unsigned long j, double tolerance) {
+
+	if (x == NULL) return 0u;
+	return fabs(x[timestep + j] - x[timestep]) > tolerance * fabs(x[timestep]);
+
+}
+
+
+/*
+ * Record the gas supply, star formation rate, and element masses of a
+ * singlezone simulation ahead of an adaptive timestep.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ * state: 	The array to store them in, of length n_elements + 2
+ */
+static void adaptive_snapshot(SINGLEZONE sz, double *state) {
+
+	unsigned int i;
+	state[0] = (*sz.ism).mass;
+	state[1] = (*sz.ism).star_formation_rate;
+	for (i = 0u; i < sz.n_elements; i++) {
+		state[i + 2u] = (*sz.elements[i]).mass;
+	}
+
+}
+
+
+/*
+ * Determine the largest fractional change per timestep of size dt of the gas
+ * supply, star formation rate, and element masses over an adaptive timestep.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ * state: 	The values recorded by adaptive_snapshot before the timestep
+ * stride: 	The number of timesteps of size dt spanned by the timestep
+ *
+ * Returns
+ * =======
+ * The largest fractional change, or 0 if none of them changed.
+ */
+static double adaptive_rate(SINGLEZONE sz, double *state,
+	unsigned long stride) {
+
+	unsigned int i;
+	double rate = 0;
+	for (i = 0u; i < sz.n_elements + 2u; i++) {
+		double now, change;
+		switch (i) {
+			case 0u:
+				now = (*sz.ism).mass;
+				break;
+			case 1u:
+				now = (*sz.ism).star_formation_rate;
+				break;
+			default:
+				now = (*sz.elements[i - 2u]).mass;
+				break;
+		}
+		if (state[i] != 0) {
+			change = fabs(now - state[i]) / (fabs(state[i]) * stride);
+		} else if (now != 0) {
+			/* A quantity turning on from zero: take small steps */
+			change = 1;
+		} else {
+			change = 0;
+		}
+		if (change > rate) rate = change;
+	}
+	return rate;
+
+}
+
+
 /*
  * Setup the singlezone object for simulation.
  *
@@ -163,14 +423,63 @@ static unsigned short singlezone_timestepper(SINGLEZONE *sz) {
  */
 extern unsigned short singlezone_setup(SINGLEZONE *sz) {
 
+	/*
+	 * Setup the cumulative return fraction, main sequence mass fraction,
+	 * and SNe Ia rates, then everything else. If the tables were retained
+	 * from the previous simulation, python has already verified that they
+	 * still apply, and they are reused as they are.
+	 */
+	if (!(*sz).retain_ssp || (*(*sz).ssp).crf == NULL) {
+		unsigned short status;
+		timer_start((*sz).timings, TIMING_SETUP_CRF);
+		status = setup_CRF(sz);
+		timer_stop((*sz).timings, TIMING_SETUP_CRF);
+		if (status) return 1u;
+		timer_start((*sz).timings, TIMING_SETUP_MSMF);
+		status = setup_MSMF(sz);
+		timer_stop((*sz).timings, TIMING_SETUP_MSMF);
+		if (status) return 1u;
+		timer_start((*sz).timings, TIMING_SETUP_RIA);
+		status = setup_RIa(sz);
+		timer_stop((*sz).timings, TIMING_SETUP_RIA);
+		if (status) return 1u;
+	} else {}
+	return singlezone_setup_evolution(sz);
+
+}
+
+
+/*
+ * Setup the singlezone object for simulation once the properties of its
+ * single stellar populations (the cumulative return fraction, the main
+ * sequence mass fraction, and the SN Ia delay-time distribution of each
+ * element) are already in place.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to do the setup for
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * Notes
+ * =====
+ * Multizone models assign these tables from one zone to all others with the
+ * same stellar population parameters, then call this function for each zone.
+ *
+ * header: singlezone.h
+ */
+extern unsigned short singlezone_setup_evolution(SINGLEZONE *sz) {
+
 	/* Open output files and write headers */
 	if (singlezone_open_files(sz)) {
 		return 1u;
 	} else {
-		write_history_header(*sz);
+		if (!(*sz).in_memory) write_history_header(*sz);
 		sz -> current_time = 0.0;
 		sz -> timestep = 0l;
-		write_mdf_header(*sz);
+		if (!(*sz).in_memory) write_mdf_header(*sz);
 	}
 
 	/*
@@ -182,15 +491,8 @@ extern unsigned short singlezone_setup(SINGLEZONE *sz) {
 	 * This is not set until after setup_gas_evolution() is called.
 	 */
 
-	/*
-	 * Setup the cumulative return fraction, main sequence mass fraction,
-	 * metallicity distribution function, SNe Ia rates, and gas evolution.
-	 */
-
-	if (setup_CRF(sz)) return 1u;
-	if (setup_MSMF(sz)) return 1u;
+	/* Setup the metallicity distribution function and gas evolution. */
 	if (setup_MDF(sz)) return 1u;
-	if (setup_RIa(sz)) return 1u;
 	if (setup_gas_evolution(sz)) return 1u;
 	unsigned int i;
 	for (i = 0u; i < (*sz).n_elements; i++) {
@@ -205,6 +507,11 @@ extern unsigned short singlezone_setup(SINGLEZONE *sz) {
 		sz -> elements[i] -> Z[0l] = (
 			(*(*sz).elements[i]).mass / (*(*sz).ism).mass
 		);
+		/* no mass has been produced yet, and none is unretained */
+		sz -> elements[i] -> unretained = 0;
+		/* helium is treated separately; resolve the symbol only once */
+		sz -> elements[i] -> is_helium = !strcmp(
+			(*(*sz).elements[i]).symbol, "he");
 	}
 
 	return 0u;
@@ -228,21 +535,12 @@ extern unsigned short singlezone_setup(SINGLEZONE *sz) {
 extern void singlezone_clean(SINGLEZONE *sz) {
 
 	unsigned int i;
+	if (!(*sz).retain_ssp) singlezone_free_ssp(sz);
 	for (i = 0; i < (*sz).n_elements; i++) {
-		if ((*(*(*(*sz).elements[i]).agb_grid).interpolator).zcoords != NULL) {
-			free(sz -> elements[i] -> agb_grid -> interpolator -> xcoords);
-			free(sz -> elements[i] -> agb_grid -> interpolator -> ycoords);
-			free(sz -> elements[i] -> agb_grid -> interpolator -> zcoords);
-			sz -> elements[i] -> agb_grid -> interpolator -> xcoords = NULL;
-			sz -> elements[i] -> agb_grid -> interpolator -> ycoords = NULL;
-			sz -> elements[i] -> agb_grid -> interpolator -> zcoords = NULL;
-		} else {}
 		free(sz -> elements[i] -> Z);
 		free(sz -> elements[i] -> Zin);
-		free(sz -> elements[i] -> sneia_yields -> RIa);
 		sz -> elements[i] -> Z = NULL;
 		sz -> elements[i] -> Zin = NULL;
-		sz -> elements[i] -> sneia_yields -> RIa = NULL;
 	}
 	free(sz -> ism -> specified);
 	free(sz -> ism -> star_formation_history);
@@ -251,8 +549,6 @@ extern void singlezone_clean(SINGLEZONE *sz) {
 	free(sz -> ism -> tau_star);
 	free(sz -> mdf -> abundance_distributions);
 	free(sz -> mdf -> ratio_distributions);
-	free(sz -> ssp -> crf);
-	free(sz -> ssp -> msmf);
 	free(sz -> output_times);
 	sz -> ism -> specified = NULL;
 	sz -> ism -> star_formation_history = NULL;
@@ -261,11 +557,63 @@ extern void singlezone_clean(SINGLEZONE *sz) {
 	sz -> ism -> tau_star = NULL;
 	sz -> mdf -> abundance_distributions = NULL;
 	sz -> mdf -> ratio_distributions = NULL;
-	sz -> ssp -> crf = NULL;
-	sz -> ssp -> msmf = NULL;
 	sz -> output_times = NULL;
 	sz -> current_time = 0;
 	sz -> timestep = 0l;
+	if ((*sz).pb != NULL) {
+		progressbar_free(sz -> pb);
+		sz -> pb = NULL;
+	} else {}
+
+}
+
+
+/*
+ * Free up the tables describing single stellar populations: the cumulative
+ * return fraction, the main sequence mass fraction, and each element's SN Ia
+ * rate and AGB star yield grid.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object to free the tables for
+ *
+ * header: singlezone.h
+ */
+extern void singlezone_free_ssp(SINGLEZONE *sz) {
+
+	unsigned int i;
+	unsigned long j;
+	unshare_RIa(sz);
+	for (i = 0; i < (*sz).n_elements; i++) {
+		INTERP_SCHEME_2D *agb = sz -> elements[i] -> agb_grid -> interpolator;
+		if ((*agb).zcoords != NULL) {
+			for (j = 0ul; j < (*agb).n_x_values; j++) free(agb -> zcoords[j]);
+			free(agb -> zcoords);
+			agb -> zcoords = NULL;
+		} else {}
+		if ((*agb).xcoords != NULL) {
+			free(agb -> xcoords);
+			agb -> xcoords = NULL;
+		} else {}
+		if ((*agb).ycoords != NULL) {
+			free(agb -> ycoords);
+			agb -> ycoords = NULL;
+		} else {}
+		/* tables borrowed from another zone are freed by that zone */
+		SNEIA_YIELD_SPECS *ia = sz -> elements[i] -> sneia_yields;
+		if ((*ia).RIa != NULL && !(*ia).RIa_borrowed) free(ia -> RIa);
+		ia -> RIa = NULL;
+		ia -> RIa_borrowed = 0u;
+	}
+	if ((*(*sz).ssp).crf != NULL && !(*(*sz).ssp).borrowed) {
+		free(sz -> ssp -> crf);
+	} else {}
+	if ((*(*sz).ssp).msmf != NULL && !(*(*sz).ssp).borrowed) {
+		free(sz -> ssp -> msmf);
+	} else {}
+	sz -> ssp -> crf = NULL;
+	sz -> ssp -> msmf = NULL;
+	sz -> ssp -> borrowed = 0u;
 
 }
 
@@ -290,27 +638,12 @@ extern void singlezone_cancel(SINGLEZONE *sz) {
 	 */
 
 	unsigned int i;
+	singlezone_free_ssp(sz);
 	for (i = 0; i < (*sz).n_elements; i++) {
 		if ((*(*sz).elements[i]).Zin != NULL) {
 			free(sz -> elements[i] -> Zin);
 			sz -> elements[i] -> Zin = NULL;
 		} else {}
-		if ((*(*(*sz).elements[i]).sneia_yields).RIa != NULL) {
-			free(sz -> elements[i] -> sneia_yields -> RIa);
-			sz -> elements[i] -> sneia_yields -> RIa = NULL;
-		} else {}
-		if ((*(*(*(*sz).elements[i]).agb_grid).interpolator).xcoords != NULL) {
-			free(sz -> elements[i] -> agb_grid -> interpolator -> xcoords);
-			sz -> elements[i] -> agb_grid -> interpolator -> xcoords = NULL;
-		} else {}
-		if ((*(*(*(*sz).elements[i]).agb_grid).interpolator).ycoords != NULL) {
-			free(sz -> elements[i] -> agb_grid -> interpolator -> ycoords);
-			sz -> elements[i] -> agb_grid -> interpolator -> ycoords = NULL;
-		} else {}
-		if ((*(*(*(*sz).elements[i]).agb_grid).interpolator).zcoords != NULL) {
-			free(sz -> elements[i] -> agb_grid -> interpolator -> zcoords);
-			sz -> elements[i] -> agb_grid -> interpolator -> zcoords = NULL;
-		} else {}
 	}
 
 	if ((*(*sz).ism).specified != NULL) {
@@ -329,6 +662,10 @@ extern void singlezone_cancel(SINGLEZONE *sz) {
 		free(sz -> ism -> tau_star);
 		sz -> ism -> tau_star = NULL;
 	} else {}
+	if ((*sz).pb != NULL) {
+		progressbar_free(sz -> pb);
+		sz -> pb = NULL;
+	} else {}
 
 }
 
@@ -363,26 +700,30 @@ extern unsigned long n_timesteps(SINGLEZONE sz) {
  *
  * Parameters
  * ==========
- * sz: 		The singlezone object for the current simulation
+ * sz: 		A pointer to the singlezone object for the current simulation.
+ * 			Its progressbar is created on the first call and freed once the
+ * 			simulation reaches its final timestep.
  *
  * header: singlezone.h
  */
-extern void singlezone_verbosity(SINGLEZONE sz) {
+extern void singlezone_verbosity(SINGLEZONE *sz) {
 
-	if (sz.verbose) {
-		if (PB == NULL) {
-			PB = progressbar_initialize(n_timesteps(sz) - BUFFER);
-			PB -> custom_left_hand_side = 1u;
-			PB -> eta_mode = 875u;
+	if ((*sz).verbose) {
+		if ((*sz).pb == NULL) {
+			sz -> pb = progressbar_initialize(n_timesteps(*sz) - BUFFER);
+			sz -> pb -> custom_left_hand_side = 1u;
+			sz -> pb -> eta_mode = 875u;
 		} else {}
 		char current_time[100];
-		sprintf(current_time, "Current Time: %.2f Gyr", sz.current_time);
-		progressbar_set_left_hand_side(PB, current_time);
-		if (sz.timestep <= (*PB).maxval) progressbar_update(PB, sz.timestep);
-		if (sz.timestep == (*PB).maxval) {
-			progressbar_finish(PB);
-			progressbar_free(PB);
-			PB = NULL;
+		sprintf(current_time, "Current Time: %.2f Gyr", (*sz).current_time);
+		progressbar_set_left_hand_side((*sz).pb, current_time);
+		if ((*sz).timestep <= (*(*sz).pb).maxval) {
+			progressbar_update((*sz).pb, (*sz).timestep);
+		} else {}
+		if ((*sz).timestep >= (*(*sz).pb).maxval) {
+			progressbar_finish((*sz).pb);
+			progressbar_free(sz -> pb);
+			sz -> pb = NULL;
 		} else {}
 	} else {}
 
@@ -19,6 +19,25 @@ extern "C" {
  */
 extern long singlezone_address(SINGLEZONE *sz);
 
+/*
+ * Determine whether or not a singlezone simulation will call any python
+ * functions as it evolves, in which case the python interpreter must not run
+ * concurrently (i.e. the global interpreter lock must be held).
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation, set up to run
+ *
+ * Returns
+ * =======
+ * 1 if the nucleosynthetic yields of any element, the star formation
+ * efficiency timescale, or an untabulated IMF are python functions, 0
+ * otherwise.
+ *
+ * source: singlezone.c
+ */
+extern unsigned short singlezone_calls_python(SINGLEZONE sz);
+
 /*
  * Runs the singlezone simulation under current user settings. Most of VICE is
  * built around calling this function.
@@ -62,6 +81,24 @@ extern void singlezone_evolve_no_setup_no_clean(SINGLEZONE *sz);
  */
 extern unsigned short singlezone_setup(SINGLEZONE *sz);
 
+/*
+ * Setup the singlezone object for simulation once the properties of its
+ * single stellar populations (the cumulative return fraction, the main
+ * sequence mass fraction, and the SN Ia delay-time distribution of each
+ * element) are already in place.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to do the setup for
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * source: singlezone.c
+ */
+extern unsigned short singlezone_setup_evolution(SINGLEZONE *sz);
+
 /*
  * Frees up the memory allocated in running a singlezone simulation. These
  * values are objects that are stored at the python level and copied at
@@ -77,6 +114,24 @@ extern unsigned short singlezone_setup(SINGLEZONE *sz);
  */
 extern void singlezone_clean(SINGLEZONE *sz);
 
+/*
+ * Free up the tables describing single stellar populations: the cumulative
+ * return fraction, the main sequence mass fraction, and each element's SN Ia
+ * rate and AGB star yield grid.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object to free the tables for
+ *
+ * Notes
+ * =====
+ * singlezone_clean calls this function unless the singlezone object retains
+ * these tables for the next simulation (see retain_ssp in objects.h).
+ *
+ * source: singlezone.c
+ */
+extern void singlezone_free_ssp(SINGLEZONE *sz);
+
 /*
  * Undo the pieces of preparation to run a singlezone simulation that are
  * called from python. This function is invoked when the user cancels their
@@ -111,11 +166,13 @@ extern unsigned long n_timesteps(SINGLEZONE sz);
  *
  * Parameters
  * ==========
- * sz: 		The singlezone object for the current simulation
+ * sz: 		A pointer to the singlezone object for the current simulation.
+ * 			Its progressbar is created on the first call and freed once the
+ * 			simulation reaches its final timestep.
  *
  * source: singlezone.c
  */
-extern void singlezone_verbosity(SINGLEZONE sz);
+extern void singlezone_verbosity(SINGLEZONE *sz);
 
 /*
  * Determine the stellar mass in a singlezone simulation
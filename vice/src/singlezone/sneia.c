@@ -5,6 +5,7 @@
 
 #include <stdlib.h>
 #include <stdio.h>
+#include <string.h>
 #include <math.h>
 #include "../singlezone.h"
 #include "../callback.h"
@@ -13,7 +14,8 @@
 #include "sneia.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double RIa_builtin(ELEMENT e, double time);
+static double RIa_builtin(ELEMENT e, unsigned long dtd, double time);
+static double mdot_sneia_stride(SINGLEZONE sz, ELEMENT e);
 
 
 /*
@@ -36,6 +38,7 @@ extern double mdot_sneia(SINGLEZONE sz, ELEMENT e) {
 
 	unsigned long i;
 	double mdotia = 0;
+	if (sz.stride > 1ul) return mdot_sneia_stride(sz, e);
 	for (i = 0l; i < sz.timestep; i++) {
 		mdotia += (
 			get_ia_yield(e, scale_metallicity(sz, i)) *
@@ -49,6 +52,63 @@ extern double mdot_sneia(SINGLEZONE sz, ELEMENT e) {
 }
 
 
+/*
+ * Determine the mean rate of mass enrichment of a given element from SNe Ia
+ * over a timestep spanning several timesteps of size dt (i.e. when the
+ * timestep size is chosen adaptively).
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to find the rate of mass enrichment for
+ *
+ * Returns
+ * =======
+ * The time-derivative of the type Ia supernovae mass enrichment term,
+ * averaged over the next sz.stride timesteps of size dt.
+ *
+ * Notes
+ * =====
+ * Stellar populations which form during the timestep do so at the current
+ * star formation rate and metallicity.
+ */
+static double mdot_sneia_stride(SINGLEZONE sz, ELEMENT e) {
+
+	unsigned long i, length = (unsigned long) (RIA_MAX_EVAL_TIME / sz.dt);
+	double *ria = (*e.sneia_yields).RIa;
+	double window = 0, mdotia = 0;
+
+	/*
+	 * The DTD summed over the stride, evaluated at a delay of i timesteps of
+	 * size dt, is updated as a sliding window as the delay increases.
+	 */
+	for (i = 1ul; i <= sz.stride && i < length; i++) window += ria[i];
+	for (i = 1ul; i <= sz.timestep; i++) {
+		mdotia += (
+			get_ia_yield(e, scale_metallicity(sz, sz.timestep - i)) *
+			(*sz.ism).star_formation_history[sz.timestep - i] *
+			window
+		);
+		if (i < length) window -= ria[i];
+		if (i + sz.stride < length) window += ria[i + sz.stride];
+	}
+
+	/* Populations which form during the timestep itself */
+	window = 0;
+	for (i = 1ul; i < sz.stride && i < length; i++) {
+		window += (sz.stride - i) * ria[i];
+	}
+	mdotia += (
+		get_ia_yield(e, scale_metallicity(sz, sz.timestep)) *
+		(*sz.ism).star_formation_history[sz.timestep] *
+		window
+	);
+
+	return mdotia / sz.stride;
+
+}
+
+
 /*
  * Obtain the IMF-integrated fractional mass yield of a given element from its
  * internal yield table.
@@ -87,46 +147,141 @@ extern double get_ia_yield(ELEMENT e, double Z) {
  */
 extern unsigned short setup_RIa(SINGLEZONE *sz) {
 
-	unsigned int j;
-	unsigned long i, length = (unsigned long) (RIA_MAX_EVAL_TIME / (*sz).dt);
+	/*
+	 * Every element in a zone usually has the same DTD, in which case they
+	 * all share the buffer of the first element.
+	 */
+	unsigned int i, j;
 	for (j = 0; j < (*sz).n_elements; j++) {
+		for (i = 0; i < j; i++) {
+			if (same_RIa(*(*sz).elements[i], *(*sz).elements[j])) break;
+		}
+		if (i < j) {
+			sz -> elements[j] -> sneia_yields -> RIa = (
+				(*(*(*sz).elements[i]).sneia_yields).RIa
+			);
+		} else if (setup_element_RIa(sz, j)) {
+			return 1;
+		} else continue;
+	}
 
-		switch (checksum((*(*(*sz).elements[j]).sneia_yields).dtd)) {
+	return 0; 		/* success */
 
-			case PLAW:
-				/* same as EXP */
+}
 
-			case EXP:
-				sz -> elements[j] -> sneia_yields -> RIa = (double *) malloc (
-					length * sizeof(double));
-				if ((*(*(*sz).elements[j]).sneia_yields).RIa == NULL) {
-					return 1; 		/* memory error */
-				} else {
-					for (i = 0l; i < length; i++) {
-						sz -> elements[j] -> sneia_yields -> RIa[i] = (
-							RIa_builtin(*(*sz).elements[j], i * (*sz).dt)
-						);
-					}
-					normalize_RIa(sz -> elements[j], length); /* norm it */
-				}
-				break;
 
-			case CUSTOM:
-				/*
-				 * Python will map the custom function into this array, so
-				 * simply normalize it here.
-				 */
-				normalize_RIa(sz -> elements[j], length);
-				break;
+/*
+ * Determine whether or not two elements can share the same buffer for their
+ * SNe Ia delay-time distributions. This assumes that they're in simulations
+ * with the same timestep size.
+ *
+ * Parameters
+ * ==========
+ * e1: 		The first element
+ * e2: 		The second element
+ *
+ * Returns
+ * =======
+ * 1 if the DTDs are built-in with the same parameters or if they are custom
+ * and already share the same buffer, 0 otherwise
+ *
+ * header: sneia.h
+ */
+extern unsigned short same_RIa(ELEMENT e1, ELEMENT e2) {
 
-			default:
-				return 1;
+	SNEIA_YIELD_SPECS ia1 = *e1.sneia_yields;
+	SNEIA_YIELD_SPECS ia2 = *e2.sneia_yields;
 
-		}
+	if (strcmp(ia1.dtd, ia2.dtd)) {
+		return 0u;
+	} else if (checksum(ia1.dtd) == CUSTOM) {
+		return ia1.RIa == ia2.RIa;
+	} else {
+		return ia1.tau_ia == ia2.tau_ia && ia1.t_d == ia2.t_d;
+	}
 
+}
+
+
+/*
+ * Remove references to SNe Ia rate buffers shared with a previous element in
+ * a singlezone object, such that each buffer is referenced only by the first
+ * element that uses it and can be freed exactly once.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object
+ *
+ * header: sneia.h
+ */
+extern void unshare_RIa(SINGLEZONE *sz) {
+
+	unsigned int i, j;
+	for (j = 1u; j < (*sz).n_elements; j++) {
+		for (i = 0u; i < j; i++) {
+			if ((*(*(*sz).elements[j]).sneia_yields).RIa ==
+				(*(*(*sz).elements[i]).sneia_yields).RIa) {
+				sz -> elements[j] -> sneia_yields -> RIa = NULL;
+				sz -> elements[j] -> sneia_yields -> RIa_borrowed = 0u;
+				break;
+			} else continue;
+		}
 	}
 
-	return 0; 		/* success */
+}
+
+
+/*
+ * Setup the SNe Ia rate of a single element in preparation for a singlezone
+ * simulation.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object that is about to be ran
+ * index: 	The index of the element to setup the SNe Ia rate for
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * header: sneia.h
+ */
+extern unsigned short setup_element_RIa(SINGLEZONE *sz, unsigned int index) {
+
+	unsigned long i, length = (unsigned long) (RIA_MAX_EVAL_TIME / (*sz).dt);
+	ELEMENT *e = sz -> elements[index];
+	unsigned long dtd = checksum((*(*e).sneia_yields).dtd);
+	switch (dtd) {
+
+		case PLAW:
+			/* same as EXP */
+
+		case EXP:
+			e -> sneia_yields -> RIa = (double *) malloc (length *
+				sizeof(double));
+			if ((*(*e).sneia_yields).RIa == NULL) {
+				return 1; 		/* memory error */
+			} else {
+				for (i = 0l; i < length; i++) {
+					e -> sneia_yields -> RIa[i] = RIa_builtin(*e, dtd,
+						i * (*sz).dt);
+				}
+				normalize_RIa(e, length); /* norm it */
+			}
+			return 0;
+
+		case CUSTOM:
+			/*
+			 * Python will map the custom function into this array, so
+			 * simply normalize it here.
+			 */
+			normalize_RIa(e, length);
+			return 0;
+
+		default:
+			return 1;
+
+	}
 
 }
 
@@ -138,6 +293,8 @@ extern unsigned short setup_RIa(SINGLEZONE *sz) {
  * Parameters
  * ==========
  * e: 		An ELEMENT struct containing the delay-time information
+ * dtd: 	The hash code of the DTD string (EXP or PLAW), resolved once by the
+ * 			caller rather than at every evaluation
  * time: 	The time in Gyr following the formation of a single stellar
  * 			population
  *
@@ -145,13 +302,13 @@ extern unsigned short setup_RIa(SINGLEZONE *sz) {
  * =======
  * The value of the DTD prior to normalization
  */
-static double RIa_builtin(ELEMENT e, double time) {
+static double RIa_builtin(ELEMENT e, unsigned long dtd, double time) {
 
 	if (time < (*e.sneia_yields).t_d) {
 		/* Time is below minimum Ia delay time, force to zero */
 		return 0;
 	} else {
-		switch (checksum((*e.sneia_yields).dtd)) {
+		switch (dtd) {
 
 			case EXP:
 				/* exponential DTD w/user-specified e-folding timescale */
@@ -59,6 +59,55 @@ extern double get_ia_yield(ELEMENT e, double Z);
  */
 extern unsigned short setup_RIa(SINGLEZONE *sz);
 
+/*
+ * Setup the SNe Ia rate of a single element in preparation for a singlezone
+ * simulation.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object that is about to be ran
+ * index: 	The index of the element to setup the SNe Ia rate for
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * source: sneia.c
+ */
+extern unsigned short setup_element_RIa(SINGLEZONE *sz, unsigned int index);
+
+/*
+ * Determine whether or not two elements can share the same buffer for their
+ * SNe Ia delay-time distributions. This assumes that they're in simulations
+ * with the same timestep size.
+ *
+ * Parameters
+ * ==========
+ * e1: 		The first element
+ * e2: 		The second element
+ *
+ * Returns
+ * =======
+ * 1 if the DTDs are built-in with the same parameters or if they are custom
+ * and already share the same buffer, 0 otherwise
+ *
+ * source: sneia.c
+ */
+extern unsigned short same_RIa(ELEMENT e1, ELEMENT e2);
+
+/*
+ * Remove references to SNe Ia rate buffers shared with a previous element in
+ * a singlezone object, such that each buffer is referenced only by the first
+ * element that uses it and can be freed exactly once.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object
+ *
+ * source: sneia.c
+ */
+extern void unshare_RIa(SINGLEZONE *sz);
+
 /*
  * Normalize the SNe Ia delay-time distribution once it is set according to
  * an arbitrary normalization.
@@ -3,10 +3,15 @@
  * branch stars in the parent directory.
  */
 
+#include "../../agb.h"
 #include "../../utils.h"
 #include "../../ssp.h"
 #include "../agb.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static unsigned short bracketed_yield_sweep(ELEMENT e, double Z_stars,
+	long *mass_bin, long *Z_bin);
+
 
 /*
  * Performs the quiescence edge-case test on the m_AGB function at ../agb.h
@@ -94,3 +99,100 @@ extern unsigned short zero_age_ssp_test_m_AGB(SINGLEZONE *sz) {
 
 }
 
+
+/*
+ * Tests the get_AGB_yield_bracketed function at ../agb.h, which starts the
+ * search for the bins of the yield grid from those of a previous call, under
+ * the yield settings of a max age SSP edge-case test. The turnoff mass is
+ * swept down and back up the grid at a range of metallicities, including
+ * values exactly on the grid edges and outside of the grid. The yields must
+ * match those of get_AGB_yield, which looks up the bins with get_bin_number.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to perform the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: agb.h
+ */
+extern unsigned short max_age_ssp_test_get_AGB_yield_bracketed(
+	SINGLEZONE *sz) {
+
+	unsigned short i, status = 1u;
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		ELEMENT e = *(*sz).elements[i];
+		/* user-specified yields as a function of mass do not use the grid */
+		if ((*(*e.agb_grid).custom_yield).user_func != NULL) continue;
+		INTERP_SCHEME_2D is2d = *(*e.agb_grid).interpolator;
+		long mass_bin = -1l, Z_bin = -1l;
+		unsigned long j;
+		/* below, on, between, and above the metallicities on the grid */
+		status &= bracketed_yield_sweep(e, is2d.ycoords[0] - 0.01, &mass_bin,
+			&Z_bin);
+		for (j = 0ul; j < is2d.n_y_values; j++) {
+			status &= bracketed_yield_sweep(e, is2d.ycoords[j], &mass_bin,
+				&Z_bin);
+			if (j < is2d.n_y_values - 1ul) status &= bracketed_yield_sweep(e,
+				0.5 * (is2d.ycoords[j] + is2d.ycoords[j + 1ul]), &mass_bin,
+				&Z_bin);
+		}
+		status &= bracketed_yield_sweep(e,
+			2 * is2d.ycoords[is2d.n_y_values - 1ul], &mass_bin, &Z_bin);
+		if (!status) break;
+	}
+	return status;
+
+}
+
+
+/*
+ * Sweep the turnoff mass down and back up the AGB star yield grid of an
+ * element at a given metallicity, comparing get_AGB_yield_bracketed against
+ * get_AGB_yield at each mass.
+ *
+ * Parameters
+ * ==========
+ * e: 			The element whose AGB star yields are to be tested
+ * Z_stars: 	The metallicity by mass Z of the AGB stars
+ * mass_bin: 	A pointer to the bin number in stellar mass from the previous
+ * 				call, passed along from one sweep to the next
+ * Z_bin: 		Same as mass_bin, but for the metallicity
+ *
+ * Returns
+ * =======
+ * 1 if the yields match at every mass, 0 otherwise
+ */
+static unsigned short bracketed_yield_sweep(ELEMENT e, double Z_stars,
+	long *mass_bin, long *Z_bin) {
+
+	INTERP_SCHEME_2D is2d = *(*e.agb_grid).interpolator;
+	unsigned long n = is2d.n_x_values, i;
+	unsigned short status = 1u;
+	for (i = 0ul; i <= 4ul * n; i++) {
+		/*
+		 * Position k counts up from below the grid (k = 0) through each grid
+		 * point (odd k) and midpoint (even k) to above it (k = 2n). The
+		 * sweep runs from k = 2n down to 0 and back up.
+		 */
+		unsigned long k = i <= 2ul * n ? 2ul * n - i : i - 2ul * n;
+		double m;
+		if (k == 2ul * n) {
+			m = 0.5 * (is2d.xcoords[n - 1ul] + MAX_AGB_MASS);
+		} else if (k == 0ul) {
+			m = 0.5 * (MIN_AGB_MASS + is2d.xcoords[0]);
+		} else if (k % 2ul) {
+			m = is2d.xcoords[(k - 1ul) / 2ul];
+		} else {
+			m = 0.5 * (is2d.xcoords[k / 2ul - 1ul] + is2d.xcoords[k / 2ul]);
+		}
+		status &= get_AGB_yield_bracketed(e, Z_stars, m, mass_bin, Z_bin) ==
+			get_AGB_yield(e, Z_stars, m);
+		if (!status) break;
+	}
+	return status;
+
+}
+
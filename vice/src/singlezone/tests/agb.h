@@ -55,6 +55,25 @@ extern unsigned short max_age_ssp_test_m_AGB(SINGLEZONE *sz);
  */
 extern unsigned short zero_age_ssp_test_m_AGB(SINGLEZONE *sz);
 
+/*
+ * Tests the get_AGB_yield_bracketed function at ../agb.h against
+ * get_AGB_yield under the yield settings of a max age SSP edge-case test,
+ * including turnoff masses and metallicities on the grid edges and outside
+ * of the grid.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to perform the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: agb.c
+ */
+extern unsigned short max_age_ssp_test_get_AGB_yield_bracketed(
+	SINGLEZONE *sz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -12,6 +12,7 @@ cdef class max_age_ssp(generic):
 ### Max Age SSP unit tests ###
 cdef extern from "../agb.h":
 	unsigned short max_age_ssp_test_m_AGB(SINGLEZONE *sz)
+	unsigned short max_age_ssp_test_get_AGB_yield_bracketed(SINGLEZONE *sz)
 
 cdef extern from "../ccsne.h":
 	unsigned short max_age_ssp_test_m_ccsne(SINGLEZONE *sz)
@@ -65,6 +65,7 @@ def max_age_ssp_test(**kwargs):
 		return None
 	return [
 		_TEST_.test_m_AGB(),
+		_TEST_.test_get_AGB_yield_bracketed(),
 		_TEST_.test_m_ccsne(),
 		_TEST_.test_update_element_mass(),
 		_TEST_.test_onH(),
@@ -110,6 +111,16 @@ cdef class max_age_ssp:
 			return _max_age_ssp.max_age_ssp_test_m_AGB(self._sz)
 		return ["vice.src.singlezone.agb.m_agb", test]
 
+	@unittest
+	def test_get_AGB_yield_bracketed(self):
+		r"""
+		vice.src.singlezone.agb.get_AGB_yield_bracketed max age SSP test
+		"""
+		def test():
+			return _max_age_ssp.max_age_ssp_test_get_AGB_yield_bracketed(
+				self._sz)
+		return ["vice.src.singlezone.agb.get_AGB_yield_bracketed", test]
+
 	@unittest
 	def test_m_ccsne(self):
 		r"""
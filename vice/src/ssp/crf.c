@@ -14,16 +14,16 @@
 #include "mlr.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double CRFdenominator_integrand(double m);
-static double CRFnumerator_integrand(double m);
+static double CRFdenominator_integrand(double m, void *imf);
+static double CRFnumerator_integrand(double m, void *imf);
 static double CRFnumerator_Kalirai08(SSP ssp, double time);
+static double CRFnumerator_tabulated(SSP ssp, double *cumulative, double t);
 static double CRFnumerator_Kalirai08_IMFrange(double m_upper,
 	double turnoff_mass, double m_lower, double a);
 static double CRFnumerator_Kalirai08_above_8Msun(double m_upper,
 	double turnoff_mass, double a);
 static double CRFnumerator_Kalirai08_below_8Msun(double m_upper,
 	double turnoff_mass, double a);
-static IMF_ *ADOPTED_IMF = NULL;
 
 /*
  * Determine the cumulative return fraction from a single stellar population
@@ -87,10 +87,26 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
 		 */
 		unsigned long i, n = n_timesteps(*sz);
 
+		/*
+		 * For a tabulated custom IMF, the numerator at each timestep is
+		 * interpolated from the cumulative integral over the IMF computed
+		 * when it was tabulated, rather than integrating the IMF numerically
+		 * n times.
+		 */
+		double *cumulative = NULL;
+		if (checksum((*(*(*sz).ssp).imf).spec) == CUSTOM) {
+			cumulative = (*(*(*sz).ssp).imf).returned_cumulative;
+		} else {}
+
 		sz -> ssp -> crf = (double *) malloc (n * sizeof(double));
 		for (i = 0l; i < n; i++) {
-			sz -> ssp -> crf[i] = CRFnumerator_Kalirai08(
-				(*(*sz).ssp), i * (*sz).dt) / denominator;
+			if (cumulative != NULL) {
+				sz -> ssp -> crf[i] = CRFnumerator_tabulated((*(*sz).ssp),
+					cumulative, i * (*sz).dt) / denominator;
+			} else {
+				sz -> ssp -> crf[i] = CRFnumerator_Kalirai08(
+					(*(*sz).ssp), i * (*sz).dt) / denominator;
+			}
 		}
 		return 0u;
 
@@ -105,6 +121,7 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
  * Parameters
  * ==========
  * m: 		The initial stellar mass in Msun
+ * imf: 	The adopted IMF (type IMF_ *)
  *
  * Returns
  * =======
@@ -115,9 +132,9 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
  * ========
  * Section 2.2 of Science Documentation: The Cumulative Return Fraction
  */
-static double CRFnumerator_integrand(double m) {
+static double CRFnumerator_integrand(double m, void *imf) {
 
-	return (m - Kalirai08_remnant_mass(m)) * imf_evaluate(*ADOPTED_IMF, m);
+	return (m - Kalirai08_remnant_mass(m)) * imf_evaluate(*((IMF_ *) imf), m);
 
 }
 
@@ -128,6 +145,7 @@ static double CRFnumerator_integrand(double m) {
  * Parameters
  * ==========
  * m: 		The initial stellar mass in Msun
+ * imf: 	The adopted IMF (type IMF_ *)
  *
  * Returns
  * =======
@@ -137,9 +155,38 @@ static double CRFnumerator_integrand(double m) {
  * ========
  * Section 2.2 of Science Documentation: The Cumulative Return Fraction
  */
-static double CRFdenominator_integrand(double m) {
+static double CRFdenominator_integrand(double m, void *imf) {
+
+	return m * imf_evaluate(*((IMF_ *) imf), m);
 
-	return m * imf_evaluate(*ADOPTED_IMF, m);
+}
+
+
+/*
+ * Determine the total mass returned to the ISM from a single stellar
+ * population with a tabulated custom IMF a time t in Gyr following its
+ * formation.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * cumulative: 	The cumulative integral of the IMF weighted by the mass
+ * 				returned to the ISM (i.e. the returned_cumulative attribute of
+ * 				the IMF object)
+ * t: 			The time in Gyr following the single stellar population's
+ * 				formation.
+ *
+ * Returns
+ * =======
+ * The total returned mass in solar masses up to the normalization of the
+ * stellar IMF.
+ */
+static double CRFnumerator_tabulated(SSP ssp, double *cumulative, double t) {
+
+	double turnoff_mass = dying_star_mass(t, ssp.postMS, 0.014);
+	return (cumulative[IMF_N_MASSES - 1ul] -
+		imf_cumulative_evaluate(*ssp.imf, cumulative, turnoff_mass));
 
 }
 
@@ -244,10 +291,15 @@ static double CRFnumerator_Kalirai08(SSP ssp, double t) {
 			}
 
 		case CUSTOM:
+			if ((*ssp.imf).returned_cumulative != NULL) {
+				/* tabulated custom IMF -> interpolate the integrated table */
+				return CRFnumerator_tabulated(ssp,
+					(*ssp.imf).returned_cumulative, t);
+			} else {}
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *numerator = integral_initialize();
 			numerator -> func = &CRFnumerator_integrand;
+			numerator -> params = (void *) ssp.imf;
 			numerator -> a = turnoff_mass;
 			numerator -> b = (*ssp.imf).m_upper;
 			/* default values for these parameters */
@@ -258,7 +310,6 @@ static double CRFnumerator_Kalirai08(SSP ssp, double t) {
 			quad(numerator);
 			double x = (*numerator).result;
 			integral_free(numerator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -466,10 +517,14 @@ extern double CRFdenominator(SSP ssp) {
 			}
 
 		case CUSTOM:
+			if ((*ssp.imf).mass_cumulative != NULL) {
+				/* tabulated custom IMF -> the integrated table */
+				return (*ssp.imf).mass_cumulative[IMF_N_MASSES - 1ul];
+			} else {}
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *denominator = integral_initialize();
 			denominator -> func = &CRFdenominator_integrand;
+			denominator -> params = (void *) ssp.imf;
 			denominator -> a = (*ssp.imf).m_lower;
 			denominator -> b = (*ssp.imf).m_upper;
 			/* default values for these properties */
@@ -480,7 +535,6 @@ extern double CRFdenominator(SSP ssp) {
 			quad(denominator);
 			double x = (*denominator).result;
 			integral_free(denominator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -38,6 +38,15 @@ static const double Z_SOLAR = 0.02;
 static double **HPT2000TABLE = NULL;
 static const unsigned short HPT2000TABLE_DIMENSION = 4u;
 
+/*
+ * The number of simulations and functions currently using the data. It is read
+ * in only once and freed only when the last of them is finished with it, such
+ * that simulations running concurrently in separate threads can share it.
+ * Imports and frees are always called from python while holding the global
+ * interpreter lock, so they are never concurrent themselves.
+ */
+static unsigned int HPT2000_USERS = 0u;
+
 
 /*
  * Compute the mass of dying stars in a star cluster of known age according to
@@ -257,7 +266,14 @@ static double zeta(double Z) {
  */
 extern unsigned short hpt2000_import(char *filename) {
 
+	if (HPT2000_USERS) {
+		/* already read in for another simulation */
+		HPT2000_USERS++;
+		return 0u;
+	} else {}
+
 	HPT2000TABLE = read_square_ascii_file(filename);
+	if (HPT2000TABLE != NULL) HPT2000_USERS = 1u;
 	return HPT2000TABLE == NULL;
 
 }
@@ -274,6 +290,14 @@ extern unsigned short hpt2000_import(char *filename) {
  */
 extern void hpt2000_free(void) {
 
+	if (HPT2000_USERS > 1u) {
+		/* still in use by another simulation */
+		HPT2000_USERS--;
+		return;
+	} else {
+		HPT2000_USERS = 0u;
+	}
+
 	free(HPT2000TABLE);
 	HPT2000TABLE = NULL;
 
@@ -20,6 +20,15 @@ static const unsigned short N_MASSES = 41u;
 static const unsigned short N_METALLICITIES = 9u;
 static INTERP_SCHEME_2D *KA1997 = NULL;
 
+/*
+ * The number of simulations and functions currently using the data. It is read
+ * in only once and freed only when the last of them is finished with it, such
+ * that simulations running concurrently in separate threads can share it.
+ * Imports and frees are always called from python while holding the global
+ * interpreter lock, so they are never concurrent themselves.
+ */
+static unsigned int KA1997_USERS = 0u;
+
 
 /*
  * Compute the mass of dying stars in a star cluster of known age according to
@@ -168,6 +177,12 @@ extern double ka1997_lifetime(double mass, double postMS, double Z) {
  */
 extern unsigned short ka1997_import(char *filename) {
 
+	if (KA1997_USERS) {
+		/* already read in for another simulation */
+		KA1997_USERS++;
+		return 0u;
+	} else {}
+
 	FILE *in = fopen(filename, "r");
 	if (in == NULL) return 1u;
 
@@ -193,6 +208,7 @@ extern unsigned short ka1997_import(char *filename) {
 	}
 
 	fclose(in);
+	KA1997_USERS = 1u;
 	return 0u;
 
 }
@@ -209,6 +225,14 @@ extern unsigned short ka1997_import(char *filename) {
  */
 extern void ka1997_free(void) {
 
+	if (KA1997_USERS > 1u) {
+		/* still in use by another simulation */
+		KA1997_USERS--;
+		return;
+	} else {
+		KA1997_USERS = 0u;
+	}
+
 	interp_scheme_2d_free(KA1997);
 	KA1997 = NULL;
 
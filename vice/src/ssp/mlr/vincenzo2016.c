@@ -37,6 +37,15 @@ static INTERP_SCHEME_1D *VINCENZO_A = NULL;
 static INTERP_SCHEME_1D *VINCENZO_B = NULL;
 static INTERP_SCHEME_1D *VINCENZO_C = NULL;
 
+/*
+ * The number of simulations and functions currently using the data. It is read
+ * in only once and freed only when the last of them is finished with it, such
+ * that simulations running concurrently in separate threads can share it.
+ * Imports and frees are always called from python while holding the global
+ * interpreter lock, so they are never concurrent themselves.
+ */
+static unsigned int VINCENZO2016_USERS = 0u;
+
 
 /*
  * Compute the mass of dying stars in a star cluster of known age according to
@@ -214,6 +223,12 @@ extern double vincenzo2016_lifetime(double mass, double postMS, double Z) {
  */
 extern unsigned short vincenzo2016_import(char *filename) {
 
+	if (VINCENZO2016_USERS) {
+		/* already read in for another simulation */
+		VINCENZO2016_USERS++;
+		return 0u;
+	} else {}
+
 	int hlength = header_length(filename);
 	if (hlength == -1) return 1u;
 	int flength = line_count(filename);
@@ -250,6 +265,7 @@ extern unsigned short vincenzo2016_import(char *filename) {
 	}
 
 	fclose(in);
+	VINCENZO2016_USERS = 1u;
 	return 0u;
 
 }
@@ -266,6 +282,14 @@ extern unsigned short vincenzo2016_import(char *filename) {
  */
 extern void vincenzo2016_free(void) {
 
+	if (VINCENZO2016_USERS > 1u) {
+		/* still in use by another simulation */
+		VINCENZO2016_USERS--;
+		return;
+	} else {
+		VINCENZO2016_USERS = 0u;
+	}
+
 	interp_scheme_1d_free(VINCENZO_A);
 	interp_scheme_1d_free(VINCENZO_B);
 	interp_scheme_1d_free(VINCENZO_C);
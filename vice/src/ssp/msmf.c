@@ -14,8 +14,7 @@
 #include "mlr.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double MSMFnumerator_integrand(double m);
-static IMF_ *ADOPTED_IMF = NULL;
+static double MSMFnumerator_integrand(double m, void *imf);
 
 
 /*
@@ -48,6 +47,57 @@ extern double MSMF(SSP ssp, double time) {
 }
 
 
+/*
+ * Evaluate the main sequence mass fraction of a stellar population at each of
+ * an array of ages.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		A SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages of the stellar population in Gyr
+ * n_times: 	The number of elements in the times array
+ *
+ * Returns
+ * =======
+ * An array of the same length as times containing the main sequence mass
+ * fraction at each age. NULL in the case of an unrecognized IMF or a failure
+ * to allocate memory.
+ *
+ * header: msmf.h
+ */
+extern double *MSMF_tabulate(SSP ssp, double *times, unsigned long n_times) {
+
+	double denominator = MSMFdenominator(ssp);
+	if (denominator < 0) return NULL; 	/* unrecognized IMF */
+	double *msmf = (double *) malloc (n_times * sizeof(double));
+	if (msmf == NULL) return NULL; 		/* memory error */
+
+	/*
+	 * As in setup_MSMF, a tabulated custom IMF is interpolated from the
+	 * cumulative integral computed when it was tabulated.
+	 */
+	double *cumulative = NULL;
+	if (checksum((*ssp.imf).spec) == CUSTOM) {
+		cumulative = (*ssp.imf).mass_cumulative;
+	} else {}
+
+	unsigned long i;
+	for (i = 0l; i < n_times; i++) {
+		double turnoff_mass = dying_star_mass(times[i], ssp.postMS, 0.014);
+		if (cumulative != NULL && (*ssp.imf).m_lower <= turnoff_mass &&
+			turnoff_mass <= (*ssp.imf).m_upper) {
+			msmf[i] = imf_cumulative_evaluate(*ssp.imf, cumulative,
+				turnoff_mass) / denominator;
+		} else {
+			msmf[i] = MSMFnumerator(ssp, times[i]) / denominator;
+		}
+	}
+	return msmf;
+
+}
+
+
 /*
  * Evaluate the main sequence mass fraction across all timesteps in preparation
  * of a singlezone simulation. This will store the MSMF in the SSP struct
@@ -80,10 +130,28 @@ extern unsigned short setup_MSMF(SINGLEZONE *sz) {
 		 */
 		unsigned long i, n = n_timesteps(*sz);
 
+		/*
+		 * For a tabulated custom IMF, the numerator at each timestep is
+		 * interpolated from the cumulative integral over the IMF computed
+		 * when it was tabulated, rather than integrating the IMF numerically
+		 * n times.
+		 */
+		double *cumulative = NULL;
+		if (checksum((*(*(*sz).ssp).imf).spec) == CUSTOM) {
+			cumulative = (*(*(*sz).ssp).imf).mass_cumulative;
+		} else {}
+
 		sz -> ssp -> msmf = (double *) malloc (n * sizeof(double));
 		for (i = 0l; i < n; i++) {
-			sz -> ssp -> msmf[i] = MSMFnumerator((*(*sz).ssp),
-				i * (*sz).dt) / denominator;
+			if (cumulative != NULL) {
+				sz -> ssp -> msmf[i] = imf_cumulative_evaluate(
+					*(*(*sz).ssp).imf, cumulative, dying_star_mass(
+						i * (*sz).dt, (*(*sz).ssp).postMS, 0.014)
+				) / denominator;
+			} else {
+				sz -> ssp -> msmf[i] = MSMFnumerator((*(*sz).ssp),
+					i * (*sz).dt) / denominator;
+			}
 		}
 		return 0;
 	}
@@ -214,10 +282,15 @@ extern double MSMFnumerator(SSP ssp, double t) {
 			}
 
 		case CUSTOM:
+			if ((*ssp.imf).mass_cumulative != NULL) {
+				/* tabulated custom IMF -> interpolate the integrated table */
+				return imf_cumulative_evaluate(*ssp.imf,
+					(*ssp.imf).mass_cumulative, turnoff_mass);
+			} else {}
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *numerator = integral_initialize();
 			numerator -> func = &MSMFnumerator_integrand;
+			numerator -> params = (void *) ssp.imf;
 			numerator -> a = (*ssp.imf).m_lower;
 			numerator -> b = turnoff_mass;
 			/* default values for these parameters */
@@ -228,7 +301,6 @@ extern double MSMFnumerator(SSP ssp, double t) {
 			quad(numerator);
 			double x = (*numerator).result;
 			integral_free(numerator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -246,6 +318,7 @@ extern double MSMFnumerator(SSP ssp, double t) {
  * Parameters
  * ==========
  * m: 			The initial stellar mass in Msun
+ * imf: 		The adopted IMF (type IMF_ *)
  *
  * Returns
  * =======
@@ -255,9 +328,9 @@ extern double MSMFnumerator(SSP ssp, double t) {
  * ========
  * Section 2.3 of Science Documentation: The Main Sequence Mass Fraction
  */
-static double MSMFnumerator_integrand(double m) {
+static double MSMFnumerator_integrand(double m, void *imf) {
 
-	return m * imf_evaluate(*ADOPTED_IMF, m);
+	return m * imf_evaluate(*((IMF_ *) imf), m);
 
 }
 
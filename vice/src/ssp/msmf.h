@@ -27,6 +27,27 @@ extern "C" {
  */
 extern double MSMF(SSP ssp, double time);
 
+/*
+ * Evaluate the main sequence mass fraction of a stellar population at each of
+ * an array of ages.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		A SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages of the stellar population in Gyr
+ * n_times: 	The number of elements in the times array
+ *
+ * Returns
+ * =======
+ * An array of the same length as times containing the main sequence mass
+ * fraction at each age. NULL in the case of an unrecognized IMF or a failure
+ * to allocate memory.
+ *
+ * source: msmf.c
+ */
+extern double *MSMF_tabulate(SSP ssp, double *times, unsigned long n_times);
+
 /*
  * Evaluate the main sequence mass fraction across all timesteps in preparation
  * of a singlezone simulation. This will store the MSMF in the SSP struct
@@ -8,6 +8,11 @@
 #include "../singlezone.h"
 #include "ssp.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static void single_population_enrichment_fill(SSP ssp, ELEMENT e, double Z,
+	double mstar, double *times, unsigned long n_times, double *mass);
+
+
 /*
  * Run a simulation of elemental production for a single element produced by a
  * single stellar population.
@@ -32,48 +37,105 @@
 extern double *single_population_enrichment(SSP *ssp, ELEMENT *e,
 	double Z, double *times, unsigned long n_times, double mstar) {
 
-	double *mass = (double *) malloc (n_times * sizeof(double));
+	return single_population_enrichment_many(ssp, e, &Z, &mstar, 1l, times,
+		n_times);
+
+}
+
+
+/*
+ * Run simulations of elemental production for a single element produced by
+ * many single stellar populations of different metallicities and masses.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		A pointer to an SSP object. If its main sequence mass fraction
+ * 				has not yet been tabulated, it will be evaluated at each of
+ * 				the times and stored here; otherwise it is assumed to have been
+ * 				tabulated at these times by a previous call to this function.
+ * e: 			A pointer to an element to run the simulations for
+ * Z: 			The metallicity by mass of each stellar population
+ * mstar: 		The mass of each stellar population in Msun
+ * n_pops: 		The number of elements in the Z and mstar arrays
+ * times: 		The times at which the simulations will evaluate
+ * n_times: 	The number of elements in the times array
+ *
+ * Returns
+ * =======
+ * An array of length n_pops * n_times, where element i * n_times + j is the
+ * mass of the given chemical element produced by the i'th stellar population
+ * at the j'th time. NULL on failure to allocate memory or in the case of an
+ * unrecognized IMF.
+ *
+ * header: ssp.h
+ */
+extern double *single_population_enrichment_many(SSP *ssp, ELEMENT *e,
+	double *Z, double *mstar, unsigned long n_pops, double *times,
+	unsigned long n_times) {
+
+	if ((*ssp).msmf == NULL) {
+		ssp -> msmf = MSMF_tabulate(*ssp, times, n_times);
+		if ((*ssp).msmf == NULL) return NULL;
+	} else {}
+
+	double *mass = (double *) malloc (n_pops * n_times * sizeof(double));
 	if (mass == NULL) return NULL; 	/* memory error */
 
-	ssp -> msmf = (double *) malloc (n_times * sizeof(double));
-	if ((*ssp).msmf == NULL) return NULL; /* memory error */
-	double denominator = MSMFdenominator(*ssp);
-	if (denominator < 0) { /* unrecognized IMF */
-		free(mass);
-		free(ssp -> msmf);
-		return NULL;
-	} else {
-		unsigned long i;
-		for (i = 0l; i < n_times; i++) {
-			ssp -> msmf[i] = MSMFnumerator(*ssp, times[i]) / denominator;
-		}
+	unsigned long i;
+	for (i = 0l; i < n_pops; i++) {
+		single_population_enrichment_fill(*ssp, *e, Z[i], mstar[i], times,
+			n_times, mass + i * n_times);
 	}
+	return mass;
+
+}
+
+
+/*
+ * Compute the mass of an element produced by one single stellar population at
+ * each time, given its main sequence mass fraction at each time.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP object, with its main sequence mass fraction tabulated
+ * e: 			The element to run the simulation for
+ * Z: 			The metallicity by mass of the stellar population
+ * mstar: 		The mass of the stellar population in Msun
+ * times: 		The times at which the simulation will evaluate
+ * n_times: 	The number of elements in the times array
+ * mass: 		The array of length n_times to store the results in
+ */
+static void single_population_enrichment_fill(SSP ssp, ELEMENT e, double Z,
+	double mstar, double *times, unsigned long n_times, double *mass) {
 
+	if (n_times == 0l) return;
 	mass[0] = 0;
-	double ia_yield = get_ia_yield(*e, Z);
+	double ia_yield = get_ia_yield(e, Z);
 	if (n_times >= 2l) {
 		/* The contribution from CCSNe */
-		mass[1] = get_cc_yield(*e, Z) * mstar;
+		mass[1] = get_cc_yield(e, Z) * mstar;
 		unsigned long i;
+		long mass_bin = -1l, Z_bin = -1l;
 		for (i = 2l; i < n_times; i++) {
 			mass[i] = mass[i - 1l]; 		/* previous timesteps */
 
 			/* The contribution from SNe Ia */
-			// mass[i] += ((*(*e).sneia_yields).yield_ *
-			mass[i] += ia_yield * (*(*e).sneia_yields).RIa[i] * mstar;
-
-			/* The contribution from AGB stars */
-			mass[i] += (
-				get_AGB_yield(*e, Z,
-					dying_star_mass(times[i], (*ssp).postMS, Z)) *
-				mstar * ((*ssp).msmf[i] - (*ssp).msmf[i + 1l])
+			mass[i] += ia_yield * (*e.sneia_yields).RIa[i] * mstar;
+
+			/*
+			 * The contribution from AGB stars. The main sequence mass
+			 * fraction is only known up to the final time, so no stars are
+			 * counted as dying over the final timestep.
+			 */
+			if (i + 1l < n_times) mass[i] += (
+				get_AGB_yield_bracketed(e, Z,
+					dying_star_mass(times[i], ssp.postMS, Z),
+					&mass_bin, &Z_bin) *
+				mstar * (ssp.msmf[i] - ssp.msmf[i + 1l])
 			);
 
 		}
 	} else {}
 
-	return mass;
-
 }
 
-
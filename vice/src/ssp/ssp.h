@@ -32,6 +32,36 @@ extern "C" {
 extern double *single_population_enrichment(SSP *ssp, ELEMENT *e,
 	double Z, double *times, unsigned long n_times, double mstar);
 
+/*
+ * Run simulations of elemental production for a single element produced by
+ * many single stellar populations of different metallicities and masses.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		A pointer to an SSP object. If its main sequence mass fraction
+ * 				has not yet been tabulated, it will be evaluated at each of
+ * 				the times and stored here; otherwise it is assumed to have been
+ * 				tabulated at these times by a previous call to this function.
+ * e: 			A pointer to an element to run the simulations for
+ * Z: 			The metallicity by mass of each stellar population
+ * mstar: 		The mass of each stellar population in Msun
+ * n_pops: 		The number of elements in the Z and mstar arrays
+ * times: 		The times at which the simulations will evaluate
+ * n_times: 	The number of elements in the times array
+ *
+ * Returns
+ * =======
+ * An array of length n_pops * n_times, where element i * n_times + j is the
+ * mass of the given chemical element produced by the i'th stellar population
+ * at the j'th time. NULL on failure to allocate memory or in the case of an
+ * unrecognized IMF.
+ *
+ * source: ssp.c
+ */
+extern double *single_population_enrichment_many(SSP *ssp, ELEMENT *e,
+	double *Z, double *mstar, unsigned long n_pops, double *times,
+	unsigned long n_times);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -2,5 +2,6 @@
 
 cdef extern from "imf.h":
 	unsigned short test_imf_evaluate()
+	unsigned short test_imf_cumulative_integral()
 	unsigned short test_salpeter55()
 	unsigned short test_kroupa01()
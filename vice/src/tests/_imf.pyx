@@ -6,6 +6,7 @@ __all__ = [
 	"test_custom_mass_distribution",
 	"test_mass_bin_counter",
 	"test_imf_evaluation",
+	"test_tabulated_imf",
 	"test_builtin_salpeter",
 	"test_builtin_kroupa"
 ]
@@ -22,6 +23,7 @@ def test():
 	return ["vice.src.imf",
 		[
 			test_imf_evaluation(),
+			test_tabulated_imf(),
 			test_builtin_salpeter(),
 			test_builtin_kroupa()
 		]
@@ -36,6 +38,15 @@ def test_imf_evaluation():
 	return ["vice.src.imf.evaluate", _imf.test_imf_evaluate]
 
 
+@unittest
+def test_tabulated_imf():
+	"""
+	Tests the cumulative integrals of a tabulated imf at vice/src/imf.h
+	"""
+	return ["vice.src.imf.cumulative_integral",
+		_imf.test_imf_cumulative_integral]
+
+
 @unittest
 def test_builtin_salpeter():
 	"""
@@ -15,3 +15,4 @@ cdef extern from "utils.h":
 	unsigned short test_sum()
 	unsigned short test_set_char_p_value()
 	unsigned short test_max()
+	unsigned short test_interp_scheme_2d_evaluate_bracketed()
@@ -16,7 +16,8 @@ __all__ = [
 	"test_bin_center_calculator",
 	"test_summation",
 	"test_string_copier",
-	"test_maximum"
+	"test_maximum",
+	"test_bracketed_2D_interpolation"
 ]
 from ...testing import moduletest
 from ...testing import unittest
@@ -43,7 +44,8 @@ def test():
 			test_bin_center_calculator(),
 			test_summation(),
 			test_string_copier(),
-			test_maximum()
+			test_maximum(),
+			test_bracketed_2D_interpolation()
 		]
 	]
 
@@ -159,3 +161,12 @@ def test_maximum():
 	"""
 	return ["vice.src.utils.max", _utils.test_max]
 
+
+@unittest
+def test_bracketed_2D_interpolation():
+	"""
+	Tests the evaluation of an interp_scheme_2d object from the bins of a
+	previous evaluation at vice/src/toolkit/interp_scheme_2d.h
+	"""
+	return ["vice.src.toolkit.interp_scheme_2d_evaluate_bracketed",
+		_utils.test_interp_scheme_2d_evaluate_bracketed]
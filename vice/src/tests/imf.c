@@ -12,6 +12,7 @@
 
 /* ---------- static function comment headers not duplicated here ---------- */
 static double test_imf(double m, void *dummy);
+static double test_imf_weight(double m);
 static IMF_ *get_test_imf(void);
 
 /*
@@ -61,6 +62,60 @@ extern unsigned short test_imf_evaluate(void) {
 }
 
 
+/*
+ * Test the functions which tabulate a custom IMF and integrate the table
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: imf.h
+ */
+extern unsigned short test_imf_cumulative_integral(void) {
+
+	IMF_ *test = get_test_imf();
+	strcpy(test -> spec, "custom");
+	test -> custom_imf -> callback = &test_imf;
+	test -> custom_imf -> user_func = &test_imf;
+	test -> custom_imf -> assumed_constant = -1;
+	unsigned long j;
+	test -> mass_distribution = (double *) malloc (IMF_N_MASSES *
+		sizeof(double));
+	for (j = 0ul; j < IMF_N_MASSES; j++) {
+		test -> mass_distribution[j] = imf_evaluate(*test,
+			imf_tabulation_mass(*test, j));
+	}
+	if (imf_integrate_table(test)) {
+		imf_free(test);
+		return 0u;
+	} else {}
+
+	/*
+	 * With an IMF of m^-2 and a weight of m, the integrand is constant in
+	 * ln(m), and the integral up to some mass m is exactly ln(m / m_lower).
+	 */
+	double *cumulative = imf_cumulative_integral(*test, &test_imf_weight);
+	unsigned short i, result = 1u;
+	double masses[5] = {0.01, 0.08, 0.5, 8, 1000};
+	for (i = 0u; i < 5u; i++) {
+		double expected = log(fmax(fmin(masses[i], TEST_IMF_MAX_MASS),
+			TEST_IMF_MIN_MASS) / TEST_IMF_MIN_MASS);
+		double actual = imf_cumulative_evaluate(*test, cumulative, masses[i]);
+		double stored = imf_cumulative_evaluate(*test,
+			(*test).mass_cumulative, masses[i]);
+		if (fabs(actual - expected) > 1e-10 ||
+			fabs(stored - expected) > 1e-10) {
+			result = 0u;
+			break;
+		} else continue;
+	}
+	free(cumulative);
+	imf_free(test);
+	return result;
+
+}
+
+
 /*
  * Test the built-in Salpeter (1955) IMF
  *
@@ -126,6 +181,20 @@ static double test_imf(double m, void *dummy) {
 }
 
 
+/*
+ * The weight on the test IMF in testing its cumulative integral
+ *
+ * Parameters
+ * ==========
+ * m: 		Stellar mass in Msun
+ */
+static double test_imf_weight(double m) {
+
+	return m;
+
+}
+
+
 /*
  * Get the test IMF object
  */
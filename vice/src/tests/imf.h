@@ -19,6 +19,17 @@ extern "C" {
  */
 extern unsigned short test_imf_evaluate(void);
 
+/*
+ * Test the functions which tabulate a custom IMF and integrate the table
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: imf.c
+ */
+extern unsigned short test_imf_cumulative_integral(void);
+
 /*
  * Test the built-in Salpeter (1955) IMF
  *
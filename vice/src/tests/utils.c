@@ -9,10 +9,13 @@
 #include "../utils.h"
 #include "../yields.h"
 #include "../ism.h"
+#include "../toolkit/interp_scheme_2d.h"
 #include "utils.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
 static unsigned long factorial(unsigned short n);
+static double evaluate_by_bin_number(INTERP_SCHEME_2D is2d, double x,
+	double y);
 
 static double TEST_RANDOM_RANGE_MIN = 0;
 static double TEST_RANDOM_RANGE_MAX = 100;
@@ -318,10 +321,37 @@ extern unsigned short test_get_bin_number(void) {
 	double *centers = bin_centers(test_bins, TEST_BINSPACE_N_BINS);
 	for (i = 0u; i < TEST_BINSPACE_N_BINS; i++) {
 		if (get_bin_number(test_bins, TEST_BINSPACE_N_BINS, centers[i]) != i) {
+			free(test_bins);
+			free(centers);
 			return 0u;
 		} else {}
 	}
-	return 1u;
+
+	/*
+	 * Repeat with a binspace whose widths increase quadratically so that the
+	 * bisection search is tested as well. Values on the bin edges belong to
+	 * the lower bin, and values outside of the binspace to no bin.
+	 */
+	unsigned short status = 1u;
+	for (i = 0u; i <= TEST_BINSPACE_N_BINS; i++) {
+		test_bins[i] = TEST_RANDOM_RANGE_MIN + (TEST_RANDOM_RANGE_MAX -
+			TEST_RANDOM_RANGE_MIN) * i * i / (
+			TEST_BINSPACE_N_BINS * TEST_BINSPACE_N_BINS);
+	}
+	for (i = 0u; i < TEST_BINSPACE_N_BINS; i++) {
+		double center = (test_bins[i] + test_bins[i + 1u]) / 2;
+		status &= get_bin_number(test_bins, TEST_BINSPACE_N_BINS,
+			center) == i;
+		status &= get_bin_number(test_bins, TEST_BINSPACE_N_BINS,
+			test_bins[i + 1u]) == i;
+	}
+	status &= get_bin_number(test_bins, TEST_BINSPACE_N_BINS,
+		TEST_RANDOM_RANGE_MIN - 1) == -1l;
+	status &= get_bin_number(test_bins, TEST_BINSPACE_N_BINS,
+		TEST_RANDOM_RANGE_MAX + 1) == -1l;
+	free(test_bins);
+	free(centers);
+	return status;
 
 }
 
@@ -480,3 +510,98 @@ extern unsigned short test_max(void) {
 
 }
 
+
+/*
+ * Test the function which evaluates an interp_scheme_2d object starting from
+ * the bins found in a previous evaluation. The values are swept up and then
+ * back down each axis, including values exactly on the grid edges and
+ * outside of the grid, and must match a lookup of the bins with
+ * get_bin_number exactly.
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure.
+ *
+ * header: utils.h
+ */
+extern unsigned short test_interp_scheme_2d_evaluate_bracketed(void) {
+
+	double xcoords[5] = {1, 2, 3, 5, 8};
+	double ycoords[4] = {0, 0.001, 0.01, 0.02};
+	double zvals[5][4], *zcoords[5];
+	unsigned short i, j;
+	for (i = 0u; i < 5u; i++) {
+		for (j = 0u; j < 4u; j++) {
+			zvals[i][j] = xcoords[i] * xcoords[i] - 100 * ycoords[j] +
+				1000 * xcoords[i] * ycoords[j];
+		}
+		zcoords[i] = zvals[i];
+	}
+	INTERP_SCHEME_2D test;
+	test.n_x_values = 5ul;
+	test.n_y_values = 4ul;
+	test.xcoords = xcoords;
+	test.ycoords = ycoords;
+	test.zcoords = zcoords;
+
+	/* grid edges, midpoints, and values outside of the grid */
+	double xvals[13] = {0.5, 1, 1.5, 2, 2.5, 3, 4, 5, 6.5, 8, 9, 2, 0.5};
+	double yvals[9] = {-0.001, 0, 0.0005, 0.001, 0.005, 0.01, 0.015, 0.02,
+		0.03};
+	unsigned short status = 1u;
+	long x_bin = -1l, y_bin = -1l;
+	for (i = 0u; i < 13u; i++) {
+		for (j = 0u; j < 9u; j++) {
+			/* sweep the y-axis up and down on alternating x-values */
+			double y = yvals[i % 2u ? 8u - j : j];
+			status &= interp_scheme_2d_evaluate_bracketed(test, xvals[i], y,
+				&x_bin, &y_bin) == evaluate_by_bin_number(test, xvals[i], y);
+			status &= interp_scheme_2d_evaluate(test, xvals[i], y) ==
+				evaluate_by_bin_number(test, xvals[i], y);
+			if (!status) break;
+		}
+		if (!status) break;
+	}
+	return status;
+
+}
+
+
+/*
+ * Evaluate an interp_scheme_2d object by determining the bins of the x- and
+ * y-coordinates with get_bin_number, to compare the evaluation starting from
+ * the bins of a previous one against.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * y: 			The value of the y-coordinate to evaluate at.
+ *
+ * Returns
+ * =======
+ * is2d(x, y), extrapolating from the bins at the edges of the grid for values
+ * outside of it.
+ */
+static double evaluate_by_bin_number(INTERP_SCHEME_2D is2d, double x,
+	double y) {
+
+	long x_bin = get_bin_number(is2d.xcoords, is2d.n_x_values - 1ul, x);
+	long y_bin = get_bin_number(is2d.ycoords, is2d.n_y_values - 1ul, y);
+	if (x_bin == -1l) {
+		x_bin = x < is2d.xcoords[0] ? 0l : (signed) is2d.n_x_values - 2l;
+	} else {}
+	if (y_bin == -1l) {
+		y_bin = y < is2d.ycoords[0] ? 0l : (signed) is2d.n_y_values - 2l;
+	} else {}
+
+	double xvals[2] = {is2d.xcoords[x_bin], is2d.xcoords[x_bin + 1l]};
+	double yvals[2] = {is2d.ycoords[y_bin], is2d.ycoords[y_bin + 1l]};
+	double zvals[2][2] = {
+		{is2d.zcoords[x_bin][y_bin], is2d.zcoords[x_bin][y_bin + 1l]},
+		{is2d.zcoords[x_bin + 1l][y_bin], is2d.zcoords[x_bin + 1l][y_bin + 1l]}
+	};
+	return interpolate2D(xvals, yvals, zvals, x, y);
+
+}
+
@@ -161,6 +161,20 @@ extern unsigned short test_set_char_p_value(void);
  */
 extern unsigned short test_max(void);
 
+/*
+ * Test the function at vice/src/toolkit/interp_scheme_2d.h which evaluates an
+ * interp_scheme_2d object starting from the bins found in a previous
+ * evaluation against a lookup of the bins with get_bin_number, including
+ * values on the grid edges and outside the grid.
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: utils.c
+ */
+extern unsigned short test_interp_scheme_2d_evaluate_bracketed(void);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -0,0 +1,77 @@
+/*
+ * This file implements the timers used to profile simulations.
+ */
+
+#include <time.h>
+#include "timings.h"
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static double seconds(clockid_t clock);
+
+
+/*
+ * Record the time at which a phase of a simulation is entered.
+ *
+ * Parameters
+ * ==========
+ * timings: 	The timings object of the simulation. NULL if the simulation is
+ * 				not being profiled, in which case nothing is done.
+ * phase: 		The TIMING_* constant of the phase
+ *
+ * header: timings.h
+ */
+extern void timer_start(TIMINGS *timings, unsigned short phase) {
+
+	if (timings != NULL) {
+		timings -> start_wall[phase] = seconds(CLOCK_MONOTONIC);
+		timings -> start_cpu[phase] = seconds(CLOCK_THREAD_CPUTIME_ID);
+	} else {}
+
+}
+
+
+/*
+ * Add the time since a phase of a simulation was entered to the total time
+ * spent in it, and count the call.
+ *
+ * Parameters
+ * ==========
+ * timings: 	The timings object of the simulation. NULL if the simulation is
+ * 				not being profiled, in which case nothing is done.
+ * phase: 		The TIMING_* constant of the phase
+ *
+ * header: timings.h
+ */
+extern void timer_stop(TIMINGS *timings, unsigned short phase) {
+
+	if (timings != NULL) {
+		timings -> cpu[phase] += (seconds(CLOCK_THREAD_CPUTIME_ID) -
+			(*timings).start_cpu[phase]);
+		timings -> wall[phase] += (seconds(CLOCK_MONOTONIC) -
+			(*timings).start_wall[phase]);
+		timings -> calls[phase]++;
+	} else {}
+
+}
+
+
+/*
+ * Read one of the system clocks.
+ *
+ * Parameters
+ * ==========
+ * clock: 	The clock to read: CLOCK_MONOTONIC for the wall-clock time, or
+ * 			CLOCK_THREAD_CPUTIME_ID for the CPU time of the calling thread
+ *
+ * Returns
+ * =======
+ * The time on that clock in seconds
+ */
+static double seconds(clockid_t clock) {
+
+	struct timespec ts;
+	clock_gettime(clock, &ts);
+	return ts.tv_sec + 1.e-9 * ts.tv_nsec;
+
+}
+
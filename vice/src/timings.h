@@ -0,0 +1,63 @@
+
+#ifndef TIMINGS_H
+#define TIMINGS_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+/*
+ * The phases of a simulation whose time is recorded when it is profiled.
+ * Their names are listed in the same order by _TIMED_PHASES_ in
+ * vice/core/_pyutils.py.
+ */
+#define TIMING_SETUP_CRF 0u
+#define TIMING_SETUP_MSMF 1u
+#define TIMING_SETUP_RIA 2u
+#define TIMING_GAS_EVOLUTION 3u
+#define TIMING_CCSNE 4u
+#define TIMING_SNEIA 5u
+#define TIMING_AGB 6u
+#define TIMING_RECYCLING 7u
+#define TIMING_MIGRATION 8u
+#define TIMING_MDF 9u
+#define TIMING_HISTORY_OUTPUT 10u
+#define TIMING_MDF_OUTPUT 11u
+#define TIMING_TRACER_OUTPUT 12u
+#define N_TIMED_PHASES 13u
+
+#include "objects.h"
+
+/*
+ * Record the time at which a phase of a simulation is entered.
+ *
+ * Parameters
+ * ==========
+ * timings: 	The timings object of the simulation. NULL if the simulation is
+ * 				not being profiled, in which case nothing is done.
+ * phase: 		The TIMING_* constant of the phase
+ *
+ * source: timings.c
+ */
+extern void timer_start(TIMINGS *timings, unsigned short phase);
+
+/*
+ * Add the time since a phase of a simulation was entered to the total time
+ * spent in it, and count the call.
+ *
+ * Parameters
+ * ==========
+ * timings: 	The timings object of the simulation. NULL if the simulation is
+ * 				not being profiled, in which case nothing is done.
+ * phase: 		The TIMING_* constant of the phase
+ *
+ * source: timings.c
+ */
+extern void timer_stop(TIMINGS *timings, unsigned short phase);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* TIMINGS_H */
+
@@ -6,6 +6,10 @@
 #include "interp_scheme_2d.h"
 #include "../utils.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static long find_bracket(double *coords, unsigned long n_values, double value,
+	long hint);
+
 
 /*
  * Evaluate an interp_scheme_2d object at some value of the x- and
@@ -27,18 +31,48 @@
 extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 	double y) {
 
-	long x_bin = get_bin_number(is2d.xcoords, is2d.n_x_values - 1ul, x);
-	long y_bin = get_bin_number(is2d.ycoords, is2d.n_y_values - 1ul, y);
+	long x_bin = -1l, y_bin = -1l;
+	return interp_scheme_2d_evaluate_bracketed(is2d, x, y, &x_bin, &y_bin);
+
+}
 
-	if (x_bin == -1l) {
+
+/*
+ * Evaluate an interp_scheme_2d object at some value of the x- and
+ * y-coordinates, starting the search for the bins they lie in from those
+ * found in a previous evaluation.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * y: 			The value of the y-coordinate to evaluate at.
+ * x_bin: 		A pointer to the bin number along the x-axis from the previous
+ * 				evaluation, or -1 if there was none. Overwritten with the bin
+ * 				number of the current x-coordinate.
+ * y_bin: 		Same as x_bin, but for the y-axis.
+ *
+ * Returns
+ * =======
+ * The same value as interp_scheme_2d_evaluate(is2d, x, y).
+ *
+ * header: interp_scheme_2d.h
+ */
+extern double interp_scheme_2d_evaluate_bracketed(INTERP_SCHEME_2D is2d,
+	double x, double y, long *x_bin, long *y_bin) {
+
+	long xb = find_bracket(is2d.xcoords, is2d.n_x_values, x, *x_bin);
+	long yb = find_bracket(is2d.ycoords, is2d.n_y_values, y, *y_bin);
+
+	if (xb == -1l) {
 		/*
 		 * The x-coordinate is either larger than the largest x-coordinate or
 		 * smaller than the smallest one.
 		 */
 		if (x < is2d.xcoords[0]) {
-			x_bin = 0ul;
+			xb = 0ul;
 		} else if (x > is2d.xcoords[is2d.n_x_values - 1ul]) {
-			x_bin = (signed) is2d.n_x_values - 2l;
+			xb = (signed) is2d.n_x_values - 2l;
 		} else {
 			/* error handling for manylinux1 distribution */
 			#ifdef NAN
@@ -50,11 +84,11 @@ extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 	}
 
 	/* Same check for the y-coordinate */
-	if (y_bin == -1l) {
+	if (yb == -1l) {
 		if (y < is2d.ycoords[0]) {
-			y_bin = 0ul;
+			yb = 0ul;
 		} else if (y > is2d.ycoords[is2d.n_y_values - 1ul]) {
-			y_bin = (signed) is2d.n_y_values - 2l;
+			yb = (signed) is2d.n_y_values - 2l;
 		} else {
 			#ifdef NAN
 				return NAN;
@@ -63,16 +97,58 @@ extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 			#endif
 		}
 	}
+	*x_bin = xb;
+	*y_bin = yb;
 
 	/* The x-, y-, and z-vals to conduct 2-D linear interpolation between */
-	double xvals[2] = {is2d.xcoords[x_bin], is2d.xcoords[x_bin + 1l]};
-	double yvals[2] = {is2d.ycoords[y_bin], is2d.ycoords[y_bin + 1l]};
+	double xvals[2] = {is2d.xcoords[xb], is2d.xcoords[xb + 1l]};
+	double yvals[2] = {is2d.ycoords[yb], is2d.ycoords[yb + 1l]};
 	double zvals[2][2] = {
-		{is2d.zcoords[x_bin][y_bin], is2d.zcoords[x_bin][y_bin + 1l]},
-		{is2d.zcoords[x_bin + 1l][y_bin], is2d.zcoords[x_bin + 1l][y_bin + 1l]}
+		{is2d.zcoords[xb][yb], is2d.zcoords[xb][yb + 1l]},
+		{is2d.zcoords[xb + 1l][yb], is2d.zcoords[xb + 1l][yb + 1l]}
 	};
 
 	return interpolate2D(xvals, yvals, zvals, x, y);
 
 }
 
+
+/*
+ * Determine the bin number of a value along one axis of an interpolation
+ * scheme, walking from a previously found bin number.
+ *
+ * Parameters
+ * ==========
+ * coords: 		The coordinates along the axis, sorted least to greatest.
+ * n_values: 	The number of coordinates along the axis.
+ * value: 		The value to find the bin number for.
+ * hint: 		The bin number to start the search from, or -1 to search
+ * 				without one.
+ *
+ * Returns
+ * =======
+ * The same value as get_bin_number(coords, n_values - 1, value): the lowest
+ * index i for which value <= coords[i + 1], or -1 if the value does not lie
+ * in the range of the coordinates.
+ *
+ * Notes
+ * =====
+ * Successive evaluations of AGB star yields at the metallicity of a given
+ * stellar population and monotonically changing turnoff mass lie in the same
+ * or adjacent bins, in which case this takes only a few comparisons.
+ */
+static long find_bracket(double *coords, unsigned long n_values, double value,
+	long hint) {
+
+	if (hint < 0l || hint > (signed) n_values - 2l ||
+		!(value >= coords[0] && value <= coords[n_values - 1ul])) {
+		/* no hint, or out of range/NaN -> let get_bin_number handle it */
+		return get_bin_number(coords, n_values - 1ul, value);
+	} else {
+		while (value > coords[hint + 1l]) hint++;
+		while (hint > 0l && value <= coords[hint]) hint--;
+		return hint;
+	}
+
+}
+
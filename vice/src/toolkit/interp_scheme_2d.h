@@ -28,6 +28,30 @@ extern "C" {
 extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 	double y);
 
+/*
+ * Evaluate an interp_scheme_2d object at some value of the x- and
+ * y-coordinates, starting the search for the bins they lie in from those
+ * found in a previous evaluation.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * y: 			The value of the y-coordinate to evaluate at.
+ * x_bin: 		A pointer to the bin number along the x-axis from the previous
+ * 				evaluation, or -1 if there was none. Overwritten with the bin
+ * 				number of the current x-coordinate.
+ * y_bin: 		Same as x_bin, but for the y-axis.
+ *
+ * Returns
+ * =======
+ * The same value as interp_scheme_2d_evaluate(is2d, x, y).
+ *
+ * source: interp_scheme_2d.c
+ */
+extern double interp_scheme_2d_evaluate_bracketed(INTERP_SCHEME_2D is2d,
+	double x, double y, long *x_bin, long *y_bin);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
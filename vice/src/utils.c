@@ -319,25 +319,54 @@ extern long get_bin_number(double *binspace, unsigned long num_bins,
 	/*
 	 * Notes
 	 * =====
-	 * This function used to search based on an if statement which checked if
-	 * the lower edge was less than the value and that the value was less than
-	 * the upper edge. This was embedded in a for-loop which returned -1l if it
-	 * reached the end of the loop. Allowing the comparison to be done based
-	 * on the upper edge alone (as implemented below) resulted in a ~20%
-	 * increase in speed for values known to be within a given binspace.
+	 * This function used to search linearly from the first bin, which became
+	 * a bottleneck for fine binspaces (e.g. MDFs, interpolation grids, and
+	 * zone assignments in multizone models). It now guesses the bin number
+	 * assuming uniform spacing, which is exact for the linearly spaced
+	 * binspaces generated by VICE, and verifies the guess against the bin
+	 * edges in O(1) time. If the guess is wrong (i.e. non-uniform spacing),
+	 * it falls back on a bisection search.
+	 *
+	 * The bin number returned is the lowest index i for which value <=
+	 * binspace[i + 1], such that values lying exactly on an interior bin edge
+	 * are sorted into the lower bin, matching the previous linear search.
+	 * Values of NaN compare false against all bin edges and are sorted into
+	 * the first bin, also matching the previous implementation.
 	 */
 
 	if (value < binspace[0] || value > binspace[num_bins]) {
 		/* If the value does not lie within the given binspace */
 		return -1l;
+	} else if (value != value || num_bins < 2ul) {
+		/* NaN, or there is only one bin to choose from */
+		return 0l;
 	} else {
+		unsigned long idx, lower = 0ul, upper = num_bins - 1ul;
+		double width = binspace[num_bins] - binspace[0];
+
+		if (width > 0) {
+			/* Uniform spacing fast path */
+			idx = (unsigned long) ((value - binspace[0]) / width * num_bins);
+			if (idx >= num_bins) idx = num_bins - 1ul;
+			if (binspace[idx + 1ul] >= value && (!idx ||
+				binspace[idx] < value)) {
+				return (signed) idx;
+			} else {}
+		} else {}
+
 		/*
-		 * Increment the index by 1 until the next element is larger than the
-		 * value. When that's true, the index is the bin number.
+		 * Bisection: binspace[upper + 1] >= value always holds, and the
+		 * search converges on the lowest such index.
 		 */
-		unsigned long idx = 0ul;
-		while (binspace[idx + 1ul] < value) idx++;
-		return (signed) idx;
+		while (lower < upper) {
+			idx = lower + (upper - lower) / 2ul;
+			if (binspace[idx + 1ul] < value) {
+				lower = idx + 1ul;
+			} else {
+				upper = idx;
+			}
+		}
+		return (signed) lower;
 	}
 
 }
@@ -379,7 +408,7 @@ extern double scale_metallicity(SINGLEZONE sz, unsigned long timestep) {
 	 */
 	for (i = 0; i < sz.n_elements; i++) {
 		/* Don't count helium as a metal */
-		if (strcmp((*sz.elements[i]).symbol, "he")) {
+		if (!(*sz.elements[i]).is_helium) {
 			solar_by_element += (*sz.elements[i]).solar;
 			z_by_element += (*sz.elements[i]).Z[timestep];
 		} else {}
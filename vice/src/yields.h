@@ -27,6 +27,16 @@ extern "C" {
 #define SIMPSON 777
 #endif /* SIMPSON */
 
+/* hash-code for romberg's method */
+#ifndef ROMBERG
+#define ROMBERG 750
+#endif /* ROMBERG */
+
+/* hash-code for adaptive gauss-kronrod quadrature */
+#ifndef GAUSS_KRONROD
+#define GAUSS_KRONROD 1314
+#endif /* GAUSS_KRONROD */
+
 #include "objects.h"
 #include "objects/integral.h"
 #include "objects/ccsne.h"
@@ -17,76 +17,9 @@
 #include "ccsne.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static void setup_calculation(IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element);
-static void zero_wind_yield_grid(void);
-static double interpolate_yield(double m);
-static double y_cc_numerator(double m);
-static double y_cc_denominator(double m);
-
-
-/*
- * These variables are declared globally in this file because it is easier for
- * quadrature functions to be able to access them while still only taking one
- * parameter.
- *
- * GRID: 			The stellar mass - element yield from the explosion
- * WIND: 			The stellar mass - element yield from the wind
- * GRIDSIZE:		The number of stellar masses on which the yield grid is
- * 					sampled
- * IMF: 			The assumed stellar IMF's corresponding object
- * EXPLODABILITY: 	The fractions of stars that explode in those mass ranges
- * Z_PROGENITOR: 	Z_x of the progenitor stars for the element x.
- * WEIGHT_INITIAL: 	A boolean int describing whether or not to weight the
- * 					initial composition by explodability
- * TESTING: 		A global testing status: 1 if testing, 0 if not.
- */
-static double **GRID;
-static double **WIND;
-static unsigned int GRIDSIZE = 0;
-static IMF_ *IMF = NULL;
-static CALLBACK_1ARG *EXPLODABILITY = NULL;
-static double Z_PROGENITOR;
-static unsigned short WEIGHT_INITIAL;
-
-
-/*
- * Weight the initial composition of each star by explodability. This ensures
- * that net yields are not reported as negative when the study did not
- * separate wind and explosive yields.
- *
- * Parameters
- * ==========
- * 1 to weight the initial composition by explodability, 0 to not.
- *
- * header: ccsne.h
- */
-extern void weight_initial_by_explodability(unsigned short weight) {
-
-	trace_print();
-	debug_print("weight = %u\n", weight);
-	WEIGHT_INITIAL = weight;
-
-}
-
-
-/*
- * Set the value of the progenitor stars abundance by mass Z_x for the element
- * x whose net yield is being calculated.
- *
- * Parameters
- * ==========
- * Z: 		The initial abundance Z_x itself
- *
- * header: ccsne.h
- */
-extern void set_Z_progenitor(double Z) {
-
-	trace_print();
-	debug_print("Z = %.5e\n", Z);
-	Z_PROGENITOR = Z;
-
-}
+static double interpolate_yield(double m, CCSNE_YIELD_CONTEXT *context);
+static double y_cc_numerator(double m, void *context);
+static double y_cc_denominator(double m, void *imf);
 
 
 /*
@@ -96,88 +29,36 @@ extern void set_Z_progenitor(double Z) {
  * Parameters
  * ==========
  * intgrl: 			The integral object for the numerator of the yield
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
+ * context: 		The yield grids, IMF, explodability and progenitor
+ * 					composition to adopt in the calculation
  *
  * Returns
  * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h).
+ * The value returned by quad (see quadrature.h).
+ *
+ * Notes
+ * =====
+ * All information required by the calculation is stored in the integral and
+ * context objects, and neither is modified by other threads, so this function
+ * is safe to call concurrently provided that the IMF and explodability
+ * are either built-in or do not require the python interpreter.
  *
  * header: ccsne.h
  */
 extern unsigned short IMFintegrated_fractional_yield_numerator(
-	INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element) {
+	INTEGRAL *intgrl, CCSNE_YIELD_CONTEXT *context) {
 
 	trace_print();
-	setup_calculation(imf, explodability, path, wind, element);
 	intgrl -> func = &y_cc_numerator;
-	int x = quad(intgrl);
-	free(GRID);
-	free(WIND);
+	intgrl -> params = (void *) context;
+	unsigned short x = quad(intgrl);
 	intgrl -> func = NULL;
-	GRIDSIZE = 0;
-	IMF = NULL;
+	intgrl -> params = NULL;
 	return x;
 
 }
 
 
-/*
- * Setup the yield calculation by initializing all of the necessary global
- * variables.
- *
- * Parameters
- * ==========
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
- */
-static void setup_calculation(IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element) {
-
-	trace_print();
-
-	/*
-	 * Initialize these variables globally. This is such that the function
-	 * which executes numerical quadrature can accept only one parameter - the
-	 * ZAMS mass of the progenitor.
-	 */
-	char *file = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
-	strcpy(file, path);
-	strcat(file, "explosive/");
-	strcat(file, element);
-	strcat(file, ".dat");
-	debug_print("Explosive yield file: %s\n", file);
-
-	GRIDSIZE = line_count(file) - header_length(file);
-	GRID = cc_yield_grid(file);
-
-	if (wind) {
-		char *wind = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
-		strcpy(wind, path);
-		strcat(wind, "wind/");
-		strcat(wind, element);
-		strcat(wind, ".dat");
-		debug_print("Wind yield file: %s\n", wind);
-		WIND = cc_yield_grid(wind);
-		free(wind);
-	} else {
-		zero_wind_yield_grid();
-	}
-
-	IMF = imf;
-	EXPLODABILITY = explodability;
-
-}
-
-
 /*
  * Determine the value of the integrated IMF weighted by stellar mass, up to
  * the normalization of the IMF.
@@ -189,43 +70,24 @@ static void setup_calculation(IMF_ *imf, CALLBACK_1ARG *explodability,
  *
  * Returns
  * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h)
+ * The value returned by quad (see quadrature.h)
  *
- * header: ccsne.c
+ * header: ccsne.h
  */
 extern unsigned short IMFintegrated_fractional_yield_denominator(
 	INTEGRAL *intgrl, IMF_ *imf) {
 
 	trace_print();
-	IMF = imf;
 	intgrl -> func = &y_cc_denominator;
-	int x = quad(intgrl);
+	intgrl -> params = (void *) imf;
+	unsigned short x = quad(intgrl);
 	intgrl -> func = NULL;
-	IMF = NULL;
+	intgrl -> params = NULL;
 	return x;
 
 }
 
 
-/*
- * Initialize the wind yield to a grid of zeroes in the event that the user
- * is neglecting the wind yields in this calculation.
- */
-static void zero_wind_yield_grid(void) {
-
-	trace_print();
-	unsigned int i;
-	WIND = (double **) malloc (GRIDSIZE * sizeof(double *));
-	for (i = 0u; i < GRIDSIZE; i++) {
-		WIND[i] = (double *) malloc (2 * sizeof(double));
-		WIND[i][0] = GRID[i][0];
-		WIND[i][1] = 0.0;
-	}
-
-}
-
-
 /*
  * Interpolates the mass yield of a given element from core-collapse supernovae
  * between masses sampled on the grid, taking into account both explosive and
@@ -233,13 +95,14 @@ static void zero_wind_yield_grid(void) {
  *
  * Parameters
  * ==========
- * m: 		The mass of a star whose yield is to be interpolated
+ * m: 			The mass of a star whose yield is to be interpolated
+ * context: 	The yield grids and progenitor composition
  *
  * Returns
  * =======
  * The interpolated yield in Msun
  */
-static double interpolate_yield(double m) {
+static double interpolate_yield(double m, CCSNE_YIELD_CONTEXT *context) {
 
 	trace_print();
 	if (m < CC_MIN_STELLAR_MASS) {
@@ -262,17 +125,22 @@ static double interpolate_yield(double m) {
 		 * rate-limiting addition to this calculation and is more resistent to
 		 * future bugs if the remnant mass parametrization changes.
 		 */
-		double initial = Z_PROGENITOR * (m - Kalirai08_remnant_mass(m));
-		if (WEIGHT_INITIAL) initial *= callback_1arg_evaluate(
-			*EXPLODABILITY, m);
-
-		unsigned int i;
-		for (i = 0; i < GRIDSIZE; i++) {
+		double initial = (*context).Z_progenitor * (
+			m - Kalirai08_remnant_mass(m));
+		double explodability = callback_1arg_evaluate(
+			*(*context).explodability, m);
+		if ((*context).weight_initial) initial *= explodability;
+
+		/* A NULL wind grid denotes that winds are neglected */
+		double **grid = (*context).grid;
+		double **wind = (*context).wind;
+		unsigned int i, n = (*context).gridsize;
+		for (i = 0; i < n; i++) {
 			/* if the mass itself is on the grid, just return that yield */
-			if (m == GRID[i][0]) {
+			if (m == grid[i][0]) {
 				return (
-					callback_1arg_evaluate(*EXPLODABILITY, m) * GRID[i][1] +
-					WIND[i][1] - initial
+					explodability * grid[i][1] +
+					(wind != NULL ? wind[i][1] : 0) - initial
 				);
 			} else {
 				continue;
@@ -280,34 +148,22 @@ static double interpolate_yield(double m) {
 		}
 
 		/*
-		 * Can't simply call get_bin_number because GRID is 2-dimensional
+		 * Can't simply call get_bin_number because the grid is 2-dimensional.
+		 *
+		 * If the code gets past this loop, the mass is above the grid. In
+		 * that case, python will raise a warning, and we automatically
+		 * extrapolate yield linearly from the top two elements on the grid.
 		 */
-		for (i = 0; i < GRIDSIZE - 1; i++) {
-			if (GRID[i][0] < m && m < GRID[i + 1][0]) {
-				return (
-					callback_1arg_evaluate(*EXPLODABILITY, m) *
-					interpolate(GRID[i][0], GRID[i + 1][0], GRID[i][1],
-						GRID[i + 1][1], m) +
-					interpolate(WIND[i][0], WIND[i + 1][0], WIND[i][1],
-						WIND[i + 1][1], m) -
-					initial
-				);
-			} else {
-				continue;
-			}
+		for (i = 0; i + 2 < n; i++) {
+			if (grid[i][0] < m && m < grid[i + 1][0]) break;
 		}
-
-		/*
-		 * If the code gets to this point, the mass is above the grid. In that
-		 * case, python will raise a warning, and we automatically extrapolate
-		 * yield linearly from the bottom two elements on the grid.
-		 */
 		return (
-			callback_1arg_evaluate(*EXPLODABILITY, m) *
-			interpolate(GRID[GRIDSIZE - 2][0], GRID[GRIDSIZE - 1][0],
-				GRID[GRIDSIZE - 2][1], GRID[GRIDSIZE - 1][1], m) +
-			interpolate(WIND[GRIDSIZE - 2][0], WIND[GRIDSIZE - 1][0],
-				WIND[GRIDSIZE - 2][1], WIND[GRIDSIZE - 1][1], m) -
+			explodability *
+			interpolate(grid[i][0], grid[i + 1][0], grid[i][1],
+				grid[i + 1][1], m) +
+			(wind != NULL ?
+				interpolate(wind[i][0], wind[i + 1][0], wind[i][1],
+					wind[i + 1][1], m) : 0) -
 			initial
 		);
 	}
@@ -320,16 +176,18 @@ static double interpolate_yield(double m) {
  *
  * Paremeters
  * ==========
- * m: 		A stellar mass in Msun
+ * m: 			A stellar mass in Msun
+ * context: 	The yield calculation's context (type CCSNE_YIELD_CONTEXT *)
  *
  * Returns
  * =======
  * The value of y(x) * dN/dm
  */
-static double y_cc_numerator(double m) {
+static double y_cc_numerator(double m, void *context) {
 
 	trace_print();
-	double result = interpolate_yield(m) * imf_evaluate(*IMF, m);
+	CCSNE_YIELD_CONTEXT *ctx = (CCSNE_YIELD_CONTEXT *) context;
+	double result = interpolate_yield(m, ctx) * imf_evaluate(*(*ctx).imf, m);
 	debug_print("result = %.5e\n", result);
 	return result;
 
@@ -342,15 +200,16 @@ static double y_cc_numerator(double m) {
  * Parameters
  * ==========
  * m: 		A stellar mass in Msun
+ * imf: 	The associated IMF object (type IMF_ *)
  *
  * Returns
  * =======
  * The value of m * dN/dm
  */
-static double y_cc_denominator(double m) {
+static double y_cc_denominator(double m, void *imf) {
 
 	trace_print();
-	double result = m * imf_evaluate(*IMF, m);
+	double result = m * imf_evaluate(*((IMF_ *) imf), m);
 	debug_print("result = %.5e\n", result);
 	return result;
 
@@ -9,29 +9,36 @@ extern "C" {
 #include "../objects.h"
 
 /*
- * Weight the initial composition of each star by explodability. This ensures
- * that net yields are not reported as negative when the study did not
- * separate wind and explosive yields.
+ * The information required to compute the IMF-integrated yield of a given
+ * element from core collapse supernovae. Storing this information in an
+ * object passed to the integrand rather than as global variables allows
+ * yields to be computed concurrently.
  *
- * Parameters
- * ==========
- * 1 to weight the initial composition by explodability, 0 to not.
- *
- * source: ccsne.c
+ * grid: 				The stellar mass - element yield from the explosion
+ * wind: 				The stellar mass - element yield from the wind. NULL
+ * 						if winds are to be neglected.
+ * gridsize: 			The number of stellar masses on which the yield grids
+ * 						are sampled
+ * imf: 				The assumed stellar IMF
+ * explodability: 		The fraction of stars that explode as a function of
+ * 						mass
+ * Z_progenitor: 		Z_x of the progenitor stars for the element x
+ * weight_initial: 		A boolean int describing whether or not to weight the
+ * 						initial composition by explodability. This ensures
+ * 						that net yields are not reported as negative when the
+ * 						study did not separate wind and explosive yields.
  */
-extern void weight_initial_by_explodability(unsigned short weight);
+typedef struct ccsne_yield_context {
 
-/*
- * Set the value of the progenitor stars abundance by mass Z_x for the element
- * x whose net yield is being calculated.
- *
- * Parameters
- * ==========
- * Z: 		The initial abundance Z_x itself
- *
- * source: ccsne.c
- */
-extern void set_Z_progenitor(double Z);
+	double **grid;
+	double **wind;
+	unsigned int gridsize;
+	IMF_ *imf;
+	CALLBACK_1ARG *explodability;
+	double Z_progenitor;
+	unsigned short weight_initial;
+
+} CCSNE_YIELD_CONTEXT;
 
 /*
  * Determine the value of the integrated IMF weighted by the mass yield of a
@@ -40,22 +47,24 @@ extern void set_Z_progenitor(double Z);
  * Parameters
  * ==========
  * intgrl: 			The integral object for the numerator of the yield
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
+ * context: 		The yield grids, IMF, explodability and progenitor
+ * 					composition to adopt in the calculation
  *
  * Returns
  * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h).
+ * The value returned by quad (see quadrature.h).
+ *
+ * Notes
+ * =====
+ * All information required by the calculation is stored in the integral and
+ * context objects, and neither is modified by other threads, so this function
+ * is safe to call concurrently provided that the IMF and explodability
+ * are either built-in or do not require the python interpreter.
  *
  * source: ccsne.c
  */
 extern unsigned short IMFintegrated_fractional_yield_numerator(
-	INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element);
+	INTEGRAL *intgrl, CCSNE_YIELD_CONTEXT *context);
 
 /*
  * Determine the value of the integrated IMF weighted by stellar mass, up to
@@ -68,8 +77,7 @@ extern unsigned short IMFintegrated_fractional_yield_numerator(
  *
  * Returns
  * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h)
+ * The value returned by quad (see quadrature.h)
  *
  * source: ccsne.c
  */
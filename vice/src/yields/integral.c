@@ -6,15 +6,63 @@
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <float.h>
+#include <math.h>
 #include "../yields.h"
 #include "../utils.h"
 #include "../debug.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double euler(INTEGRAL intgrl, unsigned long N);
-static double trapzd(INTEGRAL intgrl, unsigned long N);
+static double euler(INTEGRAL intgrl, unsigned long N, double *coarse);
+static double trapzd(INTEGRAL intgrl, unsigned long N, double *coarse);
 static double midpt(INTEGRAL intgrl, unsigned long N);
-static double simp(INTEGRAL intgrl, unsigned long N);
+static unsigned short romberg(INTEGRAL *intgrl);
+static unsigned short gauss_kronrod(INTEGRAL *intgrl);
+static void gauss_kronrod_15(INTEGRAL intgrl, double a, double b,
+	double *result, double *error);
+
+/*
+ * The maximum number of levels of Richardson extrapolation in Romberg's
+ * method. The number of bins doubles with each level, so this is never
+ * reached in practice before the number of bins exceeds Nmax.
+ */
+#define ROMBERG_MAX_LEVELS 64
+
+/*
+ * The abscissae and weights of the 15-point Kronrod rule (XGK and WGK) and
+ * of the embedded 7-point Gauss rule (WG) on the interval [-1, 1]. Only
+ * the non-negative abscissae are listed, and the Gauss abscissae are
+ * XGK[1], XGK[3], XGK[5], and XGK[7].
+ *
+ * Values are adopted from QUADPACK (Piessens, de Doncker-Kapenga,
+ * Uberhuber & Kahaner 1983, Springer-Verlag).
+ */
+static const double XGK[8] = {
+	0.991455371120812639206854697526329,
+	0.949107912342758524526189684047851,
+	0.864864423359769072789712788640926,
+	0.741531185599394439863864773280788,
+	0.586087235467691130294144845693013,
+	0.405845151377397166906606412076961,
+	0.207784955007898467600689403773245,
+	0.000000000000000000000000000000000
+};
+static const double WGK[8] = {
+	0.022935322010529224963732008058970,
+	0.063092092629978553290700663189204,
+	0.104790010322250183839876322541518,
+	0.140653259715525918745189590510238,
+	0.169004726639267902826583426598550,
+	0.190350578064785409913256402421014,
+	0.204432940075298892414161999234649,
+	0.209482141084727828012999174891714
+};
+static const double WG[4] = {
+	0.129484966168869693270611432679082,
+	0.279705391489276667901467771423780,
+	0.381830050505118944950369775488975,
+	0.417959183673469387755102040816327
+};
 
 
 /*
@@ -34,6 +82,10 @@ static double simp(INTEGRAL intgrl, unsigned long N);
  * The methods of numerical quadrature implemented in this function and its
  * subroutines are adopted from Chapter 4 of Numerical Recipes (Press,
  * Teukolsky, Vetterling & Flannery 2007), Cambridge University Press.
+ * Euler's method, trapezoid rule, Simpson's rule and Romberg's method reuse
+ * the evaluations of the integrand from previous iterations, each of which
+ * doubles the number of bins. Gauss-Kronrod quadrature instead adaptively
+ * bisects the subintervals with the largest error estimates.
  *
  * header: integral.h
  */
@@ -55,33 +107,38 @@ extern unsigned short quad(INTEGRAL *intgrl) {
 	unsigned long N = (*intgrl).Nmin / 2l;
 	if (N % 2l != 0l) N += 1l;
 
-	double (*integrate)(INTEGRAL, unsigned long);
 	double old_int = 0;
 	double new_int;
 
+	/*
+	 * The trapezoid and Euler's method estimates with N bins are carried
+	 * over to the next iteration, which only evaluates the function at the
+	 * new bin edges. Simpson's rule is computed from the trapezoid rule with
+	 * N / 2 and N bins.
+	 */
+	double estimate = 0, old_trapzd;
+	double *coarse = NULL;
 
 	switch ((*intgrl).method) {
 
 		case EULER:
-			/* integrate according to Euler's method */
-			integrate = &euler;
-			break;
-
 		case TRAPEZOID:
-			/* integrate according to Trapezoid rule */
-			integrate = &trapzd;
-			break;
-
 		case MIDPOINT:
-			/* integrate according to midpoint rule */
-			integrate = &midpt;
 			break;
 
 		case SIMPSON:
-			/* integrate according to Simpson's rule */
-			integrate = &simp;
+			estimate = trapzd(*intgrl, N / 2l, NULL);
+			coarse = &estimate;
 			break;
 
+		case ROMBERG:
+			/* Richardson extrapolation of the trapezoid rule */
+			return romberg(intgrl);
+
+		case GAUSS_KRONROD:
+			/* adaptive Gauss-Kronrod quadrature */
+			return gauss_kronrod(intgrl);
+
 		default:
 			/* error handling */
 			return 2;
@@ -90,7 +147,39 @@ extern unsigned short quad(INTEGRAL *intgrl) {
 
 	do {
 
-		new_int = integrate(*intgrl, N);
+		switch ((*intgrl).method) {
+
+			case EULER:
+				/* integrate according to Euler's method */
+				estimate = euler(*intgrl, N, coarse);
+				coarse = &estimate;
+				new_int = estimate;
+				break;
+
+			case TRAPEZOID:
+				/* integrate according to Trapezoid rule */
+				estimate = trapzd(*intgrl, N, coarse);
+				coarse = &estimate;
+				new_int = estimate;
+				break;
+
+			case MIDPOINT:
+				/* integrate according to midpoint rule */
+				new_int = midpt(*intgrl, N);
+				break;
+
+			default:
+				/*
+				 * integrate according to Simpson's rule, which is essentially
+				 * a complication of Trapezoid rule
+				 */
+				old_trapzd = estimate;
+				estimate = trapzd(*intgrl, N, coarse);
+				new_int = (4 * estimate - old_trapzd) / 3;
+				break;
+
+		}
+
 		if (new_int) {
 			intgrl -> error = absval(old_int / new_int - 1);
 		} else {
@@ -122,6 +211,242 @@ extern unsigned short quad(INTEGRAL *intgrl) {
 }
 
 
+/*
+ * Evaluate an integral using Romberg's method, which extrapolates the
+ * trapezoid rule to an infinite number of bins under the assumption that
+ * its error is a power series in the square of the bin width. Each
+ * successive level doubles the number of bins and reuses all previous
+ * evaluations of the integrand.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an error larger than the tolerance
+ *
+ * For details on Romberg's method, see chapter 4 of Numerical Recipes:
+ * Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge University Press
+ */
+static unsigned short romberg(INTEGRAL *intgrl) {
+
+	trace_print();
+	unsigned long N = (*intgrl).Nmin / 2l;
+	if (N % 2l != 0l) N += 1l;
+
+	/*
+	 * Only two rows of the extrapolation table are needed at a time: the
+	 * previous level and the current level.
+	 */
+	double previous[ROMBERG_MAX_LEVELS];
+	double current[ROMBERG_MAX_LEVELS];
+	unsigned int j, k = 0u;
+	previous[0] = trapzd(*intgrl, N, NULL);
+
+	do {
+
+		N *= 2l;
+		k++;
+		current[0] = trapzd(*intgrl, N, &previous[0]);
+		double factor = 1;
+		for (j = 1u; j <= k; j++) {
+			factor *= 4;
+			current[j] = current[j - 1u] + (
+				current[j - 1u] - previous[j - 1u]) / (factor - 1);
+		}
+
+		if (current[k]) {
+			intgrl -> error = absval(previous[k - 1u] / current[k] - 1);
+		} else {
+			intgrl -> error = 1;
+		}
+		debug_print("result = %.5e\n", current[k]);
+		debug_print("error = %.5e\n", (*intgrl).error);
+		debug_print("N = %lu\n", N);
+		for (j = 0u; j <= k; j++) previous[j] = current[j];
+
+	} while ((*intgrl).error > (*intgrl).tolerance && N < (*intgrl).Nmax &&
+		k < ROMBERG_MAX_LEVELS - 1u);
+
+	intgrl -> result = current[k];
+	intgrl -> iters = N;
+	return ((*intgrl).error > (*intgrl).tolerance);
+
+}
+
+
+/*
+ * Evaluate an integral using globally adaptive Gauss-Kronrod quadrature.
+ * The interval of integration is split into Nmin subintervals, each of which
+ * is integrated with the 15-point Kronrod rule. The subinterval with the
+ * largest error estimate is then bisected until the sum of the error
+ * estimates falls below the tolerance or the number of subintervals reaches
+ * Nmax. Function evaluations are thus concentrated where the integrand is
+ * least smooth.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an error larger than the tolerance
+ *
+ * Notes
+ * =====
+ * The iters field of the integral object is set to the final number of
+ * subintervals.
+ *
+ * For details on Gauss-Kronrod quadrature, see chapter 4 of Numerical
+ * Recipes: Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge
+ * University Press, and QUADPACK: Piessens, de Doncker-Kapenga, Uberhuber &
+ * Kahaner (1983), Springer-Verlag.
+ */
+static unsigned short gauss_kronrod(INTEGRAL *intgrl) {
+
+	trace_print();
+	unsigned long i, n = (*intgrl).Nmin ? (*intgrl).Nmin : 1l;
+	unsigned long capacity = 2l * n;
+
+	/*
+	 * Each subinterval is stored as four consecutive values: its lower and
+	 * upper bounds, the integral over it, and its error estimate.
+	 */
+	double *intervals = (double *) malloc (4l * capacity * sizeof(double));
+	double *edges = binspace((*intgrl).a, (*intgrl).b, n);
+	double total = 0, total_error = 0;
+	for (i = 0l; i < n; i++) {
+		intervals[4l * i] = edges[i];
+		intervals[4l * i + 1l] = edges[i + 1l];
+		gauss_kronrod_15(*intgrl, edges[i], edges[i + 1l],
+			&intervals[4l * i + 2l], &intervals[4l * i + 3l]);
+		total += intervals[4l * i + 2l];
+		total_error += intervals[4l * i + 3l];
+	}
+	free(edges);
+
+	while (total_error > (*intgrl).tolerance * absval(total) &&
+		n < (*intgrl).Nmax) {
+
+		/* bisect the subinterval with the largest error estimate */
+		unsigned long worst = 0l;
+		for (i = 1l; i < n; i++) {
+			if (intervals[4l * i + 3l] > intervals[4l * worst + 3l]) worst = i;
+		}
+		double lower = intervals[4l * worst];
+		double upper = intervals[4l * worst + 1l];
+		double mid = (lower + upper) / 2;
+		/* the subinterval can't be split any further */
+		if (mid <= lower || mid >= upper) break;
+
+		if (n == capacity) {
+			capacity *= 2l;
+			intervals = (double *) realloc (intervals,
+				4l * capacity * sizeof(double));
+		} else {}
+		total -= intervals[4l * worst + 2l];
+		total_error -= intervals[4l * worst + 3l];
+		intervals[4l * worst + 1l] = mid;
+		intervals[4l * n] = mid;
+		intervals[4l * n + 1l] = upper;
+		gauss_kronrod_15(*intgrl, lower, mid,
+			&intervals[4l * worst + 2l], &intervals[4l * worst + 3l]);
+		gauss_kronrod_15(*intgrl, mid, upper,
+			&intervals[4l * n + 2l], &intervals[4l * n + 3l]);
+		total += intervals[4l * worst + 2l] + intervals[4l * n + 2l];
+		total_error += intervals[4l * worst + 3l] + intervals[4l * n + 3l];
+		n++;
+
+	}
+
+	/* recompute the sums to avoid accumulating roundoff error */
+	total = 0;
+	total_error = 0;
+	for (i = 0l; i < n; i++) {
+		total += intervals[4l * i + 2l];
+		total_error += intervals[4l * i + 3l];
+	}
+	free(intervals);
+
+	if (total) {
+		intgrl -> error = total_error / absval(total);
+	} else {
+		intgrl -> error = 1;
+	}
+	intgrl -> result = total;
+	intgrl -> iters = n;
+	debug_print("result = %.5e\n", (*intgrl).result);
+	debug_print("error = %.5e\n", (*intgrl).error);
+	debug_print("iters = %lu\n", (*intgrl).iters);
+	return ((*intgrl).error > (*intgrl).tolerance);
+
+}
+
+
+/*
+ * Integrate a function over a given interval with the 15-point Kronrod rule,
+ * estimating the error from the difference with the embedded 7-point Gauss
+ * rule.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ * a: 			The lower bound of the interval
+ * b: 			The upper bound of the interval
+ * result: 		A pointer to store the value of the integral in
+ * error: 		A pointer to store the absolute error estimate in
+ *
+ * Notes
+ * =====
+ * The error estimate is scaled as in QUADPACK's QK15 routine, which
+ * accounts for roundoff error and is conservative when the Gauss and
+ * Kronrod results agree closely.
+ */
+static void gauss_kronrod_15(INTEGRAL intgrl, double a, double b,
+	double *result, double *error) {
+
+	double center = (a + b) / 2;
+	double half_length = (b - a) / 2;
+	double f_center = intgrl.func(center, intgrl.params);
+	double f_lower[7], f_upper[7];
+	double resk = WGK[7] * f_center;
+	double resg = WG[3] * f_center;
+	double resabs = absval(resk);
+
+	unsigned short j;
+	for (j = 0u; j < 7u; j++) {
+		double dx = half_length * XGK[j];
+		f_lower[j] = intgrl.func(center - dx, intgrl.params);
+		f_upper[j] = intgrl.func(center + dx, intgrl.params);
+		resk += WGK[j] * (f_lower[j] + f_upper[j]);
+		resabs += WGK[j] * (absval(f_lower[j]) + absval(f_upper[j]));
+		if (j % 2u) resg += WG[j / 2u] * (f_lower[j] + f_upper[j]);
+	}
+
+	double mean = resk / 2;
+	double resasc = WGK[7] * absval(f_center - mean);
+	for (j = 0u; j < 7u; j++) {
+		resasc += WGK[j] * (absval(f_lower[j] - mean) +
+			absval(f_upper[j] - mean));
+	}
+
+	*result = resk * half_length;
+	resabs *= absval(half_length);
+	resasc *= absval(half_length);
+	*error = absval((resk - resg) * half_length);
+	if (resasc && *error) {
+		double scale = pow(200 * *error / resasc, 1.5);
+		*error = resasc * (scale < 1 ? scale : 1);
+	} else {}
+	if (resabs > DBL_MIN / (50 * DBL_EPSILON) &&
+		*error < 50 * DBL_EPSILON * resabs) {
+		*error = 50 * DBL_EPSILON * resabs;
+	} else {}
+
+}
+
+
 /*
  * Approximates the integral of a function between two bounds using Euler's
  * method with a given number of bins.
@@ -130,6 +455,9 @@ extern unsigned short quad(INTEGRAL *intgrl) {
  * ==========
  * integrl: 	The integral object
  * N: 			The number of bins to use in evaluating the Riemann sum
+ * coarse: 		A pointer to the value returned with N / 2 bins, in which case
+ * 				the function is evaluated only at the new bin edges. NULL to
+ * 				evaluate the sum from scratch.
  *
  * Returns
  * =======
@@ -138,27 +466,30 @@ extern unsigned short quad(INTEGRAL *intgrl) {
  * For details on Euler's method, see chapter 4 of Numerical Recipes:
  * Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge University Press
  */
-static double euler(INTEGRAL intgrl, unsigned long N) {
+static double euler(INTEGRAL intgrl, unsigned long N, double *coarse) {
 
 	trace_print();
 	double hN = (intgrl.b - intgrl.a) / N; /* the width of the bins */
-	/* Euler's method uses only the left edge of each bin */
-	double *x = binspace(intgrl.a, intgrl.b - hN, N - 1l);
-	double *eval = (double *) malloc (N * sizeof(double));
 
 	/*
-	 * Evaluate the function at each bin edge, add it up, multiply by the
-	 * bin width and return
+	 * Euler's method uses only the left edge of each bin. With N / 2 bins
+	 * already evaluated, only the odd-numbered left edges are new.
 	 */
-	unsigned long i;
-	for (i = 0l; i < N; i++) {
-		eval[i] = intgrl.func(x[i]);
+	unsigned long i, start = 0l, step = 1l;
+	if (coarse != NULL) {
+		start = 1l;
+		step = 2l;
+	} else {}
+	double total = 0;
+	for (i = start; i < N; i += step) {
+		total += intgrl.func(intgrl.a + i * hN, intgrl.params);
 	}
-	double total = sum(eval, N);
 	debug_print("total = %.5e\n", total);
-	free(eval);
-	free(x);
-	return hN * total;
+	if (coarse != NULL) {
+		return *coarse / 2 + hN * total;
+	} else {
+		return hN * total;
+	}
 
 }
 
@@ -171,6 +502,9 @@ static double euler(INTEGRAL intgrl, unsigned long N) {
  * ==========
  * intgrl: 		The integral object
  * N: 			The number of bins to use in evaluating the Riemann sum
+ * coarse: 		A pointer to the value returned with N / 2 bins, in which case
+ * 				the function is evaluated only at the new bin edges. NULL to
+ * 				evaluate the sum from scratch.
  *
  * Returns
  * =======
@@ -179,28 +513,38 @@ static double euler(INTEGRAL intgrl, unsigned long N) {
  * For details on the Trapezoid rule, see chapter 4 of Numerical Recipes:
  * Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge University Press
  */
-static double trapzd(INTEGRAL intgrl, unsigned long N) {
+static double trapzd(INTEGRAL intgrl, unsigned long N, double *coarse) {
 
 	trace_print();
 	double hN = (intgrl.b - intgrl.a) / N; /* width of each bin */
-	double *x = binspace(intgrl.a, intgrl.b, N);
-	double *eval = (double *) malloc ((N + 1l) * sizeof(double));
-
-	/*
-	 * Evaluate the function at each bin edge, and add everything up. According
-	 * to trapezoid rule, subtract half of the value of the function at the
-	 * first and last bin edges, then multiply by the width and return
-	 */
 	unsigned long i;
-	for (i = 0l; i <= N; i++) {
-		eval[i] = intgrl.func(x[i]);
+	double total = 0;
+
+	if (coarse != NULL) {
+		/*
+		 * The bin edges with N / 2 bins are every other bin edge with N bins.
+		 * Add the function evaluated at the new bin edges (the midpoints of
+		 * the old bins) to the previous sum.
+		 */
+		for (i = 1l; i < N; i += 2l) {
+			total += intgrl.func(intgrl.a + i * hN, intgrl.params);
+		}
+		debug_print("total = %.5e\n", total);
+		return *coarse / 2 + hN * total;
+	} else {
+		/*
+		 * Evaluate the function at each bin edge, and add everything up.
+		 * According to trapezoid rule, the first and last bin edges are
+		 * weighted by one half. Then multiply by the width and return.
+		 */
+		for (i = 1l; i < N; i++) {
+			total += intgrl.func(intgrl.a + i * hN, intgrl.params);
+		}
+		total += 0.5 * (intgrl.func(intgrl.a, intgrl.params) +
+			intgrl.func(intgrl.b, intgrl.params));
+		debug_print("total = %.5e\n", total);
+		return hN * total;
 	}
-	double total = sum(eval, N + 1l);
-	total -= 0.5 * (eval[0] + eval[N]);
-	debug_print("total = %.5e\n", total);
-	free(x);
-	free(eval);
-	return hN * total;
 
 }
 
@@ -218,6 +562,11 @@ static double trapzd(INTEGRAL intgrl, unsigned long N) {
  * =======
  * The approximate value of the integral with the given number of bins
  *
+ * Notes
+ * =====
+ * Unlike the other methods, the bin centers with N bins are not a subset of
+ * those with 2N bins, so previous evaluations can not be reused.
+ *
  * For details on the Midpoint rule, see chapter 4 of Numerical Recipes:
  * Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge University Press
  */
@@ -225,48 +574,18 @@ static double midpt(INTEGRAL intgrl, unsigned long N) {
 
 	trace_print();
 	double hN = (intgrl.b - intgrl.a) / N; 	/* width of each bin */
-	double *x = binspace(intgrl.a, intgrl.b, N);
-	double *mids = bin_centers(x, N);
-	double *eval = (double *) malloc (N * sizeof(double));
 
 	/*
 	 * Evaluate the function at the bin centers, add everything up, then
 	 * multiply by the width and return
 	 */
 	unsigned long i;
+	double total = 0;
 	for (i = 0l; i < N; i++) {
-		eval[i] = intgrl.func(mids[i]);
+		total += intgrl.func(intgrl.a + (i + 0.5) * hN, intgrl.params);
 	}
-	double total = sum(eval, N);
 	debug_print("total = %.5e\n", total);
-	free(x);
-	free(mids);
-	free(eval);
 	return hN * total;
 
 }
 
-
-/*
- * Approximates the integral of a function between two bounds using Simpson's
- * rule with a given number of bins.
- *
- * Parameters
- * ==========
- * intgrl: 		The integral object
- * N: 			The number of bins to use in evaluating the Riemann sum
- *
- * Returns
- * =======
- * The approximate value of the integral with the given number of bins
- *
- * For details on Simpson's rule, see chapter 4 of Numerical Recipes:
- * Press, Teukolsky, Vetterling, & Flannery (2007), Cambridge University Press
- */
-static double simp(INTEGRAL intgrl, unsigned long N) {
-
-	/* Simpson's rule is essentially a complication of Trapezoid rule */
-	return (4 * trapzd(intgrl, N) - trapzd(intgrl, N / 2l)) / 3;
-
-}
-
@@ -25,6 +25,10 @@ extern "C" {
  * The methods of numerical quadrature implemented in this function and its
  * subroutines are adopted from Chapter 4 of Numerical Recipes (Press,
  * Teukolsky, Vetterling & Flannery 2007), Cambridge University Press.
+ * Euler's method, trapezoid rule, Simpson's rule and Romberg's method reuse
+ * the evaluations of the integrand from previous iterations, each of which
+ * doubles the number of bins. Gauss-Kronrod quadrature instead adaptively
+ * bisects the subintervals with the largest error estimates.
  *
  * source: integral.c
  */
@@ -17,7 +17,7 @@
 
 /* ---------- static function comment headers not duplicated here ---------- */
 static unsigned short test_quad_common(unsigned long method);
-static double test_function(double x);
+static double test_function(double x, void *params);
 static INTEGRAL *get_test_integral(void);
 static unsigned short assess_test(INTEGRAL test);
 
@@ -86,6 +86,39 @@ extern unsigned short test_quad_simp(void) {
 }
 
 
+/*
+ * Test the numerical quadrature implementation of Romberg's method
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: integral.h
+ */
+extern unsigned short test_quad_romberg(void) {
+
+	return test_quad_common(ROMBERG);
+
+}
+
+
+/*
+ * Test the numerical quadrature implementation of adaptive Gauss-Kronrod
+ * quadrature
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: integral.h
+ */
+extern unsigned short test_quad_gauss_kronrod(void) {
+
+	return test_quad_common(GAUSS_KRONROD);
+
+}
+
+
 /*
  * Common routine for testing the implementation of a given quadrature routine
  *
@@ -145,7 +178,7 @@ static INTEGRAL *get_test_integral(void) {
  * sin(x) from 0 to pi/2 and ensures that the return value is within the
  * specified tolerance of 1.
  */
-static double test_function(double x) {
+static double test_function(double x, void *params) {
 
 	return sin(x);
 
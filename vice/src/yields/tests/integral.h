@@ -56,6 +56,29 @@ extern unsigned short test_quad_midpt(void);
  */
 extern unsigned short test_quad_simp(void);
 
+/*
+ * Test the numerical quadrature implementation of Romberg's method
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: integral.c
+ */
+extern unsigned short test_quad_romberg(void);
+
+/*
+ * Test the numerical quadrature implementation of adaptive Gauss-Kronrod
+ * quadrature
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: integral.c
+ */
+extern unsigned short test_quad_gauss_kronrod(void);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -16,6 +16,7 @@ except NameError:
 if not __VICE_SETUP__:
 
 	__all__ = [
+		"benchmarks",
 		"core",
 		"elements",
 		"toolkit",
@@ -27,6 +28,7 @@ if not __VICE_SETUP__:
 
 	from ..testing import moduletest
 	from . import elements
+	from .. import benchmarks
 	from .. import core
 	from ..milkyway import test as milkyway_test
 	from .. import src
@@ -65,6 +67,7 @@ This program will overwrite the VICE output at %s/test.vice. Proceed? \
 		warnings.filterwarnings("ignore")
 		return ["",
 			[
+				benchmarks.test(run = False),
 				core.test(run = False),
 				elements.test(run = False),
 				toolkit.test(run = False),
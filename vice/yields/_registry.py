@@ -0,0 +1,65 @@
+r"""
+The registry of yield tables read from VICE's data files. Each table is
+parsed from disk only the first time it is requested in a given python
+process and served from memory thereafter, unless the file has been modified
+since it was read.
+
+Contents
+--------
+lookup : <function>
+	Obtain the contents of a yield file, parsing it only if necessary.
+clear : <function>
+	Discard all tables held in memory.
+"""
+
+from __future__ import absolute_import
+import os
+
+__all__ = ["lookup", "clear"]
+
+# (filename, reader) -> (modification time, contents)
+_TABLES_ = {}
+
+
+def lookup(filename, reader):
+	r"""
+	Obtain the contents of a yield file, parsing it only if it has not been
+	already or if it has been modified since.
+
+	Parameters
+	----------
+	filename : str
+		The full path to the yield file.
+	reader : callable
+		The function which parses the file, accepting the filename as its only
+		argument. The same file read by different functions is stored
+		separately for each.
+
+	Returns
+	-------
+	contents : object
+		The return value of reader(filename). This object is shared between
+		all calls with the same filename and reader, and must not be modified
+		by the caller.
+
+	Raises
+	------
+	* IOError
+		- The file does not exist.
+	* Other exceptions raised by ``reader`` are propagated.
+	"""
+	mtime = os.path.getmtime(filename)
+	key = (filename, reader)
+	if key not in _TABLES_ or _TABLES_[key][0] != mtime:
+		_TABLES_[key] = (mtime, reader(filename))
+	else: pass
+	return _TABLES_[key][1]
+
+
+def clear():
+	r"""
+	Discard all tables held in memory, such that each is read from disk again
+	the next time it is requested.
+	"""
+	_TABLES_.clear()
+
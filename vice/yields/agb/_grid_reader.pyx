@@ -10,6 +10,7 @@ from ..._globals import _RECOGNIZED_ELEMENTS_
 from ..._globals import _VERSION_ERROR_
 from ...core.dataframe._builtin_dataframes import atomic_number
 from ...core import _pyutils
+from .. import _registry
 import sys
 import os
 if sys.version_info[:2] == (2, 7):
@@ -144,6 +145,34 @@ element %s. Only the following elements have tables available: %s.""" % (
 	else:
 		pass
 
+	return list(cached_grid(element, study))
+
+
+def cached_grid(element, study):
+	r"""
+	Obtain the stellar mass-metallicity grid of AGB star yields for a given
+	element and study from the registry of yield tables, reading the file
+	only if it has not been already (see vice/yields/_registry.py).
+
+	Parameters
+	==========
+	element :: str [case-insensitive]
+		The symbol for the element whose yield grid is to be found
+	study :: str [case-insensitive]
+		The keyword for the study to lookup
+
+	Returns
+	=======
+	grid :: tuple
+		The yields, masses, and metallicities in the format returned by
+		vice.yields.agb.grid. This object is shared between calls and must not
+		be modified.
+
+	Raises
+	======
+	IOError ::
+		:: The file containing the yield grid was not found
+	"""
 	# full path to the file containing the yield grid
 	filename = find_yield_file(element, study)
 
@@ -154,8 +183,30 @@ element %s. Only the following elements have tables available: %s.""" % (
 		"""
 		raise IOError("Yield file not found. Please re-install VICE.")
 	else:
-		pass
+		return _registry.lookup(filename, read_grid)
+
+
+def read_grid(filename):
+	r"""
+	Read in the stellar mass-metallicity grid of AGB star yields stored in a
+	given file.
+
+	Parameters
+	==========
+	filename :: str
+		The full path to the file containing the yield grid
+
+	Returns
+	=======
+	grid :: tuple
+		The yields, masses, and metallicities in the format returned by
+		vice.yields.agb.grid.
 
+	Raises
+	======
+	SystemError ::
+		:: The file could not be read
+	"""
 	cdef ELEMENT *e = _grid_reader.element_initialize()
 	if _grid_reader.import_agb_grid(e, filename.encode("latin-1")):
 		_grid_reader.element_free(e)
@@ -177,8 +228,8 @@ element %s. Only the following elements have tables available: %s.""" % (
 		finally:
 			_grid_reader.element_free(e)
 
-		return [tuple(i) for i in [[tuple(j) for j in yields], masses,
-			metallicities]]
+		return tuple([tuple(i) for i in [[tuple(j) for j in yields], masses,
+			metallicities]])
 
 
 def find_yield_file(element, study):
@@ -15,6 +15,8 @@ Contents
 --------
 fractional : <function>
 	Calculate an IMF-averaged yield for a given element.
+fractional_many : <function>
+	Calculate many IMF-averaged yields in parallel.
 table : <function>
 	Obtain the table of mass yields and progenitor masses for a given element
 	from a given study.
@@ -64,9 +66,11 @@ except NameError:
 
 if not __VICE_SETUP__:
 
-	__all__ = ["engines", "fractional", "settings", "table", "test"]
+	__all__ = ["engines", "fractional", "fractional_many", "settings",
+		"table", "test"]
 	from . import engines
 	from ._yield_integrator import integrate as fractional
+	from .batch import fractional_many
 	from .grid_reader import table
 	from .settings import settings
 	from .tests import test
@@ -21,7 +21,8 @@ else:
 
 
 # Recognized methods of numerical quadrature and yield studies
-_RECOGNIZED_METHODS_ = tuple(["simpson", "midpoint", "trapezoid", "euler"])
+_RECOGNIZED_METHODS_ = tuple(["simpson", "midpoint", "trapezoid", "euler",
+	"romberg", "gausskronrod"])
 _RECOGNIZED_STUDIES_ = tuple(["WW95", "LC18", "CL13", "CL04", "NKT13",
 	"S16/W18", "S16/W18F", "S16/N20"])
 
@@ -10,12 +10,29 @@ cdef extern from "../../src/ccsne.h":
 	double CC_MIN_STELLAR_MASS
 
 
+cdef extern from "../../src/io.h":
+	long line_count(char *file)
+	int header_length(char *file)
+	double **cc_yield_grid(char *file)
+
+
 cdef extern from "../../src/yields/ccsne.h":
-	void weight_initial_by_explodability(unsigned short weight)
-	void set_Z_progenitor(double Z)
+	ctypedef struct CCSNE_YIELD_CONTEXT:
+		double **grid
+		double **wind
+		unsigned int gridsize
+		IMF_ *imf
+		CALLBACK_1ARG *explodability
+		double Z_progenitor
+		unsigned short weight_initial
+
 	unsigned short IMFintegrated_fractional_yield_numerator(
-		INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-		char *path, const unsigned short wind, char *element)
-	extern unsigned short IMFintegrated_fractional_yield_denominator(
-		INTEGRAL *intgrl, IMF_ *imf)
+		INTEGRAL *intgrl, CCSNE_YIELD_CONTEXT *context) nogil
+	unsigned short IMFintegrated_fractional_yield_denominator(
+		INTEGRAL *intgrl, IMF_ *imf) nogil
+
+
+cdef class yield_grid:
+	cdef double **_grid
+	cdef unsigned int _size
 
@@ -19,6 +19,7 @@ from ._errors import _RECOGNIZED_METHODS_
 from ._errors import _RECOGNIZED_STUDIES_
 from ._errors import numeric_check
 from ._errors import string_check
+from .. import _registry
 import math as m
 import warnings
 import numbers
@@ -38,6 +39,8 @@ from ...core.objects._callback_1arg cimport callback_1arg_initialize
 from ...core.objects._callback_1arg cimport callback_1arg_free
 from ...core.objects._integral cimport INTEGRAL
 from ...core.objects cimport _integral
+from ._yield_integrator cimport CCSNE_YIELD_CONTEXT
+from libc.stdlib cimport free
 from ...core.objects cimport _imf
 from ...core._cutils cimport copy_pylist
 from ...core._cutils cimport callback_1arg_setup
@@ -180,10 +183,22 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 			- "trapezoid"
 			- "midpoint"
 			- "euler"
+			- "romberg"
+			- "gausskronrod"
 
 		.. note:: These methods of quadrature are implemented according to
 			Chapter 4 of Press, Teukolsky, Vetterling & Flannery (2007) [10]_.
 
+		.. versionadded:: 1.4.0
+			The "romberg" and "gausskronrod" methods. Romberg's method
+			extrapolates the trapezoid rule to infinitely many bins, and
+			"gausskronrod" adaptively bisects the regions of the mass range
+			with the largest error estimates using the 15-point Kronrod rule.
+			For this method, ``Nmin`` and ``Nmax`` bound the number of
+			subintervals rather than the number of bins. All methods except
+			"midpoint" reuse evaluations of the integrand from previous
+			iterations.
+
 	m_lower : real number [default : 0.08]
 		The lower mass limit on star formation in :math:`M_\odot`.
 	m_upper : real number [default : 100]
@@ -384,11 +399,8 @@ smaller than maximum number of bins.""")
 	"""
 	cdef CALLBACK_1ARG *explodability_cb = callback_1arg_initialize()
 	if explodability is None:
-		# assume everything explodes
-		def uniform(m):
-			return 1.0
-		uniform_explodability = callback1_nan_inf(uniform)
-		callback_1arg_setup(explodability_cb, uniform_explodability)
+		# assume everything explodes -> a constant doesn't call python
+		callback_1arg_setup(explodability_cb, 1.0)
 	elif callable(explodability):
 		exp_cb = callback1_nan_inf(explodability)
 		callback_1arg_setup(explodability_cb, exp_cb)
@@ -501,27 +513,47 @@ own discretion by modifying their CCSN yield settings directly.""" % (
 	else:
 		pass
 
+	cdef CCSNE_YIELD_CONTEXT context
 	if net:
-		zprog = initial_abundance(
+		context.Z_progenitor = initial_abundance(
 			"%syields/ccsne/%s/FeH%s/birth_composition.dat" % (
 				_DIRECTORY_, study.upper(), MoverHstr), element.lower())
-		_yield_integrator.set_Z_progenitor(zprog)
-		if study.upper() not in ["S16/W18", "S16/W18F", "S16/N20", "LC18"]:
-			_yield_integrator.weight_initial_by_explodability(1)
-		else:
-			_yield_integrator.weight_initial_by_explodability(0)
+		context.weight_initial = int(study.upper() not in [
+			"S16/W18", "S16/W18F", "S16/N20", "LC18"])
 		if study.upper() == "WW95": warnings.warn("""\
 Woosley & Weaver (1995) did not report their birth abundances. VICE cannot \
 compute net yields for this study, only reporting gross yields.""",
 			ScienceWarning)
 	else:
-		_yield_integrator.set_Z_progenitor(0)
-		_yield_integrator.weight_initial_by_explodability(0)
+		context.Z_progenitor = 0
+		context.weight_initial = 0
 		if study.upper() == "NKT13": warnings.warn("""\
 Nomoto, Kobayashi & Tominaga (2013) reported net mass yields in their model \
 core collapse supernova ejecta. VICE cannot compute gross yields for this \
 study, only reporting net yields.""")
 
+	"""
+	The yield grids are read from disk only once per process and shared
+	between calls. If neither the IMF nor the explodability are python
+	functions, the integrals don't require the interpreter, and the GIL is
+	released so that many yields can be computed concurrently (see
+	vice.yields.ccsne.fractional_many).
+	"""
+	cdef yield_grid grid = _cached_grid("%sexplosive/%s.dat" % (path,
+		element.lower()))
+	cdef yield_grid wind_grid
+	context.grid = grid._grid
+	context.gridsize = grid._size
+	if wind:
+		wind_grid = _cached_grid("%swind/%s.dat" % (path, element.lower()))
+		context.wind = wind_grid._grid
+	else:
+		context.wind = NULL
+	context.imf = imf_obj
+	context.explodability = explodability_cb
+	cdef bint nogil_ok = explodability is None and not callable(IMF)
+	cdef unsigned short flag
+
 	# Compute the yield
 	cdef INTEGRAL *num = _integral.integral_initialize()
 	num[0].a = m_lower
@@ -531,9 +563,14 @@ study, only reporting net yields.""")
 	num[0].Nmax = <unsigned long> Nmax
 	num[0].Nmin = <unsigned long> Nmin
 	try:
-		x = _yield_integrator.IMFintegrated_fractional_yield_numerator(num,
-			imf_obj, explodability_cb, path.encode("latin-1"),
-			int(wind), element.lower().encode("latin-1"))
+		if nogil_ok:
+			with nogil:
+				flag = _yield_integrator.IMFintegrated_fractional_yield_numerator(
+					num, &context)
+		else:
+			flag = _yield_integrator.IMFintegrated_fractional_yield_numerator(
+				num, &context)
+		x = flag
 		if x == 1:
 			warnings.warn("""Yield-weighted IMF integration did not converge \
 for element: %s. Estimated fractional error: %.2e""" % (element.lower(),
@@ -556,8 +593,16 @@ for element: %s. Estimated fractional error: %.2e""" % (element.lower(),
 	den[0].Nmax = <unsigned long> Nmax
 	den[0].Nmin = <unsigned long> Nmin
 	try:
-		x = _yield_integrator.IMFintegrated_fractional_yield_denominator(den,
-			imf_obj)
+		if nogil_ok:
+			with nogil:
+				flag = (
+					_yield_integrator.IMFintegrated_fractional_yield_denominator(
+						den, imf_obj)
+				)
+		else:
+			flag = _yield_integrator.IMFintegrated_fractional_yield_denominator(
+				den, imf_obj)
+		x = flag
 		if x == 1:
 			warnings.warn("""Mass-weighted IMF integration did not converge. \
 Estimated fractional error: %.2e""" % (den[0].error), ScienceWarning)
@@ -611,3 +656,63 @@ def initial_abundance(filename, element):
 	raise SystemError("Internal Error.")
 
 
+def _cached_grid(filename):
+	r"""
+	Obtain the mass-yield grid stored in a given file from the registry of
+	yield tables (see vice/yields/_registry.py), reading it in only if it has
+	not been already.
+
+	Parameters
+	----------
+	filename : str
+		The full path to the file containing the grid.
+
+	Returns
+	-------
+	grid : yield_grid
+		The grid itself, shared between all calls with the same filename.
+	"""
+	return _registry.lookup(filename, yield_grid)
+
+
+cdef class yield_grid:
+
+	r"""
+	A mass-yield grid of a given element from a given study, stored in C.
+
+	Parameters
+	----------
+	filename : str
+		The full path to the file containing the grid.
+
+	Attributes
+	----------
+	size : int
+		The number of progenitor masses on the grid.
+	"""
+
+	def __cinit__(self, filename):
+		self._grid = NULL
+		self._size = 0
+		encoded = filename.encode("latin-1")
+		self._grid = _yield_integrator.cc_yield_grid(encoded)
+		if self._grid is NULL: raise IOError(
+			"Could not read yield grid from file: %s" % (filename))
+		self._size = <unsigned int> (_yield_integrator.line_count(encoded) -
+			_yield_integrator.header_length(encoded))
+
+	def __dealloc__(self):
+		cdef unsigned int i
+		if self._grid is not NULL:
+			for i in range(self._size):
+				free(self._grid[i])
+			free(self._grid)
+
+	@property
+	def size(self):
+		r"""
+		Type : int
+
+		The number of progenitor masses on the grid.
+		"""
+		return self._size
@@ -0,0 +1,145 @@
+r"""
+This file implements the fractional_many function, which computes many
+IMF-integrated CCSN yields at once across a pool of threads.
+"""
+
+from __future__ import absolute_import
+from ..._globals import _VERSION_ERROR_
+from ._yield_integrator import integrate
+from concurrent.futures import ThreadPoolExecutor
+import numbers
+import sys
+if sys.version_info[:2] == (2, 7):
+	strcomp = basestring
+elif sys.version_info[:2] >= (3, 5):
+	strcomp = str
+else:
+	_VERSION_ERROR_()
+
+# The order of the positional arguments within each combination
+_POSITIONAL_ = ["element", "study", "MoverH", "rotation"]
+
+
+def fractional_many(combinations, workers = 1, **kwargs):
+	r"""
+	Calculate many IMF-integrated fractional nucleosynthetic yields from
+	core-collapse supernovae in parallel.
+
+	**Signature**: vice.yields.ccsne.fractional_many(combinations,
+	workers = 1, **kwargs)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	combinations : array-like
+		The yields to calculate. Each element may be either:
+
+			- A string, denoting the element to calculate the yield for.
+			- An array-like object of up to four values, denoting the element,
+			  the study, [M/H] and the rotational velocity in that order.
+			- A dictionary of keyword arguments to
+			  ``vice.yields.ccsne.fractional``.
+
+	workers : ``int`` [default : 1]
+		The number of threads to compute yields with.
+	kwargs : varying types
+		Keyword arguments to pass to ``vice.yields.ccsne.fractional`` for every
+		combination. Values specified within a combination take precedence.
+
+	Returns
+	-------
+	yields : ``list``
+		The yield and its estimated numerical error for each combination, in
+		the same order as ``combinations``. Each element is the value that
+		``vice.yields.ccsne.fractional`` returns for that combination.
+
+	Raises
+	------
+	* TypeError
+		- ``combinations`` is not array-like
+		- A combination is not a string, array-like object or dictionary
+		- ``workers`` is not an integer
+	* ValueError
+		- A combination has more than four positional values
+		- ``workers`` is not positive
+	* Other exceptions and warnings
+		- Any raised by ``vice.yields.ccsne.fractional`` for a combination
+
+	Notes
+	-----
+	The yield grids are read from disk only once and are shared between all
+	calculations which use them. When the IMF is built-in and no
+	explodability criterion is specified, the numerical quadrature runs
+	without the global interpreter lock, and the combinations are computed
+	concurrently. Python functions for the IMF or explodability require the
+	interpreter at every evaluation, in which case the threads provide little
+	to no speedup.
+
+	.. seealso:: vice.yields.ccsne.fractional
+
+	Example Code
+	------------
+	>>> import vice
+	>>> yields = vice.yields.ccsne.fractional_many([
+		("o", "LC18", -1, 0),
+		("o", "LC18", 0, 0),
+		("mg", "CL13"),
+		"fe"], workers = 4)
+	>>> [y for y, err in yields]
+		[0.00552, 0.004859197708207693, 0.0009939371276697314, 0.000472]
+	"""
+	try:
+		combinations = list(combinations)
+	except TypeError:
+		raise TypeError("Must be an array-like object. Got: %s" % (
+			type(combinations)))
+	if not isinstance(workers, numbers.Number) or workers % 1 != 0:
+		raise TypeError("Keyword arg 'workers' must be an integer. Got: %s" % (
+			type(workers)))
+	elif workers <= 0:
+		raise ValueError("""Keyword arg 'workers' must be positive. \
+Got: %d""" % (workers))
+	else:
+		workers = int(workers)
+	calls = [_keywords(i, kwargs) for i in combinations]
+	if workers == 1:
+		return [integrate(**i) for i in calls]
+	else:
+		with ThreadPoolExecutor(max_workers = workers) as executor:
+			return list(executor.map(lambda x: integrate(**x), calls))
+
+
+def _keywords(combination, defaults):
+	r"""
+	Determine the keyword arguments to pass to ``vice.yields.ccsne.fractional``
+	for a given combination.
+
+	Parameters
+	----------
+	combination : ``str``, array-like, or ``dict``
+		The combination as specified by the user.
+	defaults : ``dict``
+		The keyword arguments common to all combinations.
+
+	Returns
+	-------
+	kwargs : ``dict``
+		The keyword arguments for this combination.
+	"""
+	kwargs = dict(defaults)
+	if isinstance(combination, strcomp):
+		kwargs["element"] = combination
+	elif isinstance(combination, dict):
+		kwargs.update(combination)
+	else:
+		try:
+			combination = list(combination)
+		except TypeError:
+			raise TypeError("""Each combination must be either a string, an \
+array-like object, or a dictionary. Got: %s""" % (type(combination)))
+		if len(combination) > len(_POSITIONAL_): raise ValueError("""\
+Combinations may specify at most %d positional values (%s). Got: %d""" % (
+			len(_POSITIONAL_), ", ".join(_POSITIONAL_), len(combination)))
+		kwargs.update(zip(_POSITIONAL_, combination))
+	return kwargs
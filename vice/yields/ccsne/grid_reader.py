@@ -13,6 +13,7 @@ from ._errors import string_check
 from ._errors import _ROTATION_
 from ._errors import _MOVERH_
 from ._errors import _NAMES_
+from .. import _registry
 import warnings
 import sys
 import os
@@ -235,11 +236,11 @@ yield can be approximated as zero at this metallicity. Users may exercise \
 their own discretion by modifying their CCSN yield settings directly.""" % (
 			_NAMES_[study.upper()], element))
 	else:
-		grid = read_grid(filename)
+		grid = [list(row) for row in _registry.lookup(filename, read_grid)]
 
 	if wind:
-		wind_grid = read_grid(find_yield_file(study, MoverH, rotation, "wind",
-			element))
+		wind_grid = _registry.lookup(find_yield_file(study, MoverH, rotation,
+			"wind", element), read_grid)
 		for i in range(len(grid)):
 			for j in range(1, len(grid[i])):
 				grid[i][j] += wind_grid[i][j]
@@ -258,7 +259,7 @@ reason, this function cannot separate the wind yields from this table.""" % (
 
 	if isotopic:
 		return ccsn_yield_table(masses, tuple(isotopic_yields),
-			isotopes = get_isotopes(filename))
+			isotopes = list(_registry.lookup(filename, get_isotopes)))
 	else:
 		mass_yields = len(masses) * [0.]
 		for i in range(len(mass_yields)):
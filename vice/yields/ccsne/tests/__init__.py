@@ -67,6 +67,7 @@ if not __VICE_SETUP__:
 		except:
 			tests.append(unittest("vice.yields.ccsne.WW95", lambda: None))
 		tests.append(integrator.test(run = False))
+		tests.append(integrator.test_fractional_many())
 		return ["vice.yields.ccsne", tests]
 
 else:
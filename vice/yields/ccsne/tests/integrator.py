@@ -3,9 +3,10 @@ Test the CCSNe yield integrator at vice/yields/ccnse/_yield_integrator.pyx
 """
 
 from __future__ import absolute_import
-__all__ = ["test" ]
+__all__ = ["test", "test_fractional_many"]
 from ...._globals import _RECOGNIZED_ELEMENTS_
 from .._yield_integrator import integrate as fractional
+from ..batch import fractional_many
 from .._errors import _RECOGNIZED_STUDIES_ as _STUDY_
 from .._errors import _NAMES_
 from .._errors import _MOVERH_
@@ -126,3 +127,35 @@ def test():
 						**params)())
 	return ["vice.yields.ccsne.fractional", trials]
 
+
+@unittest
+def test_fractional_many():
+	r"""
+	vice.yields.ccsne.fractional_many unit test
+	"""
+	def test():
+		combinations = [
+			"o",
+			("mg", "CL13"),
+			("fe", "LC18", -1, 300),
+			dict(element = "c", study = "WW95", IMF = "salpeter"),
+			("n", "NKT13", 0.15)
+		]
+		try:
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				serial = fractional_many(combinations, method = "trapezoid")
+				threaded = fractional_many(combinations, workers = 3,
+					method = "trapezoid")
+				expected = [fractional("o", method = "trapezoid"),
+					fractional("mg", study = "CL13", method = "trapezoid"),
+					fractional("fe", study = "LC18", MoverH = -1,
+						rotation = 300, method = "trapezoid"),
+					fractional("c", study = "WW95", IMF = "salpeter",
+						method = "trapezoid"),
+					fractional("n", study = "NKT13", MoverH = 0.15,
+						method = "trapezoid")]
+		except:
+			return False
+		return serial == expected and threaded == expected
+	return ["vice.yields.ccsne.fractional_many", test]
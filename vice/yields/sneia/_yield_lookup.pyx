@@ -7,6 +7,7 @@ from __future__ import absolute_import
 from ..._globals import _RECOGNIZED_ELEMENTS_
 from ..._globals import _DIRECTORY_
 from ..._globals import _VERSION_ERROR_
+from .. import _registry
 import numbers
 import sys
 import os
@@ -193,11 +194,29 @@ Gronow et al. (2021a, b), a:A&A, 649, 155, b:arxiv:2103.14050"""
 	filename = "%syields/sneia/%s/%s/%s.dat" % (_DIRECTORY_, study.lower(),
 		model.upper(), element.lower())
 	if os.path.exists(filename):
-		return single_ia_mass_yield_lookup(filename.encode("latin-1"))
+		return _registry.lookup(filename, _read_single_detonation)
 	else:
 		raise IOError("Yield file not found. Please re-install VICE.")
 
 
+def _read_single_detonation(filename):
+	r"""
+	Read in the total mass yield of an element from a single SN Ia stored in
+	a given file.
+
+	Parameters
+	----------
+	filename : str
+		The full path to the yield file.
+
+	Returns
+	-------
+	mass : real number
+		The mass yield in :math:`M_\odot` summed over all isotopes.
+	"""
+	return single_ia_mass_yield_lookup(filename.encode("latin-1"))
+
+
 #----------------------- FRACTIONAL_IA_YIELD FUNCTION -----------------------#
 def integrated_yield(element, study = "seitenzahl13", model = "N1",
 	n = 2.2e-3):
@@ -11,6 +11,7 @@ if not __VICE_SETUP__:
 	from ...testing import moduletest
 	from . import _integral as integral
 	from . import functional_yields
+	from . import registry
 
 	@moduletest
 	def test():
@@ -20,7 +21,8 @@ if not __VICE_SETUP__:
 		return ["vice.src.yields",
 			[
 				integral.test(run = False),
-				functional_yields.equivalence_test()
+				functional_yields.equivalence_test(),
+				registry.test_lookup()
 			]
 		]
 
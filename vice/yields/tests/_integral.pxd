@@ -5,4 +5,5 @@ cdef extern from "../../src/yields/tests/integral.h":
 	unsigned short test_quad_trapzd()
 	unsigned short test_quad_midpt()
 	unsigned short test_quad_simp()
-
+	unsigned short test_quad_romberg()
+	unsigned short test_quad_gauss_kronrod()
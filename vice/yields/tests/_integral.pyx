@@ -6,7 +6,9 @@ __all__ = [
 	"test_euler",
 	"test_trapezoid",
 	"test_midpoint",
-	"test_simpson"
+	"test_simpson",
+	"test_romberg",
+	"test_gauss_kronrod"
 ]
 from ...testing import moduletest
 from ...testing import unittest
@@ -23,7 +25,9 @@ def test():
 			test_euler(),
 			test_trapezoid(),
 			test_midpoint(),
-			test_simpson()
+			test_simpson(),
+			test_romberg(),
+			test_gauss_kronrod()
 		]
 	]
 
@@ -63,3 +67,22 @@ def test_simpson():
 	return ["vice.src.yields.integral [method :: simpson]",
 		_integral.test_quad_simp]
 
+
+@unittest
+def test_romberg():
+	"""
+	Tests the Romberg's method integration routine at
+	vice/src/yields/integral.c
+	"""
+	return ["vice.src.yields.integral [method :: romberg]",
+		_integral.test_quad_romberg]
+
+
+@unittest
+def test_gauss_kronrod():
+	"""
+	Tests the adaptive Gauss-Kronrod integration routine at
+	vice/src/yields/integral.c
+	"""
+	return ["vice.src.yields.integral [method :: gausskronrod]",
+		_integral.test_quad_gauss_kronrod]
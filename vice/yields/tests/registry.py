@@ -0,0 +1,43 @@
+r"""
+This file implements the unit test of the registry of yield tables at
+vice/yields/_registry.py.
+"""
+
+from ...testing import unittest
+from .. import _registry
+import tempfile
+import os
+
+
+@unittest
+def test_lookup():
+	r"""
+	vice.yields._registry.lookup unit test
+	"""
+	def test():
+		calls = []
+		def reader(filename):
+			calls.append(filename)
+			with open(filename, 'r') as f:
+				return float(f.read())
+		fd, filename = tempfile.mkstemp()
+		try:
+			with os.fdopen(fd, 'w') as f:
+				f.write("1.0")
+			status = _registry.lookup(filename, reader) == 1.0
+			status &= _registry.lookup(filename, reader) == 1.0
+			status &= len(calls) == 1 # served from memory
+			with open(filename, 'w') as f:
+				f.write("2.0")
+			mtime = os.path.getmtime(filename) + 10
+			os.utime(filename, (mtime, mtime))
+			status &= _registry.lookup(filename, reader) == 2.0
+			status &= len(calls) == 2 # modification invalidates the table
+		except:
+			return False
+		finally:
+			_registry._TABLES_.pop((filename, reader), None)
+			os.remove(filename)
+		return status
+	return ["vice.yields._registry.lookup", test]
+